@@ -0,0 +1,80 @@
+#!/usr/bin/env python
+"""Compares the files and packed cache backends.
+
+Usage:
+    python benchmarks/cache_backend_bench.py [--entries N] [--entry-size BYTES] [--threads N]
+
+For each backend a fresh cache folder is populated with N entries, after which the time it takes to
+open the cache, to read all entries sequentially and to read them from a thread pool is measured,
+along with the number of files and the disk space used by the cache folder.
+"""
+
+import argparse
+import random
+import string
+import tempfile
+import time
+import typing as t
+from pathlib import Path
+
+from sqlmesh.utils.cache import CacheBackend, FileCache, configure_cache_dir
+from sqlmesh.utils.concurrency import concurrent_apply_to_values
+
+
+def make_entries(count: int, entry_size: int) -> t.Dict[str, t.Dict[str, t.Any]]:
+    rng = random.Random(42)
+    return {
+        f'"db"."schema"."model_{i}"': {
+            "query": "".join(rng.choices(string.ascii_letters + " ", k=entry_size)),
+            "columns": {f"col_{j}": "INT" for j in range(10)},
+        }
+        for i in range(count)
+    }
+
+
+def timed(func: t.Callable[[], t.Any]) -> float:
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def run(backend: CacheBackend, entries: t.Dict[str, t.Dict[str, t.Any]], threads: int) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp)
+        configure_cache_dir(path, backend=backend)
+
+        cache: FileCache[t.Dict[str, t.Any]] = FileCache(path, prefix="bench")
+        put = timed(lambda: [cache.put(name, "id", value=value) for name, value in entries.items()])
+
+        names = list(entries)
+        init = timed(lambda: FileCache(path, prefix="bench"))
+        cache = FileCache(path, prefix="bench")
+        get = timed(lambda: [cache.get(name, "id") for name in names])
+        threaded_get = timed(
+            lambda: concurrent_apply_to_values(names, lambda name: cache.get(name, "id"), threads)
+        )
+
+        files = [p for p in path.rglob("*") if p.is_file()]
+        size_mb = sum(p.stat().st_size for p in files) / 1024 / 1024
+
+        print(
+            f"{backend.value:>8}: put {put:.3f}s, init {init:.3f}s, get {get:.3f}s, "
+            f"threaded get {threaded_get:.3f}s, {len(files)} files, {size_mb:.1f} MB"
+        )
+        configure_cache_dir(path, backend=CacheBackend.FILES)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--entries", type=int, default=10_000)
+    parser.add_argument("--entry-size", type=int, default=4_000)
+    parser.add_argument("--threads", type=int, default=8)
+    args = parser.parse_args()
+
+    entries = make_entries(args.entries, args.entry_size)
+    for backend in CacheBackend:
+        run(backend, entries, args.threads)
+
+
+if __name__ == "__main__":
+    main()
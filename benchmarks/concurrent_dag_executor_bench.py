@@ -0,0 +1,54 @@
+#!/usr/bin/env python
+
+import random
+
+import pyperf
+
+from sqlmesh.utils.concurrency import ConcurrentDAGExecutor
+from sqlmesh.utils.dag import DAG
+
+NODES_NUM = 50_000
+MAX_PARENTS = 3
+WIDTH = 500
+
+
+def build_layered_dag(nodes_num: int = NODES_NUM, width: int = WIDTH) -> DAG[int]:
+    """Builds a synthetic DAG in which each node depends on up to MAX_PARENTS nodes from the previous layer."""
+    rng = random.Random(42)
+    dag: DAG[int] = DAG()
+    for node in range(nodes_num):
+        layer_start = (node // width) * width
+        if layer_start == 0:
+            dag.add(node)
+            continue
+        previous_layer = range(layer_start - width, layer_start)
+        dag.add(node, rng.sample(previous_layer, rng.randint(1, MAX_PARENTS)))
+    return dag
+
+
+def build_chain_dag(nodes_num: int = NODES_NUM) -> DAG[int]:
+    """Builds a synthetic DAG in which every node depends on the previous one."""
+    dag: DAG[int] = DAG()
+    dag.add(0)
+    for node in range(1, nodes_num):
+        dag.add(node, [node - 1])
+    return dag
+
+
+def run_executor(dag: DAG[int], loops: int) -> float:
+    t0 = pyperf.perf_counter()
+    for _ in range(loops):
+        ConcurrentDAGExecutor(dag, lambda _: None, tasks_num=8, raise_on_error=True).run()
+    return pyperf.perf_counter() - t0
+
+
+def main():
+    runner = pyperf.Runner()
+    layered_dag = build_layered_dag()
+    chain_dag = build_chain_dag()
+    runner.bench_time_func("concurrent_dag_executor_layered_50k", run_executor, layered_dag)
+    runner.bench_time_func("concurrent_dag_executor_chain_50k", run_executor, chain_dag)
+
+
+if __name__ == "__main__":
+    main()
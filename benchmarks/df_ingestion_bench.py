@@ -0,0 +1,105 @@
+#!/usr/bin/env python
+"""Measures the throughput of inserting pandas DataFrames through engine adapters.
+
+Usage:
+    python benchmarks/df_ingestion_bench.py [--rows N] [--postgres DSN]
+
+Each engine is measured twice: once with its native loading pathway (a registered DataFrame for
+DuckDB, COPY FROM STDIN for Postgres) and once with the generic pathway which renders batches of
+literal VALUES. DuckDB is always used. Postgres is used as well when a DSN is provided, e.g.
+"host=localhost dbname=sqlmesh user=postgres password=postgres".
+"""
+
+import argparse
+import time
+import typing as t
+
+import duckdb  # noqa: TID253
+import numpy as np  # noqa: TID253
+import pandas as pd  # noqa: TID253
+from sqlglot import exp
+
+from sqlmesh.core.engine_adapter import EngineAdapter, create_engine_adapter
+
+COLUMNS_TO_TYPES = {
+    "id": exp.DataType.build("bigint"),
+    "name": exp.DataType.build("text"),
+    "amount": exp.DataType.build("double"),
+    "ts": exp.DataType.build("timestamp"),
+}
+
+
+def make_df(rows: int) -> pd.DataFrame:
+    rng = np.random.default_rng(42)
+    return pd.DataFrame(
+        {
+            "id": np.arange(rows),
+            "name": rng.choice(["a", "b", "c", None], rows),
+            "amount": rng.random(rows),
+            "ts": pd.date_range("2020-01-01", periods=rows, freq="s"),
+        }
+    )
+
+
+def values_only(engine_adapter: EngineAdapter) -> EngineAdapter:
+    """Forces the adapter to use the generic VALUES pathway for DataFrames."""
+    engine_adapter.__class__ = type(
+        f"ValuesOnly{type(engine_adapter).__name__}",
+        (type(engine_adapter),),
+        {
+            "supports_bulk_load": property(lambda self: False),
+            "_df_to_source_queries": EngineAdapter._df_to_source_queries,
+        },
+    )
+    return engine_adapter
+
+
+def measure(engine_adapter: EngineAdapter, df: pd.DataFrame) -> float:
+    table = "sqlmesh_bench.df_ingestion"
+    engine_adapter.create_schema("sqlmesh_bench")
+    engine_adapter.drop_table(table)
+    engine_adapter.create_table(table, COLUMNS_TO_TYPES)
+    try:
+        start = time.perf_counter()
+        engine_adapter.insert_append(table, df, target_columns_to_types=COLUMNS_TO_TYPES)
+        elapsed = time.perf_counter() - start
+        row = engine_adapter.fetchone(exp.select("COUNT(*)").from_(table))
+        assert row and row[0] == len(df.index)
+    finally:
+        engine_adapter.drop_table(table)
+    return elapsed
+
+
+def run(engine_name: str, adapter_factory: t.Callable[[], EngineAdapter], df: pd.DataFrame) -> None:
+    print(f"{engine_name}:")
+    for pathway, engine_adapter in (
+        ("native", adapter_factory()),
+        ("values", values_only(adapter_factory())),
+    ):
+        elapsed = measure(engine_adapter, df)
+        print(f"{pathway:>8}: {elapsed:.3f}s, {len(df.index) / elapsed:,.0f} rows/s")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=200_000)
+    parser.add_argument("--postgres")
+    args = parser.parse_args()
+
+    df = make_df(args.rows)
+
+    connection = duckdb.connect()
+    run("duckdb", lambda: create_engine_adapter(lambda: connection, "duckdb"), df)
+
+    if args.postgres:
+        import psycopg2
+
+        run(
+            "postgres",
+            lambda: create_engine_adapter(lambda: psycopg2.connect(args.postgres), "postgres"),
+            df,
+        )
+
+
+if __name__ == "__main__":
+    main()
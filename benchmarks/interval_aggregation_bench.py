@@ -0,0 +1,134 @@
+#!/usr/bin/env python
+"""Compares client-side and server-side folding of snapshot intervals.
+
+Usage:
+    python benchmarks/interval_aggregation_bench.py [--snapshots N] [--intervals N] [--postgres DSN]
+
+Populates a fresh state store with daily intervals recorded one at a time for each snapshot, which is
+what the intervals table looks like for incremental models between compactions, and then reports the
+number of rows transferred and the wall time of fetching intervals with and without server-side
+aggregation. DuckDB is always used. Postgres is used as well when a DSN is provided, e.g.
+"host=localhost dbname=sqlmesh user=postgres password=postgres".
+"""
+
+import argparse
+import tempfile
+import time
+import typing as t
+from pathlib import Path
+
+import duckdb  # noqa: TID253
+
+from sqlmesh.core.engine_adapter import EngineAdapter, create_engine_adapter
+from sqlmesh.core.snapshot import SnapshotIntervals, SnapshotNameVersion
+from sqlmesh.core.state_sync import EngineAdapterStateSync
+from sqlmesh.core.state_sync.db.interval import IntervalState
+from sqlmesh.utils.date import to_timestamp
+
+DAY = 24 * 60 * 60 * 1000
+
+
+def populate(
+    state_sync: EngineAdapterStateSync, snapshots_num: int, intervals_num: int
+) -> t.List[SnapshotNameVersion]:
+    start = to_timestamp("2020-01-01")
+    snapshots = [
+        SnapshotNameVersion(name=f'"db"."model_{i}"', version=f"version_{i}")
+        for i in range(snapshots_num)
+    ]
+    for day in range(intervals_num):
+        state_sync.interval_state.add_snapshots_intervals(
+            [
+                SnapshotIntervals(
+                    name=snapshot.name,
+                    identifier=f"identifier_{i}",
+                    version=snapshot.version,
+                    dev_version=f"dev_version_{i}",
+                    intervals=[(start + day * DAY, start + (day + 1) * DAY)],
+                    dev_intervals=[],
+                )
+                for i, snapshot in enumerate(snapshots)
+            ]
+        )
+    return snapshots
+
+
+def measure(
+    engine_adapter: EngineAdapter,
+    fetch: t.Callable[[], t.List[SnapshotIntervals]],
+) -> t.Tuple[int, float, t.List[SnapshotIntervals]]:
+    rows_transferred = 0
+    fetchall = engine_adapter.fetchall
+
+    def counting_fetchall(*args: t.Any, **kwargs: t.Any) -> t.List[t.Tuple]:
+        nonlocal rows_transferred
+        rows = fetchall(*args, **kwargs)
+        rows_transferred += len(rows)
+        return rows
+
+    engine_adapter.fetchall = counting_fetchall  # type: ignore
+    try:
+        start = time.perf_counter()
+        result = fetch()
+        elapsed = time.perf_counter() - start
+    finally:
+        engine_adapter.fetchall = fetchall  # type: ignore
+    return rows_transferred, elapsed, result
+
+
+def run(engine_name: str, engine_adapter: EngineAdapter, snapshots_num: int, intervals_num: int):
+    with tempfile.TemporaryDirectory() as cache_dir:
+        state_sync = EngineAdapterStateSync(
+            engine_adapter, schema="sqlmesh_bench", cache_dir=Path(cache_dir)
+        )
+        state_sync.remove_state()
+        state_sync.migrate(skip_backup=True)
+        try:
+            snapshots = populate(state_sync, snapshots_num, intervals_num)
+            interval_state = IntervalState(engine_adapter, schema="sqlmesh_bench")
+
+            client_rows, client_time, client_result = measure(
+                engine_adapter, lambda: interval_state._get_snapshot_intervals(snapshots)[1]
+            )
+            server_rows, server_time, server_result = measure(
+                engine_adapter, lambda: interval_state._get_aggregated_snapshot_intervals(snapshots)
+            )
+            assert sorted(client_result, key=lambda s: s.name) == sorted(
+                server_result, key=lambda s: s.name
+            )
+
+            print(f"{engine_name}:")
+            print(f"{'client-side':>14}: {client_rows:>9} rows, {client_time:.3f}s")
+            print(f"{'server-side':>14}: {server_rows:>9} rows, {server_time:.3f}s")
+        finally:
+            state_sync.remove_state()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--snapshots", type=int, default=200)
+    parser.add_argument("--intervals", type=int, default=365)
+    parser.add_argument("--postgres")
+    args = parser.parse_args()
+
+    connection = duckdb.connect()
+    run(
+        "duckdb",
+        create_engine_adapter(lambda: connection, "duckdb"),
+        args.snapshots,
+        args.intervals,
+    )
+
+    if args.postgres:
+        import psycopg2
+
+        run(
+            "postgres",
+            create_engine_adapter(lambda: psycopg2.connect(args.postgres), "postgres"),
+            args.snapshots,
+            args.intervals,
+        )
+
+
+if __name__ == "__main__":
+    main()
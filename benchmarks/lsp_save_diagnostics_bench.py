@@ -0,0 +1,134 @@
+#!/usr/bin/env python
+
+import asyncio
+import pyperf
+import os
+import logging
+from pathlib import Path
+from lsprotocol import types
+
+from sqlmesh.lsp.uri import URI
+from pygls.client import JsonRPCClient
+
+# Suppress debug logging during benchmark
+logging.getLogger().setLevel(logging.WARNING)
+
+
+class LSPClient(JsonRPCClient):
+    """A custom LSP client for benchmarking."""
+
+    def __init__(self):
+        super().__init__()
+
+        # Register handlers for notifications and requests we expect from the server
+        @self.feature(types.WINDOW_SHOW_MESSAGE)
+        def handle_show_message(_):
+            # Silently ignore show message notifications during benchmark
+            pass
+
+        @self.feature(types.WINDOW_LOG_MESSAGE)
+        def handle_log_message(_):
+            # Silently ignore log message notifications during benchmark
+            pass
+
+        @self.feature(types.WORKSPACE_DIAGNOSTIC_REFRESH)
+        def handle_diagnostic_refresh(_):
+            return None
+
+        @self.feature(types.WORKSPACE_INLAY_HINT_REFRESH)
+        def handle_inlay_hint_refresh(_):
+            return None
+
+    async def initialize_server(self, project_dir: Path):
+        """Send initialization request to server."""
+        response = await self.protocol.send_request_async(
+            types.INITIALIZE,
+            types.InitializeParams(
+                process_id=os.getpid(),
+                root_uri=URI.from_path(project_dir).value,
+                capabilities=types.ClientCapabilities(
+                    text_document=types.TextDocumentClientCapabilities(
+                        diagnostic=types.DiagnosticClientCapabilities()
+                    )
+                ),
+                workspace_folders=[
+                    types.WorkspaceFolder(uri=URI.from_path(project_dir).value, name="sushi")
+                ],
+            ),
+        )
+
+        # Send initialized notification
+        self.protocol.notify(types.INITIALIZED, types.InitializedParams())
+        return response
+
+
+async def benchmark_save_diagnostics_async(client: LSPClient, model_path: Path):
+    """Benchmark a save of the model file followed by a pull of its diagnostics."""
+    uri = URI.from_path(model_path).value
+
+    # Bump the modification time so that the saved file is actually re-parsed
+    os.utime(model_path)
+    client.protocol.notify(
+        types.TEXT_DOCUMENT_DID_SAVE,
+        types.DidSaveTextDocumentParams(text_document=types.TextDocumentIdentifier(uri=uri)),
+    )
+
+    # The server handles messages in order, so the diagnostics reflect the reloaded context
+    return await client.protocol.send_request_async(
+        types.TEXT_DOCUMENT_DIAGNOSTIC,
+        types.DocumentDiagnosticParams(text_document=types.TextDocumentIdentifier(uri=uri)),
+    )
+
+
+def benchmark_save_diagnostics(loops):
+    """Synchronous wrapper for the benchmark."""
+
+    async def run():
+        # Create client
+        client = LSPClient()
+
+        # Start the SQLMesh LSP server as a subprocess
+        await client.start_io("python", "-m", "sqlmesh.lsp.main")
+
+        # Initialize the server
+        sushi_dir = Path(__file__).parent.parent / "examples" / "sushi"
+        await client.initialize_server(sushi_dir)
+
+        # Get a model file with downstream models to test with
+        model_path = sushi_dir / "models" / "waiter_revenue_by_day.sql"
+        client.protocol.notify(
+            types.TEXT_DOCUMENT_DID_OPEN,
+            types.DidOpenTextDocumentParams(
+                text_document=types.TextDocumentItem(
+                    uri=URI.from_path(model_path).value,
+                    language_id="sql",
+                    version=1,
+                    text=model_path.read_text(),
+                )
+            ),
+        )
+
+        # Warm up
+        await benchmark_save_diagnostics_async(client, model_path)
+
+        # Run benchmark
+        t0 = pyperf.perf_counter()
+        for _ in range(loops):
+            await benchmark_save_diagnostics_async(client, model_path)
+        dt = pyperf.perf_counter() - t0
+
+        # Clean up
+        await client.stop()
+
+        return dt
+
+    return asyncio.run(run())
+
+
+def main():
+    runner = pyperf.Runner()
+    runner.bench_time_func("lsp_save_diagnostics", benchmark_save_diagnostics)
+
+
+if __name__ == "__main__":
+    main()
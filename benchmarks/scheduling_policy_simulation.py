@@ -0,0 +1,127 @@
+#!/usr/bin/env python
+"""Replays recorded snapshot evaluation durations to compare scheduling policies.
+
+Usage:
+    python benchmarks/scheduling_policy_simulation.py [PROJECT_PATH] [--workers N]
+
+When a project path is provided, the DAG of the project's models is combined with the evaluation
+durations persisted in the project's cache directory by previous runs that used the `critical_path`
+scheduling policy. Otherwise a synthetic DAG with random durations is used.
+"""
+
+import argparse
+import heapq
+import random
+import typing as t
+
+from sqlmesh.core.config.common import SchedulingPolicy
+from sqlmesh.core.scheduler import (
+    EvaluateNode,
+    SchedulingUnit,
+    critical_path_lengths,
+    node_duration_estimator,
+)
+from sqlmesh.utils.dag import DAG
+
+
+def simulate(
+    dag: DAG[SchedulingUnit],
+    durations: t.Dict[str, float],
+    workers: int,
+    policy: SchedulingPolicy,
+) -> float:
+    """Simulates the execution of the DAG with the given number of workers and returns its makespan."""
+    estimate = node_duration_estimator(durations)
+    if policy.is_critical_path:
+        critical_paths = critical_path_lengths(dag, estimate)
+        priority: t.Callable[[SchedulingUnit], t.Any] = lambda n: (-critical_paths[n], n)
+    else:
+        priority = lambda n: n
+
+    graph = dag.graph
+    indegrees = {node: len(deps) for node, deps in graph.items()}
+    downstream: t.Dict[SchedulingUnit, t.List[SchedulingUnit]] = {}
+    for node, deps in graph.items():
+        for dep in deps:
+            downstream.setdefault(dep, []).append(node)
+
+    ready = [(priority(node), node) for node, indegree in indegrees.items() if not indegree]
+    heapq.heapify(ready)
+    running: t.List[t.Tuple[float, int, SchedulingUnit]] = []
+    clock = 0.0
+    seq = 0
+
+    while ready or running:
+        while ready and len(running) < workers:
+            _, node = heapq.heappop(ready)
+            heapq.heappush(running, (clock + estimate(node), seq, node))
+            seq += 1
+
+        clock, _, finished = heapq.heappop(running)
+        for child in downstream.get(finished, ()):
+            indegrees[child] -= 1
+            if not indegrees[child]:
+                heapq.heappush(ready, (priority(child), child))
+
+    return clock
+
+
+def synthetic_run(
+    nodes_num: int = 2000, seed: int = 42
+) -> t.Tuple[DAG[SchedulingUnit], t.Dict[str, float]]:
+    rng = random.Random(seed)
+    dag: DAG[SchedulingUnit] = DAG()
+    durations: t.Dict[str, float] = {}
+    nodes: t.List[EvaluateNode] = []
+    for i in range(nodes_num):
+        name = f"model_{i:05d}"
+        node = EvaluateNode(snapshot_name=name, interval=(0, 1), batch_index=0)
+        # A few long chains of slow models mixed with many short, wide, fast ones
+        if i % 50 == 0 or not nodes:
+            parents = []
+        elif i % 10 == 0:
+            parents = [nodes[i - 10]]
+        else:
+            parents = rng.sample(nodes, min(len(nodes), rng.randint(0, 2)))
+        dag.add(node, parents)
+        durations[name] = rng.expovariate(1 / 5000) if i % 10 == 0 else rng.expovariate(1 / 500)
+        nodes.append(node)
+    return dag, durations
+
+
+def recorded_run(project_path: str) -> t.Tuple[DAG[SchedulingUnit], t.Dict[str, float]]:
+    from sqlmesh.core.context import DURATION_ESTIMATES_CACHE_ENTRY, Context
+
+    context = Context(paths=project_path)
+    durations = context._duration_estimates_cache.get(DURATION_ESTIMATES_CACHE_ENTRY) or {}
+    if not durations:
+        print("No recorded durations were found, unknown models are assumed to be equally slow.")
+
+    snapshots = context.snapshots
+    dag: DAG[SchedulingUnit] = DAG()
+    for snapshot in snapshots.values():
+        dag.add(
+            EvaluateNode(snapshot_name=snapshot.name, interval=(0, 1), batch_index=0),
+            [
+                EvaluateNode(snapshot_name=parent.name, interval=(0, 1), batch_index=0)
+                for parent in snapshot.parents
+            ],
+        )
+    return dag, durations
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("project_path", nargs="?")
+    parser.add_argument("--workers", type=int, default=4)
+    args = parser.parse_args()
+
+    dag, durations = recorded_run(args.project_path) if args.project_path else synthetic_run()
+
+    for policy in SchedulingPolicy:
+        makespan = simulate(dag, durations, args.workers, policy)
+        print(f"{policy.value:>15}: {makespan / 1000:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -4,11 +4,13 @@ import logging
 import os
 import sys
 import typing as t
+from datetime import datetime
 from pathlib import Path
 
 import click
 
 from sqlmesh import configure_logging, remove_excess_logs
+from sqlmesh.core import constants as c
 from sqlmesh.cli import error_handler
 from sqlmesh.cli import options as opt
 from sqlmesh.cli.project_init import (
@@ -21,9 +23,11 @@ from sqlmesh.core.analytics import cli_analytics
 from sqlmesh.core.config import load_configs
 from sqlmesh.core.console import configure_console, get_console
 from sqlmesh.core.context import Context
+from sqlmesh.core.table_diff import RowDiffAlgorithm
 from sqlmesh.utils import Verbosity
 from sqlmesh.utils.date import TimeLike
 from sqlmesh.utils.errors import MissingDependencyError, SQLMeshError
+from sqlmesh.utils.tracing import start_tracing, stop_tracing
 
 logger = logging.getLogger(__name__)
 
@@ -132,6 +136,9 @@ def cli(
     # The parent callback constructs Context before Click invokes `lint`, so inspect its parsed args here.
     if ctx.invoked_subcommand == "lint" and "--local" in ctx.meta["subcommand_args"]:
         load_state = False
+    # Tracing has to start before the context is loaded, so that loading is part of the plan profile.
+    if ctx.invoked_subcommand == "plan" and "--profile" in ctx.meta["subcommand_args"]:
+        start_tracing()
 
     if len(paths) == 1:
         path = os.path.abspath(paths[0])
@@ -557,6 +564,11 @@ def diff(ctx: click.Context, environment: t.Optional[str] = None) -> None:
     default=None,
     help="For every model, ensure at least this many intervals are covered by a missing intervals check regardless of the plan start date",
 )
+@click.option(
+    "--profile",
+    is_flag=True,
+    help="Record where the time was spent, write it to a Chrome trace file in the log directory and print a summary.",
+)
 @opt.verbose
 @click.pass_context
 @error_handler
@@ -575,18 +587,35 @@ def plan(
     allow_additive_models = kwargs.pop("allow_additive_model") or None
     backfill_models = kwargs.pop("backfill_model") or None
     ignore_cron = kwargs.pop("ignore_cron") or None
+    profile = kwargs.pop("profile")
     setattr(get_console(), "verbosity", Verbosity(verbose))
 
-    context.plan(
-        environment,
-        restate_models=restate_models,
-        select_models=select_models,
-        allow_destructive_models=allow_destructive_models,
-        allow_additive_models=allow_additive_models,
-        backfill_models=backfill_models,
-        ignore_cron=ignore_cron,
-        **kwargs,
-    )
+    try:
+        context.plan(
+            environment,
+            restate_models=restate_models,
+            select_models=select_models,
+            allow_destructive_models=allow_destructive_models,
+            allow_additive_models=allow_additive_models,
+            backfill_models=backfill_models,
+            ignore_cron=ignore_cron,
+            **kwargs,
+        )
+    finally:
+        tracer = stop_tracing()
+        if profile and tracer:
+            log_file_dir = ctx.find_root().params.get("log_file_dir") or c.DEFAULT_LOG_FILE_DIR
+            trace_path = (
+                Path(log_file_dir)
+                / f"plan_profile_{datetime.now().strftime('%Y_%m_%d_%H_%M_%S')}.json"
+            )
+            tracer.write_chrome_trace(trace_path)
+
+            console = get_console()
+            console.log_status_update("")
+            console.log_status_update(f"Plan profile (trace written to {trace_path}):")
+            for line in tracer.format_summary():
+                console.log_status_update(f"  {line}")
 
 
 @cli.command("run")
@@ -662,6 +691,11 @@ def invalidate(ctx: click.Context, environment: str, **kwargs: t.Any) -> None:
     default=None,
     help="Scope cleanup to a single expired environment. Global snapshot and interval compaction are skipped.",
 )
+@click.option(
+    "--compact",
+    is_flag=True,
+    help="Compact intervals regardless of the configured compaction threshold, including when --environment is specified.",
+)
 @click.pass_context
 @error_handler
 @cli_analytics
@@ -670,6 +704,7 @@ def janitor(
     ignore_ttl: bool,
     force_delete: bool,
     environment: t.Optional[str],
+    compact: bool,
     **kwargs: t.Any,
 ) -> None:
     """
@@ -677,7 +712,9 @@ def janitor(
 
     The janitor cleans up old environments and expired snapshots.
     """
-    ctx.obj.run_janitor(ignore_ttl, force_delete=force_delete, environment=environment, **kwargs)
+    ctx.obj.run_janitor(
+        ignore_ttl, force_delete=force_delete, environment=environment, compact=compact, **kwargs
+    )
 
 
 @cli.command("destroy")
@@ -795,6 +832,11 @@ def create_test(
     default=False,
     help="Preserve the fixture tables in the testing database, useful for debugging.",
 )
+@click.option(
+    "--processes",
+    type=int,
+    help="The number of processes to run the tests in. Only applies to in-memory DuckDB tests.",
+)
 @click.argument("tests", nargs=-1)
 @click.pass_obj
 @error_handler
@@ -805,6 +847,7 @@ def test(
     verbose: int,
     preserve_fixtures: bool,
     tests: t.List[str],
+    processes: t.Optional[int] = None,
 ) -> None:
     """Run model unit tests."""
     result = obj.test(
@@ -812,6 +855,7 @@ def test(
         tests=tests,
         verbosity=Verbosity(verbose),
         preserve_fixtures=preserve_fixtures,
+        processes=processes,
     )
     if not result.wasSuccessful():
         exit(1)
@@ -899,17 +943,22 @@ def fetchdf(ctx: click.Context, sql: str) -> None:
     is_flag=True,
     help="Skip the connection test.",
 )
+@click.option(
+    "--timings",
+    is_flag=True,
+    help="Show how long each phase of loading the project took.",
+)
 @opt.verbose
 @click.pass_obj
 @error_handler
 @cli_analytics
-def info(obj: Context, skip_connection: bool, verbose: int) -> None:
+def info(obj: Context, skip_connection: bool, timings: bool, verbose: int) -> None:
     """
     Print information about a SQLMesh project.
 
     Includes counts of project models and macros and connection tests for the data warehouse.
     """
-    obj.print_info(skip_connection=skip_connection, verbosity=Verbosity(verbose))
+    obj.print_info(skip_connection=skip_connection, verbosity=Verbosity(verbose), timings=timings)
 
 
 @cli.command("ui")
@@ -1067,6 +1116,17 @@ def create_external_models(obj: Context, **kwargs: t.Any) -> None:
     is_flag=True,
     help="If set, when performing a schema diff the case of column names is ignored when matching between the two schemas. For example, 'col_a' in the source schema and 'COL_A' in the target schema will be treated as the same column.",
 )
+@click.option(
+    "--algorithm",
+    type=click.Choice([a.value for a in RowDiffAlgorithm]),
+    default=RowDiffAlgorithm.JOIN.value,
+    help="The algorithm used to compute row differences. 'join' joins the tables in full, 'hashdiff' compares checksums of table segments and only joins the segments that differ. Default: join",
+)
+@click.option(
+    "--mismatches-file",
+    type=click.Path(dir_okay=False),
+    help="The path of a CSV file to which every mismatched row is written when diffing tables across gateways.",
+)
 @click.pass_obj
 @error_handler
 @cli_analytics
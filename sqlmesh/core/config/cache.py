@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+import typing as t
+
+from sqlmesh.core.config.base import BaseConfig
+from sqlmesh.utils.cache import CacheBackend
+from sqlmesh.utils.pydantic import field_validator
+
+
+class CacheConfig(BaseConfig):
+    """The configuration for the local SQLMesh cache.
+
+    Args:
+        backend: The storage layout of the cache. `files` stores every entry in its own gzip-compressed
+            file, `packed` stores all entries in a single SQLite database file.
+        max_size_mb: The maximum size of the packed cache in megabytes. The least recently used entries
+            are evicted once it's exceeded. Unbounded if not set. Ignored by the `files` backend.
+    """
+
+    backend: CacheBackend = CacheBackend.FILES
+    max_size_mb: t.Optional[int] = None
+
+    @field_validator("max_size_mb", mode="before")
+    @classmethod
+    def _validate_max_size_mb(cls, value: t.Any) -> t.Optional[int]:
+        if value is None:
+            return None
+        max_size_mb = int(value)
+        if max_size_mb <= 0:
+            raise ValueError("max_size_mb must be greater than 0")
+        return max_size_mb
+
+    @property
+    def max_size_bytes(self) -> t.Optional[int]:
+        return self.max_size_mb * 1024 * 1024 if self.max_size_mb is not None else None
@@ -116,6 +116,36 @@ class TableNamingConvention(str, Enum):
         return str(self)
 
 
+class SchedulingPolicy(str, Enum):
+    """Policy used to order snapshot evaluations that are ready to run.
+
+    DEFAULT: Evaluate ready nodes in their natural order (by snapshot name and interval).
+    CRITICAL_PATH: Evaluate first the nodes which start the longest chains of downstream work, weighted by
+        the historical evaluation duration of each snapshot.
+    """
+
+    DEFAULT = "default"
+    CRITICAL_PATH = "critical_path"
+
+    @property
+    def is_default(self) -> bool:
+        return self == SchedulingPolicy.DEFAULT
+
+    @property
+    def is_critical_path(self) -> bool:
+        return self == SchedulingPolicy.CRITICAL_PATH
+
+    @classproperty
+    def default(cls) -> SchedulingPolicy:
+        return SchedulingPolicy.DEFAULT
+
+    def __str__(self) -> str:
+        return self.name
+
+    def __repr__(self) -> str:
+        return str(self)
+
+
 def _concurrent_tasks_validator(v: t.Any) -> int:
     if isinstance(v, str):
         v = int(v)
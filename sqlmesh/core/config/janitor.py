@@ -3,7 +3,7 @@ from __future__ import annotations
 import typing as t
 
 from sqlmesh.core.config.base import BaseConfig
-from sqlmesh.utils.pydantic import field_validator
+from sqlmesh.utils.pydantic import ValidationInfo, field_validator
 
 
 class JanitorConfig(BaseConfig):
@@ -12,15 +12,26 @@ class JanitorConfig(BaseConfig):
     Args:
         warn_on_delete_failure: Whether to warn instead of erroring if the janitor fails to delete the expired environment schema / views.
         expired_snapshots_batch_size: Maximum number of expired snapshots to clean in a single batch.
+        compaction_batch_size: Maximum number of snapshots whose intervals are compacted in a single transaction.
+            Intervals of all snapshots are compacted in one transaction if not set.
+        compaction_threshold: Minimum number of uncompacted interval records required for the janitor to compact
+            intervals. Intervals are compacted on every janitor run if not set.
     """
 
     warn_on_delete_failure: bool = False
     expired_snapshots_batch_size: t.Optional[int] = None
+    compaction_batch_size: t.Optional[int] = None
+    compaction_threshold: t.Optional[int] = None
 
-    @field_validator("expired_snapshots_batch_size", mode="before")
+    @field_validator(
+        "expired_snapshots_batch_size",
+        "compaction_batch_size",
+        "compaction_threshold",
+        mode="before",
+    )
     @classmethod
-    def _validate_batch_size(cls, value: int) -> int:
+    def _validate_batch_size(cls, value: int, info: ValidationInfo) -> int:
         batch_size = int(value)
         if batch_size <= 0:
-            raise ValueError("expired_snapshots_batch_size must be greater than 0")
+            raise ValueError(f"{info.field_name} must be greater than 0")
         return batch_size
@@ -7,6 +7,7 @@ from pydantic import Field, ValidationError
 
 from sqlglot.helper import subclasses
 from sqlmesh.core.config.base import BaseConfig
+from sqlmesh.core.config.common import SchedulingPolicy
 from sqlmesh.core.console import get_console
 from sqlmesh.core.plan import (
     BuiltInPlanEvaluator,
@@ -64,6 +65,8 @@ class SchedulerConfig(abc.ABC):
 
 
 class _EngineAdapterStateSyncSchedulerConfig(SchedulerConfig):
+    server_side_interval_aggregation: bool = False
+
     def create_state_sync(self, context: GenericContext) -> StateSync:
         state_connection = (
             context.config.get_state_connection(context.gateway) or context.connection_config
@@ -105,7 +108,12 @@ class _EngineAdapterStateSyncSchedulerConfig(SchedulerConfig):
 
         schema = context.config.get_state_schema(context.gateway)
         return EngineAdapterStateSync(
-            engine_adapter, schema=schema, cache_dir=context.cache_dir, console=context.console
+            engine_adapter,
+            schema=schema,
+            cache_dir=context.cache_dir,
+            console=context.console,
+            server_side_interval_aggregation=self.server_side_interval_aggregation,
+            cache_namespace=self.state_sync_fingerprint(context),
         )
 
     def state_sync_fingerprint(self, context: GenericContext) -> str:
@@ -123,9 +131,16 @@ class _EngineAdapterStateSyncSchedulerConfig(SchedulerConfig):
 
 
 class BuiltInSchedulerConfig(_EngineAdapterStateSyncSchedulerConfig, BaseConfig):
-    """The Built-In Scheduler configuration."""
+    """The Built-In Scheduler configuration.
+
+    Args:
+        scheduling_policy: The policy used to order the evaluation of snapshot intervals that are ready to run.
+        server_side_interval_aggregation: Whether to coalesce snapshot intervals in the state database instead
+            of fetching and folding every interval record client-side.
+    """
 
     type_: t.Literal["builtin"] = Field(alias="type", default="builtin")
+    scheduling_policy: SchedulingPolicy = SchedulingPolicy.default
 
     def create_plan_evaluator(self, context: GenericContext) -> PlanEvaluator:
         return BuiltInPlanEvaluator(
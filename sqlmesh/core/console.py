@@ -2251,6 +2251,12 @@ class TerminalConsole(Console):
                 self._print(f" • {test.path}::{test.test_name}")
             self._print("=" * divider_length, end="\n\n")
 
+        if result.showAll and result.test_durations:
+            self._print("Slowest tests:")
+            for test, duration in result.slowest_tests():
+                self._print(f" • {test.path}::{test.test_name} ({duration:.2f}s)")
+            self._print("")
+
     def _captured_unit_test_results(self, result: ModelTextTestResult) -> str:
         with self.console.capture() as capture:
             self._log_test_details(result)
@@ -47,6 +47,12 @@ if hasattr(os, "fork") and not mp.current_process().daemon:
 else:
     MAX_FORK_WORKERS = 1
 
+try:
+    MAX_CACHE_READ_WORKERS = int(os.getenv("MAX_CACHE_READ_WORKERS"))  # type: ignore
+except TypeError:
+    # Cache entries are read and decompressed on threads, so IO and zlib can overlap
+    MAX_CACHE_READ_WORKERS = min(32, (os.cpu_count() or 1) + 4)
+
 EPOCH = datetime.date(1970, 1, 1)
 
 DEFAULT_MAX_LIMIT = 1000
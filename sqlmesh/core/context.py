@@ -61,9 +61,11 @@ from sqlmesh.core.config import (
     Config,
     load_configs,
 )
+from sqlmesh.core.config.common import SchedulingPolicy
 from sqlmesh.core.config.connection import ConnectionConfig
 from sqlmesh.core.config.loader import C
 from sqlmesh.core.config.root import RegexKeyDict
+from sqlmesh.core.config.scheduler import BuiltInSchedulerConfig
 from sqlmesh.core.console import get_console
 from sqlmesh.core.context_diff import ContextDiff
 from sqlmesh.core.dialect import (
@@ -76,7 +78,7 @@ from sqlmesh.core.dialect import (
 )
 from sqlmesh.core.engine_adapter import EngineAdapter
 from sqlmesh.core.environment import Environment, EnvironmentNamingInfo, EnvironmentStatements
-from sqlmesh.core.loader import Loader
+from sqlmesh.core.loader import Loader, LoadTimings
 from sqlmesh.core.linter.definition import AnnotatedRuleViolation, Linter
 from sqlmesh.core.linter.rules import BUILTIN_RULES
 from sqlmesh.core.macros import ExecutableOrMacro, macro
@@ -99,9 +101,11 @@ from sqlmesh.core.snapshot import (
     Snapshot,
     SnapshotEvaluator,
     SnapshotFingerprint,
+    fingerprint_from_node,
     missing_intervals,
     to_table_mapping,
 )
+from sqlmesh.core.snapshot.cache import FingerprintIndexCache
 from sqlmesh.core.snapshot.definition import get_next_model_interval_start
 from sqlmesh.core.state_sync import (
     CachingStateSync,
@@ -109,7 +113,7 @@ from sqlmesh.core.state_sync import (
     StateSync,
 )
 from sqlmesh.core.janitor import cleanup_expired_views, delete_expired_snapshots
-from sqlmesh.core.table_diff import TableDiff
+from sqlmesh.core.table_diff import RowDiffAlgorithm, StreamingTableDiff, TableDiff
 from sqlmesh.core.test import (
     ModelTextTestResult,
     ModelTestMetadata,
@@ -119,6 +123,7 @@ from sqlmesh.core.test import (
 )
 from sqlmesh.core.user import User
 from sqlmesh.utils import CorrelationId, UniqueKeyDict, Verbosity
+from sqlmesh.utils.cache import FileCache, configure_cache_dir, reset_cache_dir
 from sqlmesh.utils.concurrency import concurrent_apply_to_values
 from sqlmesh.utils.dag import DAG
 from sqlmesh.utils.date import (
@@ -140,6 +145,7 @@ from sqlmesh.utils.errors import (
 )
 from sqlmesh.utils.config import print_config
 from sqlmesh.utils.jinja import JinjaMacroRegistry
+from sqlmesh.utils.tracing import span, traced
 from sqlmesh.utils.windows import IS_WINDOWS, fix_windows_path
 
 if t.TYPE_CHECKING:
@@ -162,6 +168,8 @@ if t.TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+DURATION_ESTIMATES_CACHE_ENTRY = "duration_estimates"
+
 
 class BaseContext(abc.ABC):
     """The base context which defines methods to execute a model."""
@@ -451,10 +459,18 @@ class GenericContext(BaseContext, t.Generic[C]):
             dialect = Dialect.get_or_raise(self.config.dialect)
             type(dialect).NORMALIZATION_STRATEGY = dialect.normalization_strategy
 
+        configure_cache_dir(
+            self.cache_dir,
+            backend=self.config.cache.backend,
+            max_size_bytes=self.config.cache.max_size_bytes,
+        )
+
         self._loaders = [
             (loader or config.loader)(self, path, **config.loader_kwargs)
             for path, config in self.configs.items()
         ]
+        self.load_timings = LoadTimings()
+        self._fingerprint_index = FingerprintIndexCache(self.cache_dir)
 
         self._concurrent_tasks = concurrent_tasks
         self._state_connection_config = (
@@ -501,6 +517,10 @@ class GenericContext(BaseContext, t.Generic[C]):
                 ddl_concurrent_tasks=self.concurrent_tasks,
                 selected_gateway=self.selected_gateway,
             )
+            if self.scheduling_policy.is_critical_path:
+                self._snapshot_evaluator.execution_tracker.update_duration_estimates(
+                    self._duration_estimates_cache.get(DURATION_ESTIMATES_CACHE_ENTRY) or {}
+                )
         return self._snapshot_evaluator
 
     def _ensure_virtual_catalog_injection(self) -> None:
@@ -618,8 +638,16 @@ class GenericContext(BaseContext, t.Generic[C]):
             max_workers=self.concurrent_tasks,
             console=self.console,
             notification_target_manager=self.notification_target_manager,
+            scheduling_policy=self.scheduling_policy,
         )
 
+    @property
+    def scheduling_policy(self) -> SchedulingPolicy:
+        """Returns the policy used by the built-in scheduler to order ready nodes."""
+        if isinstance(self._scheduler, BuiltInSchedulerConfig):
+            return self._scheduler.scheduling_policy
+        return SchedulingPolicy.default
+
     @property
     def state_sync(self) -> StateSync:
         if not self._state_sync:
@@ -641,12 +669,95 @@ class GenericContext(BaseContext, t.Generic[C]):
         if any(loader.reload_needed() for loader in self._loaders):
             self.load()
 
+    @traced("load")
+    def reload_paths(self, paths: t.Collection[Path]) -> t.Optional[t.Set[str]]:
+        """Reloads only the models defined in the given files instead of the whole project if possible.
+
+        The schemas, fingerprints and definitions are recomputed only for the models defined in the
+        files and their downstream models. The whole project is loaded instead if any other file was
+        modified as well, eg. a macro or a config file, or if a file doesn't define SQL models.
+
+        Args:
+            paths: The SQL model files that were modified or deleted since the last load.
+
+        Returns:
+            The names of the models affected by the reload, including the removed ones, or None if
+            the whole project was loaded.
+        """
+        paths = {Path(path) for path in paths}
+        # Remote models depend on the state of the other projects, which is only handled by a full load
+        if self._load_state and any(self._projects):
+            self.load()
+            return None
+
+        models_per_path: t.Dict[Path, t.List[Model]] = {}
+        for loader in self._loaders:
+            loader_paths = {path for path in paths if loader.config_path in path.parents}
+            reloaded = loader.reload_sql_models(loader_paths) if loader_paths else {}
+            if reloaded is None or (not loader_paths and loader.reload_needed()):
+                self.load()
+                return None
+            models_per_path.update(reloaded)
+
+        removed = {fqn for fqn, model in self._models.items() if model._path in models_per_path}
+        reloaded_models = [model for models in models_per_path.values() for model in models]
+        reloaded_fqns = {model.fqn for model in reloaded_models}
+        if (
+            len(models_per_path) < len(paths)
+            or len(reloaded_fqns) < len(reloaded_models)
+            or (reloaded_fqns - removed) & (self._models.keys() | self._standalone_audits.keys())
+        ):
+            # Let a full load report duplicate names and files outside of the projects
+            self.load()
+            return None
+
+        with span("reload models", "load"):
+            for fqn in removed:
+                self._models.pop(fqn)
+            self._models.update({model.fqn: model for model in reloaded_models})
+
+            self.dag = DAG()
+            for model in self._models.values():
+                self.dag.add(model.fqn, model.depends_on)
+
+            affected = removed | reloaded_fqns
+            graph = self.dag.graph
+            for fqn in self.dag.sorted:
+                if not graph[fqn].isdisjoint(affected):
+                    affected.add(fqn)
+            affected &= self._models.keys() | removed
+            updated = affected & self._models.keys()
+
+            # bust the fingerprint cache for all downstream models
+            self._models.update({fqn: self._models[fqn].copy() for fqn in updated - reloaded_fqns})
+
+            update_model_schemas(
+                self.dag,
+                models=self._models,
+                cache_dir=self.cache_dir,
+                fqns=updated,
+            )
+
+            for fqn in updated:
+                # The model definition can be validated correctly only after the schema is set.
+                self._models[fqn].validate_definition()
+
+        self._all_dialects = {m.dialect for m in self._models.values() if m.dialect} | {
+            self.default_dialect or ""
+        }
+        return affected
+
+    @traced("load")
     def load(self, update_schemas: bool = True) -> GenericContext[C]:
         """Load all files in the context's path."""
         load_start_ts = time.perf_counter()
 
         loaded_projects = [loader.load() for loader in self._loaders]
 
+        self.load_timings = LoadTimings()
+        for loader in self._loaders:
+            self.load_timings.merge(loader.timings)
+
         self.dag = DAG()
         self._standalone_audits.clear()
         self._audits.clear()
@@ -731,16 +842,19 @@ class GenericContext(BaseContext, t.Generic[C]):
                     self._models.update({fqn: model.copy(update={"mapping_schema": {}})})
                     continue
 
-            update_model_schemas(
-                self.dag,
-                models=self._models,
-                cache_dir=self.cache_dir,
-            )
+            with self.load_timings.measure("schema update"):
+                update_model_schemas(
+                    self.dag,
+                    models=self._models,
+                    cache_dir=self.cache_dir,
+                    indexed_models=self._fingerprint_indexed_models(),
+                )
 
-            models = self.models.values()
-            for model in models:
-                # The model definition can be validated correctly only after the schema is set.
-                model.validate_definition()
+            with self.load_timings.measure("render"):
+                models = self.models.values()
+                for model in models:
+                    # The model definition can be validated correctly only after the schema is set.
+                    model.validate_definition()
 
         duplicates = set(self._models) & set(self._standalone_audits)
         if duplicates:
@@ -911,6 +1025,7 @@ class GenericContext(BaseContext, t.Generic[C]):
         ignore_ttl: bool,
         force_delete: bool = False,
         environment: t.Optional[str] = None,
+        compact: bool = False,
     ) -> bool:
         if environment is not None:
             environment = Environment.sanitize_name(environment)
@@ -919,7 +1034,12 @@ class GenericContext(BaseContext, t.Generic[C]):
 
         if self.console.start_cleanup(ignore_ttl):
             try:
-                self._run_janitor(ignore_ttl, force_delete=force_delete, environment=environment)
+                self._run_janitor(
+                    ignore_ttl,
+                    force_delete=force_delete,
+                    environment=environment,
+                    compact=compact,
+                )
                 success = True
             finally:
                 self.console.stop_cleanup(success=success)
@@ -1474,6 +1594,7 @@ class GenericContext(BaseContext, t.Generic[C]):
 
         return plan
 
+    @traced("plan")
     @python_api_analytics
     def plan_builder(
         self,
@@ -1944,6 +2065,8 @@ class GenericContext(BaseContext, t.Generic[C]):
         warn_grain_check: bool = False,
         temp_schema: t.Optional[str] = None,
         schema_diff_ignore_case: bool = False,
+        algorithm: t.Union[str, RowDiffAlgorithm] = RowDiffAlgorithm.JOIN,
+        mismatches_file: t.Optional[str] = None,
         **kwargs: t.Any,  # catch-all to prevent an 'unexpected keyword argument' error if an table_diff extension passes in some extra arguments
     ) -> t.List[TableDiff]:
         """Show a diff between two tables.
@@ -1962,15 +2085,19 @@ class GenericContext(BaseContext, t.Generic[C]):
             decimals: The number of decimal places to keep when comparing floating point columns.
             skip_grain_check: Skip check for rows that contain null or duplicate grains.
             temp_schema: The schema to use for temporary tables.
+            algorithm: The algorithm used to compute row differences, either "join" or "hashdiff".
+            mismatches_file: The path of a CSV file to which every mismatched row is written when
+                diffing tables across gateways.
 
         Returns:
             The list of TableDiff objects containing schema and summary differences.
         """
 
-        if "|" in source or "|" in target:
+        cross_gateway = "|" in source or "|" in target
+        if cross_gateway and select_models:
             raise ConfigError(
-                "Cross-database table diffing is available in Tobiko Cloud. Read more here: "
-                "https://sqlmesh.readthedocs.io/en/stable/guides/tablediff/#diffing-tables-or-views-across-gateways"
+                "Tables in other gateways can't be diffed together with a model selection. "
+                "Specify the tables to diff as 'gateway|table' instead."
             )
 
         table_diffs: t.List[TableDiff] = []
@@ -2069,6 +2196,7 @@ class GenericContext(BaseContext, t.Generic[C]):
                             temp_schema=temp_schema,
                             skip_grain_check=skip_grain_check,
                             schema_diff_ignore_case=schema_diff_ignore_case,
+                            algorithm=algorithm,
                         ),
                         tasks_num=tasks_num,
                     )
@@ -2082,19 +2210,38 @@ class GenericContext(BaseContext, t.Generic[C]):
                 )
 
         else:
+            source_gateway, _, source_table = source.rpartition("|")
+            target_gateway, _, target_table = target.rpartition("|")
+            source_adapter = self._get_engine_adapter(source_gateway or None)
+            target_adapter = self._get_engine_adapter(target_gateway or None)
+            if cross_gateway and source_adapter is target_adapter and mismatches_file:
+                self.console.log_warning(
+                    "Both tables are in the same gateway, so mismatched rows won't be written to "
+                    f"'{mismatches_file}'."
+                )
+            if source_adapter is not target_adapter and not RowDiffAlgorithm(algorithm).is_join:
+                self.console.log_warning(
+                    f"The '{RowDiffAlgorithm(algorithm).value}' algorithm is ignored when diffing "
+                    "tables across gateways, the rows of both tables are streamed and compared "
+                    "instead."
+                )
+
             table_diffs = [
                 self._table_diff(
-                    source=source,
-                    target=target,
-                    source_alias=source,
-                    target_alias=target,
+                    source=source_table,
+                    target=target_table,
+                    source_alias=source_gateway or source_table,
+                    target_alias=target_gateway or target_table,
                     limit=limit,
                     decimals=decimals,
-                    adapter=self.engine_adapter,
+                    adapter=source_adapter,
+                    target_adapter=target_adapter,
                     on=on,
                     skip_columns=skip_columns,
                     where=where,
                     schema_diff_ignore_case=schema_diff_ignore_case,
+                    algorithm=algorithm,
+                    mismatches_file=mismatches_file,
                 )
             ]
 
@@ -2120,6 +2267,7 @@ class GenericContext(BaseContext, t.Generic[C]):
         temp_schema: t.Optional[str] = None,
         skip_grain_check: bool = False,
         schema_diff_ignore_case: bool = False,
+        algorithm: t.Union[str, RowDiffAlgorithm] = RowDiffAlgorithm.JOIN,
     ) -> TableDiff:
         self.console.start_table_diff_model_progress(model.name)
 
@@ -2136,6 +2284,7 @@ class GenericContext(BaseContext, t.Generic[C]):
             source_alias=source_alias,
             target_alias=target_alias,
             schema_diff_ignore_case=schema_diff_ignore_case,
+            algorithm=algorithm,
         )
 
         if show:
@@ -2160,14 +2309,17 @@ class GenericContext(BaseContext, t.Generic[C]):
         skip_columns: t.Optional[t.List[str]] = None,
         where: t.Optional[str | exp.Expr] = None,
         schema_diff_ignore_case: bool = False,
+        algorithm: t.Union[str, RowDiffAlgorithm] = RowDiffAlgorithm.JOIN,
+        target_adapter: t.Optional[EngineAdapter] = None,
+        mismatches_file: t.Optional[str] = None,
     ) -> TableDiff:
         if not on:
             raise SQLMeshError(
                 "SQLMesh doesn't know how to join the two tables. Specify the `grains` in each model definition or pass join column names in separate `-o` flags."
             )
 
-        return TableDiff(
-            adapter=adapter.with_settings(execute_log_level=logger.getEffectiveLevel()),
+        execute_log_level = logger.getEffectiveLevel()
+        table_diff_kwargs: t.Dict[str, t.Any] = dict(
             source=source,
             target=target,
             on=on,
@@ -2182,6 +2334,21 @@ class GenericContext(BaseContext, t.Generic[C]):
             schema_diff_ignore_case=schema_diff_ignore_case,
         )
 
+        if target_adapter is not None and target_adapter is not adapter:
+            # The tables can't be joined by a single engine, so both are streamed and compared here
+            return StreamingTableDiff(
+                adapter=adapter.with_settings(execute_log_level=execute_log_level),
+                target_adapter=target_adapter.with_settings(execute_log_level=execute_log_level),
+                mismatches_path=Path(mismatches_file) if mismatches_file else None,
+                **table_diff_kwargs,
+            )
+
+        return TableDiff(
+            adapter=adapter.with_settings(execute_log_level=execute_log_level),
+            algorithm=algorithm,
+            **table_diff_kwargs,
+        )
+
     @python_api_analytics
     def get_dag(
         self, select_models: t.Optional[t.Collection[str]] = None, **options: t.Any
@@ -2314,6 +2481,7 @@ class GenericContext(BaseContext, t.Generic[C]):
         verbosity: Verbosity = Verbosity.DEFAULT,
         preserve_fixtures: bool = False,
         stream: t.Optional[t.TextIO] = None,
+        processes: t.Optional[int] = None,
     ) -> ModelTextTestResult:
         """Discover and run model tests"""
         if verbosity >= Verbosity.VERBOSE:
@@ -2334,6 +2502,7 @@ class GenericContext(BaseContext, t.Generic[C]):
             stream=stream,
             default_catalog=self.default_catalog,
             default_catalog_dialect=self.config.dialect or "",
+            processes=processes,
         )
 
         self.console.log_test_results(
@@ -2565,12 +2734,21 @@ class GenericContext(BaseContext, t.Generic[C]):
 
     @python_api_analytics
     def print_info(
-        self, skip_connection: bool = False, verbosity: Verbosity = Verbosity.DEFAULT
+        self,
+        skip_connection: bool = False,
+        verbosity: Verbosity = Verbosity.DEFAULT,
+        timings: bool = False,
     ) -> None:
         """Prints information about connections, models, macros, etc. to the console."""
         self.console.log_status_update(f"Models: {len(self.models)}")
         self.console.log_status_update(f"Macros: {len(self._macros) - len(macro.get_registry())}")
 
+        if timings:
+            self.console.log_status_update("")
+            self.console.log_status_update("Load timings:")
+            for phase, duration in self.load_timings.durations.items():
+                self.console.log_status_update(f"  {phase}: {duration:.3f}s")
+
         if skip_connection:
             return
 
@@ -2628,17 +2806,20 @@ class GenericContext(BaseContext, t.Generic[C]):
                 select_models, no_auto_upstream, snapshots.values()
             )
 
-        completion_status = scheduler.run(
-            environment,
-            start=start,
-            end=end,
-            execution_time=execution_time,
-            ignore_cron=ignore_cron,
-            circuit_breaker=circuit_breaker,
-            selected_snapshots=select_models,
-            auto_restatement_enabled=environment.lower() == c.PROD,
-            run_environment_statements=True,
-        )
+        try:
+            completion_status = scheduler.run(
+                environment,
+                start=start,
+                end=end,
+                execution_time=execution_time,
+                ignore_cron=ignore_cron,
+                circuit_breaker=circuit_breaker,
+                selected_snapshots=select_models,
+                auto_restatement_enabled=environment.lower() == c.PROD,
+                run_environment_statements=True,
+            )
+        finally:
+            self._persist_duration_estimates(scheduler.snapshot_evaluator)
 
         if completion_status.is_nothing_to_do:
             next_run_ready_msg = ""
@@ -2656,10 +2837,29 @@ class GenericContext(BaseContext, t.Generic[C]):
 
         return completion_status
 
+    @traced("apply")
     def _apply(self, plan: Plan, circuit_breaker: t.Optional[t.Callable[[], bool]]) -> None:
-        self._scheduler.create_plan_evaluator(self).evaluate(
-            plan.to_evaluatable(), circuit_breaker=circuit_breaker
-        )
+        try:
+            self._scheduler.create_plan_evaluator(self).evaluate(
+                plan.to_evaluatable(), circuit_breaker=circuit_breaker
+            )
+        finally:
+            if self._snapshot_evaluator:
+                self._persist_duration_estimates(self._snapshot_evaluator)
+
+    @cached_property
+    def _duration_estimates_cache(self) -> FileCache[t.Dict[str, float]]:
+        return FileCache(self.cache_dir, prefix="scheduler")
+
+    def _persist_duration_estimates(self, snapshot_evaluator: SnapshotEvaluator) -> None:
+        """Stores the snapshot evaluation duration estimates so that they can be used by subsequent runs."""
+        if not self.scheduling_policy.is_critical_path:
+            return
+        duration_estimates = snapshot_evaluator.execution_tracker.get_duration_estimates()
+        if duration_estimates:
+            self._duration_estimates_cache.put(
+                DURATION_ESTIMATES_CACHE_ENTRY, value=duration_estimates
+            )
 
     @python_api_analytics
     def table_name(
@@ -2713,6 +2913,9 @@ class GenericContext(BaseContext, t.Generic[C]):
             if path.exists():
                 rmtree(path)
 
+        reset_cache_dir(self.cache_dir)
+        self._fingerprint_index = FingerprintIndexCache(self.cache_dir)
+
         if isinstance(self._state_sync, CachingStateSync):
             self._state_sync.clear_cache()
 
@@ -2940,6 +3143,7 @@ class GenericContext(BaseContext, t.Generic[C]):
             raise SQLMeshError(f"Gateway '{gateway}' not found in the available engine adapters.")
         return self.engine_adapter
 
+    @traced("plan")
     def _snapshots(
         self, models_override: t.Optional[UniqueKeyDict[str, Model]] = None
     ) -> t.Dict[str, Snapshot]:
@@ -3022,6 +3226,7 @@ class GenericContext(BaseContext, t.Generic[C]):
         ignore_ttl: bool = False,
         force_delete: bool = False,
         environment: t.Optional[str] = None,
+        compact: bool = False,
     ) -> None:
         current_ts = now_timestamp()
         failures: t.List[str] = []
@@ -3045,7 +3250,14 @@ class GenericContext(BaseContext, t.Generic[C]):
                     batch_size=self.config.janitor.expired_snapshots_batch_size,
                 )
             )
-            self.state_sync.compact_intervals()
+
+        if environment is None or compact:
+            self.state_sync.compact_intervals(
+                batch_size=self.config.janitor.compaction_batch_size,
+                min_uncompacted_intervals=(
+                    None if compact else self.config.janitor.compaction_threshold
+                ),
+            )
 
         if failures:
             failure_string = "\n  - ".join(failures)
@@ -3075,6 +3287,7 @@ class GenericContext(BaseContext, t.Generic[C]):
                 f"Environment '{name}' is not expired or does not exist. Nothing to clean up."
             )
 
+        num_deleted = 0
         for expired_env_summary in expired_environments_summaries:
             expired_env = self.state_reader.get_environment(expired_env_summary.name)
 
@@ -3086,18 +3299,26 @@ class GenericContext(BaseContext, t.Generic[C]):
                     logger.warning(failure)
                     failures.append(failure)
                     continue
-                failures.extend(
-                    cleanup_expired_views(
-                        default_adapter=cleanup_default_adapter,
-                        engine_adapters=cleanup_engine_adapters,
-                        environments=[expired_env],
-                        console=self.console,
-                    )
+                env_failures = cleanup_expired_views(
+                    default_adapter=cleanup_default_adapter,
+                    engine_adapters=cleanup_engine_adapters,
+                    environments=[expired_env],
+                    console=self.console,
+                    concurrent_tasks=self.concurrent_tasks,
                 )
+                failures.extend(env_failures)
+                if not env_failures or force_delete:
+                    # Checkpoint each environment so that an interrupted run can resume
+                    self.state_sync.delete_expired_environments(
+                        current_ts=current_ts, name=expired_env.name
+                    )
+                    num_deleted += 1
 
         # we want to retry on the next janitor pass if drops failed, unless
         # force_delete is set in which case we purge state records regardless
-        if not failures or force_delete:
+        if (not failures or force_delete) and (
+            not expired_environments_summaries or num_deleted < len(expired_environments_summaries)
+        ):
             self.state_sync.delete_expired_environments(current_ts=current_ts, name=name)
         return failures
 
@@ -3228,10 +3449,28 @@ class GenericContext(BaseContext, t.Generic[C]):
         }
         return c.HYBRID if len(project_types) > 1 else first(project_types)
 
+    def _fingerprint_indexed_models(self) -> t.Set[str]:
+        fingerprint_index = self._fingerprint_index.get()
+        return {
+            fqn
+            for fqn, model in self._models.items()
+            if model._cache_entry_id is not None
+            and fqn in fingerprint_index
+            and fingerprint_index[fqn][0] == model._cache_entry_id
+        }
+
     def _nodes_to_snapshots(self, nodes: t.Dict[str, Node]) -> t.Dict[str, Snapshot]:
         snapshots: t.Dict[str, Snapshot] = {}
         fingerprint_cache: t.Dict[str, SnapshotFingerprint] = {}
 
+        # Only nodes that changed since the last run, or whose parents did, need to be hashed again
+        fingerprint_index = self._fingerprint_index.get()
+        for node in nodes.values():
+            fingerprint_from_node(
+                node, nodes=nodes, cache=fingerprint_cache, index=fingerprint_index
+            )
+        self._fingerprint_index.persist()
+
         for node in nodes.values():
             kwargs: t.Dict[str, t.Any] = {}
             if node.project in self._projects:
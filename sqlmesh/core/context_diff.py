@@ -23,6 +23,7 @@ from sqlmesh.core.model.common import sorted_python_env_payloads
 from sqlmesh.core.snapshot import Snapshot, SnapshotId, SnapshotTableInfo
 from sqlmesh.utils.errors import SQLMeshError
 from sqlmesh.utils.pydantic import PydanticModel
+from sqlmesh.utils.tracing import traced
 
 if sys.version_info >= (3, 12):
     from importlib import metadata
@@ -90,6 +91,7 @@ class ContextDiff(PydanticModel):
     """Whether the diff should compare raw vs rendered models"""
 
     @classmethod
+    @traced("plan")
     def create(
         cls,
         environment: str,
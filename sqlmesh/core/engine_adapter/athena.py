@@ -620,3 +620,16 @@ class AthenaEngineAdapter(PandasNativeFetchDFSupportMixin, RowDiffMixin):
 
     def get_current_catalog(self) -> t.Optional[str]:
         return self.connection.catalog_name
+
+    def hash_value(self, expr: exp.Expr) -> exp.Expr:
+        return exp.Anonymous(
+            this="FROM_BIG_ENDIAN_64",
+            expressions=[
+                exp.Anonymous(
+                    this="XXHASH64", expressions=[exp.Anonymous(this="TO_UTF8", expressions=[expr])]
+                )
+            ],
+        )
+
+    def checksum_aggregate(self, expr: exp.Expr) -> exp.Expr:
+        return exp.Anonymous(this="BITWISE_XOR_AGG", expressions=[expr])
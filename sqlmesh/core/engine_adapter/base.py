@@ -110,9 +110,11 @@ class EngineAdapter:
     SUPPORTS_CLONING = False
     SUPPORTS_MANAGED_MODELS = False
     SUPPORTS_CREATE_DROP_CATALOG = False
+    SUPPORTS_MULTI_OBJECT_DROP = False
     SUPPORTED_DROP_CASCADE_OBJECT_KINDS: t.List[str] = []
     SCHEMA_DIFFER_KWARGS: t.Dict[str, t.Any] = {}
     SUPPORTS_TUPLE_IN = True
+    SUPPORTS_WINDOW_FUNCTIONS = True
     HAS_VIEW_BINDING = False
     RECREATE_MATERIALIZED_VIEW_ON_EVALUATION = True
     SUPPORTS_REPLACE_TABLE = True
@@ -196,6 +198,11 @@ class EngineAdapter:
 
         return adapter
 
+    @property
+    def multithreaded(self) -> bool:
+        """Whether this adapter can be used by more than one thread."""
+        return self._multithreaded
+
     @property
     def cursor(self) -> t.Any:
         return self._connection_pool.get_cursor()
@@ -370,13 +377,12 @@ class EngineAdapter:
         # we need to ensure that the order of the columns in columns_to_types columns matches the order of the values
         # they can differ if a user specifies columns() on a python model in a different order than what's in the DataFrame's emitted by that model
         df = df[list(source_columns or target_columns_to_types)]
-        values = list(df.itertuples(index=False, name=None))
 
         return [
             SourceQuery(
                 query_factory=partial(
-                    self._values_to_sql,
-                    values=values,  # type: ignore
+                    self._df_batch_to_sql,
+                    df=df,
                     target_columns_to_types=target_columns_to_types,
                     batch_start=i,
                     batch_end=min(i + batch_size, num_rows),
@@ -386,6 +392,25 @@ class EngineAdapter:
             for i in range(0, num_rows, batch_size)
         ]
 
+    def _df_batch_to_sql(
+        self,
+        df: pd.DataFrame,
+        target_columns_to_types: t.Dict[str, exp.DataType],
+        batch_start: int,
+        batch_end: int,
+        source_columns: t.Optional[t.List[str]] = None,
+    ) -> Query:
+        # Rows are only converted into tuples for the batch that is being rendered, so that the whole
+        # DataFrame is never copied into Python objects at once
+        values = list(df.iloc[batch_start:batch_end].itertuples(index=False, name=None))
+        return self._values_to_sql(
+            values,
+            target_columns_to_types,
+            batch_start=0,
+            batch_end=len(values),
+            source_columns=source_columns,
+        )
+
     def _get_source_queries_and_columns_to_types(
         self,
         query_or_df: QueryOrDF,
@@ -1480,6 +1505,41 @@ class EngineAdapter:
             **kwargs,
         )
 
+    def drop_views(
+        self,
+        view_names: t.Collection[TableName],
+        ignore_if_not_exists: bool = True,
+        **kwargs: t.Any,
+    ) -> None:
+        """Drop multiple views, using a single statement if the engine supports it."""
+        tables = []
+        for view_name in view_names:
+            table = exp.to_table(view_name)
+            if not self.SUPPORTS_MULTI_OBJECT_DROP or (
+                not self.catalog_support.is_full_support
+                and table.catalog not in ("", self._default_catalog)
+            ):
+                # Let the single object drop handle or reject the catalog
+                self.drop_view(table, ignore_if_not_exists=ignore_if_not_exists, **kwargs)
+                continue
+            if not self.catalog_support.is_full_support:
+                table.set("catalog", None)
+            tables.append(table)
+
+        if len(tables) == 1:
+            self.drop_view(tables[0], ignore_if_not_exists=ignore_if_not_exists, **kwargs)
+        elif tables:
+            exists = " IF EXISTS" if ignore_if_not_exists else ""
+            names = ", ".join(table.sql(dialect=self.dialect, identify=True) for table in tables)
+            cascade = (
+                " CASCADE"
+                if kwargs.get("cascade") and "VIEW" in self.SUPPORTED_DROP_CASCADE_OBJECT_KINDS
+                else ""
+            )
+            self.execute(f"DROP VIEW{exists} {names}{cascade}")
+            for table in tables:
+                self._clear_data_object_cache(table)
+
     def create_catalog(self, catalog_name: str | exp.Identifier) -> None:
         return self._create_catalog(exp.parse_identifier(catalog_name, dialect=self.dialect))
 
@@ -2437,6 +2497,22 @@ class EngineAdapter:
             )
             return self.cursor.fetchall()
 
+    def fetch_batches(
+        self,
+        query: t.Union[exp.Expr, str],
+        batch_size: int,
+        quote_identifiers: bool = False,
+    ) -> t.Iterator[t.List[t.Tuple]]:
+        """Executes the query and yields its result rows in batches of at most `batch_size` rows.
+
+        Rows are pulled from the cursor one batch at a time, so no other queries can be executed
+        through this adapter until the returned iterator is exhausted or closed.
+        """
+        with self.transaction():
+            self.execute(query, quote_identifiers=quote_identifiers)
+            while rows := self.cursor.fetchmany(batch_size):
+                yield rows
+
     def _fetch_native_df(
         self, query: t.Union[exp.Expr, str], quote_identifiers: bool = False
     ) -> DF:
@@ -29,6 +29,7 @@ class BasePostgresEngineAdapter(EngineAdapter):
     COMMENT_CREATION_TABLE = CommentCreationTable.COMMENT_COMMAND_ONLY
     COMMENT_CREATION_VIEW = CommentCreationView.COMMENT_COMMAND_ONLY
     SUPPORTS_QUERY_EXECUTION_TRACKING = True
+    SUPPORTS_MULTI_OBJECT_DROP = True
     SUPPORTED_DROP_CASCADE_OBJECT_KINDS = ["SCHEMA", "TABLE", "VIEW"]
 
     def columns(
@@ -153,6 +154,19 @@ class BasePostgresEngineAdapter(EngineAdapter):
             **kwargs,
         )
 
+    def drop_views(
+        self,
+        view_names: t.Collection[TableName],
+        ignore_if_not_exists: bool = True,
+        **kwargs: t.Any,
+    ) -> None:
+        kwargs["cascade"] = kwargs.get("cascade", True)
+        return super().drop_views(
+            view_names,
+            ignore_if_not_exists=ignore_if_not_exists,
+            **kwargs,
+        )
+
     def _get_data_objects(
         self, schema_name: SchemaName, object_names: t.Optional[t.Set[str]] = None
     ) -> t.List[DataObject]:
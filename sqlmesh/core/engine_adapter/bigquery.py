@@ -3,6 +3,7 @@ from __future__ import annotations
 import logging
 import typing as t
 from collections import defaultdict
+from itertools import islice
 
 from sqlglot import exp, parse_one
 from sqlglot.transforms import remove_precision_parameterized_types
@@ -470,6 +471,17 @@ class BigQueryEngineAdapter(ClusteredByMixin, RowDiffMixin, GrantsFromInfoSchema
         )
         return list(self._query_data)
 
+    def fetch_batches(
+        self,
+        query: t.Union[exp.Expr, str],
+        batch_size: int,
+        quote_identifiers: bool = False,
+    ) -> t.Iterator[t.List[t.Tuple]]:
+        self.execute(query, quote_identifiers=quote_identifiers)
+        query_data = self._query_data
+        while rows := list(islice(query_data, batch_size)):
+            yield rows
+
     def _split_alter_expressions(
         self,
         alter_expressions: t.List[exp.Alter],
@@ -1267,6 +1279,9 @@ class BigQueryEngineAdapter(ClusteredByMixin, RowDiffMixin, GrantsFromInfoSchema
     def _normalize_nested_value(self, col: exp.Expr) -> exp.Expr:
         return exp.func("TO_JSON_STRING", col, dialect=self.dialect)
 
+    def hash_value(self, expr: exp.Expr) -> exp.Expr:
+        return exp.Anonymous(this="FARM_FINGERPRINT", expressions=[expr])
+
     @t.overload
     def _columns_to_types(
         self,
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import typing as t
+from itertools import islice
 import logging
 import re
 from sqlglot import exp, maybe_parse
@@ -93,6 +94,21 @@ class ClickhouseEngineAdapter(EngineAdapterWithIndexSupport, LogicalMergeMixin):
             )
             return self.cursor.fetchall()[0]
 
+    def fetch_batches(
+        self,
+        query: t.Union[exp.Expr, str],
+        batch_size: int,
+        quote_identifiers: bool = False,
+    ) -> t.Iterator[t.List[t.Tuple]]:
+        # `fetchmany()` is affected by the same cursor bug, so the rows are streamed from the
+        # client in blocks instead and regrouped into batches
+        with self.cursor.client.query_row_block_stream(
+            self._to_sql(query, quote=quote_identifiers) if isinstance(query, exp.Expr) else query
+        ) as stream:
+            rows = (tuple(row) for block in stream for row in block)
+            while batch := list(islice(rows, batch_size)):
+                yield batch
+
     def _fetch_native_df(
         self, query: t.Union[exp.Expr, str], quote_identifiers: bool = False
     ) -> pd.DataFrame:
@@ -160,6 +160,9 @@ class DuckDBEngineAdapter(LogicalMergeMixin, GetCurrentCatalogFromFunctionMixin,
             f"DECIMAL(38, {precision})",
         )
 
+    def hash_value(self, expr: exp.Expr) -> exp.Expr:
+        return exp.Anonymous(this="HASH", expressions=[expr])
+
     def _create_table(
         self,
         table_name_or_schema: t.Union[exp.Schema, TableName],
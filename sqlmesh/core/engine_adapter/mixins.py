@@ -10,18 +10,22 @@ from sqlglot.helper import seq_get
 from sqlglot.optimizer.normalize_identifiers import normalize_identifiers
 
 from sqlmesh.core.engine_adapter.base import EngineAdapter
-from sqlmesh.core.engine_adapter.shared import DataObjectType
+from sqlmesh.core.engine_adapter.shared import DataObjectType, SourceQuery
 from sqlmesh.core.node import IntervalUnit
 from sqlmesh.core.dialect import schema_
 from sqlmesh.core.schema_diff import TableAlterOperation
+from sqlmesh.utils import get_source_columns_to_types
 from sqlmesh.utils.errors import SQLMeshError
 
 if t.TYPE_CHECKING:
+    import pandas as pd
+
     from sqlmesh.core._typing import TableName
     from sqlmesh.core.engine_adapter._typing import (
         DCL,
         DF,
         GrantsConfig,
+        Query,
         QueryOrDF,
     )
     from sqlmesh.core.engine_adapter.base import QueryOrDF
@@ -77,6 +81,83 @@ class PandasNativeFetchDFSupportMixin(EngineAdapter):
         return df
 
 
+class BulkLoadMixin(EngineAdapter):
+    """Loads DataFrames that don't fit into a single VALUES batch with the engine's native loader.
+
+    The DataFrame is loaded into a temp table with `_bulk_load_df` and the target is populated from
+    that temp table.
+    """
+
+    @property
+    def supports_bulk_load(self) -> bool:
+        """Whether the current connection can be used to bulk load DataFrames."""
+        return True
+
+    def _can_bulk_load_df(
+        self, df: pd.DataFrame, columns_to_types: t.Dict[str, exp.DataType]
+    ) -> bool:
+        """Whether the DataFrame with columns of the given types can be loaded with `_bulk_load_df`."""
+        return True
+
+    @abc.abstractmethod
+    def _bulk_load_df(
+        self,
+        table: exp.Table,
+        df: pd.DataFrame,
+        columns_to_types: t.Dict[str, exp.DataType],
+    ) -> None:
+        """Loads the DataFrame into an existing table using the engine's native bulk loading facility.
+
+        The DataFrame's columns are in the same order as `columns_to_types`.
+        """
+
+    def _df_to_source_queries(
+        self,
+        df: DF,
+        target_columns_to_types: t.Dict[str, exp.DataType],
+        batch_size: int,
+        target_table: TableName,
+        source_columns: t.Optional[t.List[str]] = None,
+    ) -> t.List[SourceQuery]:
+        import pandas as pd
+
+        assert isinstance(df, pd.DataFrame)
+        source_columns_to_types = get_source_columns_to_types(
+            target_columns_to_types, source_columns
+        )
+        if (
+            batch_size == 0
+            or len(df.index) <= batch_size
+            or not self.supports_bulk_load
+            or not self._can_bulk_load_df(df, source_columns_to_types)
+        ):
+            return super()._df_to_source_queries(
+                df, target_columns_to_types, batch_size, target_table, source_columns=source_columns
+            )
+
+        # reorder DataFrame so it matches columns_to_types
+        ordered_df = df[list(source_columns_to_types)]
+        temp_table = self._get_temp_table(target_table or "pandas")
+
+        def query_factory() -> Query:
+            # It is possible for the factory to be called multiple times and if so then the temp table will already
+            # be created so we skip creating again. This means we are assuming the first call is the same result
+            # as later calls.
+            if not self.table_exists(temp_table):
+                self.create_table(temp_table, source_columns_to_types)
+                self._bulk_load_df(temp_table, ordered_df, source_columns_to_types)
+            return exp.select(
+                *self._casted_columns(target_columns_to_types, source_columns=source_columns)
+            ).from_(temp_table)
+
+        return [
+            SourceQuery(
+                query_factory=query_factory,
+                cleanup_func=lambda: self.drop_table(temp_table),
+            )
+        ]
+
+
 class HiveMetastoreTablePropertiesMixin(EngineAdapter):
     MAX_TABLE_COMMENT_LENGTH = 4000
     MAX_COLUMN_COMMENT_LENGTH = 4000
@@ -553,6 +634,21 @@ class RowDiffMixin(EngineAdapter):
     def _normalize_boolean_value(self, expr: exp.Expr) -> exp.Expr:
         return exp.cast(expr, "INT")
 
+    def hash_value(self, expr: exp.Expr) -> exp.Expr:
+        """
+        Return an expression that hashes the string expression `expr` into a 64-bit integer.
+
+        Together with `checksum_aggregate` this is used to compare segments of tables without joining them.
+        """
+        raise SQLMeshError(f"Engine '{self.dialect}' doesn't support hash-based table diffs")
+
+    def checksum_aggregate(self, expr: exp.Expr) -> exp.Expr:
+        """
+        Return an aggregate expression that combines the hashes produced by `hash_value` into a single
+        value which doesn't depend on the order of rows.
+        """
+        return exp.func("BIT_XOR", expr)
+
 
 class GrantsFromInfoSchemaMixin(EngineAdapter):
     CURRENT_USER_OR_ROLE_EXPRESSION: exp.Expr = exp.func("current_user")
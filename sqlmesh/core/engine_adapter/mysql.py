@@ -38,8 +38,11 @@ class MySQLEngineAdapter(
     MAX_TABLE_COMMENT_LENGTH = 2048
     MAX_COLUMN_COMMENT_LENGTH = 1024
     SUPPORTS_REPLACE_TABLE = False
+    # Window functions are not available before MySQL 8.0
+    SUPPORTS_WINDOW_FUNCTIONS = False
     MAX_IDENTIFIER_LENGTH = 64
     SUPPORTS_QUERY_EXECUTION_TRACKING = True
+    SUPPORTS_MULTI_OBJECT_DROP = True
     SCHEMA_DIFFER_KWARGS = {
         "parameterized_type_defaults": {
             exp.DataType.build("BIT", dialect=DIALECT).this: [(1,)],
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import io
 import logging
 import re
 import typing as t
@@ -8,6 +9,7 @@ from sqlglot import exp
 
 from sqlmesh.core.engine_adapter.base_postgres import BasePostgresEngineAdapter
 from sqlmesh.core.engine_adapter.mixins import (
+    BulkLoadMixin,
     GetCurrentCatalogFromFunctionMixin,
     PandasNativeFetchDFSupportMixin,
     RowDiffMixin,
@@ -17,11 +19,25 @@ from sqlmesh.core.engine_adapter.mixins import (
 from sqlmesh.core.engine_adapter.shared import set_catalog
 
 if t.TYPE_CHECKING:
+    import pandas as pd
+
     from sqlmesh.core._typing import TableName
     from sqlmesh.core.engine_adapter._typing import DF, QueryOrDF
 
 logger = logging.getLogger(__name__)
 
+# Types whose values are loaded as is by COPY. Values of other types, such as arrays, JSON documents
+# or binary strings, are rendered differently by pandas than what COPY expects.
+COPY_SCALAR_TYPES = {
+    *exp.DataType.TEXT_TYPES,
+    *exp.DataType.NUMERIC_TYPES,
+    *exp.DataType.TEMPORAL_TYPES,
+    exp.DataType.Type.BOOLEAN,
+    exp.DataType.Type.UUID,
+}
+# Escape sequences of the text format of COPY, backslashes must be escaped first
+COPY_TEXT_ESCAPES = (("\\", "\\\\"), ("\t", "\\t"), ("\n", "\\n"), ("\r", "\\r"))
+
 
 @set_catalog()
 class PostgresEngineAdapter(
@@ -30,6 +46,7 @@ class PostgresEngineAdapter(
     GetCurrentCatalogFromFunctionMixin,
     RowDiffMixin,
     GrantsFromInfoSchemaMixin,
+    BulkLoadMixin,
 ):
     DIALECT = "postgres"
     SUPPORTS_GRANTS = True
@@ -71,6 +88,23 @@ class PostgresEngineAdapter(
         },
         "drop_cascade": True,
     }
+    BULK_LOAD_CHUNK_SIZE = 100_000
+
+    @property
+    def supports_bulk_load(self) -> bool:
+        # COPY FROM STDIN is only exposed by psycopg2, other drivers (eg. pg8000) fall back to VALUES
+        return hasattr(self.cursor, "copy_expert")
+
+    def _can_bulk_load_df(
+        self, df: pd.DataFrame, columns_to_types: t.Dict[str, exp.DataType]
+    ) -> bool:
+        return all(
+            column_type.is_type(*COPY_SCALAR_TYPES) for column_type in columns_to_types.values()
+        ) and all(
+            _to_copy_integers(series) is not None
+            for column, series in df.items()
+            if _is_float_in_integral_column(series, columns_to_types.get(str(column)))
+        )
 
     def _fetch_native_df(
         self, query: t.Union[exp.Expr, str], quote_identifiers: bool = False
@@ -85,6 +119,29 @@ class PostgresEngineAdapter(
             self._connection_pool.commit()
         return df
 
+    def _bulk_load_df(
+        self,
+        table: exp.Table,
+        df: pd.DataFrame,
+        columns_to_types: t.Dict[str, exp.DataType],
+    ) -> None:
+        columns = ", ".join(
+            exp.to_identifier(column, quoted=True).sql(dialect=self.dialect)
+            for column in columns_to_types
+        )
+        copy_sql = (
+            f"COPY {table.sql(dialect=self.dialect, identify=True)} ({columns}) "
+            "FROM STDIN WITH (FORMAT text, NULL '\\N')"
+        )
+        # The DataFrame is serialized one chunk at a time to bound the size of the buffer
+        for start in range(0, len(df.index), self.BULK_LOAD_CHUNK_SIZE):
+            buffer = io.StringIO(
+                _df_to_copy_text(
+                    df.iloc[start : start + self.BULK_LOAD_CHUNK_SIZE], columns_to_types
+                )
+            )
+            self.cursor.copy_expert(copy_sql, buffer)
+
     def _create_table_like(
         self,
         target_table_name: TableName,
@@ -141,3 +198,62 @@ class PostgresEngineAdapter(
             if match:
                 return int(match.group(1)), int(match.group(2))
         return 0, 0
+
+    def hash_value(self, expr: exp.Expr) -> exp.Expr:
+        return exp.Anonymous(this="HASHTEXTEXTENDED", expressions=[expr, exp.Literal.number(0)])
+
+
+def _df_to_copy_text(df: pd.DataFrame, columns_to_types: t.Dict[str, exp.DataType]) -> str:
+    """Serializes the DataFrame in the text format of COPY.
+
+    Backslashes and control characters of string values are escaped, so that no value can be
+    mistaken for the `\\N` NULL marker or a column or row delimiter. Integral columns which pandas
+    stores as floats, because they contain NULLs, are written without the decimal part. Booleans
+    are written as 1 and 0 into integral columns, like `CAST(TRUE AS INT)` would.
+    """
+    import pandas as pd
+
+    columns = []
+    for column, series in df.items():
+        column_type = columns_to_types.get(str(column))
+        integers = (
+            _to_copy_integers(series) if _is_float_in_integral_column(series, column_type) else None
+        )
+        if integers is not None:
+            series = integers
+        if pd.api.types.infer_dtype(series, skipna=True) == "boolean":
+            is_integral = column_type is not None and column_type.is_type(
+                *exp.DataType.INTEGER_TYPES
+            )
+            values = series.map(
+                {True: "1", False: "0"} if is_integral else {True: "true", False: "false"}
+            )
+        else:
+            values = series.astype(str)
+        if pd.api.types.is_object_dtype(series) or pd.api.types.is_string_dtype(series):
+            for char, escaped in COPY_TEXT_ESCAPES:
+                values = values.str.replace(char, escaped, regex=False)
+        columns.append(values.mask(series.isna(), "\\N"))
+
+    rows = columns[0]
+    if len(columns) > 1:
+        rows = rows.str.cat(pd.concat(columns[1:], axis=1), sep="\t")
+    return "\n".join(rows) + "\n"
+
+
+def _is_float_in_integral_column(series: pd.Series, column_type: t.Optional[exp.DataType]) -> bool:
+    import pandas as pd
+
+    return (
+        column_type is not None
+        and column_type.is_type(*exp.DataType.INTEGER_TYPES)
+        and pd.api.types.is_float_dtype(series)
+    )
+
+
+def _to_copy_integers(series: pd.Series) -> t.Optional[pd.Series]:
+    """Converts floats to nullable integers, or returns None if some values aren't whole numbers."""
+    try:
+        return series.astype("Int64")
+    except (TypeError, ValueError, OverflowError):
+        return None
@@ -34,6 +34,10 @@ class RisingwaveEngineAdapter(PostgresEngineAdapter):
     MAX_IDENTIFIER_LENGTH = None
     SUPPORTS_GRANTS = False
 
+    @property
+    def supports_bulk_load(self) -> bool:
+        return False
+
     def columns(
         self, table_name: TableName, include_pseudo_columns: bool = False
     ) -> t.Dict[str, exp.DataType]:
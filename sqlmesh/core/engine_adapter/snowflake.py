@@ -736,3 +736,9 @@ class SnowflakeEngineAdapter(
 
         result = self.fetchall(query)
         return [to_timestamp(row[0]) for row in result]
+
+    def hash_value(self, expr: exp.Expr) -> exp.Expr:
+        return exp.Anonymous(this="HASH", expressions=[expr])
+
+    def checksum_aggregate(self, expr: exp.Expr) -> exp.Expr:
+        return exp.Anonymous(this="BITXOR_AGG", expressions=[expr])
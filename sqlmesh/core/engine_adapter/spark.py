@@ -556,3 +556,6 @@ class SparkEngineAdapter(
     @classmethod
     def _wap_branch_name(cls, wap_id: str) -> str:
         return f"{cls.WAP_PREFIX}{wap_id}"
+
+    def hash_value(self, expr: exp.Expr) -> exp.Expr:
+        return exp.Anonymous(this="XXHASH64", expressions=[expr])
@@ -477,3 +477,16 @@ class TrinoEngineAdapter(
                         "@{catalog_name}", schema.catalog
                     )
         return None
+
+    def hash_value(self, expr: exp.Expr) -> exp.Expr:
+        return exp.Anonymous(
+            this="FROM_BIG_ENDIAN_64",
+            expressions=[
+                exp.Anonymous(
+                    this="XXHASH64", expressions=[exp.Anonymous(this="TO_UTF8", expressions=[expr])]
+                )
+            ],
+        )
+
+    def checksum_aggregate(self, expr: exp.Expr) -> exp.Expr:
+        return exp.Anonymous(this="BITWISE_XOR_AGG", expressions=[expr])
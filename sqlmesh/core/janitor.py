@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+import time
 import typing as t
+from collections import defaultdict
 
 from sqlglot import exp
 
@@ -16,6 +18,12 @@ from sqlmesh.core.state_sync.common import (
     RowBoundary,
     ExpiredBatchRange,
 )
+from sqlmesh.utils.concurrency import concurrent_apply_to_values
+
+T = t.TypeVar("T")
+
+MAX_VIEWS_PER_DROP = 100
+"""The maximum number of views dropped by a single statement on engines that support it."""
 
 
 def cleanup_expired_views(
@@ -23,9 +31,23 @@ def cleanup_expired_views(
     engine_adapters: t.Dict[str, EngineAdapter],
     environments: t.List[Environment],
     console: t.Optional[Console] = None,
+    concurrent_tasks: int = 1,
 ) -> t.List[str]:
-    failures: t.List[str] = []
+    """Drops the views, schemas and catalogs of the expired environments.
+
+    The objects of each engine adapter are dropped by a separate pool of up to `concurrent_tasks`
+    threads, and views are grouped into a single statement on engines that support it.
 
+    Args:
+        default_adapter: The adapter to use for the environments that aren't gateway managed.
+        engine_adapters: The adapters of the gateway managed environments by gateway name.
+        environments: The expired environments.
+        console: Optional console for reporting progress.
+        concurrent_tasks: The number of concurrent drops per engine adapter.
+
+    Returns:
+        List of failure messages so callers can surface them at the end of the janitor run.
+    """
     expired_schema_or_catalog_environments = [
         environment
         for environment in environments
@@ -41,8 +63,9 @@ def cleanup_expired_views(
             return engine_adapters.get(gateway, default_adapter)
         return default_adapter
 
-    catalogs_to_drop: t.Set[t.Tuple[EngineAdapter, str]] = set()
-    schemas_to_drop: t.Set[t.Tuple[EngineAdapter, exp.Table]] = set()
+    catalogs_to_drop: t.Dict[EngineAdapter, t.Set[str]] = defaultdict(set)
+    schemas_to_drop: t.Dict[EngineAdapter, t.Set[exp.Table]] = defaultdict(set)
+    views_to_drop: t.Dict[EngineAdapter, t.Set[str]] = defaultdict(set)
 
     # Collect schemas and catalogs to drop
     for engine_adapter, expired_catalog, expired_schema, suffix_target in {
@@ -62,63 +85,156 @@ def cleanup_expired_views(
     }:
         if suffix_target.is_catalog:
             if expired_catalog:
-                catalogs_to_drop.add((engine_adapter, expired_catalog))
+                catalogs_to_drop[engine_adapter].add(expired_catalog)
         else:
             schema = schema_(expired_schema, expired_catalog)
-            schemas_to_drop.add((engine_adapter, schema))
+            schemas_to_drop[engine_adapter].add(schema)
 
-    # Drop the views for the expired environments
-    for engine_adapter, expired_view in {
-        (
-            (engine_adapter := get_adapter(environment.gateway_managed, snapshot.model_gateway)),
-            snapshot.qualified_view_name.for_environment(
-                environment.naming_info, dialect=engine_adapter.dialect
-            ),
-        )
-        for environment in expired_table_environments
-        for snapshot in environment.snapshots
-        if snapshot.is_model and not snapshot.is_symbolic
-    }:
-        try:
-            engine_adapter.drop_view(expired_view, ignore_if_not_exists=True)
-            if console:
-                console.update_cleanup_progress(expired_view)
-        except Exception as e:
-            message = f"Failed to drop the expired environment view '{expired_view}': {e}"
-            logger.warning(message)
-            failures.append(message)
+    # Collect the views of the expired environments
+    for environment in expired_table_environments:
+        for snapshot in environment.snapshots:
+            if snapshot.is_model and not snapshot.is_symbolic:
+                engine_adapter = get_adapter(environment.gateway_managed, snapshot.model_gateway)
+                views_to_drop[engine_adapter].add(
+                    snapshot.qualified_view_name.for_environment(
+                        environment.naming_info, dialect=engine_adapter.dialect
+                    )
+                )
 
-    # Drop the schemas for the expired environments
-    for engine_adapter, schema in schemas_to_drop:
+    dropped: t.List[str] = []
+    failures: t.List[str] = []
+
+    def on_dropped(object_name: str) -> None:
+        dropped.append(object_name)
+        if console:
+            console.update_cleanup_progress(object_name)
+
+    def drop_views(engine_adapter: EngineAdapter, view_names: t.List[str]) -> None:
+        if len(view_names) > 1:
+            try:
+                engine_adapter.drop_views(view_names, ignore_if_not_exists=True)
+            except Exception as e:
+                # Drop the views one by one to find out which ones failed
+                logger.info("Failed to drop %s views at once: %s", len(view_names), e)
+            else:
+                for view_name in view_names:
+                    on_dropped(view_name)
+                return
+
+        for view_name in view_names:
+            try:
+                engine_adapter.drop_view(view_name, ignore_if_not_exists=True)
+                on_dropped(view_name)
+            except Exception as e:
+                message = f"Failed to drop the expired environment view '{view_name}': {e}"
+                logger.warning(message)
+                failures.append(message)
+
+    def drop_schema(engine_adapter: EngineAdapter, schema: exp.Table) -> None:
         try:
             engine_adapter.drop_schema(
                 schema,
                 ignore_if_not_exists=True,
                 cascade=True,
             )
-            if console:
-                console.update_cleanup_progress(schema.sql(dialect=engine_adapter.dialect))
+            on_dropped(schema.sql(dialect=engine_adapter.dialect))
         except Exception as e:
             message = f"Failed to drop the expired environment schema '{schema}': {e}"
             logger.warning(message)
             failures.append(message)
 
+    def drop_catalog(engine_adapter: EngineAdapter, catalog: str) -> None:
+        try:
+            engine_adapter.drop_catalog(catalog)
+            on_dropped(catalog)
+        except Exception as e:
+            message = f"Failed to drop the expired environment catalog '{catalog}': {e}"
+            logger.warning(message)
+            failures.append(message)
+
+    start = time.perf_counter()
+
+    # Drop the views for the expired environments
+    _apply_per_adapter(
+        {
+            engine_adapter: _view_groups(engine_adapter, sorted(view_names))
+            for engine_adapter, view_names in views_to_drop.items()
+        },
+        drop_views,
+        concurrent_tasks,
+    )
+
+    # Drop the schemas for the expired environments
+    _apply_per_adapter(
+        {
+            engine_adapter: sorted(schemas, key=lambda schema: schema.sql())
+            for engine_adapter, schemas in schemas_to_drop.items()
+        },
+        drop_schema,
+        concurrent_tasks,
+    )
+
     # Drop any catalogs that were associated with a snapshot where the engine adapter supports dropping catalogs
     # catalogs_to_drop is only populated when environment_suffix_target is set to 'catalog'
-    for engine_adapter, catalog in catalogs_to_drop:
-        if engine_adapter.SUPPORTS_CREATE_DROP_CATALOG:
-            try:
-                engine_adapter.drop_catalog(catalog)
-                if console:
-                    console.update_cleanup_progress(catalog)
-            except Exception as e:
-                message = f"Failed to drop the expired environment catalog '{catalog}': {e}"
-                logger.warning(message)
-                failures.append(message)
+    _apply_per_adapter(
+        {
+            engine_adapter: sorted(catalogs)
+            for engine_adapter, catalogs in catalogs_to_drop.items()
+            if engine_adapter.SUPPORTS_CREATE_DROP_CATALOG
+        },
+        drop_catalog,
+        concurrent_tasks,
+    )
 
+    _log_drop_rate("expired environment objects", len(dropped), time.perf_counter() - start)
     return failures
 
 
+def _view_groups(engine_adapter: EngineAdapter, view_names: t.List[str]) -> t.List[t.List[str]]:
+    if engine_adapter.SUPPORTS_MULTI_OBJECT_DROP:
+        return [
+            view_names[i : i + MAX_VIEWS_PER_DROP]
+            for i in range(0, len(view_names), MAX_VIEWS_PER_DROP)
+        ]
+    return [[view_name] for view_name in view_names]
+
+
+def _apply_per_adapter(
+    tasks: t.Dict[EngineAdapter, t.List[T]],
+    fn: t.Callable[[EngineAdapter, T], None],
+    concurrent_tasks: int,
+) -> None:
+    """Applies the function to the tasks of each engine adapter.
+
+    The tasks of different adapters are processed at the same time, each by a separate pool of up
+    to `concurrent_tasks` threads. Adapters that can't be used by multiple threads process their
+    tasks one at a time.
+    """
+
+    def apply(engine_adapter: EngineAdapter) -> None:
+        tasks_num = concurrent_tasks if engine_adapter.multithreaded else 1
+        try:
+            concurrent_apply_to_values(
+                tasks[engine_adapter], lambda task: fn(engine_adapter, task), tasks_num
+            )
+        finally:
+            if tasks_num > 1:
+                engine_adapter.recycle()
+
+    if tasks:
+        concurrent_apply_to_values(list(tasks), apply, len(tasks) if concurrent_tasks > 1 else 1)
+
+
+def _log_drop_rate(object_kind: str, num_dropped: int, elapsed: float) -> None:
+    logger.info(
+        "Dropped %s %s in %.2fs (%.1f drops/s)",
+        num_dropped,
+        object_kind,
+        elapsed,
+        num_dropped / elapsed if elapsed > 0 else 0.0,
+    )
+
+
 def delete_expired_snapshots(
     state_sync: StateSync,
     snapshot_evaluator: SnapshotEvaluator,
@@ -147,7 +263,15 @@ def delete_expired_snapshots(
         List of failure messages so callers can surface them at the end of the janitor run.
     """
     failures: t.List[str] = []
+    dropped: t.List[str] = []
     num_expired_snapshots = 0
+
+    def on_dropped(object_name: str) -> None:
+        dropped.append(object_name)
+        if console:
+            console.update_cleanup_progress(object_name)
+
+    start = time.perf_counter()
     for batch in iter_expired_snapshot_batches(
         state_reader=state_sync,
         current_ts=current_ts,
@@ -168,7 +292,7 @@ def delete_expired_snapshots(
         try:
             snapshot_evaluator.cleanup(
                 target_snapshots=batch.cleanup_tasks,
-                on_complete=console.update_cleanup_progress if console else None,
+                on_complete=on_dropped,
             )
         except Exception as failed_drops:
             message = f"Failed to clean up: {failed_drops}"
@@ -192,4 +316,5 @@ def delete_expired_snapshots(
                 logger.warning(message)
                 failures.append(message)
     logger.info("Cleaned up %s expired snapshots", num_expired_snapshots)
+    _log_drop_rate("expired snapshot tables", len(dropped), time.perf_counter() - start)
     return failures
@@ -6,8 +6,10 @@ import itertools
 import linecache
 import os
 import re
+import time
 import typing as t
 from collections import Counter, defaultdict
+from contextlib import contextmanager
 from dataclasses import dataclass
 from pathlib import Path
 from pydantic import ValidationError
@@ -37,11 +39,13 @@ from sqlmesh.core.model.common import make_python_env
 from sqlmesh.core.signal import signal
 from sqlmesh.core.test import ModelTestMetadata
 from sqlmesh.utils import UniqueKeyDict, sys_path
+from sqlmesh.utils.concurrency import concurrent_apply_to_values
 from sqlmesh.utils.errors import ConfigError
 from sqlmesh.utils.jinja import JinjaMacroRegistry, MacroExtractor
 from sqlmesh.utils.metaprogramming import import_python_file
 from sqlmesh.utils.pydantic import validation_error_message
 from sqlmesh.utils.process import create_process_pool_executor
+from sqlmesh.utils.tracing import span
 from sqlmesh.utils.yaml import YAML, load as yaml_load
 
 
@@ -67,6 +71,35 @@ class LoadedProject:
     model_test_metadata: t.List[ModelTestMetadata]
 
 
+class LoadTimings:
+    """Accumulates the wall time spent in each phase of loading a project.
+
+    The phases are reported in the order in which they were first measured.
+    """
+
+    def __init__(self) -> None:
+        self.durations: t.Dict[str, float] = {}
+
+    @contextmanager
+    def measure(self, phase: str) -> t.Iterator[None]:
+        start = time.perf_counter()
+        try:
+            with span(phase, "load"):
+                yield
+        finally:
+            self.add(phase, time.perf_counter() - start)
+
+    def add(self, phase: str, duration: float) -> None:
+        self.durations[phase] = self.durations.get(phase, 0.0) + duration
+
+    def merge(self, other: LoadTimings) -> None:
+        for phase, duration in other.durations.items():
+            self.add(phase, duration)
+
+    def clear(self) -> None:
+        self.durations.clear()
+
+
 class CacheBase(abc.ABC):
     @abc.abstractmethod
     def get_or_load_models(
@@ -101,6 +134,17 @@ class CacheBase(abc.ABC):
         """
         pass
 
+    def get_many(self, paths: t.Sequence[Path]) -> t.List[t.List[Model]]:
+        """Retrieve models from the cache for each of the given paths.
+
+        Args:
+            paths: File paths to look up in the cache
+
+        Returns:
+            Lists of cached models in the same order as the paths
+        """
+        return [self.get(path) for path in paths]
+
 
 _defaults: t.Optional[t.Dict[str, t.Any]] = None
 _cache: t.Optional[CacheBase] = None
@@ -175,11 +219,21 @@ class Loader(abc.ABC):
         from sqlmesh.core.console import get_console
 
         self._path_mtimes: t.Dict[Path, float] = {}
+        self.timings = LoadTimings()
         self.context = context
         self.config_path = path
         self.config = self.context.configs[self.config_path]
         self._variables_by_gateway: t.Dict[str, t.Dict[str, t.Any]] = {}
         self._console = get_console()
+        # The definitions the models were loaded with, which are reused when reloading SQL models
+        self._model_definitions: t.Optional[
+            t.Tuple[
+                MacroRegistry,
+                JinjaMacroRegistry,
+                UniqueKeyDict[str, ModelAudit],
+                UniqueKeyDict[str, signal],
+            ]
+        ] = None
 
         self.config_essentials = {
             "project": self.config.project,
@@ -200,6 +254,8 @@ class Loader(abc.ABC):
             # need to manually clear here so we can reload macros
             linecache.clearcache()
             self._path_mtimes.clear()
+            self._model_definitions = None
+            self.timings.clear()
 
             self._load_materializations()
             signals = self._load_signals()
@@ -235,6 +291,7 @@ class Loader(abc.ABC):
                 audits,
                 signals,
             )
+            self._model_definitions = (macros, jinja_macros, audits, signals)
 
             metrics = self._load_metrics()
 
@@ -274,6 +331,21 @@ class Loader(abc.ABC):
             for path, initial_mtime in self._path_mtimes.copy().items()
         )
 
+    def reload_sql_models(
+        self, paths: t.Collection[Path]
+    ) -> t.Optional[t.Dict[Path, t.List[Model]]]:
+        """
+        Re-parses the given SQL model files of a project that has already been loaded.
+
+        Args:
+            paths: The SQL model files that were modified or deleted since the last load.
+
+        Returns:
+            The enabled models defined in each of the given files or None if the whole project needs
+            to be loaded instead, eg. because a macro, a config or a new file was added or modified.
+        """
+        return None
+
     @abc.abstractmethod
     def _load_scripts(self) -> t.Tuple[MacroRegistry, JinjaMacroRegistry]:
         """Loads all user defined macros."""
@@ -542,7 +614,8 @@ class SqlMeshLoader(Loader):
 
         sql_models = self._load_sql_models(macros, jinja_macros, audits, signals, cache, gateway)
         external_models = self._load_external_models(audits, cache, gateway)
-        python_models = self._load_python_models(macros, jinja_macros, audits, signals)
+        with self.timings.measure("parse"):
+            python_models = self._load_python_models(macros, jinja_macros, audits, signals)
 
         all_model_names = list(sql_models) + list(external_models) + list(python_models)
         duplicates = [name for name, count in Counter(all_model_names).items() if count > 1]
@@ -562,59 +635,53 @@ class SqlMeshLoader(Loader):
     ) -> UniqueKeyDict[str, Model]:
         """Loads the sql models into a Dict"""
         models: UniqueKeyDict[str, Model] = UniqueKeyDict("models")
-        paths: t.Set[Path] = set()
-        cached_paths: UniqueKeyDict[Path, t.List[Model]] = UniqueKeyDict("cached_paths")
+        paths: t.List[Path] = []
+
+        with self.timings.measure("glob"):
+            globbed_paths = list(
+                self._glob_paths(
+                    self.config_path / c.MODELS,
+                    ignore_patterns=self.config.ignore_patterns,
+                    extension=".sql",
+                )
+            )
 
-        for path in self._glob_paths(
-            self.config_path / c.MODELS,
-            ignore_patterns=self.config.ignore_patterns,
-            extension=".sql",
-        ):
-            if not os.path.getsize(path):
-                continue
+        with self.timings.measure("stat"):
+            for path in globbed_paths:
+                if not os.path.getsize(path):
+                    continue
 
-            self._track_file(path)
-            paths.add(path)
-            if cached_models := cache.get(path):
-                cached_paths[path] = cached_models
+                self._track_file(path)
+                paths.append(path)
 
-        for path, cached_models in cached_paths.items():
-            paths.remove(path)
+        with self.timings.measure("cache read"):
+            cached_models_per_path = cache.get_many(paths)
+
+        uncached_paths = []
+        for path, cached_models in zip(paths, cached_models_per_path):
+            if not cached_models:
+                uncached_paths.append(path)
+                continue
             for model in cached_models:
                 if model.enabled:
                     models[model.fqn] = model
 
-        if paths:
-            model_loading_defaults = dict(
-                get_variables=get_variables,
-                defaults=self.config.model_defaults.dict(),
-                macros=macros,
-                jinja_macros=jinja_macros,
-                audit_definitions=audits,
-                module_path=self.config_path,
-                dialect=self.config.model_defaults.dialect,
-                time_column_format=self.config.time_column_format,
-                physical_schema_mapping=self.config.physical_schema_mapping,
-                project=self.config.project,
-                default_catalog=self.context.default_catalog,
-                infer_names=self.config.model_naming.infer_names,
-                signal_definitions=signals,
-                default_catalog_per_gateway=self.context.default_catalog_per_gateway,
-                virtual_environment_mode=self.config.virtual_environment_mode,
-            )
-
+        if uncached_paths:
+            parse_start = time.perf_counter()
             with create_process_pool_executor(
                 initializer=_init_model_defaults,
                 initargs=(
                     self.config_essentials,
                     gateway,
-                    model_loading_defaults,
+                    self._model_loading_defaults(macros, jinja_macros, audits, signals),
                     cache,
                     self._console,
                 ),
                 max_workers=c.MAX_FORK_WORKERS,
             ) as pool:
-                futures_to_paths = {pool.submit(load_sql_models, path): path for path in paths}
+                futures_to_paths = {
+                    pool.submit(load_sql_models, path): path for path in uncached_paths
+                }
                 for future in concurrent.futures.as_completed(futures_to_paths):
                     path = futures_to_paths[future]
                     try:
@@ -632,9 +699,87 @@ class SqlMeshLoader(Loader):
                                 models[model.fqn] = model
                     except Exception as ex:
                         raise ConfigError(self._failed_to_load_model_error(path, ex), path)
+            self.timings.add("parse", time.perf_counter() - parse_start)
 
         return models
 
+    def reload_sql_models(
+        self, paths: t.Collection[Path]
+    ) -> t.Optional[t.Dict[Path, t.List[Model]]]:
+        if self._model_definitions is None:
+            return None
+
+        models_path = self.config_path / c.MODELS
+        paths = set(paths)
+        for path in paths:
+            # New files may be ignored or define models of other kinds, so they require a full load
+            if (
+                path not in self._path_mtimes
+                or path.suffix != ".sql"
+                or models_path not in path.parents
+            ):
+                return None
+
+        if any(
+            not path.exists() or path.stat().st_mtime > initial_mtime
+            for path, initial_mtime in self._path_mtimes.items()
+            if path not in paths
+        ):
+            return None
+
+        cache = SqlMeshLoader._Cache(self, self.config_path)
+        _init_model_defaults(
+            self.config_essentials,
+            self.context.selected_gateway,
+            self._model_loading_defaults(*self._model_definitions),
+            cache,
+        )
+
+        models_per_path: t.Dict[Path, t.List[Model]] = {}
+        with sys_path(self.config_path), self.timings.measure("parse"):
+            for path in paths:
+                if not path.exists() or not os.path.getsize(path):
+                    self._path_mtimes.pop(path)
+                    models_per_path[path] = []
+                    continue
+
+                self._track_file(path)
+                try:
+                    loaded = load_sql_models(path) or cache.get(path)
+                except Exception as ex:
+                    raise ConfigError(self._failed_to_load_model_error(path, ex), path)
+
+                for model in loaded:
+                    model._path = path
+                models_per_path[path] = [model for model in loaded if model.enabled]
+
+        return models_per_path
+
+    def _model_loading_defaults(
+        self,
+        macros: MacroRegistry,
+        jinja_macros: JinjaMacroRegistry,
+        audits: UniqueKeyDict[str, ModelAudit],
+        signals: UniqueKeyDict[str, signal],
+    ) -> t.Dict[str, t.Any]:
+        return dict(
+            get_variables=get_variables,
+            defaults=self.config.model_defaults.dict(),
+            macros=macros,
+            jinja_macros=jinja_macros,
+            audit_definitions=audits,
+            module_path=self.config_path,
+            dialect=self.config.model_defaults.dialect,
+            time_column_format=self.config.time_column_format,
+            physical_schema_mapping=self.config.physical_schema_mapping,
+            project=self.config.project,
+            default_catalog=self.context.default_catalog,
+            infer_names=self.config.model_naming.infer_names,
+            signal_definitions=signals,
+            default_catalog_per_gateway=self.context.default_catalog_per_gateway,
+            virtual_environment_mode=self.config.virtual_environment_mode,
+        )
+
     def _load_python_models(
         self,
         macros: MacroRegistry,
@@ -896,14 +1041,13 @@ class SqlMeshLoader(Loader):
         def get_or_load_models(
             self, target_path: Path, loader: t.Callable[[], t.List[Model]]
         ) -> t.List[Model]:
-            models = self._model_cache.get_or_load(
-                self._cache_entry_name(target_path),
-                self._model_cache_entry_id(target_path),
-                loader=loader,
-            )
+            entry_name = self._cache_entry_name(target_path)
+            entry_id = self._model_cache_entry_id(target_path)
+            models = self._model_cache.get_or_load(entry_name, entry_id, loader=loader)
 
             for model in models:
                 model._path = target_path
+                model._cache_entry_id = f"{entry_name}__{entry_id}"
 
             return models
 
@@ -915,13 +1059,26 @@ class SqlMeshLoader(Loader):
             )
 
         def get(self, path: Path) -> t.List[Model]:
-            models = self._model_cache.get(
-                self._cache_entry_name(path),
-                self._model_cache_entry_id(path),
+            return self._get(path, self._model_cache_entry_id(path))
+
+        def get_many(self, paths: t.Sequence[Path]) -> t.List[t.List[Model]]:
+            # Entry ids are computed upfront, since resolving the default catalog they include may
+            # query the engine, which must not happen from multiple threads
+            entry_ids = [self._model_cache_entry_id(path) for path in paths]
+            # Reading cache entries is dominated by IO and decompression, which don't hold the GIL
+            return concurrent_apply_to_values(
+                list(zip(paths, entry_ids)),
+                lambda path_and_entry_id: self._get(*path_and_entry_id),
+                tasks_num=min(len(paths), c.MAX_CACHE_READ_WORKERS) or 1,
             )
 
+        def _get(self, path: Path, entry_id: str) -> t.List[Model]:
+            entry_name = self._cache_entry_name(path)
+            models = self._model_cache.get(entry_name, entry_id)
+
             for model in models:
                 model._path = path
+                model._cache_entry_id = f"{entry_name}__{entry_id}"
 
             return models
 
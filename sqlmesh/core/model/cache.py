@@ -10,7 +10,7 @@ from sqlglot.optimizer.simplify import gen
 from sqlglot.schema import MappingSchema
 
 from sqlmesh.core import constants as c
-from sqlmesh.core.model.definition import ExternalModel, Model, SqlModel, _Model
+from sqlmesh.core.model.definition import ExternalModel, Model, SeedModel, SqlModel, _Model
 from sqlmesh.utils.cache import FileCache
 from sqlmesh.utils.hashing import crc32
 from sqlmesh.utils.process import PoolExecutor, create_process_pool_executor
@@ -110,24 +110,54 @@ class OptimizedQueryCache:
 
         name = self._entry_name(model) if name is None else name
         cache_entry = self._file_cache.get(name)
-        if cache_entry:
-            try:
-                # If the optimized rendered query is None, then there are likely adapter calls in the query
-                # that prevent us from rendering it at load time. This means that we can safely set the
-                # unoptimized cache to None as well to prevent attempts to render it downstream.
-                optimized = cache_entry.optimized_rendered_query is not None
-                model._query_renderer.update_cache(
-                    cache_entry.optimized_rendered_query,
-                    cache_entry.renderer_violations,
-                    optimized=optimized,
-                )
-                return True
-            except Exception as ex:
-                logger.warning("Failed to load a cache entry '%s': %s", name, ex)
+        if cache_entry and self.with_entry(model, cache_entry, name):
+            return True
 
         self._put(name, model)
         return False
 
+    def with_entry(self, model: Model, entry: OptimizedQueryCacheEntry, name: str) -> bool:
+        """Adds an optimized query that has already been loaded or rendered to the model's in-memory cache.
+
+        Args:
+            model: The model to add the optimized query to.
+            entry: The cache entry with the optimized query.
+            name: The cache entry name of the model.
+        """
+        if not isinstance(model, SqlModel):
+            return False
+
+        try:
+            # If the optimized rendered query is None, then there are likely adapter calls in the query
+            # that prevent us from rendering it at load time. This means that we can safely set the
+            # unoptimized cache to None as well to prevent attempts to render it downstream.
+            optimized = entry.optimized_rendered_query is not None
+            model._query_renderer.update_cache(
+                entry.optimized_rendered_query,
+                entry.renderer_violations,
+                optimized=optimized,
+            )
+            return True
+        except Exception as ex:
+            logger.warning("Failed to load a cache entry '%s': %s", name, ex)
+        return False
+
+    def load_entry(self, model: SqlModel, name: str) -> OptimizedQueryCacheEntry:
+        """Adds an optimized query to the model's in-memory cache and returns the corresponding cache entry.
+
+        Unlike `with_optimized_query`, the entry is returned so that it can be passed to a copy of the model
+        in another process with `with_entry`.
+
+        Args:
+            model: The model to add the optimized query to.
+            name: The cache entry name of the model.
+        """
+        cache_entry = self._file_cache.get(name)
+        if cache_entry and self.with_entry(model, cache_entry, name):
+            return cache_entry
+
+        return self._put(name, model)
+
     def put(self, model: Model) -> t.Optional[str]:
         if not isinstance(model, SqlModel):
             return None
@@ -140,7 +170,7 @@ class OptimizedQueryCache:
         self._put(name, model)
         return name
 
-    def _put(self, name: str, model: SqlModel) -> None:
+    def _put(self, name: str, model: SqlModel) -> OptimizedQueryCacheEntry:
         optimized_query = model.render_query()
 
         new_entry = OptimizedQueryCacheEntry(
@@ -148,6 +178,7 @@ class OptimizedQueryCache:
             renderer_violations=model.violated_rules_for_query,
         )
         self._file_cache.put(name, value=new_entry)
+        return new_entry
 
     @staticmethod
     def _entry_name(model: SqlModel) -> str:
@@ -159,6 +190,52 @@ class OptimizedQueryCache:
         return f"{model.name}_{crc32(hash_data)}"
 
 
+@dataclass
+class SeedColumnsCacheEntry:
+    columns_to_types: t.Dict[str, exp.DataType]
+    column_hashes: t.Dict[str, str]
+
+
+class SeedColumnsCache:
+    """File-based cache implementation for the column types and hashes of seeds.
+
+    Entries are keyed by the hash of the seed content and its CSV settings, so that a seed
+    which hasn't changed doesn't have to be parsed to fingerprint it.
+
+    Args:
+        path: The path to the cache folder.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._file_cache: FileCache[SeedColumnsCacheEntry] = FileCache(path, prefix="seed_columns")
+
+    def with_seed_columns(self, model: Model) -> bool:
+        """Adds the column types and hashes of the seed to the model.
+
+        Args:
+            model: The seed model to add the column types and hashes to.
+
+        Returns:
+            True if the entry was found in the cache, False if the seed content had to be parsed.
+        """
+        if not isinstance(model, SeedModel) or not model.is_hydrated:
+            return False
+
+        name = model.seed_content_hash
+        cache_entry = self._file_cache.get(name)
+        found = cache_entry is not None
+        if cache_entry is None:
+            cache_entry = SeedColumnsCacheEntry(
+                columns_to_types=model._reader.columns_to_types,
+                column_hashes=model._reader.column_hashes,
+            )
+            self._file_cache.put(name, value=cache_entry)
+
+        model.set_seed_columns(cache_entry.columns_to_types, cache_entry.column_hashes)
+        return found
+
+
 def optimized_query_cache_pool(optimized_query_cache: OptimizedQueryCache) -> PoolExecutor:
     return create_process_pool_executor(
         initializer=_init_optimized_query_cache,
@@ -195,9 +272,21 @@ def load_optimized_query(
     return snapshot_id, entry_name
 
 
+@dataclass
+class ModelSchemaUpdate:
+    """The result of updating the schema of a single model in a worker process."""
+
+    fqn: str
+    mapping_schema: t.Dict
+    entry_name: t.Optional[str] = None
+    optimized_query_entry: t.Optional[OptimizedQueryCacheEntry] = None
+    data_hash: t.Optional[str] = None
+    metadata_hash: t.Optional[str] = None
+
+
 def load_optimized_query_and_mapping(
-    model: Model, mapping: t.Dict
-) -> t.Tuple[str, t.Optional[str], str, str, t.Dict]:
+    model: Model, mapping: t.Dict, compute_hashes: bool = True
+) -> ModelSchemaUpdate:
     assert _optimized_query_cache
 
     schema = MappingSchema(normalize=False)
@@ -205,19 +294,19 @@ def load_optimized_query_and_mapping(
         schema.add_table(parent, columns_to_types, dialect=model.dialect)
     model.update_schema(schema)
 
+    update = ModelSchemaUpdate(fqn=model.fqn, mapping_schema=model.mapping_schema)
+
     if isinstance(model, SqlModel):
-        entry_name = _optimized_query_cache._entry_name(model)
-        _optimized_query_cache.with_optimized_query(model, entry_name)
-    else:
-        entry_name = None
-
-    return (
-        model.fqn,
-        entry_name,
-        model.data_hash,
-        model.metadata_hash,
-        model.mapping_schema,
-    )
+        # The optimized query is sent back along with the schema so that the parent process
+        # doesn't have to read it from the cache again
+        update.entry_name = _optimized_query_cache._entry_name(model)
+        update.optimized_query_entry = _optimized_query_cache.load_entry(model, update.entry_name)
+
+    if compute_hashes:
+        update.data_hash = model.data_hash
+        update.metadata_hash = model.metadata_hash
+
+    return update
 
 
 def _mapping_schema_hash_data(schema: t.Dict[str, t.Any]) -> t.List[str]:
@@ -48,7 +48,7 @@ from sqlmesh.utils import columns_to_types_all_known, str_to_bool, UniqueKeyDict
 from sqlmesh.utils.cron import CroniterCache
 from sqlmesh.utils.date import TimeLike, make_inclusive, to_datetime, to_time_column
 from sqlmesh.utils.errors import ConfigError, SQLMeshError, raise_config_error, PythonModelEvalError
-from sqlmesh.utils.hashing import hash_data
+from sqlmesh.utils.hashing import hash_data, md5
 from sqlmesh.utils.jinja import JinjaMacroRegistry, extract_macro_references_and_variables
 from sqlmesh.utils.pydantic import PydanticModel, PRIVATE_FIELDS
 from sqlmesh.utils.metaprogramming import (
@@ -1660,6 +1660,9 @@ class SeedModel(_Model):
     is_hydrated: bool = True
     source_type: t.Literal["seed"] = "seed"
 
+    _seed_columns_to_types: t.Optional[t.Dict[str, exp.DataType]] = None
+    _seed_column_hashes: t.Optional[t.Dict[str, str]] = None
+
     def __getstate__(self) -> t.Dict[t.Any, t.Any]:
         state = super().__getstate__()
         state["__dict__"] = state["__dict__"].copy()
@@ -1669,6 +1672,8 @@ class SeedModel(_Model):
     def copy(self, **kwargs: t.Any) -> Self:
         model = super().copy(**kwargs)
         model.__dict__.pop("_reader", None)
+        model._seed_columns_to_types = None
+        model._seed_column_hashes = None
         return model
 
     def render(
@@ -1742,13 +1747,26 @@ class SeedModel(_Model):
                     )
 
             for column in bool_columns:
-                df[column] = df[column].apply(lambda i: None if pd.isna(i) else str_to_bool(str(i)))
+                values = df[column]
+                if values.dtype == bool:
+                    continue
+                # Seeds usually contain only a handful of distinct values in a boolean column, so each
+                # of them is converted once instead of converting every row
+                values_as_str = values.astype(str)
+                bools = values_as_str.map(
+                    {value: str_to_bool(value) for value in values_as_str.unique()}
+                )
+                df[column] = bools.where(values.notna(), None) if values.hasnans else bools
 
             df.loc[:, string_columns] = df[string_columns].mask(
                 cond=lambda x: x.notna(),  # type: ignore
                 other=df[string_columns].astype(str),  # type: ignore
             )
-            yield df.replace({np.nan: None})
+
+            # Only columns that contain missing values need to be converted
+            for column in df.columns[df.isna().any()]:
+                df[column] = df[column].replace({np.nan: None})
+            yield df
 
     @property
     def columns_to_types(self) -> t.Optional[t.Dict[str, exp.DataType]]:
@@ -1756,6 +1774,8 @@ class SeedModel(_Model):
             return self.columns_to_types_
         if self.derived_columns_to_types is not None:
             return self.derived_columns_to_types
+        if self._seed_columns_to_types is not None:
+            return self._seed_columns_to_types
         if self.is_hydrated:
             return self._reader.columns_to_types
         return None
@@ -1764,9 +1784,35 @@ class SeedModel(_Model):
     def column_hashes(self) -> t.Dict[str, str]:
         if self.column_hashes_ is not None:
             return self.column_hashes_
+        if self._seed_column_hashes is not None:
+            return self._seed_column_hashes
         self._ensure_hydrated()
         return self._reader.column_hashes
 
+    @property
+    def seed_content_hash(self) -> str:
+        """A hash of the seed content together with the settings and the dialect used to read it."""
+        self._ensure_hydrated()
+        return md5(
+            [
+                self.seed.content,
+                self.kind.csv_settings.json() if self.kind.csv_settings else None,
+                self.dialect,
+            ]
+        )
+
+    def set_seed_columns(
+        self, columns_to_types: t.Dict[str, exp.DataType], column_hashes: t.Dict[str, str]
+    ) -> None:
+        """Sets the column types and hashes of the seed, so that its content doesn't have to be parsed.
+
+        Args:
+            columns_to_types: The column types inferred from the seed content.
+            column_hashes: The hashes of the seed columns.
+        """
+        self._seed_columns_to_types = columns_to_types
+        self._seed_column_hashes = column_hashes
+
     @property
     def is_seed(self) -> bool:
         return True
@@ -11,6 +11,7 @@ from sqlmesh.core.model.cache import (
     load_optimized_query_and_mapping,
     optimized_query_cache_pool,
     OptimizedQueryCache,
+    SeedColumnsCache,
 )
 
 if t.TYPE_CHECKING:
@@ -23,11 +24,36 @@ def update_model_schemas(
     dag: DAG[str],
     models: UniqueKeyDict[str, Model],
     cache_dir: Path,
+    indexed_models: t.Optional[t.Set[str]] = None,
+    fqns: t.Optional[t.Set[str]] = None,
 ) -> None:
+    """Updates the mapping schemas of models in topological order.
+
+    Args:
+        dag: The DAG of models.
+        models: The models to update.
+        cache_dir: The path to the cache folder.
+        indexed_models: Names of models whose data and metadata hashes can likely be restored from the
+            fingerprint index. These hashes are computed lazily instead of along with the schema.
+        fqns: Names of the only models to update, eg. the downstream subgraph of a modified model.
+            The schemas of all other models are expected to be up to date. Defaults to all models.
+    """
     schema = MappingSchema(normalize=False)
     optimized_query_cache: OptimizedQueryCache = OptimizedQueryCache(cache_dir)
 
-    _update_model_schemas(dag, models, schema, optimized_query_cache)
+    seed_columns_cache = SeedColumnsCache(cache_dir)
+    for name, model in models.items():
+        if model.is_seed and (fqns is None or name in fqns):
+            seed_columns_cache.with_seed_columns(model)
+
+    _update_model_schemas(
+        dag,
+        models,
+        schema,
+        optimized_query_cache,
+        indexed_models or set(),
+        models.keys() if fqns is None else fqns,
+    )
 
 
 def _update_schema_with_model(schema: MappingSchema, model: Model) -> None:
@@ -50,51 +76,62 @@ def _update_model_schemas(
     models: UniqueKeyDict[str, Model],
     schema: MappingSchema,
     optimized_query_cache: OptimizedQueryCache,
+    indexed_models: t.Set[str],
+    fqns: t.AbstractSet[str],
 ) -> None:
     futures = set()
-    graph = {
-        model: {dep for dep in deps if dep in models}
-        for model, deps in dag._dag.items()
-        if model in models
-    }
-
-    def process_models(completed_model: t.Optional[Model] = None) -> None:
-        for name in list(graph):
-            deps = graph[name]
-
-            if completed_model:
-                deps.discard(completed_model.fqn)
-
-            if not deps:
-                del graph[name]
-                model = models[name]
-                futures.add(
-                    executor.submit(
-                        load_optimized_query_and_mapping,
-                        model,
-                        mapping={
-                            parent: models[parent].columns_to_types
-                            for parent in model.depends_on
-                            if parent in models
-                        },
-                    )
-                )
+    # Number of unprocessed parents of each model and the children waiting on each model
+    indegrees: t.Dict[str, int] = {}
+    children: t.Dict[str, t.List[str]] = {}
+    for name, deps in dag._dag.items():
+        if name not in fqns:
+            continue
+        parents = [dep for dep in deps if dep in fqns]
+        indegrees[name] = len(parents)
+        for parent in parents:
+            children.setdefault(parent, []).append(name)
+
+    def submit(name: str) -> None:
+        model = models[name]
+        futures.add(
+            executor.submit(
+                load_optimized_query_and_mapping,
+                model,
+                mapping={
+                    parent: models[parent].columns_to_types
+                    for parent in model.depends_on
+                    if parent in models
+                },
+                compute_hashes=name not in indexed_models,
+            )
+        )
 
     with optimized_query_cache_pool(optimized_query_cache) as executor:
-        process_models()
+        # Every model whose parents have all been processed is dispatched right away instead of waiting
+        # for the rest of its topological level, which keeps the workers busy on uneven graphs
+        for name, indegree in indegrees.items():
+            if not indegree:
+                submit(name)
 
         while futures:
             for future in as_completed(futures):
                 try:
                     futures.remove(future)
-                    fqn, entry_name, data_hash, metadata_hash, mapping_schema = future.result()
-                    model = models[fqn]
-                    model._data_hash = data_hash
-                    model._metadata_hash = metadata_hash
-                    if model.mapping_schema != mapping_schema:
-                        model.set_mapping_schema(mapping_schema)
-                    optimized_query_cache.with_optimized_query(model, entry_name)
+                    update = future.result()
+                    model = models[update.fqn]
+                    model._data_hash = update.data_hash
+                    model._metadata_hash = update.metadata_hash
+                    if model.mapping_schema != update.mapping_schema:
+                        model.set_mapping_schema(update.mapping_schema)
+                    if update.optimized_query_entry and update.entry_name:
+                        optimized_query_cache.with_entry(
+                            model, update.optimized_query_entry, update.entry_name
+                        )
                     _update_schema_with_model(schema, model)
-                    process_models(completed_model=model)
+
+                    for child in children.get(model.fqn, []):
+                        indegrees[child] -= 1
+                        if not indegrees[child]:
+                            submit(child)
                 except Exception as ex:
                     raise SchemaError(f"Failed to update model schemas\n\n{ex}")
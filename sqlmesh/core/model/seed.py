@@ -12,7 +12,7 @@ from sqlglot.helper import seq_get
 from sqlglot.optimizer.normalize_identifiers import normalize_identifiers
 
 from sqlmesh.core.model.common import parse_bool
-from sqlmesh.utils.pandas import columns_to_types_from_df
+from sqlmesh.utils.pandas import columns_to_types_from_dtypes
 from sqlmesh.utils.pydantic import PydanticModel, field_validator
 
 if t.TYPE_CHECKING:
@@ -23,6 +23,11 @@ logger = logging.getLogger(__name__)
 NaHashables = t.List[t.Union[int, str, bool, t.Literal[None]]]
 NaValues = t.Union[NaHashables, t.Dict[str, NaHashables]]
 
+# The number of rows serialized at a time when computing column hashes
+COLUMN_HASH_BATCH_SIZE = 100_000
+# The number of rows parsed at a time when reading seed content
+SEED_CHUNK_SIZE = 100_000
+
 
 class CsvSettings(PydanticModel):
     """Settings for CSV seeds."""
@@ -89,52 +94,167 @@ class CsvSettings(PydanticModel):
 
 
 class CsvSeedReader:
-    def __init__(self, content: str, dialect: str, settings: CsvSettings):
+    """Reads the content of a CSV seed.
+
+    The content is parsed in chunks of `chunk_size` rows, so that the whole seed is never held in
+    memory as a single DataFrame. Pandas infers column types for each chunk separately, so if the
+    types inferred for different chunks disagree, the content is parsed at once instead to get the
+    same types and values as a single read.
+    """
+
+    def __init__(
+        self,
+        content: str,
+        dialect: str,
+        settings: CsvSettings,
+        chunk_size: int = SEED_CHUNK_SIZE,
+    ):
         self.content = content
         self.dialect = dialect
         self.settings = settings
+        self.chunk_size = chunk_size
         self._df: t.Optional[pd.DataFrame] = None
+        self._dtypes: t.Optional[pd.Series] = None
+        self._column_hashes: t.Optional[t.Dict[str, str]] = None
 
     @property
     def columns_to_types(self) -> t.Dict[str, exp.DataType]:
-        return columns_to_types_from_df(self._get_df())
+        self._scan()
+        assert self._dtypes is not None
+        return columns_to_types_from_dtypes(self._dtypes.items())
 
     @property
     def column_hashes(self) -> t.Dict[str, str]:
-        df = self._get_df()
-        return {
-            column_name: str(zlib.crc32(df[column_name].to_json().encode("utf-8")))
-            for column_name in df.columns
-        }
+        self._scan()
+        assert self._column_hashes is not None
+        return self._column_hashes
 
     def read(self, batch_size: t.Optional[int] = None) -> t.Generator[pd.DataFrame, None, None]:
-        df = self._get_df()
+        import pandas as pd
 
-        batch_size = batch_size or df.size
-        batch_start = 0
-        while batch_start < df.shape[0]:
-            yield df.iloc[batch_start : batch_start + batch_size, :].copy()
-            batch_start += batch_size
+        self._scan()
+        if self._df is not None:
+            chunks: t.Iterable[pd.DataFrame] = [self._df]
+        elif not batch_size:
+            chunks = [self._read_df()]
+        else:
+            chunks = self._read_chunks()
+
+        # Chunks are split into batches, rows left over at the end of a chunk are carried over into
+        # the next batch
+        remainder: t.Optional[pd.DataFrame] = None
+        for chunk in chunks:
+            if remainder is not None:
+                chunk = pd.concat([remainder, chunk])
+            chunk_batch_size = batch_size or len(chunk.index)
+            full_batches_end = len(chunk.index) - len(chunk.index) % chunk_batch_size
+            for batch_start in range(0, full_batches_end, chunk_batch_size):
+                yield chunk.iloc[batch_start : batch_start + chunk_batch_size, :].copy()
+            remainder = chunk.iloc[full_batches_end:, :] if full_batches_end < len(chunk) else None
+
+        if remainder is not None:
+            yield remainder.copy()
+
+    def _scan(self) -> None:
+        """Infers the column types and computes the column hashes, one chunk at a time."""
+        if self._column_hashes is not None:
+            return
+
+        dtypes = None
+        hashers: t.Dict[str, ColumnHasher] = {}
+        for chunk in self._read_chunks():
+            if dtypes is None:
+                dtypes = chunk.dtypes
+                hashers = {column_name: ColumnHasher() for column_name in chunk.columns}
+            elif not chunk.dtypes.equals(dtypes):
+                dtypes = None
+                break
+            for column_name, hasher in hashers.items():
+                hasher.update(chunk[column_name])
+
+        if dtypes is None:
+            self._df = self._read_df()
+            dtypes = self._df.dtypes
+            hashers = {column_name: ColumnHasher() for column_name in self._df.columns}
+            for column_name, hasher in hashers.items():
+                hasher.update(self._df[column_name])
+
+        self._dtypes = dtypes
+        self._column_hashes = {
+            column_name: hasher.digest() for column_name, hasher in hashers.items()
+        }
+
+    def _read_df(self) -> pd.DataFrame:
+        return self._normalize_columns(self._read_csv())
+
+    def _read_chunks(self) -> t.Iterator[pd.DataFrame]:
+        for chunk in self._read_csv(chunksize=self.chunk_size):
+            yield self._normalize_columns(chunk)
 
-    def _get_df(self) -> pd.DataFrame:
+    def _read_csv(self, **kwargs: t.Any) -> t.Any:
         import pandas as pd
 
-        if self._df is None:
-            self._df = pd.read_csv(
-                StringIO(self.content),
-                index_col=False,
-                on_bad_lines="error",
-                low_memory=False,
-                **{k: v for k, v in self.settings.dict().items() if v is not None},
-            )
-            self._df = self._df.rename(
-                columns={
-                    col: normalize_identifiers(col, dialect=self.dialect).name
-                    for col in self._df.columns
-                },
-            )
-
-        return self._df
+        return pd.read_csv(
+            StringIO(self.content),
+            index_col=False,
+            on_bad_lines="error",
+            low_memory=False,
+            **kwargs,
+            **{k: v for k, v in self.settings.dict().items() if v is not None},
+        )
+
+    def _normalize_columns(self, df: pd.DataFrame) -> pd.DataFrame:
+        return df.rename(
+            columns={
+                col: normalize_identifiers(col, dialect=self.dialect).name for col in df.columns
+            },
+        )
+
+
+class ColumnHasher:
+    """Computes the CRC32 checksum of a column's JSON representation incrementally.
+
+    The column is serialized in batches of rows, so that the JSON document of the whole column
+    never has to be held in memory. Once all parts of a column have been added in order, the
+    result is identical to hashing `column.to_json()`.
+
+    Args:
+        batch_size: The number of rows to serialize at a time.
+    """
+
+    def __init__(self, batch_size: int = COLUMN_HASH_BATCH_SIZE):
+        self.batch_size = batch_size
+        self._checksum = zlib.crc32(b"{")
+        self._separator = b""
+
+    def update(self, column: pd.Series) -> None:
+        """Adds the next rows of the column to the checksum."""
+        for batch_start in range(0, len(column), self.batch_size):
+            # Each batch is serialized as a JSON object, so its braces are stripped to splice it
+            # into the whole
+            batch = column.iloc[batch_start : batch_start + self.batch_size]
+            body = batch.to_json().encode("utf-8")[1:-1]
+            self._checksum = zlib.crc32(self._separator + body, self._checksum)
+            self._separator = b","
+
+    def digest(self) -> str:
+        """Returns the checksum as a string."""
+        return str(zlib.crc32(b"}", self._checksum))
+
+
+def column_hash(column: pd.Series, batch_size: int = COLUMN_HASH_BATCH_SIZE) -> str:
+    """Computes the CRC32 checksum of a column's JSON representation.
+
+    Args:
+        column: The column to hash.
+        batch_size: The number of rows to serialize at a time.
+
+    Returns:
+        The checksum as a string.
+    """
+    hasher = ColumnHasher(batch_size)
+    hasher.update(column)
+    return hasher.digest()
 
 
 class Seed(PydanticModel):
@@ -322,6 +322,7 @@ class _Node(DbtInfoMixin, PydanticModel):
     _path: t.Optional[Path] = None
     _data_hash: t.Optional[str] = None
     _metadata_hash: t.Optional[str] = None
+    _cache_entry_id: t.Optional[str] = None
 
     _croniter: t.Optional[CroniterCache] = None
     __inferred_interval_unit: t.Optional[IntervalUnit] = None
@@ -337,12 +338,14 @@ class _Node(DbtInfoMixin, PydanticModel):
         private = state[PRIVATE_FIELDS]
         private["_data_hash"] = None
         private["_metadata_hash"] = None
+        private["_cache_entry_id"] = None
         return state
 
     def copy(self, **kwargs: t.Any) -> Self:
         node = super().copy(**kwargs)
         node._data_hash = None
         node._metadata_hash = None
+        node._cache_entry_id = None
         return node
 
     @field_validator("name", mode="before")
@@ -48,6 +48,7 @@ from sqlmesh.utils.date import (
     is_relative,
 )
 from sqlmesh.utils.errors import NoChangesPlanError, PlanError
+from sqlmesh.utils.tracing import traced
 
 logger = logging.getLogger(__name__)
 
@@ -296,6 +297,7 @@ class PlanBuilder:
             raise PlanError("Plan was not initialized with an applier.")
         self._apply(self.build())
 
+    @traced("plan")
     def build(self) -> Plan:
         """Builds the plan."""
         if self._latest_plan:
@@ -385,6 +387,7 @@ class PlanBuilder:
             dag.add(s_id, context_snapshot.parents)
         return dag
 
+    @traced("plan")
     def _build_restatements(
         self, dag: DAG[SnapshotId], earliest_interval_start: TimeLike
     ) -> t.Dict[SnapshotId, Interval]:
@@ -647,6 +650,7 @@ class PlanBuilder:
                     if snapshot.model.on_additive_change.is_error:
                         raise PlanError("Plan requires an additive change to a forward-only model.")
 
+    @traced("plan")
     def _categorize_snapshots(
         self, dag: DAG[SnapshotId], indirectly_modified: SnapshotMapping
     ) -> None:
@@ -27,6 +27,7 @@ from sqlmesh.core.snapshot.definition import (
 )
 from sqlmesh.utils.date import TimeLike, now, to_datetime, to_timestamp
 from sqlmesh.utils.pydantic import PydanticModel
+from sqlmesh.utils.tracing import traced
 
 SnapshotMapping = t.Dict[SnapshotId, t.Set[SnapshotId]]
 UserProvidedFlags = t.Union[TimeLike, str, bool, t.List[str]]
@@ -180,6 +181,7 @@ class Plan(PydanticModel, frozen=True):
         return list(self.context_diff.new_snapshots.values())
 
     @property
+    @traced("plan")
     def missing_intervals(self) -> t.List[SnapshotIntervals]:
         """Returns the missing intervals for this plan."""
         # NOTE: Even though the plan is immutable, snapshots that are part of it are not. Since snapshot intervals
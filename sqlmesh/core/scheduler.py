@@ -7,6 +7,7 @@ import time
 from datetime import datetime
 from sqlglot import exp
 from sqlmesh.core import constants as c
+from sqlmesh.core.config.common import SchedulingPolicy
 from sqlmesh.core.console import Console, get_console
 from sqlmesh.core.environment import EnvironmentNamingInfo, execute_environment_statements
 from sqlmesh.core.macros import RuntimeStage
@@ -24,8 +25,8 @@ from sqlmesh.core.snapshot import (
     SnapshotEvaluator,
     apply_auto_restatements,
     earliest_start_date,
+    IntervalSet,
     missing_intervals,
-    merge_intervals,
     snapshots_to_dag,
     Intervals,
 )
@@ -51,6 +52,7 @@ from sqlmesh.utils.errors import (
     SQLMeshError,
     SignalEvalError,
 )
+from sqlmesh.utils.tracing import traced
 
 if t.TYPE_CHECKING:
     from sqlmesh.core.context import ExecutionContext
@@ -111,6 +113,7 @@ class Scheduler:
         state_sync: The state sync to pull saved snapshots.
         max_workers: The maximum number of parallel queries to run.
         console: The rich instance used for printing scheduling information.
+        scheduling_policy: The policy used to order the evaluation of nodes that are ready to run.
     """
 
     def __init__(
@@ -122,6 +125,7 @@ class Scheduler:
         max_workers: int = 1,
         console: t.Optional[Console] = None,
         notification_target_manager: t.Optional[NotificationTargetManager] = None,
+        scheduling_policy: SchedulingPolicy = SchedulingPolicy.default,
     ):
         self.state_sync = state_sync
         self.snapshots = {s.snapshot_id: s for s in snapshots}
@@ -134,7 +138,9 @@ class Scheduler:
         self.notification_target_manager = (
             notification_target_manager or NotificationTargetManager()
         )
+        self.scheduling_policy = scheduling_policy
 
+    @traced("scheduler")
     def merged_missing_intervals(
         self,
         start: t.Optional[TimeLike] = None,
@@ -188,6 +194,7 @@ class Scheduler:
             }
         return snapshots_to_intervals
 
+    @traced("scheduler")
     def evaluate(
         self,
         snapshot: Snapshot,
@@ -290,6 +297,7 @@ class Scheduler:
             run_environment_statements=run_environment_statements,
         )
 
+    @traced("scheduler")
     def audit(
         self,
         environment: str | EnvironmentNamingInfo,
@@ -401,7 +409,7 @@ class Scheduler:
             next_batch: t.List[t.Tuple[int, int]] = []
 
             for interval in interval_diff(
-                intervals, merge_intervals(unready), uninterrupted=snapshot.depends_on_past
+                intervals, IntervalSet(unready).to_list(), uninterrupted=snapshot.depends_on_past
             ):
                 if (batch_size and len(next_batch) >= batch_size) or (
                     next_batch and interval[0] != next_batch[-1][-1]
@@ -418,6 +426,7 @@ class Scheduler:
 
         return snapshot_batches
 
+    @traced("scheduler")
     def run_merged_intervals(
         self,
         *,
@@ -602,6 +611,7 @@ class Scheduler:
                     run_node,
                     self.max_workers,
                     raise_on_error=False,
+                    priority=self._node_priority(dag),
                 )
                 self.console.stop_evaluation_progress(success=not errors)
 
@@ -637,6 +647,21 @@ class Scheduler:
 
             self.state_sync.recycle()
 
+    def _node_priority(
+        self, dag: DAG[SchedulingUnit]
+    ) -> t.Optional[t.Callable[[SchedulingUnit], t.Any]]:
+        """Returns the priority function for nodes of the given DAG according to the scheduling policy."""
+        if not self.scheduling_policy.is_critical_path:
+            return None
+
+        critical_paths = critical_path_lengths(
+            dag,
+            node_duration_estimator(
+                self.snapshot_evaluator.execution_tracker.get_duration_estimates()
+            ),
+        )
+        return lambda node: (-critical_paths[node], node)
+
     def _dag(
         self,
         batches: SnapshotToIntervals,
@@ -982,7 +1007,7 @@ class Scheduler:
 
         for signal_idx, (signal_name, kwargs) in enumerate(signals.signals_to_kwargs.items()):
             # Capture intervals before signal check for display
-            intervals_to_check = merge_intervals(intervals)
+            intervals_to_check = IntervalSet(intervals).to_list()
 
             signal_start_ts = time.perf_counter()
 
@@ -1009,7 +1034,7 @@ class Scheduler:
                 signal_name=signal_name,
                 signal_idx=signal_idx,
                 total_signals=len(signals.signals_to_kwargs),
-                ready_intervals=merge_intervals(intervals),
+                ready_intervals=IntervalSet(intervals).to_list(),
                 check_intervals=intervals_to_check,
                 duration=duration,
             )
@@ -1019,6 +1044,7 @@ class Scheduler:
         return intervals
 
 
+@traced("scheduler")
 def merged_missing_intervals(
     snapshots: t.Collection[Snapshot],
     start: t.Optional[TimeLike] = None,
@@ -1171,6 +1197,54 @@ def interval_diff(
     return results
 
 
+def node_duration_estimator(
+    duration_estimates: t.Dict[str, float],
+) -> t.Callable[[SchedulingUnit], float]:
+    """Returns a function which estimates the evaluation duration of a scheduling unit.
+
+    Snapshots without recorded history are assumed to take as long as the median known snapshot,
+    or 1 unit of time if there is no history at all. Table creation and dummy nodes are assumed to be free.
+
+    Args:
+        duration_estimates: The estimated duration of a single batch evaluation per snapshot name.
+    """
+    known_durations = sorted(duration_estimates.values())
+    default_duration = known_durations[len(known_durations) // 2] if known_durations else 1.0
+
+    def _estimate(node: SchedulingUnit) -> float:
+        if isinstance(node, EvaluateNode):
+            return duration_estimates.get(node.snapshot_name, default_duration)
+        return 0.0
+
+    return _estimate
+
+
+def critical_path_lengths(
+    dag: DAG[SchedulingUnit], node_duration: t.Callable[[SchedulingUnit], float]
+) -> t.Dict[SchedulingUnit, float]:
+    """Computes the length of the longest path, weighted by duration, from each node to any of its leaves.
+
+    Args:
+        dag: The DAG of scheduling units.
+        node_duration: A function which returns the estimated duration of a node.
+
+    Returns:
+        A mapping from each node to the length of the critical path which starts at this node, including the
+        node itself.
+    """
+    downstream: t.Dict[SchedulingUnit, t.List[SchedulingUnit]] = {}
+    for node, deps in dag.graph.items():
+        for dep in deps:
+            downstream.setdefault(dep, []).append(node)
+
+    lengths: t.Dict[SchedulingUnit, float] = {}
+    for node in reversed(dag.sorted):
+        lengths[node] = node_duration(node) + max(
+            (lengths[child] for child in downstream.get(node, ())), default=0.0
+        )
+    return lengths
+
+
 def _resolve_one_snapshot_per_version(
     snapshots: t.Iterable[Snapshot],
 ) -> t.Dict[t.Tuple[str, str], Snapshot]:
@@ -29,6 +29,7 @@ from sqlmesh.core.snapshot.definition import (
     table_name as table_name,
     to_table_mapping as to_table_mapping,
 )
+from sqlmesh.core.snapshot.interval_set import IntervalSet as IntervalSet
 from sqlmesh.core.snapshot.evaluator import (
     SnapshotEvaluator as SnapshotEvaluator,
     SnapshotCreationFailedError as SnapshotCreationFailedError,
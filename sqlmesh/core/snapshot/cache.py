@@ -10,7 +10,7 @@ from sqlmesh.core.model.cache import (
     load_optimized_query,
 )
 from sqlmesh.core import constants as c
-from sqlmesh.core.snapshot.definition import Snapshot, SnapshotId
+from sqlmesh.core.snapshot.definition import FingerprintIndex, Snapshot, SnapshotId
 from sqlmesh.utils.cache import FileCache
 
 
@@ -109,3 +109,42 @@ class SnapshotCache:
     def _update_node_hash_cache(snapshot: Snapshot) -> None:
         snapshot.node._data_hash = snapshot.fingerprint.data_hash
         snapshot.node._metadata_hash = snapshot.fingerprint.metadata_hash
+
+
+class FingerprintIndexCache:
+    """Persists the index of node fingerprints between runs.
+
+    Args:
+        path: The path to the cache folder.
+    """
+
+    ENTRY_NAME = "index"
+
+    def __init__(self, path: Path):
+        self._file_cache: FileCache[FingerprintIndex] = FileCache(path, prefix="fingerprint_index")
+        self._index: t.Optional[FingerprintIndex] = None
+        self._persisted: FingerprintIndex = {}
+
+    def get(self) -> FingerprintIndex:
+        """Returns the fingerprint index, which is loaded from the cache on first access."""
+        if self._index is None:
+            self._persisted = self._file_cache.get(self.ENTRY_NAME) or {}
+            self._index = dict(self._persisted)
+        return self._index
+
+    def persist(self) -> None:
+        """Stores the fingerprint index in the cache if it has changed since it was last stored."""
+        if self._index is None or not any(
+            self._persisted.get(name) is not entry for name, entry in self._index.items()
+        ):
+            return
+        try:
+            self._file_cache.put(self.ENTRY_NAME, value=self._index)
+            self._persisted = dict(self._index)
+        except Exception:
+            logger.exception("Failed to cache the fingerprint index")
+
+    def clear(self) -> None:
+        self._index = None
+        self._persisted = {}
+        self._file_cache.clear()
@@ -24,6 +24,7 @@ from sqlmesh.core.macros import call_macro
 from sqlmesh.core.model import Model, ModelKindMixin, ModelKindName, ViewKind, CustomKind
 from sqlmesh.core.model.definition import _Model
 from sqlmesh.core.node import IntervalUnit, NodeType
+from sqlmesh.core.snapshot.interval_set import IntervalSet
 from sqlmesh.utils import sanitize_name, unique
 from sqlmesh.utils.dag import DAG
 from sqlmesh.utils.date import (
@@ -58,6 +59,8 @@ if t.TYPE_CHECKING:
 
 Interval = t.Tuple[int, int]
 Intervals = t.List[Interval]
+# Maps node names to the model cache entry the node was loaded from and its last computed fingerprint
+FingerprintIndex = t.Dict[str, t.Tuple[str, "SnapshotFingerprint"]]
 
 Node = t.Annotated[t.Union[Model, StandaloneAudit], Field(discriminator="source_type")]
 
@@ -851,6 +854,21 @@ class Snapshot(PydanticModel, SnapshotInfoMixin):
                 If it is a datetime object, then it is exclusive.
             is_dev: Indicates whether the given interval is being added while in development mode.
         """
+        intervals = IntervalSet(self.dev_intervals if is_dev else self.intervals)
+        if not self._add_interval_to_set(intervals, start, end):
+            return
+
+        if is_dev:
+            self.dev_intervals = intervals.to_list()
+        else:
+            self.intervals = intervals.to_list()
+
+    def _add_interval_to_set(self, intervals: IntervalSet, start: TimeLike, end: TimeLike) -> bool:
+        """Adds a processed time interval to the given interval set.
+
+        Returns:
+            False if the interval was skipped because it is partial, True otherwise.
+        """
         if to_timestamp(start) > to_timestamp(end):
             raise ValueError(
                 f"Attempted to add an Invalid interval ({start}, {end}) to snapshot {self.snapshot_id}"
@@ -860,19 +878,10 @@ class Snapshot(PydanticModel, SnapshotInfoMixin):
 
         if start_ts >= end_ts:
             # Skipping partial interval.
-            return
-
-        intervals = self.dev_intervals if is_dev else self.intervals
-        intervals.append((start_ts, end_ts))
-
-        if len(intervals) < 2:
-            return
+            return False
 
-        merged_intervals = merge_intervals(intervals)
-        if is_dev:
-            self.dev_intervals = merged_intervals
-        else:
-            self.intervals = merged_intervals
+        intervals.add(start_ts, end_ts)
+        return True
 
     def remove_interval(self, interval: Interval) -> None:
         """Remove an interval from the snapshot.
@@ -969,13 +978,15 @@ class Snapshot(PydanticModel, SnapshotInfoMixin):
         """
         effective_from_ts = self.normalized_effective_from_ts or 0
         apply_effective_from = effective_from_ts > 0 and self.identifier != other.identifier
+        intervals = IntervalSet(self.intervals)
         for start, end in other.intervals:
             # If the effective_from is set, then intervals that come after it must come from
             # the current snapshots.
             if apply_effective_from and start < effective_from_ts:
                 end = min(end, effective_from_ts)
             if not apply_effective_from or end <= effective_from_ts:
-                self.add_interval(start, end)
+                self._add_interval_to_set(intervals, start, end)
+        self.intervals = intervals.to_list()
 
         if other.last_altered_ts:
             self.last_altered_ts = max(self.last_altered_ts or 0, other.last_altered_ts)
@@ -983,8 +994,10 @@ class Snapshot(PydanticModel, SnapshotInfoMixin):
         if self.dev_version == other.dev_version:
             # Merge dev intervals if the dev versions match which would mean
             # that this and the other snapshot are pointing to the same dev table.
+            dev_intervals = IntervalSet(self.dev_intervals)
             for start, end in other.dev_intervals:
-                self.add_interval(start, end, is_dev=True)
+                self._add_interval_to_set(dev_intervals, start, end)
+            self.dev_intervals = dev_intervals.to_list()
 
             if other.dev_last_altered_ts:
                 self.dev_last_altered_ts = max(
@@ -1863,6 +1876,7 @@ def fingerprint_from_node(
     *,
     nodes: t.Dict[str, Node],
     cache: t.Optional[t.Dict[str, SnapshotFingerprint]] = None,
+    index: t.Optional[FingerprintIndex] = None,
 ) -> SnapshotFingerprint:
     """Helper function to generate a fingerprint based on the data and metadata of the node and its parents.
 
@@ -1870,23 +1884,43 @@ def fingerprint_from_node(
     The fingerprint is made up of two parts split by an underscore -- query_metadata. The query hash is
     determined purely by the rendered query and the metadata by everything else.
 
+    Parents are fingerprinted before their children by walking the graph iteratively, so that deep graphs
+    don't hit the recursion limit.
+
     Args:
         node: Node to fingerprint.
         nodes: Dictionary of all nodes in the graph to make the fingerprint dependent on parent changes.
             If no dictionary is passed in the fingerprint will not be dependent on a node's parents.
         cache: Cache of node name to fingerprints.
+        index: Fingerprints computed previously for nodes loaded from the model cache, keyed by node name.
+            The data and metadata hashes of a node are reused if neither its cache entry nor its parents'
+            fingerprints have changed since. The index is updated with newly computed fingerprints.
 
     Returns:
         The fingerprint.
     """
     cache = {} if cache is None else cache
 
-    if node.fqn not in cache:
-        parents = [
-            fingerprint_from_node(nodes[table], nodes=nodes, cache=cache)
-            for table in node.depends_on
-            if table in nodes
+    stack = [node]
+    expanded: t.Set[str] = set()
+    while stack:
+        current = stack[-1]
+        if current.fqn in cache:
+            stack.pop()
+            continue
+
+        missing_parents = [
+            nodes[table] for table in current.depends_on if table in nodes and table not in cache
         ]
+        if missing_parents:
+            if current.fqn in expanded:
+                raise SQLMeshError(f"Detected a cycle in the dependencies of '{current.fqn}'.")
+            expanded.add(current.fqn)
+            stack.extend(missing_parents)
+            continue
+
+        stack.pop()
+        parents = [cache[table] for table in current.depends_on if table in nodes]
 
         parent_data_hash = hash_data(sorted(p.to_version() for p in parents))
 
@@ -1894,14 +1928,49 @@ def fingerprint_from_node(
             sorted(h for p in parents for h in (p.metadata_hash, p.parent_metadata_hash))
         )
 
-        cache[node.fqn] = SnapshotFingerprint(
+        cache[current.fqn] = _node_fingerprint(
+            current, parent_data_hash, parent_metadata_hash, index
+        )
+
+    return cache[node.fqn]
+
+
+def _node_fingerprint(
+    node: Node,
+    parent_data_hash: str,
+    parent_metadata_hash: str,
+    index: t.Optional[FingerprintIndex],
+) -> SnapshotFingerprint:
+    cache_entry_id = node._cache_entry_id
+    if index is None or cache_entry_id is None:
+        return SnapshotFingerprint(
             data_hash=node.data_hash,
             metadata_hash=node.metadata_hash,
             parent_data_hash=parent_data_hash,
             parent_metadata_hash=parent_metadata_hash,
         )
 
-    return cache[node.fqn]
+    indexed = index.get(node.fqn)
+    if indexed is not None:
+        indexed_entry_id, fingerprint = indexed
+        if (
+            indexed_entry_id == cache_entry_id
+            and fingerprint.parent_data_hash == parent_data_hash
+            and fingerprint.parent_metadata_hash == parent_metadata_hash
+        ):
+            # The node's definition and its mapping schema are unchanged, so are its own hashes
+            node._data_hash = fingerprint.data_hash
+            node._metadata_hash = fingerprint.metadata_hash
+            return fingerprint
+
+    fingerprint = SnapshotFingerprint(
+        data_hash=node.data_hash,
+        metadata_hash=node.metadata_hash,
+        parent_data_hash=parent_data_hash,
+        parent_metadata_hash=parent_metadata_hash,
+    )
+    index[node.fqn] = (cache_entry_id, fingerprint)
+    return fingerprint
 
 
 def _parents_from_node(
@@ -1909,12 +1978,14 @@ def _parents_from_node(
     nodes: t.Dict[str, Node],
 ) -> t.Dict[str, Node]:
     parent_nodes = {}
-    for parent_fqn in node.depends_on:
-        parent = nodes.get(parent_fqn)
-        if parent:
-            parent_nodes[parent.fqn] = parent
-            if parent.is_model and t.cast(_Model, parent).kind.is_embedded:
-                parent_nodes.update(_parents_from_node(parent, nodes))
+    stack = [node]
+    while stack:
+        for parent_fqn in stack.pop().depends_on:
+            parent = nodes.get(parent_fqn)
+            if parent and parent.fqn not in parent_nodes:
+                parent_nodes[parent.fqn] = parent
+                if parent.is_model and t.cast(_Model, parent).kind.is_embedded:
+                    stack.append(parent)
 
     return parent_nodes
 
@@ -2150,40 +2221,58 @@ def compute_missing_intervals(
         return []
 
     timestamps = expand_range(start_ts, end_ts, interval_unit)
-    missing = set()
+    missing = _missing_flags(timestamps, intervals)
 
-    for current_ts, next_ts in zip(timestamps, timestamps[1:]):
-        for low, high in intervals:
-            if current_ts < low:
-                missing.add((current_ts, next_ts))
-                break
-            elif current_ts >= low and next_ts <= high:
-                break
-        else:
-            missing.add((current_ts, next_ts))
+    if not any(missing):
+        return []
+
+    if lookback:
+        if model_end_ts:
+            croniter = interval_unit.croniter(end_ts)
+            end_ts = to_timestamp(croniter.get_prev(estimate=True))
 
-    if missing:
-        if lookback:
-            if model_end_ts:
-                croniter = interval_unit.croniter(end_ts)
+            while model_end_ts < end_ts:
                 end_ts = to_timestamp(croniter.get_prev(estimate=True))
+                lookback -= 1
 
-                while model_end_ts < end_ts:
-                    end_ts = to_timestamp(croniter.get_prev(estimate=True))
-                    lookback -= 1
+            lookback = max(lookback, 0)
 
-                lookback = max(lookback, 0)
+        # An interval is also missing if the interval `lookback` steps ahead of it is missing
+        # or if there aren't enough intervals ahead of it.
+        num_intervals = len(missing)
+        missing = [
+            is_missing or i + lookback >= num_intervals or missing[i + lookback]
+            for i, is_missing in enumerate(missing)
+        ]
 
-            for i, (current_ts, next_ts) in enumerate(zip(timestamps, timestamps[1:])):
-                parent = timestamps[i + lookback : i + lookback + 2]
+    return [
+        (timestamps[i], timestamps[i + 1])
+        for i, is_missing in enumerate(missing)
+        if is_missing and (not model_end_ts or timestamps[i] < model_end_ts)
+    ]
 
-                if len(parent) < 2 or tuple(parent) in missing:
-                    missing.add((current_ts, next_ts))
 
-        if model_end_ts:
-            missing = {interval for interval in missing if interval[0] < model_end_ts}
+def _missing_flags(timestamps: t.List[int], intervals: t.Tuple[Interval, ...]) -> t.List[bool]:
+    """Returns a flag for each pair of adjacent timestamps which indicates whether the pair is not covered by intervals.
 
-    return sorted(missing)
+    A pair is covered if any of the intervals that precede the first interval which starts after the pair's
+    start fully contains the pair. The timestamps are increasing, so the boundary of preceding intervals only
+    moves forward and both sequences are swept only once.
+    """
+    missing = []
+    num_intervals = len(intervals)
+    boundary = 0
+    max_high: t.Optional[int] = None
+
+    for current_ts, next_ts in zip(timestamps, timestamps[1:]):
+        while boundary < num_intervals and intervals[boundary][0] <= current_ts:
+            high = intervals[boundary][1]
+            if max_high is None or high > max_high:
+                max_high = high
+            boundary += 1
+        missing.append(max_high is None or next_ts > max_high)
+
+    return missing
 
 
 @lru_cache(maxsize=16384)
@@ -85,6 +85,7 @@ from sqlmesh.utils.errors import (
     AdditiveChangeError,
 )
 from sqlmesh.utils.jinja import MacroReturnVal
+from sqlmesh.utils.tracing import traced
 
 if sys.version_info >= (3, 12):
     from importlib import metadata
@@ -147,6 +148,7 @@ class SnapshotEvaluator:
         self.selected_gateway = selected_gateway
         self.ddl_concurrent_tasks = ddl_concurrent_tasks
 
+    @traced("evaluator")
     def evaluate(
         self,
         snapshot: Snapshot,
@@ -264,6 +266,7 @@ class SnapshotEvaluator:
 
         return adapter._fetch_native_df(query_or_df.limit(limit))
 
+    @traced("evaluator")
     def promote(
         self,
         target_snapshots: t.Iterable[Snapshot],
@@ -329,6 +332,7 @@ class SnapshotEvaluator:
                 self.ddl_concurrent_tasks,
             )
 
+    @traced("evaluator")
     def demote(
         self,
         target_snapshots: t.Iterable[Snapshot],
@@ -357,6 +361,7 @@ class SnapshotEvaluator:
                 self.ddl_concurrent_tasks,
             )
 
+    @traced("evaluator")
     def create(
         self,
         target_snapshots: t.Iterable[Snapshot],
@@ -470,6 +475,7 @@ class SnapshotEvaluator:
             if errors:
                 raise SnapshotCreationFailedError(errors, skipped)
 
+    @traced("evaluator")
     def migrate(
         self,
         target_snapshots: t.Iterable[Snapshot],
@@ -514,6 +520,7 @@ class SnapshotEvaluator:
                 self.ddl_concurrent_tasks,
             )
 
+    @traced("evaluator")
     def cleanup(
         self,
         target_snapshots: t.Iterable[SnapshotTableCleanupTask],
@@ -563,6 +570,7 @@ class SnapshotEvaluator:
             errored_snapshots = "\n".join(f"  {e.node.name}: {e.__cause__}" for e in errors)
             raise SQLMeshError(f"\n{errored_snapshots}")
 
+    @traced("evaluator")
     def audit(
         self,
         snapshot: Snapshot,
@@ -1,8 +1,9 @@
 from __future__ import annotations
 
+import time
 import typing as t
 from contextlib import contextmanager
-from threading import local
+from threading import Lock, local
 from dataclasses import dataclass, field
 from sqlmesh.core.snapshot import SnapshotIdBatch
 
@@ -12,6 +13,7 @@ class QueryExecutionStats:
     snapshot_id_batch: SnapshotIdBatch
     total_rows_processed: t.Optional[int] = None
     total_bytes_processed: t.Optional[int] = None
+    duration_ms: t.Optional[int] = None
 
 
 @dataclass
@@ -54,11 +56,22 @@ class QueryExecutionContext:
 
 
 class QueryExecutionTracker:
-    """Thread-local context manager for snapshot execution statistics, such as rows processed."""
+    """Thread-local context manager for snapshot execution statistics, such as rows processed.
 
-    def __init__(self) -> None:
+    The tracker also maintains an exponentially weighted moving average of the evaluation duration
+    of each snapshot batch, keyed by snapshot name. These estimates are used by the scheduler to
+    prioritize long-running chains of snapshots.
+
+    Args:
+        duration_smoothing: The weight given to the most recent duration when updating the moving average.
+    """
+
+    def __init__(self, duration_smoothing: float = 0.5) -> None:
         self._thread_local = local()
         self._contexts: t.Dict[SnapshotIdBatch, QueryExecutionContext] = {}
+        self._duration_smoothing = duration_smoothing
+        self._duration_estimates: t.Dict[str, float] = {}
+        self._duration_estimates_lock = Lock()
 
     def get_execution_context(
         self, snapshot_id_batch: SnapshotIdBatch
@@ -77,8 +90,11 @@ class QueryExecutionTracker:
         self._thread_local.context = context
         self._contexts[snapshot_id_batch] = context
 
+        start = time.perf_counter()
         try:
             yield context
+            context.stats.duration_ms = int((time.perf_counter() - start) * 1000)
+            self.record_duration(snapshot_id_batch.snapshot_id.name, context.stats.duration_ms)
         finally:
             self._thread_local.context = None
 
@@ -95,3 +111,28 @@ class QueryExecutionTracker:
         context = self._contexts.get(snapshot_id_batch)
         self._contexts.pop(snapshot_id_batch, None)
         return context.get_execution_stats() if context else None
+
+    def record_duration(self, snapshot_name: str, duration_ms: float) -> None:
+        """Updates the duration estimate of a single batch evaluation of the given snapshot."""
+        with self._duration_estimates_lock:
+            previous = self._duration_estimates.get(snapshot_name)
+            if previous is None:
+                self._duration_estimates[snapshot_name] = float(duration_ms)
+            else:
+                self._duration_estimates[snapshot_name] = (
+                    self._duration_smoothing * duration_ms
+                    + (1 - self._duration_smoothing) * previous
+                )
+
+    def get_duration_estimates(self) -> t.Dict[str, float]:
+        """Returns the estimated duration in milliseconds of a single batch evaluation per snapshot name."""
+        with self._duration_estimates_lock:
+            return dict(self._duration_estimates)
+
+    def update_duration_estimates(self, duration_estimates: t.Dict[str, float]) -> None:
+        """Seeds the duration estimates, e.g. with estimates persisted by a previous run.
+
+        Estimates that have already been recorded by this tracker take precedence.
+        """
+        with self._duration_estimates_lock:
+            self._duration_estimates = {**duration_estimates, **self._duration_estimates}
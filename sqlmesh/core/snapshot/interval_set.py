@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+import typing as t
+from array import array
+from bisect import bisect_left, bisect_right
+
+
+class IntervalSet:
+    """A sorted collection of [start, end) intervals with coalescing insertion and removal.
+
+    Bounds are stored in a single flat `array('q')` of the form `[start_0, end_0, start_1, end_1, ...]`
+    which is kept sorted, so that the intervals affected by an insertion or a removal are located with
+    two binary searches and only that slice of the array is rewritten. Overlapping or adjacent intervals
+    are merged on insertion, following the same rules as `merge_intervals`.
+
+    The collection behaves like a sequence of `(start, end)` tuples and compares equal to lists and tuples
+    with the same intervals. Use `to_list` to get the regular list representation used by snapshots.
+
+    Args:
+        intervals: The initial intervals. They don't need to be sorted or merged.
+    """
+
+    __slots__ = ("_bounds", "_has_splits")
+
+    _bounds: array[int]
+    _has_splits: bool
+
+    def __init__(self, intervals: t.Iterable[t.Tuple[int, int]] = ()):
+        if isinstance(intervals, IntervalSet):
+            self._bounds = array("q", intervals._bounds)
+            self._has_splits = intervals._has_splits
+            return
+
+        self._has_splits = False
+
+        self._bounds = array("q")
+        bounds = self._bounds
+        for start, end in sorted(intervals):
+            if bounds and start <= bounds[-1]:
+                if end > bounds[-1]:
+                    bounds[-1] = end
+            else:
+                bounds.append(start)
+                bounds.append(end)
+
+    def add(self, start: int, end: int) -> None:
+        """Adds the [start, end) interval, merging it with any overlapping or adjacent intervals."""
+        if self._has_splits:
+            # Empty removals leave adjacent intervals behind, which merge_intervals would coalesce
+            self._bounds = IntervalSet(self.to_list())._bounds
+            self._has_splits = False
+
+        lo, hi = self._affected_range(start, end)
+        if lo < hi:
+            start = min(start, self._bounds[2 * lo])
+            end = max(end, self._bounds[2 * hi - 1])
+        self._bounds[2 * lo : 2 * hi] = array("q", (start, end))
+
+    def remove(self, start: int, end: int) -> None:
+        """Removes the [start, end) interval, splitting or trimming any intervals that overlap with it.
+
+        Like `remove_interval`, removing an empty interval splits the interval that strictly
+        contains its start at that point, without removing anything from it. The split is undone
+        by the next `add`.
+        """
+        if start >= end:
+            i = bisect_right(self._bounds, start)
+            if i % 2 and self._bounds[i - 1] < start:
+                self._bounds[i:i] = array("q", (start, start))
+                self._has_splits = True
+            return
+
+        lo, hi = self._affected_range(start, end)
+        remaining = array("q")
+        for i in range(lo, hi):
+            current_start, current_end = self._bounds[2 * i], self._bounds[2 * i + 1]
+            if current_start < start:
+                remaining.append(current_start)
+                remaining.append(min(start, current_end))
+            if current_end > end:
+                remaining.append(max(end, current_start))
+                remaining.append(current_end)
+        self._bounds[2 * lo : 2 * hi] = remaining
+
+    def update(self, intervals: t.Iterable[t.Tuple[int, int]]) -> None:
+        """Adds all given intervals."""
+        for start, end in intervals:
+            self.add(start, end)
+
+    def to_list(self) -> t.List[t.Tuple[int, int]]:
+        """Returns the intervals as a list of tuples."""
+        bounds = self._bounds
+        return [(bounds[i], bounds[i + 1]) for i in range(0, len(bounds), 2)]
+
+    def copy(self) -> IntervalSet:
+        return IntervalSet(self)
+
+    def _affected_range(self, start: int, end: int) -> t.Tuple[int, int]:
+        """Returns the [lo, hi) range of indices of intervals which overlap with or are adjacent to [start, end]."""
+        # The first interval whose end is not before `start`
+        lo = bisect_left(self._bounds, start) // 2
+        # The first interval which starts after `end`
+        hi = (bisect_right(self._bounds, end) + 1) // 2
+        return lo, hi
+
+    def __iter__(self) -> t.Iterator[t.Tuple[int, int]]:
+        bounds = self._bounds
+        for i in range(0, len(bounds), 2):
+            yield bounds[i], bounds[i + 1]
+
+    def __len__(self) -> int:
+        return len(self._bounds) // 2
+
+    def __bool__(self) -> bool:
+        return bool(self._bounds)
+
+    @t.overload
+    def __getitem__(self, index: int) -> t.Tuple[int, int]: ...
+
+    @t.overload
+    def __getitem__(self, index: slice) -> t.List[t.Tuple[int, int]]: ...
+
+    def __getitem__(
+        self, index: t.Union[int, slice]
+    ) -> t.Union[t.Tuple[int, int], t.List[t.Tuple[int, int]]]:
+        if isinstance(index, slice):
+            return self.to_list()[index]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("IntervalSet index out of range")
+        return self._bounds[2 * index], self._bounds[2 * index + 1]
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, IntervalSet):
+            return self._bounds == other._bounds
+        if isinstance(other, (list, tuple)):
+            return self.to_list() == [tuple(interval) for interval in other]
+        return NotImplemented
+
+    def __reduce__(self) -> t.Tuple[t.Type[IntervalSet], t.Tuple[t.List[t.Tuple[int, int]]]]:
+        return (IntervalSet, (self.to_list(),))
+
+    def __repr__(self) -> str:
+        return f"IntervalSet({self.to_list()!r})"
@@ -22,6 +22,7 @@ from sqlmesh.core.snapshot import (
     SnapshotInfoLike,
     SnapshotNameVersion,
     SnapshotIdAndVersion,
+    SnapshotTableInfo,
 )
 from sqlmesh.core.snapshot.definition import Interval, SnapshotIntervals
 from sqlmesh.utils import major_minor
@@ -90,6 +91,23 @@ class StateReader(abc.ABC):
             A dictionary of snapshot ids to snapshots for ones that could be found.
         """
 
+    @abc.abstractmethod
+    def get_snapshot_table_infos(
+        self, snapshot_ids: t.Iterable[SnapshotIdLike]
+    ) -> t.Dict[SnapshotId, SnapshotTableInfo]:
+        """Bulk fetch table infos of snapshots given the corresponding snapshot ids.
+
+        This is a cheaper alternative to `get_snapshots` for callers that only need the snapshot's
+        name, version, kind, fingerprint, parents and physical table details, since it doesn't require
+        deserializing the snapshot's node. Intervals are not fetched.
+
+        Args:
+            snapshot_ids: Iterable of snapshot ids to get.
+
+        Returns:
+            A dictionary of snapshot ids to table infos for ones that could be found.
+        """
+
     @abc.abstractmethod
     def get_snapshots_by_names(
         self,
@@ -473,11 +491,21 @@ class StateSync(StateReader, abc.ABC):
         """
 
     @abc.abstractmethod
-    def compact_intervals(self) -> None:
+    def compact_intervals(
+        self,
+        batch_size: t.Optional[int] = None,
+        min_uncompacted_intervals: t.Optional[int] = None,
+    ) -> None:
         """Compacts intervals for all snapshots.
 
         Compaction process involves merging of existing interval records into new records and
         then deleting the old ones.
+
+        Args:
+            batch_size: The number of snapshots whose intervals are compacted in a single transaction.
+                All intervals are compacted in one transaction if not provided.
+            min_uncompacted_intervals: Skip compaction if there are fewer uncompacted interval records
+                than this.
         """
 
     @abc.abstractmethod
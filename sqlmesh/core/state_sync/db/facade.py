@@ -64,6 +64,7 @@ from sqlmesh.core.state_sync.db.version import VersionState
 from sqlmesh.core.state_sync.db.migrator import StateMigrator, _backup_table_name
 from sqlmesh.utils.date import TimeLike, to_timestamp, time_like_to_str, now_timestamp
 from sqlmesh.utils.errors import ConflictingPlanError, SQLMeshError
+from sqlmesh.utils.tracing import traced
 
 logger = logging.getLogger(__name__)
 
@@ -81,7 +82,11 @@ class EngineAdapterStateSync(StateSync):
         engine_adapter: The EngineAdapter to use to store and fetch snapshots.
         schema: The schema to store state metadata in. If None or empty string then no schema is defined
         console: The console to log information to.
-        cache_dir: The cache path, used for caching snapshot models.
+        cache_dir: The cache path, used for caching snapshot models and intervals.
+        server_side_interval_aggregation: Whether to coalesce contiguous snapshot intervals in the state
+            database when the engine supports it.
+        cache_namespace: Identifies the state store in the cache directory, so that the cached data of
+            different state stores that share a cache directory is kept apart.
     """
 
     def __init__(
@@ -90,8 +95,16 @@ class EngineAdapterStateSync(StateSync):
         schema: t.Optional[str],
         console: t.Optional[Console] = None,
         cache_dir: Path = Path(),
+        server_side_interval_aggregation: bool = False,
+        cache_namespace: t.Optional[str] = None,
     ):
-        self.interval_state = IntervalState(engine_adapter, schema=schema)
+        self.interval_state = IntervalState(
+            engine_adapter,
+            schema=schema,
+            cache_dir=cache_dir,
+            server_side_aggregation=server_side_interval_aggregation,
+            cache_namespace=cache_namespace,
+        )
         self.environment_state = EnvironmentState(engine_adapter, schema=schema)
         self.snapshot_state = SnapshotState(engine_adapter, schema=schema, cache_dir=cache_dir)
         self.version_state = VersionState(engine_adapter, schema=schema)
@@ -108,6 +121,7 @@ class EngineAdapterStateSync(StateSync):
         self.engine_adapter = engine_adapter
         self.console = console or get_console()
 
+    @traced("state")
     @transactional()
     def push_snapshots(self, snapshots: t.Iterable[Snapshot]) -> None:
         """Pushes snapshots to the state store, merging them with existing ones.
@@ -143,6 +157,7 @@ class EngineAdapterStateSync(StateSync):
         if snapshots:
             self.snapshot_state.push_snapshots(snapshots)
 
+    @traced("state")
     @transactional()
     def promote(
         self,
@@ -242,6 +257,7 @@ class EngineAdapterStateSync(StateSync):
             ),
         )
 
+    @traced("state")
     @transactional()
     def finalize(self, environment: Environment) -> None:
         """Finalize the target environment, indicating that this environment has been
@@ -252,6 +268,7 @@ class EngineAdapterStateSync(StateSync):
         """
         self.environment_state.finalize(environment)
 
+    @traced("state")
     @transactional()
     def unpause_snapshots(
         self, snapshots: t.Collection[SnapshotInfoLike], unpaused_dt: TimeLike
@@ -261,6 +278,7 @@ class EngineAdapterStateSync(StateSync):
     def invalidate_environment(self, name: str, protect_prod: bool = True) -> None:
         self.environment_state.invalidate_environment(name, protect_prod)
 
+    @traced("state")
     def get_expired_snapshots(
         self,
         *,
@@ -281,6 +299,7 @@ class EngineAdapterStateSync(StateSync):
     ) -> t.List[EnvironmentSummary]:
         return self.environment_state.get_expired_environments(current_ts=current_ts, name=name)
 
+    @traced("state")
     @transactional()
     def delete_expired_snapshots(
         self,
@@ -307,9 +326,11 @@ class EngineAdapterStateSync(StateSync):
     def delete_snapshots(self, snapshot_ids: t.Iterable[SnapshotIdLike]) -> None:
         self.snapshot_state.delete_snapshots(snapshot_ids)
 
+    @traced("state")
     def snapshots_exist(self, snapshot_ids: t.Iterable[SnapshotIdLike]) -> t.Set[SnapshotId]:
         return self.snapshot_state.snapshots_exist(snapshot_ids)
 
+    @traced("state")
     def nodes_exist(self, names: t.Iterable[str], exclude_external: bool = False) -> t.Set[str]:
         return self.snapshot_state.nodes_exist(names, exclude_external)
 
@@ -321,6 +342,7 @@ class EngineAdapterStateSync(StateSync):
             self.environment_state.environments_table,
             self.environment_state.environment_statements_table,
             self.interval_state.intervals_table,
+            self.interval_state.interval_revisions_table,
             self.version_state.versions_table,
         ):
             self.engine_adapter.drop_table(table)
@@ -328,6 +350,7 @@ class EngineAdapterStateSync(StateSync):
                 self.engine_adapter.drop_table(_backup_table_name(table))
 
         self.snapshot_state.clear_cache()
+        self.interval_state.clear_cache()
 
     def reset(self, default_catalog: t.Optional[str]) -> None:
         """Resets the state store to the state when it was first initialized."""
@@ -340,12 +363,15 @@ class EngineAdapterStateSync(StateSync):
     ) -> None:
         self.snapshot_state.update_auto_restatements(next_auto_restatement_ts)
 
+    @traced("state")
     def get_environment(self, environment: str) -> t.Optional[Environment]:
         return self.environment_state.get_environment(environment)
 
+    @traced("state")
     def get_environment_statements(self, environment: str) -> t.List[EnvironmentStatements]:
         return self.environment_state.get_environment_statements(environment)
 
+    @traced("state")
     def get_environments(self) -> t.List[Environment]:
         """Fetches all environments.
 
@@ -354,6 +380,7 @@ class EngineAdapterStateSync(StateSync):
         """
         return self.environment_state.get_environments()
 
+    @traced("state")
     def get_environments_summary(self) -> t.List[EnvironmentSummary]:
         """Fetches all environment names along with expiry datetime.
 
@@ -362,6 +389,7 @@ class EngineAdapterStateSync(StateSync):
         """
         return self.environment_state.get_environments_summary()
 
+    @traced("state")
     def get_snapshots(
         self,
         snapshot_ids: t.Iterable[SnapshotIdLike],
@@ -379,6 +407,14 @@ class EngineAdapterStateSync(StateSync):
         Snapshot.hydrate_with_intervals_by_version(snapshots.values(), intervals)
         return snapshots
 
+    @traced("state")
+    def get_snapshot_table_infos(
+        self,
+        snapshot_ids: t.Iterable[SnapshotIdLike],
+    ) -> t.Dict[SnapshotId, SnapshotTableInfo]:
+        return self.snapshot_state.get_snapshot_table_infos(snapshot_ids)
+
+    @traced("state")
     def get_snapshots_by_names(
         self,
         snapshot_names: t.Iterable[str],
@@ -400,6 +436,7 @@ class EngineAdapterStateSync(StateSync):
     ) -> None:
         super().add_interval(snapshot, start, end, is_dev, last_altered_ts)
 
+    @traced("state")
     @transactional()
     def add_snapshots_intervals(self, snapshots_intervals: t.Sequence[SnapshotIntervals]) -> None:
         intervals_to_insert = []
@@ -421,6 +458,7 @@ class EngineAdapterStateSync(StateSync):
         if intervals_to_insert:
             self.interval_state.add_snapshots_intervals(intervals_to_insert)
 
+    @traced("state")
     @transactional()
     def remove_intervals(
         self,
@@ -429,13 +467,44 @@ class EngineAdapterStateSync(StateSync):
     ) -> None:
         self.interval_state.remove_intervals(snapshot_intervals, remove_shared_versions)
 
-    @transactional()
-    def compact_intervals(self) -> None:
-        self.interval_state.compact_intervals()
+    def compact_intervals(
+        self,
+        batch_size: t.Optional[int] = None,
+        min_uncompacted_intervals: t.Optional[int] = None,
+    ) -> None:
+        if min_uncompacted_intervals:
+            uncompacted_intervals_count = self.interval_state.count_uncompacted_intervals()
+            if uncompacted_intervals_count < min_uncompacted_intervals:
+                logger.info(
+                    "Skipping compaction of %s intervals, the threshold is %s",
+                    uncompacted_intervals_count,
+                    min_uncompacted_intervals,
+                )
+                return
+
+        if batch_size is None:
+            with self._transaction():
+                self.interval_state.compact_intervals()
+            return
+
+        snapshots = self.interval_state.get_uncompacted_snapshots()
+        batches_num = -(-len(snapshots) // batch_size)
+        for i, batch in enumerate(chunk_iterable(snapshots, batch_size)):
+            with self._transaction():
+                records_before, records_after = self.interval_state.compact_intervals(list(batch))
+            logger.info(
+                "Compacted intervals batch %s/%s: %s records before, %s records after",
+                i + 1,
+                batches_num,
+                records_before,
+                records_after,
+            )
 
+    @traced("state")
     def refresh_snapshot_intervals(self, snapshots: t.Collection[Snapshot]) -> t.List[Snapshot]:
         return self.interval_state.refresh_snapshot_intervals(snapshots)
 
+    @traced("state")
     def max_interval_end_per_model(
         self,
         environment: str,
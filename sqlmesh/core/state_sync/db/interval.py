@@ -2,6 +2,9 @@ from __future__ import annotations
 
 import typing as t
 import logging
+import threading
+from collections import defaultdict
+from pathlib import Path
 
 from sqlglot import exp
 
@@ -11,6 +14,7 @@ from sqlmesh.core.state_sync.db.utils import (
     snapshot_id_filter,
     create_batches,
     fetchall,
+    fetchone,
 )
 from sqlmesh.core.snapshot import (
     SnapshotIntervals,
@@ -22,6 +26,9 @@ from sqlmesh.core.snapshot import (
     Snapshot,
 )
 from sqlmesh.core.snapshot.definition import Interval
+from sqlmesh.core.snapshot.interval_set import IntervalSet
+from sqlmesh.utils.cache import FileCache
+from sqlmesh.utils.hashing import crc32, md5
 from sqlmesh.utils.migration import index_text_type
 from sqlmesh.utils import random_id
 from sqlmesh.utils.date import now_timestamp
@@ -33,20 +40,55 @@ if t.TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
+_IntervalsCacheKey = t.Tuple[str, str]
+_IntervalsCache = t.Dict[_IntervalsCacheKey, t.Tuple[str, t.List[SnapshotIntervals]]]
+
+
 class IntervalState:
     INTERVAL_BATCH_SIZE = 1000
     SNAPSHOT_BATCH_SIZE = 1000
+    # The maximum number of snapshot names and versions whose folded intervals are kept in the cache
+    MAX_CACHED_INTERVALS = 10_000
+    # The number of cache entries the cached intervals are spread across
+    INTERVALS_CACHE_CHUNKS = 64
 
     def __init__(
         self,
         engine_adapter: EngineAdapter,
         schema: t.Optional[str] = None,
         table_name: t.Optional[str] = None,
+        cache_dir: t.Optional[Path] = None,
+        server_side_aggregation: bool = False,
+        cache_namespace: t.Optional[str] = None,
     ):
         self.engine_adapter = engine_adapter
         self.intervals_table = exp.table_(table_name or "_intervals", db=schema)
+        self.interval_revisions_table = exp.table_("_interval_revisions", db=schema)
+        self.server_side_aggregation = (
+            server_side_aggregation and engine_adapter.SUPPORTS_WINDOW_FUNCTIONS
+        )
+
+        # Folded intervals keyed by snapshot name and version together with the revision of the
+        # interval records they were built from. Entries are reused until the revision changes.
+        # Entries are spread across a fixed number of chunks by the hash of their key. Each chunk
+        # is loaded on first use and persisted as its own cache entry only when it changes. Chunks
+        # are named after the state store, so that state stores sharing a cache folder don't
+        # overwrite each other's.
+        self._intervals_cache_chunks: t.Dict[int, _IntervalsCache] = {}
+        self._intervals_cache_lock = threading.Lock()
+        self._intervals_file_cache: t.Optional[FileCache[_IntervalsCache]] = (
+            FileCache(cache_dir, prefix="intervals") if cache_dir is not None else None
+        )
+        self._intervals_cache_entry_name = md5(
+            [cache_namespace or "", engine_adapter.dialect, self.intervals_table.sql()]
+        )
 
         index_type = index_text_type(engine_adapter.dialect)
+        self._interval_revision_columns_to_types = {
+            "name": exp.DataType.build(index_type),
+            "version": exp.DataType.build(index_type),
+            "revision": exp.DataType.build(index_type),
+        }
         self._interval_columns_to_types = {
             "id": exp.DataType.build(index_type),
             "created_ts": exp.DataType.build("bigint"),
@@ -66,6 +108,7 @@ class IntervalState:
     def add_snapshots_intervals(self, snapshots_intervals: t.Sequence[SnapshotIntervals]) -> None:
         if snapshots_intervals:
             self._push_snapshot_intervals(snapshots_intervals)
+            self._add_interval_revisions(snapshots_intervals)
 
     def remove_intervals(
         self,
@@ -118,20 +161,113 @@ class IntervalState:
             target_columns_to_types=self._interval_columns_to_types,
             track_rows_processed=False,
         )
+        self._add_interval_revisions(s for s, _ in intervals_to_remove)
 
     def get_snapshot_intervals(
         self, snapshots: t.Collection[SnapshotNameVersionLike]
     ) -> t.List[SnapshotIntervals]:
-        return self._get_snapshot_intervals(snapshots)[1]
+        """Fetches intervals of the given snapshots.
+
+        Instead of folding every interval record on each call, the revision of the interval records
+        is fetched first for each snapshot name and version. Every write to the interval records
+        adds a revision for the affected names and versions, so records are only fetched and folded
+        for pairs whose revision differs from the one of the locally cached result. Repeated calls
+        only pay for what has changed since the previous call.
+
+        Args:
+            snapshots: The snapshots to fetch intervals for.
+
+        Returns:
+            The list of snapshot intervals.
+        """
+        # Interval records are keyed by version, so snapshots without one can't have any
+        snapshots_by_key = {(s.name, s.version): s for s in snapshots if s.version}
+        if not snapshots_by_key:
+            return []
+
+        revisions = self._get_interval_revisions(snapshots_by_key.values())
+
+        result: t.List[SnapshotIntervals] = []
+        stale_keys = []
+        with self._intervals_cache_lock:
+            for key in snapshots_by_key:
+                cached = self._intervals_cache_chunk(key).get(key)
+                if cached is None or cached[0] != revisions.get(key):
+                    stale_keys.append(key)
+                    continue
+                result.extend(cached[1])
+
+        if not stale_keys:
+            return result
+
+        stale_snapshots = [snapshots_by_key[key] for key in stale_keys]
+        intervals = (
+            self._get_aggregated_snapshot_intervals(stale_snapshots)
+            if self.server_side_aggregation
+            else self._get_snapshot_intervals(stale_snapshots)[1]
+        )
+        intervals_by_key = defaultdict(list)
+        for snapshot_intervals in intervals:
+            intervals_by_key[_intervals_cache_key(snapshot_intervals)].append(snapshot_intervals)
+
+        max_chunk_size = -(-self.MAX_CACHED_INTERVALS // self.INTERVALS_CACHE_CHUNKS)
+        with self._intervals_cache_lock:
+            changed_chunks: t.Set[int] = set()
+            for key in stale_keys:
+                key_intervals = intervals_by_key.get(key, [])
+                result.extend(key_intervals)
+
+                chunk_id = _intervals_cache_chunk_id(key, self.INTERVALS_CACHE_CHUNKS)
+                chunk = self._intervals_cache_chunk(key)
+                # Refreshed entries are moved to the end, so that the least recently refreshed ones are evicted first
+                if chunk.pop(key, None) is not None:
+                    changed_chunks.add(chunk_id)
+                revision = revisions.get(key)
+                if revision is not None:
+                    chunk[key] = (revision, key_intervals)
+                    changed_chunks.add(chunk_id)
+
+            for chunk_id in changed_chunks:
+                chunk = self._intervals_cache_chunks[chunk_id]
+                for key in list(chunk)[: max(len(chunk) - max_chunk_size, 0)]:
+                    del chunk[key]
+                if self._intervals_file_cache:
+                    self._intervals_file_cache.put(
+                        self._intervals_cache_entry_name, str(chunk_id), value=chunk
+                    )
+
+        return result
+
+    def clear_cache(self) -> None:
+        """Clears the intervals cache."""
+        with self._intervals_cache_lock:
+            self._intervals_cache_chunks = {}
+            if self._intervals_file_cache:
+                self._intervals_file_cache.clear()
 
-    def compact_intervals(self) -> None:
-        interval_ids, snapshot_intervals = self._get_snapshot_intervals(uncompacted_only=True)
+    def compact_intervals(
+        self, snapshots: t.Optional[t.Collection[SnapshotNameVersionLike]] = None
+    ) -> t.Tuple[int, int]:
+        """Merges interval records into new compacted records and deletes the old ones.
+
+        Args:
+            snapshots: Limits compaction to interval records of these snapshot names and versions. All
+                records are compacted if not provided.
+
+        Returns:
+            The number of interval records before and after compaction.
+        """
+        interval_ids, snapshot_intervals = self._get_snapshot_intervals(
+            snapshots, uncompacted_only=True
+        )
 
         logger.info(
             "Compacting %s intervals for %s snapshots", len(interval_ids), len(snapshot_intervals)
         )
 
-        self._push_snapshot_intervals(snapshot_intervals, is_compacted=True)
+        compacted_records_count = self._push_snapshot_intervals(
+            snapshot_intervals, is_compacted=True
+        )
 
         if interval_ids:
             for interval_id_batch in create_batches(
@@ -140,12 +276,39 @@ class IntervalState:
                 self.engine_adapter.delete_from(
                     self.intervals_table, exp.column("id").isin(*interval_id_batch)
                 )
+            self._compact_interval_revisions(snapshot_intervals)
+
+        return len(interval_ids), compacted_records_count
+
+    def get_uncompacted_snapshots(self) -> t.List[SnapshotNameVersion]:
+        """Returns names and versions of snapshots which have uncompacted interval records."""
+        return [
+            SnapshotNameVersion(name=name, version=version)
+            for name, version in fetchall(
+                self.engine_adapter,
+                exp.select("name", "version")
+                .from_(self.intervals_table)
+                .where(exp.column("is_compacted").not_())
+                .distinct()
+                .order_by("name", "version"),
+            )
+        ]
+
+    def count_uncompacted_intervals(self) -> int:
+        """Returns the number of interval records which haven't been compacted yet."""
+        row = fetchone(
+            self.engine_adapter,
+            exp.select(exp.func("COUNT", exp.Star()))
+            .from_(self.intervals_table)
+            .where(exp.column("is_compacted").not_()),
+        )
+        return row[0] if row else 0
 
     def refresh_snapshot_intervals(self, snapshots: t.Collection[Snapshot]) -> t.List[Snapshot]:
         if not snapshots:
             return []
 
-        _, intervals = self._get_snapshot_intervals([s for s in snapshots if s.version])
+        intervals = self.get_snapshot_intervals([s for s in snapshots if s.version])
         for s in snapshots:
             s.intervals = []
             s.dev_intervals = []
@@ -194,8 +357,9 @@ class IntervalState:
         cleanup_targets: t.List[SnapshotTableCleanupTask],
         expired_snapshot_ids: t.Collection[SnapshotIdLike],
     ) -> None:
-        # Cleanup can only happen for compacted intervals
-        self.compact_intervals()
+        # Cleanup can only happen for compacted intervals. Only the records of the snapshots being cleaned up
+        # are compacted here to keep the transaction short, the rest is left to the regular compaction.
+        self.compact_intervals({t.snapshot.name_version for t in cleanup_targets})
         # Delete intervals for non-dev tables that are no longer used
         self._delete_intervals_by_version(cleanup_targets)
         # Delete dev intervals for dev tables that are no longer used
@@ -207,7 +371,7 @@ class IntervalState:
         self,
         snapshots: t.Iterable[t.Union[Snapshot, SnapshotIntervals]],
         is_compacted: bool = False,
-    ) -> None:
+    ) -> int:
         import pandas as pd
 
         new_intervals = []
@@ -258,6 +422,7 @@ class IntervalState:
                 target_columns_to_types=self._interval_columns_to_types,
                 track_rows_processed=False,
             )
+        return len(new_intervals)
 
     def _get_snapshot_intervals(
         self,
@@ -271,7 +436,7 @@ class IntervalState:
 
         interval_ids: t.Set[str] = set()
         intervals: t.Dict[
-            t.Tuple[str, str, t.Optional[str], t.Optional[str]], SnapshotIntervals
+            t.Tuple[str, str, t.Optional[str], t.Optional[str]], _SnapshotIntervalsBuilder
         ] = {}
 
         for where in (
@@ -304,7 +469,7 @@ class IntervalState:
                 pending_restatement_interval_merge_key = (name, version, None, None)
 
                 if merge_key not in intervals:
-                    intervals[merge_key] = SnapshotIntervals(
+                    intervals[merge_key] = _SnapshotIntervalsBuilder(
                         name=name,
                         identifier=identifier,
                         version=version,
@@ -312,7 +477,7 @@ class IntervalState:
                     )
 
                 if pending_restatement_interval_merge_key not in intervals:
-                    intervals[pending_restatement_interval_merge_key] = SnapshotIntervals(
+                    intervals[pending_restatement_interval_merge_key] = _SnapshotIntervalsBuilder(
                         name=name,
                         identifier=None,
                         version=version,
@@ -340,7 +505,251 @@ class IntervalState:
                             pending_restatement_interval_merge_key
                         ].remove_pending_restatement_interval(start, end)
 
-        return interval_ids, [i for i in intervals.values() if not i.is_empty()]
+        return interval_ids, [i.build() for i in intervals.values() if not i.is_empty()]
+
+    def _get_aggregated_snapshot_intervals(
+        self, snapshots: t.Collection[SnapshotNameVersionLike]
+    ) -> t.List[SnapshotIntervals]:
+        """Fetches intervals of the given snapshots with contiguous intervals coalesced by the engine.
+
+        The result of folding interval records depends on the order in which they were recorded only when
+        removals or pending restatements are involved. Otherwise it's just the union of all added intervals,
+        which is computed in SQL using window functions so that only the resulting intervals are transferred.
+        Snapshot versions that have removed or pending restatement records are folded client-side.
+        """
+        order_dependent_keys = set()
+        for where in snapshot_name_version_filter(
+            self.engine_adapter, snapshots, alias=None, batch_size=self.SNAPSHOT_BATCH_SIZE
+        ):
+            order_dependent_keys.update(
+                fetchall(
+                    self.engine_adapter,
+                    exp.select("name", "version")
+                    .from_(self.intervals_table)
+                    .where(where, copy=False)
+                    .where(
+                        exp.or_(exp.column("is_removed"), exp.column("is_pending_restatement")),
+                        copy=False,
+                    )
+                    .distinct(copy=False),
+                )
+            )
+
+        result = []
+        if order_dependent_keys:
+            _, intervals = self._get_snapshot_intervals(
+                [
+                    SnapshotNameVersion(name=name, version=version)
+                    for name, version in order_dependent_keys
+                ]
+            )
+            result.extend(intervals)
+
+        order_independent_snapshots = [
+            s for s in snapshots if (s.name, s.version) not in order_dependent_keys
+        ]
+        if not order_independent_snapshots:
+            return result
+
+        builders: t.Dict[
+            t.Tuple[str, str, t.Optional[str], t.Optional[str]], _SnapshotIntervalsBuilder
+        ] = {}
+        for where in snapshot_name_version_filter(
+            self.engine_adapter,
+            order_independent_snapshots,
+            alias=None,
+            batch_size=self.SNAPSHOT_BATCH_SIZE,
+        ):
+            for (
+                name,
+                identifier,
+                version,
+                dev_version,
+                is_dev,
+                start,
+                end,
+                last_altered_ts,
+            ) in fetchall(
+                self.engine_adapter, self._get_aggregated_snapshot_intervals_query(where)
+            ):
+                merge_key = (name, version, dev_version, identifier)
+                if merge_key not in builders:
+                    builders[merge_key] = _SnapshotIntervalsBuilder(
+                        name=name,
+                        identifier=identifier,
+                        version=version,
+                        dev_version=dev_version,
+                    )
+                if is_dev:
+                    builders[merge_key].add_dev_interval(start, end)
+                    builders[merge_key].update_dev_last_altered_ts(last_altered_ts)
+                else:
+                    builders[merge_key].add_interval(start, end)
+                    builders[merge_key].update_last_altered_ts(last_altered_ts)
+
+        result.extend(b.build() for b in builders.values())
+        return result
+
+    def _get_aggregated_snapshot_intervals_query(self, where: exp.Condition) -> exp.Select:
+        """Returns a query which coalesces overlapping and adjacent intervals of each snapshot.
+
+        This is a classic gaps-and-islands query: an interval starts a new island when it begins after the
+        end of every interval that precedes it, and each island is then collapsed into a single interval.
+        """
+        partition_by = ["name", "identifier", "version", "dev_version", "is_dev"]
+
+        def window(this: exp.Expr, end: exp.Expr | str, end_side: t.Optional[str]) -> exp.Window:
+            return exp.Window(
+                this=this,
+                partition_by=[exp.column(column) for column in partition_by],
+                order=exp.Order(
+                    expressions=[
+                        exp.Ordered(this=exp.column(c), nulls_first=True)
+                        for c in ("start_ts", "end_ts")
+                    ]
+                ),
+                spec=exp.WindowSpec(
+                    kind="ROWS",
+                    start="UNBOUNDED",
+                    start_side="PRECEDING",
+                    end=end,
+                    end_side=end_side,
+                ),
+            )
+
+        ordered = (
+            exp.select(
+                *partition_by,
+                "start_ts",
+                "end_ts",
+                "last_altered_ts",
+                exp.alias_(
+                    window(
+                        exp.func("MAX", exp.column("end_ts")), exp.Literal.number(1), "PRECEDING"
+                    ),
+                    "prev_max_end_ts",
+                ),
+            )
+            .from_(self.intervals_table)
+            .where(where)
+        )
+        starts_island = (
+            exp.case()
+            .when(exp.column("start_ts") <= exp.column("prev_max_end_ts"), exp.Literal.number(0))
+            .else_(exp.Literal.number(1))
+        )
+        islands = exp.select(
+            *partition_by,
+            "start_ts",
+            "end_ts",
+            "last_altered_ts",
+            exp.alias_(window(exp.func("SUM", starts_island), "CURRENT ROW", None), "island"),
+        ).from_(ordered.subquery("ordered"))
+
+        return (
+            exp.select(
+                *partition_by,
+                exp.func("MIN", exp.column("start_ts")),
+                exp.func("MAX", exp.column("end_ts")),
+                exp.func("MAX", exp.column("last_altered_ts")),
+            )
+            .from_(islands.subquery("islands"))
+            .group_by(*partition_by, "island")
+        )
+
+    def _intervals_cache_chunk(self, key: _IntervalsCacheKey) -> _IntervalsCache:
+        chunk_id = _intervals_cache_chunk_id(key, self.INTERVALS_CACHE_CHUNKS)
+        chunk = self._intervals_cache_chunks.get(chunk_id)
+        if chunk is None:
+            chunk = (
+                self._intervals_file_cache.get(self._intervals_cache_entry_name, str(chunk_id))
+                if self._intervals_file_cache
+                else None
+            ) or {}
+            self._intervals_cache_chunks[chunk_id] = chunk
+        return chunk
+
+    def _get_interval_revisions(
+        self, snapshots: t.Collection[SnapshotNameVersionLike]
+    ) -> t.Dict[_IntervalsCacheKey, str]:
+        """Returns revisions of the interval records of the given snapshot names and versions.
+
+        Names and versions without a revision are omitted, their interval records can't be cached.
+        """
+        revisions = {}
+        for where in snapshot_name_version_filter(
+            self.engine_adapter, snapshots, alias=None, batch_size=self.SNAPSHOT_BATCH_SIZE
+        ):
+            query = (
+                exp.select(
+                    "name",
+                    "version",
+                    exp.func("COUNT", exp.Star()),
+                    exp.func("MAX", exp.column("revision")),
+                )
+                .from_(self.interval_revisions_table)
+                .where(where, copy=False)
+                .group_by("name", "version", copy=False)
+            )
+            for name, version, count, max_revision in fetchall(self.engine_adapter, query):
+                revisions[(name, version)] = f"{count}_{max_revision}"
+        return revisions
+
+    def _add_interval_revisions(
+        self, snapshots: t.Iterable[t.Union[SnapshotNameVersionLike, SnapshotIntervals]]
+    ) -> None:
+        """Records a new revision of the interval records of the given snapshot names and versions.
+
+        Must be called after every write to the interval records, since cached intervals are reused
+        for as long as the revisions of their snapshot name and version don't change. Revisions are
+        only ever appended with a random identifier, so that each write takes a single statement and
+        a revision can't be mistaken for one of another state store.
+        """
+        import pandas as pd
+
+        keys = sorted({_intervals_cache_key(s) for s in snapshots})
+        if not keys:
+            return
+
+        revision = random_id()
+        self.engine_adapter.insert_append(
+            self.interval_revisions_table,
+            pd.DataFrame(
+                [{"name": name, "version": version, "revision": revision} for name, version in keys]
+            ),
+            target_columns_to_types=self._interval_revision_columns_to_types,
+            track_rows_processed=False,
+        )
+
+    def _add_interval_revisions_where(self, where: exp.Condition) -> None:
+        """Records a new revision for the snapshot names and versions of the matching interval records."""
+        self.engine_adapter.insert_append(
+            self.interval_revisions_table,
+            exp.select(
+                "name",
+                "version",
+                exp.Literal.string(random_id()).as_("revision"),
+            )
+            .from_(self.intervals_table)
+            .where(where)
+            .distinct(),
+            target_columns_to_types=self._interval_revision_columns_to_types,
+            track_rows_processed=False,
+        )
+
+    def _compact_interval_revisions(
+        self, snapshots: t.Collection[t.Union[SnapshotNameVersionLike, SnapshotIntervals]]
+    ) -> None:
+        """Replaces the revisions of the given snapshot names and versions with a single new one."""
+        keys = [
+            SnapshotNameVersion(name=name, version=version)
+            for name, version in {_intervals_cache_key(s) for s in snapshots}
+        ]
+        for where in snapshot_name_version_filter(
+            self.engine_adapter, keys, alias=None, batch_size=self.SNAPSHOT_BATCH_SIZE
+        ):
+            self.engine_adapter.delete_from(self.interval_revisions_table, where)
+        self._add_interval_revisions(keys)
 
     def _get_snapshot_intervals_query(self, uncompacted_only: bool) -> exp.Select:
         query = (
@@ -397,6 +806,7 @@ class IntervalState:
         for where in snapshot_id_filter(
             self.engine_adapter, snapshot_ids, alias=None, batch_size=self.SNAPSHOT_BATCH_SIZE
         ):
+            self._add_interval_revisions_where(where)
             # Nullify the identifier for dev intervals
             # Set is_compacted to False so that it's compacted during the next compaction
             self.engine_adapter.update_table(
@@ -429,7 +839,9 @@ class IntervalState:
             alias=None,
             batch_size=self.SNAPSHOT_BATCH_SIZE,
         ):
-            self.engine_adapter.delete_from(self.intervals_table, where.and_(exp.column("is_dev")))
+            where = where.and_(exp.column("is_dev"))
+            self._add_interval_revisions_where(where)
+            self.engine_adapter.delete_from(self.intervals_table, where)
 
     def _delete_intervals_by_version(self, targets: t.List[SnapshotTableCleanupTask]) -> None:
         """Deletes intervals for snapshot versions that are no longer used."""
@@ -444,6 +856,88 @@ class IntervalState:
             batch_size=self.SNAPSHOT_BATCH_SIZE,
         ):
             self.engine_adapter.delete_from(self.intervals_table, where)
+            self.engine_adapter.delete_from(self.interval_revisions_table, where)
+
+
+def _intervals_cache_key(
+    snapshot: t.Union[SnapshotNameVersionLike, SnapshotIntervals],
+) -> _IntervalsCacheKey:
+    name_version = snapshot.name_version
+    return (name_version.name, name_version.version)
+
+
+def _intervals_cache_chunk_id(key: _IntervalsCacheKey, chunks: int) -> int:
+    return int(crc32(key)) % chunks
+
+
+class _SnapshotIntervalsBuilder:
+    """Accumulates interval records of a single snapshot into interval sets.
+
+    Interval records are applied one at a time in the order they were recorded. Keeping them in `IntervalSet`s
+    makes each addition or removal logarithmic in the number of intervals instead of re-sorting and re-merging
+    the whole list for every record.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        identifier: t.Optional[str],
+        version: str,
+        dev_version: t.Optional[str],
+    ):
+        self.name = name
+        self.identifier = identifier
+        self.version = version
+        self.dev_version = dev_version
+        self.intervals = IntervalSet()
+        self.dev_intervals = IntervalSet()
+        self.pending_restatement_intervals = IntervalSet()
+        self.last_altered_ts: t.Optional[int] = None
+        self.dev_last_altered_ts: t.Optional[int] = None
+
+    def add_interval(self, start: int, end: int) -> None:
+        self.intervals.add(start, end)
+
+    def add_dev_interval(self, start: int, end: int) -> None:
+        self.dev_intervals.add(start, end)
+
+    def add_pending_restatement_interval(self, start: int, end: int) -> None:
+        self.pending_restatement_intervals.add(start, end)
+
+    def remove_interval(self, start: int, end: int) -> None:
+        self.intervals.remove(start, end)
+
+    def remove_dev_interval(self, start: int, end: int) -> None:
+        self.dev_intervals.remove(start, end)
+
+    def remove_pending_restatement_interval(self, start: int, end: int) -> None:
+        self.pending_restatement_intervals.remove(start, end)
+
+    def update_last_altered_ts(self, last_altered_ts: t.Optional[int]) -> None:
+        if last_altered_ts:
+            self.last_altered_ts = max(self.last_altered_ts or 0, last_altered_ts)
+
+    def update_dev_last_altered_ts(self, last_altered_ts: t.Optional[int]) -> None:
+        if last_altered_ts:
+            self.dev_last_altered_ts = max(self.dev_last_altered_ts or 0, last_altered_ts)
+
+    def is_empty(self) -> bool:
+        return (
+            not self.intervals and not self.dev_intervals and not self.pending_restatement_intervals
+        )
+
+    def build(self) -> SnapshotIntervals:
+        return SnapshotIntervals(
+            name=self.name,
+            identifier=self.identifier,
+            version=self.version,
+            dev_version=self.dev_version,
+            intervals=self.intervals.to_list(),
+            dev_intervals=self.dev_intervals.to_list(),
+            pending_restatement_intervals=self.pending_restatement_intervals.to_list(),
+            last_altered_ts=self.last_altered_ts,
+            dev_last_altered_ts=self.dev_last_altered_ts,
+        )
 
 
 def _intervals_to_df(
@@ -78,6 +78,7 @@ class StateMigrator:
         ]
         self._optional_state_tables = [
             self.interval_state.intervals_table,
+            self.interval_state.interval_revisions_table,
             self.snapshot_state.auto_restatements_table,
             self.environment_state.environment_statements_table,
         ]
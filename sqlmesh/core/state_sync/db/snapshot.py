@@ -28,6 +28,7 @@ from sqlmesh.core.snapshot import (
     SnapshotIdAndVersion,
     SnapshotId,
     SnapshotFingerprint,
+    SnapshotTableInfo,
 )
 from sqlmesh.core.state_sync.common import (
     RowBoundary,
@@ -74,6 +75,7 @@ class SnapshotState:
             "unrestorable": exp.DataType.build("boolean"),
             "forward_only": exp.DataType.build("boolean"),
             "fingerprint": exp.DataType.build(blob_type),
+            "table_info": exp.DataType.build(blob_type),
         }
 
         self._auto_restatement_columns_to_types = {
@@ -274,12 +276,12 @@ class SnapshotState:
                 cleanup_targets.append((snapshot.snapshot_id, dev_table_only))
 
         snapshot_ids_to_cleanup = [snapshot_id for snapshot_id, _ in cleanup_targets]
-        full_snapshots = self._get_snapshots(snapshot_ids_to_cleanup)
+        table_infos = self.get_snapshot_table_infos(snapshot_ids_to_cleanup)
         for snapshot_id, dev_table_only in cleanup_targets:
-            if snapshot_id in full_snapshots:
+            if snapshot_id in table_infos:
                 cleanup_tasks.append(
                     SnapshotTableCleanupTask(
-                        snapshot=full_snapshots[snapshot_id].table_info,
+                        snapshot=table_infos[snapshot_id],
                         dev_table_only=dev_table_only,
                     )
                 )
@@ -334,6 +336,50 @@ class SnapshotState:
         """
         return self._get_snapshots(snapshot_ids)
 
+    def get_snapshot_table_infos(
+        self,
+        snapshot_ids: t.Iterable[SnapshotIdLike],
+    ) -> t.Dict[SnapshotId, SnapshotTableInfo]:
+        """Fetches table infos of snapshots without deserializing their nodes.
+
+        Table infos are read from a dedicated column. Snapshots stored before this column was introduced
+        don't have it populated, so these are fully loaded instead.
+
+        Args:
+            snapshot_ids: The snapshot IDs to fetch.
+
+        Returns:
+            A dictionary of snapshot IDs to table infos.
+        """
+        table_infos: t.Dict[SnapshotId, SnapshotTableInfo] = {}
+        snapshot_ids_to_load: t.Set[SnapshotId] = set()
+
+        for where in snapshot_id_filter(
+            self.engine_adapter, snapshot_ids, batch_size=self.SNAPSHOT_BATCH_SIZE
+        ):
+            for name, identifier, table_info, forward_only in fetchall(
+                self.engine_adapter,
+                exp.select("name", "identifier", "table_info", "forward_only")
+                .from_(self.snapshots_table)
+                .where(where),
+            ):
+                snapshot_id = SnapshotId(name=name, identifier=identifier)
+                if not table_info:
+                    snapshot_ids_to_load.add(snapshot_id)
+                    continue
+                parsed_table_info = SnapshotTableInfo.parse_raw(table_info)
+                if parsed_table_info.forward_only != bool(forward_only):
+                    parsed_table_info = parsed_table_info.copy(
+                        update={"forward_only": bool(forward_only)}
+                    )
+                table_infos[snapshot_id] = parsed_table_info
+
+        if snapshot_ids_to_load:
+            for snapshot_id, snapshot in self._get_snapshots(snapshot_ids_to_load).items():
+                table_infos[snapshot_id] = snapshot.table_info
+
+        return table_infos
+
     def get_snapshots_by_names(
         self,
         snapshot_names: t.Iterable[str],
@@ -769,6 +815,9 @@ def _snapshots_to_df(snapshots: t.Iterable[Snapshot]) -> pd.DataFrame:
                 "forward_only": snapshot.forward_only,
                 "dev_version": snapshot.dev_version,
                 "fingerprint": snapshot.fingerprint.json(),
+                "table_info": snapshot.table_info.json()
+                if snapshot.change_category and snapshot.version
+                else None,
             }
             for snapshot in snapshots
         ]
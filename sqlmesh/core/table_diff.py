@@ -1,8 +1,14 @@
 from __future__ import annotations
 
+import csv
 import math
 import typing as t
+from contextlib import ExitStack
+from datetime import datetime, timezone
+from decimal import Decimal
+from enum import Enum
 from functools import cached_property
+from pathlib import Path
 
 from sqlmesh.core.dialect import to_schema
 from sqlmesh.core.engine_adapter.mixins import RowDiffMixin
@@ -27,6 +33,26 @@ SQLMESH_JOIN_KEY_COL = "__sqlmesh_join_key"
 SQLMESH_SAMPLE_TYPE_COL = "__sqlmesh_sample_type"
 
 
+class RowDiffAlgorithm(str, Enum):
+    """Algorithm used to compute row level differences between tables.
+
+    JOIN: Materialize a full outer join of the source and target tables.
+    HASHDIFF: Compare checksums of hash-partitioned segments of both tables, recursively bisecting only
+        the segments that differ, and materialize the join only for rows of the mismatched segments.
+    """
+
+    JOIN = "join"
+    HASHDIFF = "hashdiff"
+
+    @property
+    def is_join(self) -> bool:
+        return self == RowDiffAlgorithm.JOIN
+
+    @property
+    def is_hashdiff(self) -> bool:
+        return self == RowDiffAlgorithm.HASHDIFF
+
+
 class SchemaDiff(PydanticModel, frozen=True):
     """An object containing the schema difference between a source and target table."""
 
@@ -219,6 +245,16 @@ class RowDiff(PydanticModel, frozen=True):
 class TableDiff:
     """Calculates differences between tables, taking into account schema and row level differences."""
 
+    # The number of segments each mismatched segment is split into when using the hashdiff algorithm
+    HASHDIFF_BISECTION_FACTOR = 32
+    # Mismatched segments with at most this many rows on either side aren't bisected any further
+    HASHDIFF_MAX_LEAF_ROWS = 10_000
+    # Bisection stops once this many segments would need to be compared
+    HASHDIFF_MAX_SEGMENTS = 4096
+    HASHDIFF_MAX_DEPTH = 8
+    # Whether the row diff is computed by the engine and thus relies on the RowDiffMixin helpers
+    REQUIRES_ROW_DIFF_MIXIN = True
+
     def __init__(
         self,
         adapter: EngineAdapter,
@@ -234,8 +270,9 @@ class TableDiff:
         model_dialect: t.Optional[str] = None,
         decimals: int = 3,
         schema_diff_ignore_case: bool = False,
+        algorithm: RowDiffAlgorithm | str = RowDiffAlgorithm.JOIN,
     ):
-        if not isinstance(adapter, RowDiffMixin):
+        if self.REQUIRES_ROW_DIFF_MIXIN and not isinstance(adapter, RowDiffMixin):
             raise ValueError(f"Engine {adapter} doesnt support RowDiff")
 
         self.adapter = adapter
@@ -250,6 +287,7 @@ class TableDiff:
         self.model_dialect = model_dialect
         self.decimals = decimals
         self.schema_diff_ignore_case = schema_diff_ignore_case
+        self.algorithm = RowDiffAlgorithm(algorithm)
 
         # Support environment aliases for diff output improvement in certain cases
         self.source_alias = source_alias
@@ -323,6 +361,7 @@ class TableDiff:
             return exp.to_column(cols[0].name)
 
         # if there are multiple columns, turn them into a single column by stringify-ing/concatenating them together
+        assert isinstance(self.adapter, RowDiffMixin)
         key_columns_to_types = {key.name: schema[key.name] for key in cols}
         return self.adapter.concat_columns(key_columns_to_types, self.decimals)
 
@@ -342,6 +381,9 @@ class TableDiff:
         self, temp_schema: t.Optional[str] = None, skip_grain_check: bool = False
     ) -> RowDiff:
         if self._row_diff is None:
+            assert isinstance(self.adapter, RowDiffMixin)
+            adapter = self.adapter
+
             source_schema = {
                 c: t for c, t in self.source_schema.items() if c not in self.skip_columns
             }
@@ -369,9 +411,9 @@ class TableDiff:
                 qualified_column = exp.column(name, table)
 
                 if column_type.is_type(*exp.DataType.REAL_TYPES):
-                    return self.adapter._normalize_decimal_value(qualified_column, self.decimals)
+                    return adapter._normalize_decimal_value(qualified_column, self.decimals)
                 if column_type.is_type(*exp.DataType.NESTED_TYPES):
-                    return self.adapter._normalize_nested_value(qualified_column)
+                    return adapter._normalize_nested_value(qualified_column)
 
                 return qualified_column
 
@@ -408,6 +450,13 @@ class TableDiff:
                 .where(self.where)
             )
 
+            # The number of rows in each table which belong to segments with matching checksums
+            matched_rows = 0
+            if self.algorithm.is_hashdiff:
+                source_query, target_query, matched_rows = self._restrict_to_mismatched_segments(
+                    source_query, target_query, matched_columns
+                )
+
             # Ensure every column is qualified with the alias in the source and target queries
             for col in find_all_in_scope(source_query, exp.Column):
                 col.set("table", exp.to_identifier("s"))
@@ -539,9 +588,21 @@ class TableDiff:
                 summary_query = exp.select(*summary_sums).from_(table)
 
                 stats_df = self.adapter.fetchdf(summary_query, quote_identifiers=True).fillna(0)
+                if matched_rows:
+                    # Rows of segments with matching checksums exist on both sides and are identical
+                    matched_stats = [
+                        "s_count",
+                        "t_count",
+                        "join_count",
+                        "full_match_count",
+                        *(c.alias for c in comparisons),
+                    ]
+                    if not skip_grain_check:
+                        matched_stats.extend(["distinct_count_s", "distinct_count_t"])
+                    stats_df[matched_stats] += matched_rows
                 stats_df["s_only_count"] = stats_df["s_count"] - stats_df["join_count"]
                 stats_df["t_only_count"] = stats_df["t_count"] - stats_df["join_count"]
-                stats = stats_df.iloc[0].to_dict()
+                stats = t.cast(t.Dict[str, float], stats_df.iloc[0].to_dict())
 
                 column_stats_query = (
                     exp.select(
@@ -551,9 +612,10 @@ class TableDiff:
                                 100
                                 * (
                                     exp.cast(
-                                        exp.func("SUM", name(c)), exp.DataType.build("NUMERIC")
+                                        _add_matched_rows(exp.func("SUM", name(c)), matched_rows),
+                                        exp.DataType.build("NUMERIC"),
                                     )
-                                    / exp.func("COUNT", name(c))
+                                    / _add_matched_rows(exp.func("COUNT", name(c)), matched_rows)
                                 ),
                                 9,
                             ).as_(c.alias)
@@ -579,102 +641,263 @@ class TableDiff:
                     table, s_selects, s_index, t_selects, t_index, self.limit
                 )
 
-                joined_sample_cols = [f"s__{c}" for c in s_index_names]
-                comparison_cols = [
-                    (f"s__{c}", f"t__{c}")
-                    for c in column_stats[column_stats["pct_match"] < 100].index
-                ]
+                self._row_diff = self._build_row_diff(
+                    stats=stats,
+                    column_stats=column_stats,
+                    sample=sample,
+                    source_columns=source_schema,
+                    target_columns=target_schema,
+                    s_index_names=s_index_names,
+                    t_index_names=t_index_names,
+                    index_cols=index_cols,
+                )
 
-                for cols in comparison_cols:
-                    joined_sample_cols.extend(cols)
+        return self._row_diff
 
-                joined_renamed_cols = {
-                    c: c.split("__")[1] if c.split("__")[1] in index_cols else c
-                    for c in joined_sample_cols
-                }
+    def _build_row_diff(
+        self,
+        stats: t.Dict[str, float],
+        column_stats: pd.DataFrame,
+        sample: pd.DataFrame,
+        source_columns: t.Iterable[str],
+        target_columns: t.Iterable[str],
+        s_index_names: t.List[str],
+        t_index_names: t.List[str],
+        index_cols: t.List[str],
+    ) -> RowDiff:
+        joined_sample_cols = [f"s__{c}" for c in s_index_names]
+        comparison_cols = [
+            (f"s__{c}", f"t__{c}") for c in column_stats[column_stats["pct_match"] < 100].index
+        ]
 
-                if (
-                    self.source_alias
-                    and self.target_alias
-                    and self.source != self.source_alias
-                    and self.target != self.target_alias
-                ):
-                    joined_renamed_cols = {
-                        c: (
-                            n.replace(
-                                "s__",
-                                f"{self.source_alias.upper()}__",
-                            )
-                            if n.startswith("s__")
-                            else n
-                        )
-                        for c, n in joined_renamed_cols.items()
-                    }
-                    joined_renamed_cols = {
-                        c: (
-                            n.replace(
-                                "t__",
-                                f"{self.target_alias.upper()}__",
-                            )
-                            if n.startswith("t__")
-                            else n
-                        )
-                        for c, n in joined_renamed_cols.items()
-                    }
+        for cols in comparison_cols:
+            joined_sample_cols.extend(cols)
 
-                joined_sample = sample[sample[SQLMESH_SAMPLE_TYPE_COL] == "common_rows"][
-                    joined_sample_cols
-                ]
-                joined_sample.rename(
-                    columns=joined_renamed_cols,
-                    inplace=True,
-                )
+        joined_renamed_cols = {
+            c: c.split("__")[1] if c.split("__")[1] in index_cols else c for c in joined_sample_cols
+        }
 
-                s_sample = sample[sample[SQLMESH_SAMPLE_TYPE_COL] == "source_only"][
-                    [
-                        *[f"s__{c}" for c in s_index_names],
-                        *[f"s__{c}" for c in source_schema if c not in s_index_names],
-                    ]
-                ]
-                s_sample.rename(
-                    columns={c: c.replace("s__", "") for c in s_sample.columns}, inplace=True
+        if (
+            self.source_alias
+            and self.target_alias
+            and self.source != self.source_alias
+            and self.target != self.target_alias
+        ):
+            joined_renamed_cols = {
+                c: (
+                    n.replace(
+                        "s__",
+                        f"{self.source_alias.upper()}__",
+                    )
+                    if n.startswith("s__")
+                    else n
                 )
+                for c, n in joined_renamed_cols.items()
+            }
+            joined_renamed_cols = {
+                c: (
+                    n.replace(
+                        "t__",
+                        f"{self.target_alias.upper()}__",
+                    )
+                    if n.startswith("t__")
+                    else n
+                )
+                for c, n in joined_renamed_cols.items()
+            }
 
-                t_sample = sample[sample[SQLMESH_SAMPLE_TYPE_COL] == "target_only"][
-                    [
-                        *[f"t__{c}" for c in t_index_names],
-                        *[f"t__{c}" for c in target_schema if c not in t_index_names],
-                    ]
-                ]
-                t_sample.rename(
-                    columns={c: c.replace("t__", "") for c in t_sample.columns}, inplace=True
+        joined_sample = sample[sample[SQLMESH_SAMPLE_TYPE_COL] == "common_rows"][joined_sample_cols]
+        joined_sample.rename(
+            columns=joined_renamed_cols,
+            inplace=True,
+        )
+
+        s_sample = sample[sample[SQLMESH_SAMPLE_TYPE_COL] == "source_only"][
+            [
+                *[f"s__{c}" for c in s_index_names],
+                *[f"s__{c}" for c in source_columns if c not in s_index_names],
+            ]
+        ]
+        s_sample.rename(columns={c: c.replace("s__", "") for c in s_sample.columns}, inplace=True)
+
+        t_sample = sample[sample[SQLMESH_SAMPLE_TYPE_COL] == "target_only"][
+            [
+                *[f"t__{c}" for c in t_index_names],
+                *[f"t__{c}" for c in target_columns if c not in t_index_names],
+            ]
+        ]
+        t_sample.rename(columns={c: c.replace("t__", "") for c in t_sample.columns}, inplace=True)
+
+        sample.drop(
+            columns=[
+                f"s__{SQLMESH_JOIN_KEY_COL}",
+                f"t__{SQLMESH_JOIN_KEY_COL}",
+                SQLMESH_SAMPLE_TYPE_COL,
+            ],
+            inplace=True,
+        )
+
+        return RowDiff(
+            source=self.source,
+            target=self.target,
+            stats=stats,
+            column_stats=column_stats,
+            sample=sample,
+            joined_sample=joined_sample,
+            s_sample=s_sample,
+            t_sample=t_sample,
+            source_alias=self.source_alias,
+            target_alias=self.target_alias,
+            model_name=self.model_name,
+            decimals=self.decimals,
+        )
+
+    def _restrict_to_mismatched_segments(
+        self,
+        source_query: exp.Select,
+        target_query: exp.Select,
+        matched_columns: t.Dict[str, exp.DataType],
+    ) -> t.Tuple[exp.Select, exp.Select, int]:
+        """Finds the segments whose checksums differ between the source and target tables.
+
+        Rows are partitioned into segments by the hash of their join key. Segments are compared using
+        their row counts, distinct key counts and an order-independent checksum of row hashes. Each
+        segment that differs is split into `HASHDIFF_BISECTION_FACTOR` smaller segments and compared
+        again until the mismatched segments are small enough.
+
+        Returns:
+            The source and target queries restricted to rows of the mismatched segments and rows with
+            NULL join keys, and the number of rows in each table which belong to matching segments.
+        """
+        assert isinstance(self.adapter, RowDiffMixin)
+
+        modulus = 1
+        mismatched_segments = [0]
+        matched_rows = 0
+        for _ in range(self.HASHDIFF_MAX_DEPTH):
+            if (
+                len(mismatched_segments) * self.HASHDIFF_BISECTION_FACTOR
+                > self.HASHDIFF_MAX_SEGMENTS
+            ):
+                break
+
+            parent_modulus = modulus
+            parent_segments = mismatched_segments
+            modulus *= self.HASHDIFF_BISECTION_FACTOR
+
+            source_checksums = self._segment_checksums(
+                source_query, matched_columns, modulus, parent_modulus, parent_segments
+            )
+            target_checksums = self._segment_checksums(
+                target_query, matched_columns, modulus, parent_modulus, parent_segments
+            )
+
+            mismatched_segments = []
+            max_mismatched_rows = 0
+            for segment in sorted(source_checksums.keys() | target_checksums.keys()):
+                source_checksum = source_checksums.get(segment)
+                target_checksum = target_checksums.get(segment)
+                if (
+                    source_checksum is not None
+                    and source_checksum == target_checksum
+                    # Duplicate keys need to be joined to produce the same counts as the join algorithm
+                    and source_checksum[0] == source_checksum[1]
+                ):
+                    matched_rows += source_checksum[0]
+                    continue
+                mismatched_segments.append(segment)
+                max_mismatched_rows = max(
+                    max_mismatched_rows,
+                    (source_checksum or (0,))[0],
+                    (target_checksum or (0,))[0],
                 )
 
-                sample.drop(
-                    columns=[
-                        f"s__{SQLMESH_JOIN_KEY_COL}",
-                        f"t__{SQLMESH_JOIN_KEY_COL}",
-                        SQLMESH_SAMPLE_TYPE_COL,
-                    ],
-                    inplace=True,
+            if max_mismatched_rows <= self.HASHDIFF_MAX_LEAF_ROWS:
+                break
+
+        def restrict(query: exp.Select, key_expression: exp.Expr) -> exp.Select:
+            condition: exp.Expr = key_expression.is_(exp.null())
+            if mismatched_segments:
+                condition = exp.or_(
+                    condition,
+                    self._segment_expression(key_expression.copy(), modulus).isin(
+                        *mismatched_segments
+                    ),
                 )
+            return query.where(condition)
 
-                self._row_diff = RowDiff(
-                    source=self.source,
-                    target=self.target,
-                    stats=stats,
-                    column_stats=column_stats,
-                    sample=sample,
-                    joined_sample=joined_sample,
-                    s_sample=s_sample,
-                    t_sample=t_sample,
-                    source_alias=self.source_alias,
-                    target_alias=self.target_alias,
-                    model_name=self.model_name,
-                    decimals=self.decimals,
+        return (
+            restrict(source_query, self.source_key_expression),
+            restrict(target_query, self.target_key_expression),
+            matched_rows,
+        )
+
+    def _segment_checksums(
+        self,
+        query: exp.Select,
+        matched_columns: t.Dict[str, exp.DataType],
+        modulus: int,
+        parent_modulus: int,
+        parent_segments: t.List[int],
+    ) -> t.Dict[int, t.Tuple[int, int, t.Any]]:
+        """Returns the row count, the distinct key count and the checksum of each segment of the query."""
+        assert isinstance(self.adapter, RowDiffMixin)
+
+        join_key = exp.column(SQLMESH_JOIN_KEY_COL)
+        # Each value is prefixed with its length and NULLs are written as "-", so that values
+        # containing a delimiter can't shift into their neighbours and yield the same row string
+        row_values: exp.Expr = exp.func(
+            "CONCAT",
+            _length_prefixed(exp.cast(join_key.copy(), exp.DataType.build("VARCHAR"))),
+            *(
+                exp.Case()
+                .when(exp.column(c).is_(exp.null()), exp.Literal.string("-"))
+                .else_(
+                    _length_prefixed(
+                        self.adapter.normalize_value(exp.column(c), column_type, self.decimals)
+                    )
                 )
+                for c, column_type in matched_columns.items()
+            ),
+        )
 
-        return self._row_diff
+        where: exp.Condition = join_key.is_(exp.null()).not_()
+        if parent_modulus > 1:
+            where = where.and_(
+                self._segment_expression(join_key.copy(), parent_modulus).isin(*parent_segments)
+            )
+
+        segment = self._segment_expression(join_key.copy(), modulus)
+        checksums_query = (
+            exp.select(
+                segment.as_("segment"),
+                exp.func("COUNT", exp.Star()).as_("row_count"),
+                exp.func("COUNT", exp.Distinct(expressions=[join_key.copy()])).as_("key_count"),
+                self.adapter.checksum_aggregate(self.adapter.hash_value(row_values)).as_(
+                    "checksum"
+                ),
+            )
+            .from_(query.subquery("segments"))
+            .where(where)
+            .group_by(segment.copy())
+        )
+        checksums_query = quote_identifiers(
+            checksums_query, dialect=self.model_dialect or self.dialect
+        )
+
+        return {
+            int(segment): (int(row_count), int(key_count), checksum)
+            for segment, row_count, key_count, checksum in self.adapter.fetchall(
+                checksums_query, quote_identifiers=True
+            )
+        }
+
+    def _segment_expression(self, key_expression: exp.Expr, modulus: int) -> exp.Expr:
+        assert isinstance(self.adapter, RowDiffMixin)
+        return exp.BitwiseAnd(
+            this=self.adapter.hash_value(exp.cast(key_expression, exp.DataType.build("VARCHAR"))),
+            expression=exp.Literal.number(modulus - 1),
+        )
 
     def _fetch_sample(
         self,
@@ -743,5 +966,378 @@ class TableDiff:
         return self.adapter.fetchdf(query, quote_identifiers=True)
 
 
+class StreamingTableDiff(TableDiff):
+    """Calculates differences between tables that are accessed through different engine adapters.
+
+    Both tables are read in batches ordered by the join key and merge-joined client-side, so memory usage
+    is bounded by the batch size, the sample limit and the number of rows sharing a single key rather than
+    by the size of the tables. Column names are matched case-insensitively, since engines normalize
+    identifiers differently, and rows with a NULL in any of the key columns never match.
+
+    Args:
+        target_adapter: The engine adapter used to read the target table.
+        batch_size: The number of rows fetched from each table at a time.
+        mismatches_path: An optional path of a CSV file to which every mismatched row is written as soon
+            as it is found.
+    """
+
+    REQUIRES_ROW_DIFF_MIXIN = False
+    BATCH_SIZE = 10_000
+    # Collations which order strings by code point, so that both sides are sorted the same way
+    BINARY_COLLATIONS = {"postgres": "C"}
+
+    def __init__(
+        self,
+        adapter: EngineAdapter,
+        target_adapter: EngineAdapter,
+        source: TableName,
+        target: TableName,
+        on: t.List[str] | exp.Expr,
+        where: t.Optional[str | exp.Expr] = None,
+        batch_size: t.Optional[int] = None,
+        mismatches_path: t.Optional[Path] = None,
+        **kwargs: t.Any,
+    ):
+        if adapter is target_adapter:
+            raise ValueError("Streamed table diffs require separate source and target adapters")
+
+        super().__init__(
+            adapter=adapter, source=source, target=target, on=on, where=where, **kwargs
+        )
+
+        self.target_adapter = target_adapter
+        self.target_table = exp.to_table(self.target, dialect=target_adapter.dialect)
+        self.target_where = (
+            exp.condition(where, dialect=target_adapter.dialect)
+            if isinstance(where, str)
+            else self.where
+        )
+        self.batch_size = batch_size or self.BATCH_SIZE
+        self.mismatches_path = mismatches_path
+        # Each engine normalizes identifiers differently, so column names are never compared verbatim
+        self.schema_diff_ignore_case = True
+
+    @cached_property
+    def target_schema(self) -> t.Dict[str, exp.DataType]:
+        return self.target_adapter.columns(self.target_table)
+
+    def row_diff(
+        self, temp_schema: t.Optional[str] = None, skip_grain_check: bool = False
+    ) -> RowDiff:
+        if self._row_diff is not None:
+            return self._row_diff
+
+        import pandas as pd
+
+        skip_columns = {c.lower() for c in self.skip_columns}
+        source_columns = [c for c in self.source_schema if c.lower() not in skip_columns]
+        target_columns = [c for c in self.target_schema if c.lower() not in skip_columns]
+
+        # Target columns are labeled after their source counterparts so that both sides line up
+        source_names = {c.lower(): c for c in source_columns}
+        target_labels = [source_names.get(c.lower(), c) for c in target_columns]
+        target_positions = {c.lower(): i for i, c in enumerate(target_columns)}
+        matched_columns = [
+            (i, target_positions[c.lower()], c)
+            for i, c in enumerate(source_columns)
+            if c.lower() in target_positions
+        ]
+
+        matched_names = [c for _, _, c in matched_columns]
+        s_matched_positions = [s_position for s_position, _, _ in matched_columns]
+        t_matched_positions = [t_position for _, t_position, _ in matched_columns]
+
+        s_index, t_index, index_cols = self.key_columns
+        s_key_positions = [self._column_position(c.name, source_columns) for c in s_index]
+        t_key_positions = [self._column_position(c.name, target_columns) for c in t_index]
+        s_index_names = [source_columns[i] for i in s_key_positions]
+        t_index_names = [target_labels[i] for i in t_key_positions]
+
+        stats: t.Dict[str, float] = {
+            "s_count": 0,
+            "t_count": 0,
+            "join_count": 0,
+            "null_grain_count": 0,
+            "full_match_count": 0,
+            **{f"{c}_matches": 0 for _, _, c in matched_columns},
+        }
+        distinct_count_s = 0
+        distinct_count_t = 0
+
+        sample_columns = [
+            SQLMESH_SAMPLE_TYPE_COL,
+            *(f"s__{c}" for c in source_columns),
+            f"s__{SQLMESH_JOIN_KEY_COL}",
+            *(f"t__{c}" for c in target_labels),
+            f"t__{SQLMESH_JOIN_KEY_COL}",
+        ]
+        samples: t.Dict[str, t.List[t.List[t.Any]]] = {
+            "source_only": [],
+            "target_only": [],
+            "common_rows": [],
+        }
+        source_nulls = [None] * (len(source_columns) + 1)
+        target_nulls = [None] * (len(target_columns) + 1)
+
+        source_groups = self._key_groups(
+            self.adapter,
+            self.source_table,
+            {c: self.source_schema[c] for c in source_columns},
+            s_key_positions,
+            self.where,
+        )
+        target_groups = self._key_groups(
+            self.target_adapter,
+            self.target_table,
+            {c: self.target_schema[c] for c in target_columns},
+            t_key_positions,
+            self.target_where,
+        )
+
+        with ExitStack() as stack:
+            stack.callback(source_groups.close)
+            stack.callback(target_groups.close)
+
+            write_mismatch: t.Optional[t.Callable[[t.List[t.Any]], t.Any]] = None
+            if self.mismatches_path:
+                mismatches_file = stack.enter_context(
+                    open(self.mismatches_path, "w", newline="", encoding="utf-8")
+                )
+                write_mismatch = csv.writer(mismatches_file).writerow
+                write_mismatch(sample_columns)
+
+            def add_mismatch(sample_type: str, row: t.List[t.Any]) -> None:
+                row = [sample_type, *row]
+                if len(samples[sample_type]) < self.limit:
+                    samples[sample_type].append(row)
+                if write_mismatch:
+                    write_mismatch(row)
+
+            def add_unmatched(
+                key: t.Tuple, row: t.Tuple, positions: t.List[int], count_stat: str
+            ) -> None:
+                # Mirror the outer join: a row's columns match those of the missing row when they're NULL
+                stats[count_stat] += _join_key(key) is not None
+                stats["null_grain_count"] += None in key
+                full_match = True
+                for position, column in zip(positions, matched_names):
+                    if row[position] is None:
+                        stats[f"{column}_matches"] += 1
+                    else:
+                        full_match = False
+                stats["full_match_count"] += full_match
+
+            def add_source_only(key: t.Tuple, rows: t.List[t.Tuple]) -> None:
+                for row in rows:
+                    add_unmatched(key, row, s_matched_positions, "s_count")
+                    add_mismatch("source_only", [*row, _join_key(key), *target_nulls])
+
+            def add_target_only(key: t.Tuple, rows: t.List[t.Tuple]) -> None:
+                for row in rows:
+                    add_unmatched(key, row, t_matched_positions, "t_count")
+                    add_mismatch("target_only", [*source_nulls, *row, _join_key(key)])
+
+            try:
+                source_group = next(source_groups, None)
+                target_group = next(target_groups, None)
+                while source_group or target_group:
+                    if target_group is None or (
+                        source_group is not None
+                        and _sort_key(source_group[0]) < _sort_key(target_group[0])
+                    ):
+                        add_source_only(*source_group)  # type: ignore
+                        distinct_count_s += _join_key(source_group[0]) is not None  # type: ignore
+                        source_group = next(source_groups, None)
+                        continue
+
+                    if source_group is None or _sort_key(target_group[0]) < _sort_key(
+                        source_group[0]
+                    ):
+                        add_target_only(*target_group)
+                        distinct_count_t += _join_key(target_group[0]) is not None
+                        target_group = next(target_groups, None)
+                        continue
+
+                    key, source_rows = source_group
+                    _, target_rows = target_group
+                    if None in key:
+                        add_source_only(key, source_rows)
+                        add_target_only(key, target_rows)
+                        distinct_count_s += _join_key(key) is not None
+                        distinct_count_t += _join_key(key) is not None
+                    else:
+                        distinct_count_s += 1
+                        distinct_count_t += 1
+                        for s_row in source_rows:
+                            for t_row in target_rows:
+                                stats["s_count"] += 1
+                                stats["t_count"] += 1
+                                stats["join_count"] += 1
+                                full_match = True
+                                for s_position, t_position, column in matched_columns:
+                                    if s_row[s_position] == t_row[t_position]:
+                                        stats[f"{column}_matches"] += 1
+                                    else:
+                                        full_match = False
+                                if full_match:
+                                    stats["full_match_count"] += 1
+                                else:
+                                    join_key = _join_key(key)
+                                    add_mismatch(
+                                        "common_rows", [*s_row, join_key, *t_row, join_key]
+                                    )
+                    source_group = next(source_groups, None)
+                    target_group = next(target_groups, None)
+            except TypeError as ex:
+                raise SQLMeshError(
+                    f"Keys of '{self.source}' and '{self.target}' can't be compared: {ex}. "
+                    "Make sure that the key columns have compatible types in both tables."
+                )
+
+        if not skip_grain_check:
+            stats["distinct_count_s"] = distinct_count_s
+            stats["distinct_count_t"] = distinct_count_t
+        stats["s_only_count"] = stats["s_count"] - stats["join_count"]
+        stats["t_only_count"] = stats["t_count"] - stats["join_count"]
+
+        join_count = stats["join_count"]
+        column_stats = (
+            pd.DataFrame(
+                [
+                    {
+                        f"{c}_matches": (
+                            round(100 * stats[f"{c}_matches"] / join_count, 9)
+                            if join_count
+                            else None
+                        )
+                        for _, _, c in matched_columns
+                    }
+                ]
+            )
+            .T.rename(
+                columns={0: "pct_match"},
+                index=lambda x: str(x).replace("_matches", "") if x else "",
+            )
+            .drop(index=index_cols, errors="ignore")
+        )
+
+        sample = pd.DataFrame(
+            [*samples["source_only"], *samples["target_only"], *samples["common_rows"]],
+            columns=sample_columns,
+        )
+
+        self._row_diff = self._build_row_diff(
+            stats=stats,
+            column_stats=column_stats,
+            sample=sample,
+            source_columns=source_columns,
+            target_columns=target_labels,
+            s_index_names=s_index_names,
+            t_index_names=t_index_names,
+            index_cols=index_cols,
+        )
+        return self._row_diff
+
+    def _key_groups(
+        self,
+        adapter: EngineAdapter,
+        table: exp.Table,
+        columns_to_types: t.Dict[str, exp.DataType],
+        key_positions: t.List[int],
+        where: t.Optional[exp.Expr],
+    ) -> t.Generator[t.Tuple[t.Tuple, t.List[t.Tuple]], None, None]:
+        """Streams the rows of the table grouped by key, in key order.
+
+        Values are normalized so that they compare equal across engines. Rows with a NULL key are yielded
+        one at a time since they never match.
+        """
+        columns = list(columns_to_types)
+        collation = self.BINARY_COLLATIONS.get(adapter.dialect)
+        order_by = []
+        for position in key_positions:
+            column: exp.Expr = exp.column(columns[position])
+            # Collations can only be applied to strings, other types are ordered the same way by every engine
+            if collation and columns_to_types[columns[position]].is_type(*exp.DataType.TEXT_TYPES):
+                column = exp.Collate(
+                    this=column, expression=exp.to_identifier(collation, quoted=True)
+                )
+            order_by.append(exp.Ordered(this=column, nulls_first=False))
+
+        query = (
+            exp.select(*(exp.column(c) for c in columns))
+            .from_(table)
+            .where(where)
+            .order_by(*order_by)
+        )
+
+        group_key: t.Tuple = ()
+        group: t.List[t.Tuple] = []
+        for batch in adapter.fetch_batches(query, self.batch_size, quote_identifiers=True):
+            for row in batch:
+                row = tuple(_normalize_value(value, self.decimals) for value in row)
+                key = tuple(row[i] for i in key_positions)
+                if group and key == group_key and None not in key:
+                    group.append(row)
+                    continue
+                if group:
+                    if _sort_key(key) < _sort_key(group_key):
+                        raise SQLMeshError(
+                            f"Rows of '{table.sql(dialect=adapter.dialect)}' aren't returned in the same "
+                            "order by both engines. This usually happens when the engine's collation "
+                            "orders strings differently, try joining on columns of another type."
+                        )
+                    yield group_key, group
+                group_key, group = key, [row]
+        if group:
+            yield group_key, group
+
+    def _column_position(self, column: str, columns: t.List[str]) -> int:
+        column = column.lower()
+        for i, c in enumerate(columns):
+            if c.lower() == column:
+                return i
+        raise SQLMeshError(f"Column '{column}' was not found in both tables")
+
+
 def name(e: exp.Expr) -> str:
     return e.args["alias"].sql(identify=True)
+
+
+def _add_matched_rows(aggregate: exp.Expr, matched_rows: int) -> exp.Expr:
+    if not matched_rows:
+        return aggregate
+    return exp.func("COALESCE", aggregate, 0) + matched_rows
+
+
+def _length_prefixed(value: exp.Expr) -> exp.Expr:
+    return exp.func(
+        "CONCAT",
+        exp.cast(exp.Length(this=value.copy()), exp.DataType.build("VARCHAR")),
+        exp.Literal.string(":"),
+        value,
+    )
+
+
+def _normalize_value(value: t.Any, decimals: int) -> t.Any:
+    """Normalizes values returned by different database drivers so that they can be compared."""
+    if isinstance(value, Decimal):
+        if value.is_finite() and value == value.to_integral_value():
+            return int(value)
+        value = float(value)
+    if isinstance(value, float):
+        return round(value, decimals)
+    if isinstance(value, datetime) and value.tzinfo is not None:
+        return value.astimezone(timezone.utc).replace(tzinfo=None)
+    if isinstance(value, memoryview):
+        return value.tobytes()
+    return value
+
+
+def _sort_key(key: t.Tuple) -> t.Tuple:
+    # Sorts NULLs last, like the queries used to stream the tables
+    return tuple((value is None, value) for value in key)
+
+
+def _join_key(key: t.Tuple) -> t.Any:
+    # Like the join key expression, a composite key is a concatenation which is never NULL
+    return key[0] if len(key) == 1 else "|".join("" if v is None else str(v) for v in key)
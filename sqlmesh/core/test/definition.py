@@ -26,6 +26,7 @@ from sqlmesh.core.model import Model, PythonModel, SqlModel
 from sqlmesh.utils import UniqueKeyDict, random_id, type_is_known, yaml
 from sqlmesh.utils.date import date_dict, pandas_timestamp_to_pydatetime, to_datetime
 from sqlmesh.utils.errors import ConfigError, TestError
+from sqlmesh.utils.hashing import md5
 from sqlmesh.utils.yaml import load as yaml_load
 from sqlmesh.utils import Verbosity
 from sqlmesh.utils.rich import df_to_table
@@ -48,6 +49,71 @@ TIME_KWARG_KEYS = {
 }
 
 
+class FixtureCache:
+    """Materializes identical test inputs only once per engine adapter.
+
+    Inputs are keyed by the hash of their content and column types. Each distinct input is created
+    as a table in a schema that is shared by all tests that use the engine adapter, so that tests
+    with the same fixtures don't have to create and scan them again.
+
+    Args:
+        engine_adapter: The engine adapter that the tests are executed against.
+    """
+
+    def __init__(self, engine_adapter: EngineAdapter):
+        self.engine_adapter = engine_adapter
+        self._fixture_catalog = _fixture_catalog(engine_adapter)
+        self._fixture_schema = exp.parse_identifier(
+            f"sqlmesh_test_fixtures_{random_id(short=True)}"
+        )
+        self._schema_created = False
+        self._tables: t.Dict[str, exp.Table] = {}
+        self._table_locks: t.Dict[str, threading.Lock] = {}
+        self._lock = threading.Lock()
+
+    def get_or_create(self, fixture_hash: str, create: t.Callable[[exp.Table], None]) -> exp.Table:
+        """Returns the table of the fixture with the given hash, creating it first if needed.
+
+        Args:
+            fixture_hash: The hash of the fixture's content and column types.
+            create: A function that creates the fixture table with the given name.
+
+        Returns:
+            The name of the fixture table.
+        """
+        with self._lock:
+            table_lock = self._table_locks.setdefault(fixture_hash, threading.Lock())
+
+        with table_lock:
+            table = self._tables.get(fixture_hash)
+            if table is None:
+                with self._lock:
+                    if not self._schema_created:
+                        self.engine_adapter.create_schema(
+                            schema_(self._fixture_schema, self._fixture_catalog)
+                        )
+                        self._schema_created = True
+
+                table = exp.table_(
+                    f"fixture_{fixture_hash}",
+                    db=self._fixture_schema.copy(),
+                    catalog=self._fixture_catalog.copy() if self._fixture_catalog else None,
+                )
+                create(table)
+                self._tables[fixture_hash] = table
+
+        return table
+
+    def cleanup(self) -> None:
+        """Drops the shared fixture tables."""
+        if self._schema_created:
+            self.engine_adapter.drop_schema(
+                schema_(self._fixture_schema, self._fixture_catalog), cascade=True
+            )
+            self._schema_created = False
+            self._tables.clear()
+
+
 class ModelTest(unittest.TestCase):
     __test__ = False
 
@@ -66,6 +132,7 @@ class ModelTest(unittest.TestCase):
         default_catalog: str | None = None,
         concurrency: bool = False,
         verbosity: Verbosity = Verbosity.DEFAULT,
+        fixture_cache: t.Optional[FixtureCache] = None,
     ) -> None:
         """ModelTest encapsulates a unit test for a model.
 
@@ -78,6 +145,7 @@ class ModelTest(unittest.TestCase):
             dialect: The models' dialect, used for normalization purposes.
             path: An optional path to the test definition yaml file.
             preserve_fixtures: Preserve the fixture tables in the testing database, useful for debugging.
+            fixture_cache: An optional cache of the fixtures shared with other tests of the adapter.
         """
         self.body = body
         self.test_name = test_name
@@ -90,6 +158,8 @@ class ModelTest(unittest.TestCase):
         self.dialect = dialect
         self.concurrency = concurrency
         self.verbosity = verbosity
+        # Fixtures are only shared if they are expected to be dropped with the test's schema
+        self.fixture_cache = None if preserve_fixtures or self.body.get("schema") else fixture_cache
 
         self._fixture_table_cache: t.Dict[str, exp.Table] = {}
         self._normalized_column_name_cache: t.Dict[str, str] = {}
@@ -99,15 +169,7 @@ class ModelTest(unittest.TestCase):
 
         self._validate_and_normalize_test()
 
-        if self.engine_adapter.default_catalog:
-            self._fixture_catalog: t.Optional[exp.Identifier] = normalize_identifiers(
-                exp.parse_identifier(
-                    self.engine_adapter.default_catalog, dialect=self._test_adapter_dialect
-                ),
-                dialect=self._test_adapter_dialect,
-            )
-        else:
-            self._fixture_catalog = None
+        self._fixture_catalog = _fixture_catalog(self.engine_adapter)
 
         # The test schema name is randomized to avoid concurrency issues,
         # unless a schema is provided in the unit tests's body
@@ -211,9 +273,27 @@ class ModelTest(unittest.TestCase):
             if isinstance(query_or_df, pd.DataFrame):
                 query_or_df = query_or_df.replace({np.nan: None})
 
-            self.engine_adapter.create_view(
-                self._test_fixture_table(name), query_or_df, columns_to_known_types
-            )
+            # Queries are only shared if they're self-contained, whereas DataFrames can only be
+            # materialized as tables if they have rows and the types of all their columns are known
+            if self.fixture_cache and (
+                (isinstance(query_or_df, exp.Query) and not query_or_df.find(exp.Table))
+                or (
+                    isinstance(query_or_df, pd.DataFrame)
+                    and not query_or_df.empty
+                    and columns_to_known_types
+                    and set(query_or_df.columns) <= columns_to_known_types.keys()
+                )
+            ):
+                self._fixture_table_cache[name] = self.fixture_cache.get_or_create(
+                    self._fixture_hash(query_or_df, columns_to_known_types),
+                    lambda table: self.engine_adapter.ctas(
+                        table, query_or_df, columns_to_known_types or None
+                    ),
+                )
+            else:
+                self.engine_adapter.create_view(
+                    self._test_fixture_table(name), query_or_df, columns_to_known_types
+                )
 
     def tearDown(self) -> None:
         """Drop all fixture tables."""
@@ -390,6 +470,7 @@ class ModelTest(unittest.TestCase):
         default_catalog: str | None = None,
         concurrency: bool = False,
         verbosity: Verbosity = Verbosity.DEFAULT,
+        fixture_cache: t.Optional[FixtureCache] = None,
     ) -> t.Optional[ModelTest]:
         """Create a SqlModelTest or a PythonModelTest.
 
@@ -401,6 +482,7 @@ class ModelTest(unittest.TestCase):
             dialect: The models' dialect, used for normalization purposes.
             path: An optional path to the test definition yaml file.
             preserve_fixtures: Preserve the fixture tables in the testing database, useful for debugging.
+            fixture_cache: An optional cache of the fixtures shared with other tests of the adapter.
         """
         name = body.get("model")
         if name is None:
@@ -436,6 +518,7 @@ class ModelTest(unittest.TestCase):
                 default_catalog,
                 concurrency,
                 verbosity,
+                fixture_cache,
             )
         except Exception as e:
             raise TestError(f"Failed to create test {test_name} ({path})\n{str(e)}")
@@ -583,6 +666,22 @@ class ModelTest(unittest.TestCase):
 
         return table
 
+    def _fixture_hash(
+        self, query_or_df: exp.Query | pd.DataFrame, columns_to_types: t.Dict[str, exp.DataType]
+    ) -> str:
+        data = [
+            self.engine_adapter.dialect,
+            *(
+                f"{column} {data_type.sql(dialect=self._test_adapter_dialect)}"
+                for column, data_type in columns_to_types.items()
+            ),
+        ]
+        if isinstance(query_or_df, exp.Query):
+            data.append(query_or_df.sql(dialect=self._test_adapter_dialect))
+        else:
+            data.append(query_or_df.to_json(orient="split", date_format="iso", default_handler=str))
+        return md5(data)
+
     def _normalize_model_name(self, name: str, with_default_catalog: bool = True) -> str:
         normalized_name = self._normalized_model_name_cache.get((name, with_default_catalog))
         if normalized_name is None:
@@ -768,6 +867,7 @@ class PythonModelTest(ModelTest):
         default_catalog: str | None = None,
         concurrency: bool = False,
         verbosity: Verbosity = Verbosity.DEFAULT,
+        fixture_cache: t.Optional[FixtureCache] = None,
     ) -> None:
         """PythonModelTest encapsulates a unit test for a Python model.
 
@@ -780,6 +880,7 @@ class PythonModelTest(ModelTest):
             dialect: The models' dialect, used for normalization purposes.
             path: An optional path to the test definition yaml file.
             preserve_fixtures: Preserve the fixture tables in the testing database, useful for debugging.
+            fixture_cache: An optional cache of the fixtures shared with other tests of the adapter.
         """
         from sqlmesh.core.test.context import TestExecutionContext
 
@@ -795,6 +896,7 @@ class PythonModelTest(ModelTest):
             default_catalog,
             concurrency,
             verbosity,
+            fixture_cache,
         )
 
         self.context = TestExecutionContext(
@@ -1008,6 +1110,16 @@ def _row_difference(left: pd.DataFrame, right: pd.DataFrame) -> pd.DataFrame:
     return pd.DataFrame(rows_missing_from_right)
 
 
+def _fixture_catalog(engine_adapter: EngineAdapter) -> t.Optional[exp.Identifier]:
+    if not engine_adapter.default_catalog:
+        return None
+
+    dialect = Dialect.get_or_raise(engine_adapter.dialect)
+    return normalize_identifiers(
+        exp.parse_identifier(engine_adapter.default_catalog, dialect=dialect), dialect=dialect
+    )
+
+
 def _raise_error(msg: str, path: Path | None = None) -> None:
     if path:
         raise TestError(f"Failed to run test at {path}:\n{msg}")
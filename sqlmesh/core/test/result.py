@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import time
 import types
 import typing as t
 import unittest
@@ -24,6 +25,18 @@ class ModelTextTestResult(unittest.TextTestResult):
         self.failure_tables: t.List[t.Tuple[t.Any, ...]] = []
         self.original_errors: t.List[t.Tuple[unittest.TestCase, ErrorType]] = []
         self.duration: t.Optional[float] = None
+        self.test_durations: t.List[t.Tuple[ModelTest, float]] = []
+        self._test_start: t.Optional[float] = None
+
+    def startTest(self, test: unittest.TestCase) -> None:
+        self._test_start = time.perf_counter()
+        super().startTest(test)
+
+    def stopTest(self, test: unittest.TestCase) -> None:
+        super().stopTest(test)
+        if isinstance(test, ModelTest) and self._test_start is not None:
+            self.test_durations.append((test, time.perf_counter() - self._test_start))
+        self._test_start = None
 
     def addSubTest(
         self,
@@ -123,6 +136,15 @@ class ModelTextTestResult(unittest.TextTestResult):
             self.addSkip(skipped_args[0], skipped_args[1])
 
         self.testsRun += other.testsRun
+        self.test_durations.extend(other.test_durations)
+
+    def slowest_tests(self, limit: int = 10) -> t.List[t.Tuple[ModelTest, float]]:
+        """Returns the tests that took the longest to run along with their durations in seconds.
+
+        Args:
+            limit: The maximum number of tests to return.
+        """
+        return sorted(self.test_durations, key=lambda test_duration: -test_duration[1])[:limit]
 
     def get_fail_and_error_tests(self) -> t.List[ModelTest]:
         # If tests contain failed subtests (e.g testing CTE outputs) we don't want
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import pickle
 import time
 import threading
 import typing as t
@@ -7,17 +8,24 @@ import unittest
 from io import StringIO
 
 import concurrent
+from collections import Counter
 from concurrent.futures import ThreadPoolExecutor
 
 from sqlmesh.core.engine_adapter import EngineAdapter
 from sqlmesh.core.model import Model
-from sqlmesh.core.test.definition import ModelTest as ModelTest, generate_test as generate_test
+from sqlmesh.core.test.definition import (
+    FixtureCache,
+    ModelTest as ModelTest,
+    generate_test as generate_test,
+)
 from sqlmesh.core.test.discovery import (
     ModelTestMetadata as ModelTestMetadata,
 )
-from sqlmesh.core.config.connection import BaseDuckDBConnectionConfig
+from sqlmesh.core.config.connection import BaseDuckDBConnectionConfig, ConnectionConfig
 from sqlmesh.core.test.result import ModelTextTestResult as ModelTextTestResult
 from sqlmesh.utils import UniqueKeyDict, Verbosity
+from sqlmesh.utils.errors import TestError
+from sqlmesh.utils.process import create_process_pool_executor
 
 
 if t.TYPE_CHECKING:
@@ -88,6 +96,7 @@ def run_tests(
     stream: t.TextIO | None = None,
     default_catalog: str | None = None,
     default_catalog_dialect: str = "",
+    processes: int | None = None,
 ) -> ModelTextTestResult:
     """Create a test suite of ModelTest objects and run it.
 
@@ -96,6 +105,9 @@ def run_tests(
         models: All models to use for expansion and mapping of physical locations.
         verbosity: The verbosity level.
         preserve_fixtures: Preserve the fixture tables in the testing database, useful for debugging.
+        processes: The number of worker processes to shard the tests across. Each worker runs its
+            tests against its own in-memory DuckDB instances. Only applies if all tests use
+            in-memory DuckDB connections, otherwise the tests are run on threads.
     """
     default_test_connection = config.get_test_connection(
         gateway_name=selected_gateway,
@@ -125,6 +137,30 @@ def run_tests(
     # Ensure workers are not greater than the number of tests
     num_workers = min(len(model_test_metadata) or 1, default_test_connection.concurrent_tasks)
 
+    use_processes = (
+        processes is not None
+        and processes > 1
+        and len(model_test_metadata) > 1
+        and all(
+            _is_in_memory_duckdb(
+                config.get_test_connection(
+                    metadata.body.get("gateway") or selected_gateway,
+                    default_catalog,
+                    default_catalog_dialect,
+                )
+            )
+            for metadata in model_test_metadata
+        )
+    )
+
+    # Identical inputs are materialized once per adapter that is shared by multiple tests
+    adapter_counts = Counter(metadata_to_adapter.values())
+    fixture_caches = {
+        engine_adapter: FixtureCache(engine_adapter)
+        for engine_adapter, count in adapter_counts.items()
+        if count > 1
+    }
+
     def _run_single_test(
         metadata: ModelTestMetadata, engine_adapter: EngineAdapter
     ) -> t.Optional[ModelTextTestResult]:
@@ -139,6 +175,7 @@ def run_tests(
             preserve_fixtures=preserve_fixtures,
             concurrency=num_workers > 1,
             verbosity=verbosity,
+            fixture_cache=fixture_caches.get(engine_adapter),
         )
 
         if not test:
@@ -158,18 +195,36 @@ def run_tests(
 
     start_time = time.perf_counter()
     try:
-        with ThreadPoolExecutor(max_workers=num_workers) as pool:
-            futures = [
-                pool.submit(_run_single_test, metadata=metadata, engine_adapter=engine_adapter)
-                for metadata, engine_adapter in metadata_to_adapter.items()
-            ]
-
-            for future in concurrent.futures.as_completed(futures):
-                test_results.append(future.result())
+        if use_processes:
+            _run_tests_in_processes(
+                t.cast(int, processes),
+                combined_results,
+                model_test_metadata,
+                metadata_to_adapter,
+                models=models,
+                config=config,
+                selected_gateway=selected_gateway,
+                dialect=dialect,
+                verbosity=verbosity,
+                preserve_fixtures=preserve_fixtures,
+                default_catalog=default_catalog,
+                default_catalog_dialect=default_catalog_dialect,
+            )
+        else:
+            with ThreadPoolExecutor(max_workers=num_workers) as pool:
+                futures = [
+                    pool.submit(_run_single_test, metadata=metadata, engine_adapter=engine_adapter)
+                    for metadata, engine_adapter in metadata_to_adapter.items()
+                ]
+
+                for future in concurrent.futures.as_completed(futures):
+                    test_results.append(future.result())
     finally:
         for engine_adapter in set(metadata_to_adapter.values()):
             # The engine adapters list might have duplicates, so we ensure that we close each adapter once
             if engine_adapter:
+                if engine_adapter in fixture_caches:
+                    fixture_caches[engine_adapter].cleanup()
                 engine_adapter.close()
 
     end_time = time.perf_counter()
@@ -177,3 +232,173 @@ def run_tests(
     combined_results.duration = round(end_time - start_time, 2)
 
     return combined_results
+
+
+def _is_in_memory_duckdb(connection: ConnectionConfig) -> bool:
+    if not isinstance(connection, BaseDuckDBConnectionConfig):
+        return False
+
+    paths = [connection.database] if connection.database else []
+    for catalog in (connection.catalogs or {}).values():
+        paths.append(catalog if isinstance(catalog, str) else catalog.path)
+
+    return all(path == ":memory:" for path in paths)
+
+
+class _TestOutcome(t.NamedTuple):
+    """The picklable outcome of a test that was run in a worker process."""
+
+    test_index: int
+    successes: int
+    failures: t.List[t.Tuple[t.Type[BaseException], BaseException]]
+    failure_tables: t.List[t.Tuple[t.Any, ...]]
+    errors: t.List[t.Tuple[t.Type[BaseException], BaseException]]
+    skipped: t.List[str]
+    duration: t.Optional[float]
+
+
+_test_worker_args: t.Optional[t.Dict[str, t.Any]] = None
+
+
+def _init_test_worker(args: t.Dict[str, t.Any]) -> None:
+    global _test_worker_args
+    _test_worker_args = args
+
+
+def _run_tests_in_processes(
+    processes: int,
+    combined_results: ModelTextTestResult,
+    model_test_metadata: t.List[ModelTestMetadata],
+    metadata_to_adapter: t.Dict[ModelTestMetadata, EngineAdapter],
+    **kwargs: t.Any,
+) -> None:
+    """Shards the tests across worker processes and merges their outcomes into the combined results.
+
+    The tests are also created in this process, without running them, so that the outcomes can be
+    reported against them.
+    """
+    tests = [
+        ModelTest.create_test(
+            body=metadata.body,
+            test_name=metadata.test_name,
+            models=kwargs["models"],
+            engine_adapter=metadata_to_adapter[metadata],
+            dialect=kwargs["dialect"],
+            path=metadata.path,
+            default_catalog=kwargs["default_catalog"],
+            preserve_fixtures=kwargs["preserve_fixtures"],
+            verbosity=kwargs["verbosity"],
+        )
+        for metadata in model_test_metadata
+    ]
+    indices = [index for index, test in enumerate(tests) if test]
+    num_processes = min(processes, len(indices))
+    shards = [indices[i::num_processes] for i in range(num_processes)]
+
+    with create_process_pool_executor(
+        initializer=_init_test_worker,
+        initargs=({**kwargs, "model_test_metadata": model_test_metadata},),
+        max_workers=num_processes,
+    ) as pool:
+        futures = [pool.submit(_run_test_shard, shard) for shard in shards if shard]
+        for future in concurrent.futures.as_completed(futures):
+            for outcome in future.result():
+                test = t.cast(ModelTest, tests[outcome.test_index])
+                combined_results.merge(_result_from_outcome(test, outcome))
+
+
+def _run_test_shard(indices: t.List[int]) -> t.List[_TestOutcome]:
+    """Runs the tests with the given indices one after another in a worker process.
+
+    The tests of each gateway share a single adapter and thus a single DuckDB instance, which
+    allows their identical inputs to be materialized only once.
+    """
+    assert _test_worker_args is not None
+    args = _test_worker_args
+    model_test_metadata: t.List[ModelTestMetadata] = args["model_test_metadata"]
+
+    adapters: t.Dict[str, EngineAdapter] = {}
+    fixture_caches: t.Dict[str, FixtureCache] = {}
+    outcomes = []
+    try:
+        for index in indices:
+            metadata = model_test_metadata[index]
+            gateway = metadata.body.get("gateway") or args["selected_gateway"]
+            if gateway not in adapters:
+                test_connection = args["config"].get_test_connection(
+                    gateway, args["default_catalog"], args["default_catalog_dialect"]
+                )
+                adapters[gateway] = test_connection.create_engine_adapter(
+                    register_comments_override=False, concurrent_tasks=1
+                )
+                fixture_caches[gateway] = FixtureCache(adapters[gateway])
+
+            test = ModelTest.create_test(
+                body=metadata.body,
+                test_name=metadata.test_name,
+                models=args["models"],
+                engine_adapter=adapters[gateway],
+                dialect=args["dialect"],
+                path=metadata.path,
+                default_catalog=args["default_catalog"],
+                preserve_fixtures=args["preserve_fixtures"],
+                verbosity=args["verbosity"],
+                fixture_cache=fixture_caches[gateway],
+            )
+            if test:
+                result = t.cast(
+                    ModelTextTestResult,
+                    ModelTextTestRunner().run(t.cast(unittest.TestCase, test)),
+                )
+                outcomes.append(_outcome_from_result(index, result))
+    finally:
+        for gateway, engine_adapter in adapters.items():
+            fixture_caches[gateway].cleanup()
+            engine_adapter.close()
+
+    return outcomes
+
+
+def _outcome_from_result(test_index: int, result: ModelTextTestResult) -> _TestOutcome:
+    def picklable(
+        errors: t.List[t.Tuple[unittest.TestCase, t.Any]],
+    ) -> t.List[t.Tuple[t.Type[BaseException], BaseException]]:
+        picklable_errors = []
+        for _, (exctype, value, _) in errors:
+            try:
+                pickle.dumps((exctype, value))
+            except Exception:
+                exctype, value = TestError, TestError(f"{exctype.__name__}: {value}")
+            picklable_errors.append((exctype, value))
+        return picklable_errors
+
+    return _TestOutcome(
+        test_index=test_index,
+        successes=len(result.successes),
+        failures=picklable(result.original_failures),
+        failure_tables=result.failure_tables,
+        errors=picklable(result.original_errors),
+        skipped=[reason for _, reason in result.skipped],
+        duration=result.test_durations[0][1] if result.test_durations else None,
+    )
+
+
+def _result_from_outcome(test: ModelTest, outcome: _TestOutcome) -> ModelTextTestResult:
+    result = ModelTextTestResult(
+        stream=unittest.runner._WritelnDecorator(StringIO()),  # type: ignore
+        verbosity=1,
+        descriptions=True,
+    )
+    for exctype, value in outcome.errors:
+        result.addError(test, (exctype, value, None))  # type: ignore
+    for exctype, value in outcome.failures:
+        result.addFailure(test, (exctype, value, None))  # type: ignore
+    result.failure_tables.extend(outcome.failure_tables)
+    for reason in outcome.skipped:
+        result.addSkip(test, reason)
+    if outcome.successes:
+        result.addSuccess(test)
+    if outcome.duration is not None:
+        result.test_durations.append((test, outcome.duration))
+    result.testsRun = 1
+    return result
@@ -9,7 +9,6 @@ from sqlmesh import macro
 import typing as t
 from sqlmesh.lsp.context import AuditTarget, LSPContext, ModelTarget
 from sqlmesh.lsp.uri import URI
-from sqlmesh.utils.lineage import generate_markdown_description
 
 
 def get_sql_completions(
@@ -54,19 +53,12 @@ def get_models(
 
     current_path = file_uri.to_path() if file_uri is not None else None
 
-    completions: t.List[ModelCompletion] = []
-    for model in context.context.models.values():
-        if current_path is not None and model._path == current_path:
-            continue
-        description = None
-        try:
-            description = generate_markdown_description(model)
-        except Exception:
-            description = getattr(model, "description", None)
-
-        completions.append(ModelCompletion(name=model.name, description=description))
-
-    return completions
+    # The completions of all models are built once per context and reused across requests
+    return [
+        completion
+        for path, completion in context.symbols.model_completions()
+        if current_path is None or path != current_path
+    ]
 
 
 def get_macros(
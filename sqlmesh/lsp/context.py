@@ -17,6 +17,9 @@ from lsprotocol import types
 from sqlmesh.utils import yaml
 from sqlmesh.utils.lineage import get_yaml_model_name_ranges
 
+if t.TYPE_CHECKING:
+    from sqlmesh.lsp.symbols import SymbolIndex
+
 
 @dataclass
 class ModelTarget:
@@ -46,10 +49,49 @@ class LSPContext:
         self.context = context
         self._render_cache = {}
         self._lint_cache = {}
+        self._symbols: t.Optional["SymbolIndex"] = None
+        self.map = self._build_map()
+
+    @property
+    def symbols(self) -> "SymbolIndex":
+        """The index of the symbols referenced in the files of this context."""
+        if self._symbols is None:
+            from sqlmesh.lsp.symbols import SymbolIndex
+
+            self._symbols = SymbolIndex(self)
+        return self._symbols
+
+    def reload_files(self, paths: t.Collection[Path]) -> None:
+        """Reloads the given files in the context, keeping the cached results of the unaffected files.
 
+        Args:
+            paths: The files that were modified or deleted.
+        """
+        affected = self.context.reload_paths(paths)
+        if affected is None:
+            # The whole project was loaded, so none of the cached results can be reused
+            self._render_cache.clear()
+            self._lint_cache.clear()
+            if self._symbols is not None:
+                self._symbols.clear()
+        else:
+            affected_paths = set(paths)
+            for fqn in affected:
+                model = self.context.get_model(fqn)
+                if model is not None and model._path is not None:
+                    affected_paths.add(model._path)
+            for path in affected_paths:
+                self._render_cache.pop(path, None)
+                self._lint_cache.pop(path, None)
+            if self._symbols is not None:
+                self._symbols.invalidate(affected_paths)
+
+        self.map = self._build_map()
+
+    def _build_map(self) -> t.Dict[Path, t.Union[ModelTarget, AuditTarget]]:
         # Add models to the map
         model_map: t.Dict[Path, ModelTarget] = {}
-        for model in context.models.values():
+        for model in self.context.models.values():
             if model._path is not None:
                 uri = model._path
                 if uri in model_map:
@@ -59,13 +101,13 @@ class LSPContext:
 
         # Add standalone audits to the map
         audit_map: t.Dict[Path, AuditTarget] = {}
-        for audit in context.standalone_audits.values():
+        for audit in self.context.standalone_audits.values():
             if audit._path is not None:
                 uri = audit._path
                 if uri not in audit_map:
                     audit_map[uri] = AuditTarget(name=audit.name)
 
-        self.map: t.Dict[Path, t.Union[ModelTarget, AuditTarget]] = {
+        return {
             **model_map,
             **audit_map,
         }
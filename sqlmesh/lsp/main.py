@@ -474,12 +474,12 @@ class SQLMeshLanguageServer:
                     ls.log_trace(f"Still cannot load context: {e}")
                     # The error will be stored in context_state by _ensure_context_for_document
         else:
-            # Reload the context if it was successfully loaded
+            # Reload the saved file if the context was successfully loaded
             try:
-                context = self.context_state.lsp_context.context
-                context.load()
-                # Create new LSPContext which will have fresh, empty caches
-                self.context_state = ContextLoaded(lsp_context=LSPContext(context))
+                lsp_context = self.context_state.lsp_context
+                lsp_context.reload_files([uri.to_path()])
+                # A new state with a fresh version id lets the client know that the diagnostics changed
+                self.context_state = ContextLoaded(lsp_context=lsp_context)
             except Exception as e:
                 ls.log_trace(f"Error loading context: {e}")
                 self.context_state = ContextFailed(
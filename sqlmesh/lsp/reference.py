@@ -376,30 +376,19 @@ def get_model_find_all_references(
             )
         )
 
-    # Search through the models in the project
-    for path, _ in lint_context.map.items():
-        file_uri = URI.from_path(path)
-
+    # Look up the references in the other files of the project
+    for path, ref in lint_context.symbols.model_references(target_model_path):
         # Skip current file, already processed
-        if file_uri.value == document_uri.value:
+        if URI.from_path(path).value == document_uri.value:
             continue
 
-        # Get model references that point to the target model
-        matching_refs = filter(
-            lambda ref: isinstance(ref, ModelReference) and ref.path == target_model_path,
-            get_model_definitions_for_a_path(lint_context, file_uri),
-        )
-
-        for ref in matching_refs:
-            assert isinstance(ref, ModelReference)  # for mypy
-
-            all_references.append(
-                ModelReference(
-                    path=path,
-                    range=ref.range,
-                    markdown_description=ref.markdown_description,
-                )
+        all_references.append(
+            ModelReference(
+                path=path,
+                range=ref.range,
+                markdown_description=ref.markdown_description,
             )
+        )
 
     return all_references
 
@@ -513,30 +502,18 @@ def get_macro_find_all_references(
         )
     ]
 
-    # Search through all SQL and audit files in the project
-    for path, _ in lsp_context.map.items():
-        file_uri = URI.from_path(path)
-
-        # Get macro references that point to the same macro definition
-        matching_refs = filter(
-            lambda ref: (
-                isinstance(ref, MacroReference)
-                and ref.path == target_macro_path
-                and ref.target_range == target_macro_target_range
-            ),
-            get_macro_definitions_for_a_path(lsp_context, file_uri),
-        )
-
-        for ref in matching_refs:
-            assert isinstance(ref, MacroReference)  # for mypy
-            all_references.append(
-                MacroReference(
-                    path=path,
-                    range=ref.range,
-                    target_range=ref.target_range,
-                    markdown_description=ref.markdown_description,
-                )
+    # Look up the invocations of the same macro definition in all SQL and audit files
+    for path, ref in lsp_context.symbols.macro_references(
+        target_macro_path, target_macro_target_range
+    ):
+        all_references.append(
+            MacroReference(
+                path=path,
+                range=ref.range,
+                target_range=ref.target_range,
+                markdown_description=ref.markdown_description,
             )
+        )
 
     return all_references
 
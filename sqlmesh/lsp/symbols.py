@@ -0,0 +1,232 @@
+"""An index of the symbols referenced in each file of a project.
+
+Finding all references of a model or a macro requires the references of every file in the project.
+The references of each file are stored in the cache folder and keyed by the hash of the file content
+and of everything that its references resolve to, so that a file is only parsed again after it or
+one of its dependencies changed. Lookups are served from inverted indexes held in memory.
+"""
+
+from __future__ import annotations
+
+import typing as t
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from sqlmesh.core.audit import StandaloneAudit
+from sqlmesh.core.linter.rule import Range
+from sqlmesh.core.model import Model
+from sqlmesh.core.model.definition import SqlModel
+from sqlmesh.lsp.custom import ModelCompletion
+from sqlmesh.lsp.uri import URI
+from sqlmesh.utils.cache import FileCache
+from sqlmesh.utils.hashing import md5
+from sqlmesh.utils.lineage import (
+    CTEReference,
+    MacroReference,
+    ModelReference,
+    generate_markdown_description,
+)
+
+if t.TYPE_CHECKING:
+    from sqlmesh.lsp.context import LSPContext
+
+IndexedReference = t.Union[ModelReference, CTEReference, MacroReference]
+RangeKey = t.Tuple[int, int, int, int]
+ModelReferenceIndex = t.Dict[Path, t.List[t.Tuple[Path, ModelReference]]]
+ModelCompletionEntry = t.Tuple[t.Optional[Path], ModelCompletion]
+MacroReferenceIndex = t.Dict[t.Tuple[Path, RangeKey], t.List[t.Tuple[Path, MacroReference]]]
+
+
+@dataclass
+class FileSymbols:
+    """The model, CTE and macro references of a single file.
+
+    Model references include the column qualifiers that refer to a model. Markdown descriptions are
+    not stored, since they depend on the referenced models rather than on the file itself.
+    """
+
+    references: t.List[IndexedReference] = field(default_factory=list)
+
+
+class SymbolIndex:
+    """An index of the references of all SQL files known to an LSP context.
+
+    Args:
+        lsp_context: The LSP context whose files are indexed.
+    """
+
+    def __init__(self, lsp_context: LSPContext):
+        self._lsp_context = lsp_context
+        self._file_cache: FileCache[FileSymbols] = FileCache(
+            lsp_context.context.cache_dir, prefix="lsp_symbols"
+        )
+        self._files: t.Dict[Path, FileSymbols] = {}
+        self._file_hashes: t.Dict[Path, str] = {}
+        self._model_references: t.Optional[ModelReferenceIndex] = None
+        self._macro_references: t.Optional[MacroReferenceIndex] = None
+        self._model_completions: t.Optional[t.List[ModelCompletionEntry]] = None
+
+    def file_symbols(self, path: Path) -> FileSymbols:
+        """Returns the symbols of the given file, parsing it only if it's not in the cache."""
+        symbols = self._files.get(path)
+        if symbols is not None:
+            return symbols
+
+        target = self._target(path)
+        if target is None or target._path is None:
+            symbols = FileSymbols()
+        else:
+            entry_name = self._entry_name(path)
+            entry_id = self._entry_id(path, target)
+            symbols = self._file_cache.get_or_load(
+                entry_name, entry_id, loader=lambda: self._extract_symbols(path)
+            )
+
+        self._files[path] = symbols
+        return symbols
+
+    def model_references(self, model_path: Path) -> t.List[t.Tuple[Path, ModelReference]]:
+        """Returns the references to the models defined in the given file.
+
+        Args:
+            model_path: The path of the file that defines the referenced models.
+
+        Returns:
+            Pairs of the referencing file and the reference, in the order of the context's files.
+        """
+        if self._model_references is None:
+            self._model_references = {}
+            for path in self._lsp_context.map:
+                for ref in self.file_symbols(path).references:
+                    if isinstance(ref, ModelReference):
+                        self._model_references.setdefault(ref.path, []).append((path, ref))
+        return self._model_references.get(model_path, [])
+
+    def macro_references(
+        self, macro_path: Path, target_range: Range
+    ) -> t.List[t.Tuple[Path, MacroReference]]:
+        """Returns the invocations of the macro defined at the given location.
+
+        Args:
+            macro_path: The path of the file that defines the macro.
+            target_range: The range of the macro definition.
+
+        Returns:
+            Pairs of the invoking file and the reference, in the order of the files in the context.
+        """
+        if self._macro_references is None:
+            self._macro_references = {}
+            for path in self._lsp_context.map:
+                for ref in self.file_symbols(path).references:
+                    if isinstance(ref, MacroReference):
+                        key = (ref.path, _range_key(ref.target_range))
+                        self._macro_references.setdefault(key, []).append((path, ref))
+        return self._macro_references.get((macro_path, _range_key(target_range)), [])
+
+    def model_completions(self) -> t.List[ModelCompletionEntry]:
+        """Returns the completions of all models along with the files that define them."""
+        if self._model_completions is None:
+            self._model_completions = []
+            for model in self._lsp_context.context.models.values():
+                description = None
+                try:
+                    description = generate_markdown_description(model)
+                except Exception:
+                    description = getattr(model, "description", None)
+
+                self._model_completions.append(
+                    (model._path, ModelCompletion(name=model.name, description=description))
+                )
+        return self._model_completions
+
+    def invalidate(self, paths: t.Iterable[Path]) -> None:
+        """Drops the symbols of the given files, which are indexed again on the next lookup.
+
+        Args:
+            paths: The files that were modified or whose dependencies were modified.
+        """
+        for path in paths:
+            self._files.pop(path, None)
+            self._file_hashes.pop(path, None)
+        self._model_references = None
+        self._macro_references = None
+        self._model_completions = None
+
+    def clear(self) -> None:
+        """Drops the symbols of all files."""
+        self.invalidate(list(self._files) + list(self._file_hashes))
+
+    def _target(self, path: Path) -> t.Optional[t.Union[Model, StandaloneAudit]]:
+        from sqlmesh.lsp.context import AuditTarget, ModelTarget
+
+        if path.suffix != ".sql":
+            return None
+
+        file_info = self._lsp_context.map.get(path)
+        if isinstance(file_info, ModelTarget):
+            model = self._lsp_context.context.get_model(file_info.names[0])
+            return model if isinstance(model, SqlModel) else None
+        if isinstance(file_info, AuditTarget):
+            return self._lsp_context.context.standalone_audits.get(file_info.name)
+        return None
+
+    def _extract_symbols(self, path: Path) -> FileSymbols:
+        from sqlmesh.lsp.reference import (
+            get_macro_definitions_for_a_path,
+            get_model_definitions_for_a_path,
+        )
+
+        uri = URI.from_path(path)
+        references: t.List[IndexedReference] = []
+        for ref in [
+            *get_model_definitions_for_a_path(self._lsp_context, uri),
+            *get_macro_definitions_for_a_path(self._lsp_context, uri),
+        ]:
+            if isinstance(ref, (ModelReference, MacroReference)):
+                references.append(ref.copy(update={"markdown_description": None}))
+            elif isinstance(ref, CTEReference):
+                references.append(ref)
+        return FileSymbols(references=references)
+
+    def _entry_name(self, path: Path) -> str:
+        _, config_path = self._lsp_context.context.config_for_path(path)
+        try:
+            parts = path.relative_to(config_path).parts
+        except ValueError:
+            parts = path.parts
+        return "__".join(parts).replace(path.suffix, "")
+
+    def _entry_id(self, path: Path, target: t.Union[Model, StandaloneAudit]) -> str:
+        context = self._lsp_context.context
+        _, config_path = context.config_for_path(path)
+
+        # The references depend on the models and macros they resolve to, not just on the file
+        data = [
+            self._file_hash(path),
+            target.dialect,
+            context.default_catalog or "",
+        ]
+        for name in sorted(target.depends_on):
+            model = context.get_model(name)
+            data.append(name)
+            if model is not None:
+                data.extend([type(model).__name__, str(model._path)])
+        for name, executable in sorted(target.python_env.items()):
+            if executable.path:
+                macro_path = config_path / executable.path
+                data.extend([name, str(macro_path), self._file_hash(macro_path)])
+        return md5(data)
+
+    def _file_hash(self, path: Path) -> str:
+        file_hash = self._file_hashes.get(path)
+        if file_hash is None:
+            try:
+                file_hash = md5(path.read_text(encoding="utf-8"))
+            except OSError:
+                file_hash = ""
+            self._file_hashes[path] = file_hash
+        return file_hash
+
+
+def _range_key(range: Range) -> RangeKey:
+    return (range.start.line, range.start.character, range.end.line, range.end.character)
@@ -812,6 +812,18 @@ class SQLMeshMagics(Magics):
         action="store_true",
         help="If set, when performing a schema diff the case of column names is ignored when matching between the two schemas. For example, 'col_a' in the source schema and 'COL_A' in the target schema will be treated as the same column.",
     )
+    @argument(
+        "--algorithm",
+        type=str,
+        choices=["join", "hashdiff"],
+        default="join",
+        help="The algorithm used to compute row differences. Default: join",
+    )
+    @argument(
+        "--mismatches-file",
+        type=str,
+        help="The path of a CSV file to which every mismatched row is written when diffing tables across gateways.",
+    )
     @line_magic
     @pass_sqlmesh_context
     def table_diff(self, context: Context, line: str) -> None:
@@ -835,6 +847,8 @@ class SQLMeshMagics(Magics):
             skip_grain_check=args.skip_grain_check,
             warn_grain_check=args.warn_grain_check,
             schema_diff_ignore_case=args.schema_diff_ignore_case,
+            algorithm=args.algorithm,
+            mismatches_file=args.mismatches_file,
         )
 
     @magic_arguments()
@@ -991,12 +1005,17 @@ class SQLMeshMagics(Magics):
         action="store_true",
         help="Cleanup snapshots that are not referenced in any environment, regardless of when they're set to expire",
     )
+    @argument(
+        "--compact",
+        action="store_true",
+        help="Compact intervals regardless of the configured compaction threshold",
+    )
     @line_magic
     @pass_sqlmesh_context
     def janitor(self, context: Context, line: str) -> None:
         """Run the janitor process to clean up old environments and expired snapshots."""
         args = parse_argstring(self.janitor, line)
-        context.run_janitor(ignore_ttl=args.ignore_ttl)
+        context.run_janitor(ignore_ttl=args.ignore_ttl, compact=args.compact)
 
     @magic_arguments()
     @argument("model", type=str)
@@ -1147,6 +1166,12 @@ class SQLMeshMagics(Magics):
         help="Skip the connection test.",
         default=False,
     )
+    @argument(
+        "--timings",
+        action="store_true",
+        help="Show how long each phase of loading the project took.",
+        default=False,
+    )
     @argument(
         "--verbose",
         "-v",
@@ -1159,7 +1184,11 @@ class SQLMeshMagics(Magics):
     def info(self, context: Context, line: str) -> None:
         """Display SQLMesh project information."""
         args = parse_argstring(self.info, line)
-        context.print_info(skip_connection=args.skip_connection, verbosity=Verbosity(args.verbose))
+        context.print_info(
+            skip_connection=args.skip_connection,
+            verbosity=Verbosity(args.verbose),
+            timings=args.timings,
+        )
 
     @magic_arguments()
     @line_magic
@@ -0,0 +1,51 @@
+"""Add the interval revisions table used to invalidate cached snapshot intervals."""
+
+from sqlglot import exp
+
+from sqlmesh.utils import random_id
+from sqlmesh.utils.migration import index_text_type
+
+
+def migrate_schemas(engine_adapter, schema, **kwargs):  # type: ignore
+    interval_revisions_table = "_interval_revisions"
+
+    if schema:
+        interval_revisions_table = f"{schema}.{interval_revisions_table}"
+
+    engine_adapter.create_state_table(
+        interval_revisions_table,
+        _interval_revisions_columns_to_types(engine_adapter),
+    )
+    engine_adapter.create_index(
+        interval_revisions_table, "_interval_revisions_name_version_idx", ("name", "version")
+    )
+
+
+def migrate_rows(engine_adapter, schema, **kwargs):  # type: ignore
+    intervals_table = "_intervals"
+    interval_revisions_table = "_interval_revisions"
+
+    if schema:
+        intervals_table = f"{schema}.{intervals_table}"
+        interval_revisions_table = f"{schema}.{interval_revisions_table}"
+
+    engine_adapter.insert_append(
+        interval_revisions_table,
+        exp.select(
+            "name",
+            "version",
+            exp.Literal.string(random_id()).as_("revision"),
+        )
+        .from_(intervals_table)
+        .distinct(),
+        target_columns_to_types=_interval_revisions_columns_to_types(engine_adapter),
+    )
+
+
+def _interval_revisions_columns_to_types(engine_adapter):  # type: ignore
+    index_type = index_text_type(engine_adapter.dialect)
+    return {
+        "name": exp.DataType.build(index_type),
+        "version": exp.DataType.build(index_type),
+        "revision": exp.DataType.build(index_type),
+    }
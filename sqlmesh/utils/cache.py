@@ -2,9 +2,14 @@ from __future__ import annotations
 
 import gzip
 import logging
+import os
 import pickle
 import shutil
+import sqlite3
+import threading
+import time
 import typing as t
+from enum import Enum
 from pathlib import Path
 
 from sqlglot import __version__ as SQLGLOT_VERSION
@@ -23,10 +28,238 @@ SQLGLOT_VERSION_TUPLE = tuple(SQLGLOT_VERSION.split("."))
 SQLGLOT_MAJOR_VERSION = SQLGLOT_VERSION_TUPLE[0]
 SQLGLOT_MINOR_VERSION = SQLGLOT_VERSION_TUPLE[1]
 
+PACKED_CACHE_FILE_NAME = "cache.db"
+
+
+class CacheBackend(str, Enum):
+    """The storage layout used for cache entries."""
+
+    FILES = "files"
+    PACKED = "packed"
+
+    @property
+    def is_files(self) -> bool:
+        return self == CacheBackend.FILES
+
+    @property
+    def is_packed(self) -> bool:
+        return self == CacheBackend.PACKED
+
+
+class PackedCacheStore:
+    """A single-file cache store backed by SQLite.
+
+    All entries of a cache folder are kept in one database file instead of one file per entry,
+    so that opening the cache doesn't require listing and stat-ing every entry. Payloads are stored
+    uncompressed and read through a memory-mapped database. Once the total payload size exceeds
+    `max_size_bytes`, the least recently used entries are evicted.
+
+    Args:
+        path: The path to the cache folder.
+        max_size_bytes: The maximum total size of stored payloads. Unbounded if not set.
+    """
+
+    # How often (in number of writes) the total size of the store is checked against the limit.
+    EVICTION_CHECK_INTERVAL = 100
+    # Access times are only refreshed on reads if they are older than this many seconds.
+    ACCESS_TIME_RESOLUTION = 3600
+    MMAP_SIZE = 256 * 1024 * 1024
+
+    def __init__(self, path: Path, max_size_bytes: t.Optional[int] = None):
+        self.path = path
+        self.max_size_bytes = max_size_bytes
+        self._local = threading.local()
+        self._generation = 0
+        self._writes_since_eviction_check = 0
+        self._pruned_versions: t.Set[str] = set()
+
+    @property
+    def db_path(self) -> Path:
+        return self.path / PACKED_CACHE_FILE_NAME
+
+    def prune(self, version: str, threshold: float) -> None:
+        """Deletes entries that belong to a different cache version or weren't accessed since the threshold.
+
+        Args:
+            version: The current cache version.
+            threshold: The timestamp before which entries are considered stale.
+        """
+        if version in self._pruned_versions or not self.db_path.exists():
+            return
+        with self._connection() as conn:
+            conn.execute(
+                "DELETE FROM entries WHERE version <> ? OR accessed_at < ?", (version, threshold)
+            )
+        self._pruned_versions.add(version)
+
+    def get(self, prefix: str, name: str, entry_id: str, version: str) -> t.Optional[bytes]:
+        if not self.db_path.exists():
+            return None
+        conn = self._connection()
+        row = conn.execute(
+            "SELECT value, accessed_at FROM entries "
+            "WHERE prefix = ? AND name = ? AND entry_id = ? AND version = ?",
+            (prefix, name, entry_id, version),
+        ).fetchone()
+        if row is None:
+            return None
+
+        value, accessed_at = row
+        now = time.time()
+        if now - accessed_at > self.ACCESS_TIME_RESOLUTION:
+            with conn:
+                conn.execute(
+                    "UPDATE entries SET accessed_at = ? "
+                    "WHERE prefix = ? AND name = ? AND entry_id = ?",
+                    (now, prefix, name, entry_id),
+                )
+        return value
+
+    def put(self, prefix: str, name: str, entry_id: str, version: str, value: bytes) -> None:
+        with self._connection() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO entries "
+                "(prefix, name, entry_id, version, value, size, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (prefix, name, entry_id, version, value, len(value), time.time()),
+            )
+
+        self._writes_since_eviction_check += 1
+        if self._writes_since_eviction_check >= self.EVICTION_CHECK_INTERVAL:
+            self.evict()
+
+    def exists(self, prefix: str, name: str, entry_id: str, version: str) -> bool:
+        if not self.db_path.exists():
+            return False
+        row = (
+            self._connection()
+            .execute(
+                "SELECT 1 FROM entries "
+                "WHERE prefix = ? AND name = ? AND entry_id = ? AND version = ?",
+                (prefix, name, entry_id, version),
+            )
+            .fetchone()
+        )
+        return row is not None
+
+    def clear(self, prefix: str) -> None:
+        if not self.db_path.exists():
+            return
+        with self._connection() as conn:
+            conn.execute("DELETE FROM entries WHERE prefix = ?", (prefix,))
+
+    def evict(self) -> None:
+        """Evicts the least recently used entries until the total size fits the configured limit."""
+        self._writes_since_eviction_check = 0
+        if self.max_size_bytes is None or not self.db_path.exists():
+            return
+
+        with self._connection() as conn:
+            total_size = conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+            if total_size <= self.max_size_bytes:
+                return
+
+            excess = total_size - self.max_size_bytes
+            evicted: t.List[t.Tuple[str, str, str]] = []
+            for prefix, name, entry_id, size in conn.execute(
+                "SELECT prefix, name, entry_id, size FROM entries ORDER BY accessed_at"
+            ).fetchall():
+                if excess <= 0:
+                    break
+                evicted.append((prefix, name, entry_id))
+                excess -= size
+
+            conn.executemany(
+                "DELETE FROM entries WHERE prefix = ? AND name = ? AND entry_id = ?", evicted
+            )
+        logger.debug("Evicted %s entries from the packed cache '%s'", len(evicted), self.db_path)
+
+    def reset(self) -> None:
+        """Drops all open connections, eg. after the underlying database file has been removed."""
+        self._generation += 1
+        self._pruned_versions.clear()
+
+    def _connection(self) -> sqlite3.Connection:
+        local = self._local
+        conn = getattr(local, "conn", None)
+        if conn is not None and local.pid == os.getpid() and local.generation == self._generation:
+            return conn
+
+        self.path.mkdir(parents=True, exist_ok=True)
+        if not self.path.is_dir():
+            raise SQLMeshError(f"Cache path '{self.path}' is not a directory.")
+
+        # Connections are never shared between threads or processes, each one gets its own
+        conn = sqlite3.connect(self.db_path, timeout=30, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute(f"PRAGMA mmap_size={self.MMAP_SIZE}")
+        with conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS entries ("
+                "prefix TEXT NOT NULL, name TEXT NOT NULL, entry_id TEXT NOT NULL, "
+                "version TEXT NOT NULL, value BLOB NOT NULL, size INTEGER NOT NULL, "
+                "accessed_at REAL NOT NULL, PRIMARY KEY (prefix, name, entry_id))"
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS entries_accessed_at_idx ON entries (accessed_at)"
+            )
+
+        local.conn = conn
+        local.pid = os.getpid()
+        local.generation = self._generation
+        return conn
+
+    def __getstate__(self) -> t.Dict[str, t.Any]:
+        state = self.__dict__.copy()
+        del state["_local"]
+        return state
+
+    def __setstate__(self, state: t.Dict[str, t.Any]) -> None:
+        self.__dict__.update(state)
+        self._local = threading.local()
+
+
+_PACKED_STORES: t.Dict[Path, PackedCacheStore] = {}
+
+
+def configure_cache_dir(
+    path: Path,
+    backend: CacheBackend = CacheBackend.FILES,
+    max_size_bytes: t.Optional[int] = None,
+) -> None:
+    """Sets the storage layout used by all caches created for the given cache folder.
+
+    Args:
+        path: The path to the cache folder.
+        backend: The cache backend to use.
+        max_size_bytes: The maximum total size of the packed cache. Ignored by the files backend.
+    """
+    key = path.resolve()
+    if backend.is_files:
+        _PACKED_STORES.pop(key, None)
+        return
+
+    store = _PACKED_STORES.get(key)
+    if store is None:
+        _PACKED_STORES[key] = PackedCacheStore(path, max_size_bytes=max_size_bytes)
+    else:
+        store.max_size_bytes = max_size_bytes
+
+
+def reset_cache_dir(path: Path) -> None:
+    """Drops open connections to the packed cache in the given folder, if any."""
+    store = _PACKED_STORES.get(path.resolve())
+    if store is not None:
+        store.reset()
+
 
 class FileCache(t.Generic[T]):
     """Generic file-based cache implementation.
 
+    Entries are stored as one gzip-compressed file each, unless the cache folder was configured
+    to use the packed backend with `configure_cache_dir`.
+
     Args:
         path: The path to the cache folder.
         entry_class: The type of cached entries.
@@ -36,6 +269,8 @@ class FileCache(t.Generic[T]):
 
     def __init__(self, path: Path, prefix: t.Optional[str] = None):
         self._path = path / prefix if prefix else path
+        self._prefix = prefix or ""
+        self._packed_store = _PACKED_STORES.get(path.resolve())
 
         from sqlmesh.core.state_sync.base import SCHEMA_VERSION
 
@@ -57,6 +292,10 @@ class FileCache(t.Generic[T]):
         )
 
         threshold = to_datetime("1 week ago").timestamp()
+        if self._packed_store is not None:
+            self._packed_store.prune(self._cache_version, threshold)
+            return
+
         # delete all old cache files
         for file in self._path.glob("*"):
             if IS_WINDOWS:
@@ -103,13 +342,25 @@ class FileCache(t.Generic[T]):
         Returns:
             The entry or None if no entry was found in the cache.
         """
-        cache_entry_path = self._cache_entry_path(name, entry_id)
-        if cache_entry_path.exists():
-            with gzip.open(cache_entry_path, "rb") as fd:
-                try:
-                    return pickle.load(fd)
-                except Exception as ex:
-                    logger.warning("Failed to load a cache entry '%s': %s", name, ex)
+        if self._packed_store is not None:
+            payload = self._packed_store.get(self._prefix, name, entry_id, self._cache_version)
+        else:
+            try:
+                # Decompressing the whole entry at once releases the GIL, so entries can be read concurrently
+                payload = gzip.decompress(self._cache_entry_path(name, entry_id).read_bytes())
+            except FileNotFoundError:
+                return None
+            except Exception as ex:
+                logger.warning("Failed to load a cache entry '%s': %s", name, ex)
+                return None
+
+        if payload is None:
+            return None
+
+        try:
+            return pickle.loads(payload)
+        except Exception as ex:
+            logger.warning("Failed to load a cache entry '%s': %s", name, ex)
 
         return None
 
@@ -121,6 +372,16 @@ class FileCache(t.Generic[T]):
             entry_id: The unique entry identifier. Used for cache invalidation.
             value: The value to store in the cache.
         """
+        if self._packed_store is not None:
+            self._packed_store.put(
+                self._prefix,
+                name,
+                entry_id,
+                self._cache_version,
+                pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL),
+            )
+            return
+
         self._path.mkdir(parents=True, exist_ok=True)
         if not self._path.is_dir():
             raise SQLMeshError(f"Cache path '{self._path}' is not a directory.")
@@ -135,9 +396,14 @@ class FileCache(t.Generic[T]):
             name: The name of the entry.
             entry_id: The unique entry identifier. Used for cache invalidation.
         """
+        if self._packed_store is not None:
+            return self._packed_store.exists(self._prefix, name, entry_id, self._cache_version)
         return self._cache_entry_path(name, entry_id).exists()
 
     def clear(self) -> None:
+        if self._packed_store is not None:
+            self._packed_store.clear(self._prefix)
+            return
         try:
             shutil.rmtree(str(self._path.absolute()))
         except Exception:
@@ -1,4 +1,6 @@
+import heapq
 import typing as t
+from collections import deque
 from concurrent.futures import Executor, Future, ThreadPoolExecutor
 from threading import Lock
 
@@ -21,6 +23,12 @@ class NodeExecutionFailedError(t.Generic[H], SQLMeshError):
 class ConcurrentDAGExecutor(t.Generic[H]):
     """Concurrently traverses the given DAG in topological order while applying a function to each node.
 
+    Scheduling is driven by per-node indegree counters and a reverse adjacency index, so completing
+    or failing a node only touches its direct downstream nodes. Nodes whose dependencies have been
+    satisfied are placed into a priority queue and are submitted for execution only when a worker
+    becomes available, which means that the ordering defined by the nodes themselves (e.g.
+    `SchedulingUnit.__lt__`) or by the optional `priority` callable is respected.
+
     If `raise_on_error` is set to False maintains a state of execution errors as well as of skipped nodes.
 
     Args:
@@ -30,6 +38,8 @@ class ConcurrentDAGExecutor(t.Generic[H]):
         raise_on_error: If set to True raises an exception on a first encountered error,
             otherwises returns a tuple which contains a list of failed nodes and a list of
             skipped nodes.
+        priority: An optional function which returns a sort key for a node. Ready nodes with
+            lower keys are submitted first. Defaults to the natural ordering of the nodes.
     """
 
     def __init__(
@@ -38,11 +48,13 @@ class ConcurrentDAGExecutor(t.Generic[H]):
         fn: t.Callable[[H], None],
         tasks_num: int,
         raise_on_error: bool,
+        priority: t.Optional[t.Callable[[H], t.Any]] = None,
     ):
         self.dag = dag
         self.fn = fn
         self.tasks_num = tasks_num
         self.raise_on_error = raise_on_error
+        self.priority = priority
 
         self._init_state()
 
@@ -70,7 +82,9 @@ class ConcurrentDAGExecutor(t.Generic[H]):
 
             with self._unprocessed_nodes_lock:
                 self._unprocessed_nodes_num -= 1
-                self._submit_next_nodes(executor, node)
+                self._running_nodes_num -= 1
+                self._release_downstream_nodes(node)
+                self._submit_next_nodes(executor)
         except Exception as ex:
             error = NodeExecutionFailedError(node)
             error.__cause__ = ex
@@ -81,56 +95,105 @@ class ConcurrentDAGExecutor(t.Generic[H]):
 
             with self._unprocessed_nodes_lock:
                 self._unprocessed_nodes_num -= 1
+                self._running_nodes_num -= 1
                 self._node_errors.append(error)
                 self._skip_next_nodes(node)
+                self._submit_next_nodes(executor)
 
-    def _submit_next_nodes(self, executor: Executor, processed_node: t.Optional[H] = None) -> None:
-        if not self._unprocessed_nodes_num:
-            self._finished_future.set_result(None)
-            return
+    def _release_downstream_nodes(self, processed_node: H) -> None:
+        for next_node in self._downstream.get(processed_node, ()):
+            self._indegrees[next_node] -= 1
+            if not self._indegrees[next_node] and next_node not in self._skipped_nodes_set:
+                self._ready_queue.push(next_node)
 
-        submitted_nodes = []
-        for next_node, deps in self._unprocessed_nodes.items():
-            if processed_node:
-                deps.discard(processed_node)
-            if not deps:
-                submitted_nodes.append(next_node)
-
-        for submitted_node in submitted_nodes:
-            self._unprocessed_nodes.pop(submitted_node)
-            executor.submit(self._process_node, submitted_node, executor)
+    def _submit_next_nodes(self, executor: Executor) -> None:
+        if self._finished_future.done():
+            return
 
-    def _skip_next_nodes(self, parent: H) -> None:
         if not self._unprocessed_nodes_num:
             self._finished_future.set_result(None)
             return
 
-        skipped_nodes = {node for node, deps in self._unprocessed_nodes.items() if parent in deps}
+        while self._ready_queue and self._running_nodes_num < self.tasks_num:
+            self._running_nodes_num += 1
+            executor.submit(self._process_node, self._ready_queue.pop(), executor)
 
-        while skipped_nodes:
-            self._skipped_nodes.extend(skipped_nodes)
-
-            for skipped_node in skipped_nodes:
-                self._unprocessed_nodes_num -= 1
-                self._unprocessed_nodes.pop(skipped_node)
+    def _skip_next_nodes(self, parent: H) -> None:
+        queue = deque(self._downstream.get(parent, ()))
 
-            skipped_nodes = {
-                node
-                for node, deps in self._unprocessed_nodes.items()
-                if skipped_nodes.intersection(deps)
-            }
+        while queue:
+            skipped_node = queue.popleft()
+            if skipped_node in self._skipped_nodes_set:
+                continue
 
-        if not self._unprocessed_nodes_num:
-            self._finished_future.set_result(None)
+            self._skipped_nodes_set.add(skipped_node)
+            self._skipped_nodes.append(skipped_node)
+            self._unprocessed_nodes_num -= 1
+            queue.extend(self._downstream.get(skipped_node, ()))
 
     def _init_state(self) -> None:
-        self._unprocessed_nodes = self.dag.graph
-        self._unprocessed_nodes_num = len(self._unprocessed_nodes)
+        self._indegrees: t.Dict[H, int] = {}
+        self._downstream: t.Dict[H, t.List[H]] = {}
+        self._ready_queue: "_ReadyQueue[H]" = _ReadyQueue(self.priority)
+
+        for node, deps in self.dag.graph.items():
+            self._indegrees[node] = len(deps)
+            for dep in deps:
+                self._downstream.setdefault(dep, []).append(node)
+            if not deps:
+                self._ready_queue.push(node)
+
+        self._unprocessed_nodes_num = len(self._indegrees)
+        self._running_nodes_num = 0
         self._unprocessed_nodes_lock = Lock()
         self._finished_future = Future()  # type: ignore
 
         self._node_errors: t.List[NodeExecutionFailedError[H]] = []
         self._skipped_nodes: t.List[H] = []
+        self._skipped_nodes_set: t.Set[H] = set()
+
+
+class _ReadyQueue(t.Generic[H]):
+    """A priority queue of nodes that are ready for execution.
+
+    Nodes are ordered by the provided key function or by their natural ordering if no key function
+    was provided. Ties, as well as nodes which don't support ordering, are resolved in the insertion order.
+    """
+
+    def __init__(self, key: t.Optional[t.Callable[[H], t.Any]] = None):
+        self._key = key
+        self._heap: t.List["_ReadyQueueItem[H]"] = []
+        self._counter = 0
+
+    def push(self, node: H) -> None:
+        sort_key = self._key(node) if self._key else node
+        heapq.heappush(self._heap, _ReadyQueueItem(sort_key, self._counter, node))
+        self._counter += 1
+
+    def pop(self) -> H:
+        return heapq.heappop(self._heap).node
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+
+class _ReadyQueueItem(t.Generic[H]):
+    __slots__ = ("sort_key", "seq", "node")
+
+    def __init__(self, sort_key: t.Any, seq: int, node: H):
+        self.sort_key = sort_key
+        self.seq = seq
+        self.node = node
+
+    def __lt__(self, other: "_ReadyQueueItem[H]") -> bool:
+        try:
+            if self.sort_key < other.sort_key:
+                return True
+            if other.sort_key < self.sort_key:
+                return False
+        except TypeError:
+            pass
+        return self.seq < other.seq
 
 
 def concurrent_apply_to_snapshots(
@@ -180,6 +243,7 @@ def concurrent_apply_to_dag(
     fn: t.Callable[[H], None],
     tasks_num: int,
     raise_on_error: bool = True,
+    priority: t.Optional[t.Callable[[H], t.Any]] = None,
 ) -> t.Tuple[t.List[NodeExecutionFailedError[H]], t.List[H]]:
     """Applies a function to the given DAG concurrently while preserving the topological
     order between snapshots.
@@ -191,6 +255,8 @@ def concurrent_apply_to_dag(
         raise_on_error: If set to True raises an exception on a first encountered error,
             otherwises returns a tuple which contains a list of failed nodes and a list of
             skipped nodes.
+        priority: An optional function which returns a sort key for a node. Nodes that are ready
+            for execution are submitted in the ascending order of their keys.
 
     Raises:
         NodeExecutionFailedError if `raise_on_error` is set to True and execution fails for any snapshot.
@@ -202,13 +268,14 @@ def concurrent_apply_to_dag(
         raise ConfigError(f"Invalid number of concurrent tasks {tasks_num}")
 
     if tasks_num == 1:
-        return sequential_apply_to_dag(dag, fn, raise_on_error)
+        return sequential_apply_to_dag(dag, fn, raise_on_error, priority=priority)
 
     return ConcurrentDAGExecutor(
         dag,
         fn,
         tasks_num,
         raise_on_error,
+        priority=priority,
     ).run()
 
 
@@ -216,6 +283,7 @@ def sequential_apply_to_dag(
     dag: DAG[H],
     fn: t.Callable[[H], None],
     raise_on_error: bool = True,
+    priority: t.Optional[t.Callable[[H], t.Any]] = None,
 ) -> t.Tuple[t.List[NodeExecutionFailedError[H]], t.List[H]]:
     dependencies = dag.graph
 
@@ -224,7 +292,7 @@ def sequential_apply_to_dag(
 
     failed_or_skipped_nodes: t.Set[H] = set()
 
-    for node in dag.sorted:
+    for node in dag.sorted if priority is None else _prioritized_topological_order(dag, priority):
         if not failed_or_skipped_nodes.isdisjoint(dependencies[node]):
             skipped_nodes.append(node)
             failed_or_skipped_nodes.add(node)
@@ -245,6 +313,30 @@ def sequential_apply_to_dag(
     return node_errors, skipped_nodes
 
 
+def _prioritized_topological_order(dag: DAG[H], priority: t.Callable[[H], t.Any]) -> t.Iterator[H]:
+    """Yields the nodes of the DAG in topological order, picking the ready node with the lowest
+    `priority` key first, just like `ConcurrentDAGExecutor` does when a single worker is available.
+    """
+    indegrees: t.Dict[H, int] = {}
+    downstream: t.Dict[H, t.List[H]] = {}
+    ready_queue: _ReadyQueue[H] = _ReadyQueue(priority)
+
+    for node, deps in dag.graph.items():
+        indegrees[node] = len(deps)
+        for dep in deps:
+            downstream.setdefault(dep, []).append(node)
+        if not deps:
+            ready_queue.push(node)
+
+    while ready_queue:
+        node = ready_queue.pop()
+        yield node
+        for next_node in downstream.get(node, ()):
+            indegrees[next_node] -= 1
+            if not indegrees[next_node]:
+                ready_queue.push(next_node)
+
+
 def concurrent_apply_to_values(
     values: t.Sequence[A],
     fn: t.Callable[[A], R],
@@ -0,0 +1,212 @@
+"""Span-based tracing of where the time goes while loading a project, planning and applying changes.
+
+Tracing is disabled until `start_tracing` is called. While it's disabled, `span` returns a shared no-op
+context manager and functions decorated with `traced` are called directly, so instrumented code only
+pays for a lookup of the active tracer.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+import typing as t
+from contextlib import contextmanager, nullcontext
+from dataclasses import dataclass, field
+from functools import wraps
+from pathlib import Path
+
+F = t.TypeVar("F", bound=t.Callable[..., t.Any])
+
+_NOOP_SPAN: t.ContextManager[None] = nullcontext()
+
+
+@dataclass
+class Span:
+    """A single timed unit of work.
+
+    Args:
+        name: The name of the span.
+        category: The category of the span, eg. "load", "plan" or "state".
+        thread_id: The identifier of the thread in which the span was recorded.
+        start: The start of the span in seconds, relative to the start of the tracer.
+        duration: The wall time of the span in seconds.
+        self_time: The wall time of the span in seconds, excluding its nested spans in the same thread.
+        args: Additional details of the span.
+    """
+
+    name: str
+    category: str
+    thread_id: int
+    start: float
+    duration: float = 0.0
+    self_time: float = 0.0
+    args: t.Dict[str, t.Any] = field(default_factory=dict)
+
+
+@dataclass
+class SpanSummary:
+    """The aggregated timings of all spans with the same name."""
+
+    name: str
+    category: str
+    count: int = 0
+    total_time: float = 0.0
+    self_time: float = 0.0
+
+
+class Tracer:
+    """Records the spans of work performed by any thread while it's active."""
+
+    def __init__(self) -> None:
+        self.spans: t.List[Span] = []
+        self._origin = time.perf_counter()
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    @contextmanager
+    def span(self, name: str, category: str = "", **args: t.Any) -> t.Iterator[None]:
+        """Records the time spent in the wrapped block as a span.
+
+        Args:
+            name: The name of the span.
+            category: The category of the span.
+            args: Additional details of the span.
+        """
+        # Each frame accumulates the total duration of the nested spans of an open span in this thread
+        stack: t.List[t.List[float]] = self._local.__dict__.setdefault("stack", [])
+        frame = [0.0]
+        stack.append(frame)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            duration = time.perf_counter() - start
+            stack.pop()
+            if stack:
+                stack[-1][0] += duration
+
+            span = Span(
+                name=name,
+                category=category,
+                thread_id=threading.get_ident(),
+                start=start - self._origin,
+                duration=duration,
+                self_time=duration - frame[0],
+                args=args,
+            )
+            with self._lock:
+                self.spans.append(span)
+
+    def summary(self) -> t.List[SpanSummary]:
+        """Returns the timings aggregated by span name, sorted by self time in descending order."""
+        summaries: t.Dict[str, SpanSummary] = {}
+        for span in self.spans:
+            summary = summaries.get(span.name)
+            if summary is None:
+                summary = summaries[span.name] = SpanSummary(name=span.name, category=span.category)
+            summary.count += 1
+            summary.total_time += span.duration
+            summary.self_time += span.self_time
+        return sorted(summaries.values(), key=lambda s: s.self_time, reverse=True)
+
+    def format_summary(self, limit: int = 25) -> t.List[str]:
+        """Returns the lines of a table with the spans that took the most self time.
+
+        Args:
+            limit: The maximum number of spans to include.
+        """
+        lines = [f"{'self (s)':>10}  {'total (s)':>10}  {'calls':>7}  span"]
+        for summary in self.summary()[:limit]:
+            lines.append(
+                f"{summary.self_time:>10.3f}  {summary.total_time:>10.3f}  {summary.count:>7}  "
+                f"{summary.name}"
+            )
+        return lines
+
+    def to_chrome_trace(self) -> t.Dict[str, t.Any]:
+        """Returns the spans in the Chrome trace event format, which can be opened in Perfetto."""
+        pid = os.getpid()
+        return {
+            "traceEvents": [
+                {
+                    "name": span.name,
+                    "cat": span.category,
+                    "ph": "X",
+                    "ts": span.start * 1e6,
+                    "dur": span.duration * 1e6,
+                    "pid": pid,
+                    "tid": span.thread_id,
+                    "args": {k: str(v) for k, v in span.args.items()},
+                }
+                for span in sorted(self.spans, key=lambda s: s.start)
+            ],
+            "displayTimeUnit": "ms",
+        }
+
+    def write_chrome_trace(self, path: Path) -> None:
+        """Writes the spans to the given file in the Chrome trace event format."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as fd:
+            json.dump(self.to_chrome_trace(), fd)
+
+
+_tracer: t.Optional[Tracer] = None
+
+
+def start_tracing() -> Tracer:
+    """Starts recording spans and returns the active tracer."""
+    global _tracer
+    _tracer = Tracer()
+    return _tracer
+
+
+def stop_tracing() -> t.Optional[Tracer]:
+    """Stops recording spans and returns the tracer that was active, if any."""
+    global _tracer
+    tracer, _tracer = _tracer, None
+    return tracer
+
+
+def active_tracer() -> t.Optional[Tracer]:
+    """Returns the active tracer or None if tracing is disabled."""
+    return _tracer
+
+
+def span(name: str, category: str = "", **args: t.Any) -> t.ContextManager[None]:
+    """Records the time spent in the wrapped block if tracing is enabled.
+
+    Args:
+        name: The name of the span.
+        category: The category of the span.
+        args: Additional details of the span.
+    """
+    tracer = _tracer
+    if tracer is None:
+        return _NOOP_SPAN
+    return tracer.span(name, category, **args)
+
+
+def traced(category: str = "", name: t.Optional[str] = None) -> t.Callable[[F], F]:
+    """Records each call of the decorated function as a span if tracing is enabled.
+
+    Args:
+        category: The category of the span.
+        name: The name of the span. Defaults to the qualified name of the function.
+    """
+
+    def decorator(func: F) -> F:
+        span_name = name or func.__qualname__
+
+        @wraps(func)
+        def wrapper(*args: t.Any, **kwargs: t.Any) -> t.Any:
+            tracer = _tracer
+            if tracer is None:
+                return func(*args, **kwargs)
+            with tracer.span(span_name, category):
+                return func(*args, **kwargs)
+
+        return t.cast(F, wrapper)
+
+    return decorator
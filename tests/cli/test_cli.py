@@ -16,6 +16,7 @@ from sqlmesh.cli.main import cli
 from sqlmesh.core.context import Context
 from sqlmesh.integrations.dlt import generate_dlt_models
 from sqlmesh.utils.date import now_ds, time_like_to_str, timedelta, to_datetime, yesterday_ds
+from sqlmesh.utils.tracing import active_tracer
 from sqlmesh.core.config.connection import DIALECT_TO_TYPE
 
 FREEZE_TIME = "2023-01-01 00:00:00 UTC"
@@ -179,6 +180,28 @@ def test_plan(runner, tmp_path):
     assert "sqlmesh_example.incremental_model   [insert 2020-01-01 - 2022-12-31]" in result.output
 
 
+def test_plan_profile(runner, tmp_path):
+    create_example_project(tmp_path)
+
+    result = runner.invoke(
+        cli, ["--log-file-dir", tmp_path, "--paths", tmp_path, "plan", "--profile"], input="y\n"
+    )
+    assert_plan_success(result)
+    assert "Plan profile (trace written to" in result.output
+    assert active_tracer() is None
+
+    trace_files = list(tmp_path.glob("plan_profile_*.json"))
+    assert len(trace_files) == 1
+    span_names = {event["name"] for event in json.loads(trace_files[0].read_text())["traceEvents"]}
+    assert {
+        "parse",
+        "ContextDiff.create",
+        "PlanBuilder.build",
+        "EngineAdapterStateSync.get_snapshots",
+        "SnapshotEvaluator.evaluate",
+    } <= span_names
+
+
 def test_plan_skip_tests(runner, tmp_path):
     create_example_project(tmp_path)
 
@@ -2442,3 +2465,16 @@ model_defaults:
     result = runner.invoke(cli, ["--paths", str(tmp_path), "format"])
     assert result.exit_code == 0, f"Format failed: {result.output}\nException: {result.exception}"
     mock.assert_not_called()
+
+
+def test_info_timings(runner, tmp_path):
+    create_example_project(tmp_path)
+
+    result = runner.invoke(
+        cli,
+        ["--log-file-dir", tmp_path, "--paths", tmp_path, "info", "--skip-connection", "--timings"],
+    )
+    assert result.exit_code == 0
+    assert "Load timings:" in result.output
+    for phase in ("glob", "stat", "cache read", "parse", "schema update", "render"):
+        assert f"  {phase}: " in result.output
@@ -7,6 +7,7 @@ from tests.core.engine_adapter import to_sql_calls
 from sqlmesh.core.dialect import parse
 from sqlglot import exp, parse_one
 import typing as t
+from contextlib import nullcontext
 from datetime import datetime
 from pytest_mock.plugin import MockerFixture
 from sqlmesh.core import dialect as d
@@ -147,6 +148,21 @@ def test_delete_from(adapter: ClickhouseEngineAdapter, mocker):
     ]
 
 
+def test_fetch_batches(adapter: ClickhouseEngineAdapter):
+    stream = adapter.cursor.client.query_row_block_stream
+    stream.return_value = nullcontext(iter([[[1, "a"], [2, "b"], [3, "c"]], [[4, "d"]]]))
+
+    batches = list(
+        adapter.fetch_batches(
+            exp.select("a", "b").from_("tbl"), batch_size=2, quote_identifiers=True
+        )
+    )
+
+    assert batches == [[(1, "a"), (2, "b")], [(3, "c"), (4, "d")]]
+    stream.assert_called_once_with('SELECT "a", "b" FROM "tbl"')
+    adapter.cursor.execute.assert_not_called()
+
+
 def test_alter_table(
     adapter: ClickhouseEngineAdapter,
     mocker,
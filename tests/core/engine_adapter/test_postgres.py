@@ -65,6 +65,19 @@ def test_drop_schema_with_catalog(make_mocked_engine_adapter: t.Callable, mocker
         adapter.drop_schema("test_catalog.test_schema")
 
 
+def test_drop_views(make_mocked_engine_adapter: t.Callable):
+    adapter = make_mocked_engine_adapter(PostgresEngineAdapter)
+    adapter._default_catalog = "test_catalog"
+
+    adapter.drop_views(["test_catalog.test_schema.a", "test_schema.b"])
+    adapter.drop_views(["test_schema.c"], ignore_if_not_exists=False)
+
+    assert to_sql_calls(adapter) == [
+        'DROP VIEW IF EXISTS "test_schema"."a", "test_schema"."b" CASCADE',
+        'DROP VIEW "test_schema"."c" CASCADE',
+    ]
+
+
 def test_comments(make_mocked_engine_adapter: t.Callable, mocker: MockerFixture):
     adapter = make_mocked_engine_adapter(PostgresEngineAdapter)
 
@@ -144,6 +157,201 @@ def test_merge_version_lt_15(
     ]
 
 
+def test_insert_append_bulk_load(
+    make_mocked_engine_adapter: t.Callable, make_temp_table_name: t.Callable, mocker: MockerFixture
+):
+    import pandas as pd
+
+    adapter = make_mocked_engine_adapter(PostgresEngineAdapter)
+    adapter.DEFAULT_BATCH_SIZE = 2
+    adapter.BULK_LOAD_CHUNK_SIZE = 2
+    mocker.patch.object(adapter, "table_exists", return_value=False)
+    temp_table_mock = mocker.patch("sqlmesh.core.engine_adapter.EngineAdapter._get_temp_table")
+    temp_table_mock.return_value = make_temp_table_name("test", "abcdefgh")
+
+    copied = []
+    adapter.cursor.copy_expert.side_effect = lambda sql, buffer: copied.append((sql, buffer.read()))
+
+    adapter.insert_append(
+        "test",
+        pd.DataFrame({"a": [1, 2, 3], "b": ["x", None, "z"]}),
+        target_columns_to_types={
+            "a": exp.DataType.build("int"),
+            "b": exp.DataType.build("text"),
+        },
+    )
+
+    copy_sql = 'COPY "__temp_test_abcdefgh" ("a", "b") FROM STDIN WITH (FORMAT text, NULL \'\\N\')'
+    assert copied == [(copy_sql, "1\tx\n2\t\\N\n"), (copy_sql, "3\tz\n")]
+    assert to_sql_calls(adapter) == [
+        'CREATE TABLE IF NOT EXISTS "__temp_test_abcdefgh" ("a" INT, "b" TEXT)',
+        'INSERT INTO "test" ("a", "b") SELECT CAST("a" AS INT) AS "a", CAST("b" AS TEXT) AS "b" FROM "__temp_test_abcdefgh"',
+        'DROP TABLE IF EXISTS "__temp_test_abcdefgh"',
+    ]
+
+
+def test_insert_append_bulk_load_escapes_values(
+    make_mocked_engine_adapter: t.Callable, make_temp_table_name: t.Callable, mocker: MockerFixture
+):
+    import pandas as pd
+
+    adapter = make_mocked_engine_adapter(PostgresEngineAdapter)
+    adapter.DEFAULT_BATCH_SIZE = 2
+    mocker.patch.object(adapter, "table_exists", return_value=False)
+    temp_table_mock = mocker.patch("sqlmesh.core.engine_adapter.EngineAdapter._get_temp_table")
+    temp_table_mock.return_value = make_temp_table_name("test", "abcdefgh")
+
+    copied = []
+    adapter.cursor.copy_expert.side_effect = lambda sql, buffer: copied.append(buffer.read())
+
+    adapter.insert_append(
+        "test",
+        pd.DataFrame({"a": ["\\N", None, "tab\tnew\nline\\"], "b": [1.5, 2.0, None]}),
+        target_columns_to_types={
+            "a": exp.DataType.build("text"),
+            "b": exp.DataType.build("double"),
+        },
+    )
+
+    # A literal \N is escaped so that it isn't loaded as NULL
+    assert copied == ["\\\\N\t1.5\n\\N\t2.0\ntab\\tnew\\nline\\\\\t\\N\n"]
+
+
+def test_insert_append_bulk_load_nullable_integers(
+    make_mocked_engine_adapter: t.Callable, make_temp_table_name: t.Callable, mocker: MockerFixture
+):
+    import pandas as pd
+
+    adapter = make_mocked_engine_adapter(PostgresEngineAdapter)
+    adapter.DEFAULT_BATCH_SIZE = 2
+    mocker.patch.object(adapter, "table_exists", return_value=False)
+    temp_table_mock = mocker.patch("sqlmesh.core.engine_adapter.EngineAdapter._get_temp_table")
+    temp_table_mock.return_value = make_temp_table_name("test", "abcdefgh")
+
+    copied = []
+    adapter.cursor.copy_expert.side_effect = lambda sql, buffer: copied.append(buffer.read())
+
+    # pandas stores integers as floats when there are NULLs among them
+    df = pd.DataFrame({"a": [1, None, 3], "b": [1.0, 2.5, None]})
+    assert df["a"].dtype == "float64"
+    adapter.insert_append(
+        "test",
+        df,
+        target_columns_to_types={
+            "a": exp.DataType.build("bigint"),
+            "b": exp.DataType.build("double"),
+        },
+    )
+
+    assert copied == ["1\t1.0\n\\N\t2.5\n3\t\\N\n"]
+
+
+def test_insert_append_bulk_load_booleans(
+    make_mocked_engine_adapter: t.Callable, make_temp_table_name: t.Callable, mocker: MockerFixture
+):
+    import pandas as pd
+
+    adapter = make_mocked_engine_adapter(PostgresEngineAdapter)
+    adapter.DEFAULT_BATCH_SIZE = 2
+    mocker.patch.object(adapter, "table_exists", return_value=False)
+    temp_table_mock = mocker.patch("sqlmesh.core.engine_adapter.EngineAdapter._get_temp_table")
+    temp_table_mock.return_value = make_temp_table_name("test", "abcdefgh")
+
+    copied = []
+    adapter.cursor.copy_expert.side_effect = lambda sql, buffer: copied.append(buffer.read())
+
+    df = pd.DataFrame(
+        {
+            "a": [True, False, True],
+            "b": [True, False, True],
+            "c": [True, None, False],
+        }
+    )
+    adapter.insert_append(
+        "test",
+        df,
+        target_columns_to_types={
+            "a": exp.DataType.build("int"),
+            "b": exp.DataType.build("boolean"),
+            "c": exp.DataType.build("bigint"),
+        },
+    )
+
+    # Booleans are written as integers into integral columns, like CAST(TRUE AS INT) would
+    assert copied == ["1\ttrue\t1\n0\tfalse\t\\N\n1\ttrue\t0\n"]
+
+
+def test_insert_append_bulk_load_fractional_integers(make_mocked_engine_adapter: t.Callable):
+    import pandas as pd
+
+    adapter = make_mocked_engine_adapter(PostgresEngineAdapter)
+    adapter.DEFAULT_BATCH_SIZE = 2
+
+    adapter.insert_append(
+        "test",
+        pd.DataFrame({"a": [1.5, None, 3.0]}),
+        target_columns_to_types={"a": exp.DataType.build("int")},
+    )
+
+    # Values that can't be written as integers are cast by the regular VALUES batches instead
+    adapter.cursor.copy_expert.assert_not_called()
+    sql_calls = to_sql_calls(adapter)
+    assert len(sql_calls) == 2
+    assert all(sql.startswith('INSERT INTO "test"') for sql in sql_calls)
+
+
+@pytest.mark.parametrize(
+    "column_type, values",
+    [
+        ("int[]", [[1, 2], [3], []]),
+        ("jsonb", [{"a": 1}, {"b": [2]}, None]),
+        ("json", ['{"a": 1}', '{"b": [2]}', None]),
+        ("bytea", [b"\x00a", b"b", None]),
+    ],
+)
+def test_insert_append_bulk_load_non_scalar_columns(
+    make_mocked_engine_adapter: t.Callable, column_type: str, values: t.List[t.Any]
+):
+    import pandas as pd
+
+    adapter = make_mocked_engine_adapter(PostgresEngineAdapter)
+    adapter.DEFAULT_BATCH_SIZE = 2
+
+    adapter.insert_append(
+        "test",
+        pd.DataFrame({"a": [1, 2, 3], "b": values}),
+        target_columns_to_types={
+            "a": exp.DataType.build("int"),
+            "b": exp.DataType.build(column_type, dialect="postgres"),
+        },
+    )
+
+    # Values that COPY can't load as is are inserted with the regular VALUES batches
+    adapter.cursor.copy_expert.assert_not_called()
+    sql_calls = to_sql_calls(adapter)
+    assert len(sql_calls) == 2
+    assert all(sql.startswith('INSERT INTO "test"') for sql in sql_calls)
+
+
+def test_insert_append_values_without_copy(make_mocked_engine_adapter: t.Callable):
+    import pandas as pd
+
+    adapter = make_mocked_engine_adapter(PostgresEngineAdapter)
+    adapter.DEFAULT_BATCH_SIZE = 2
+    del adapter.cursor.copy_expert
+
+    adapter.insert_append(
+        "test",
+        pd.DataFrame({"a": [1, 2, 3]}),
+        target_columns_to_types={"a": exp.DataType.build("int")},
+    )
+
+    assert to_sql_calls(adapter) == [
+        'INSERT INTO "test" ("a") SELECT CAST("a" AS INT) AS "a" FROM (VALUES (1), (2)) AS "t"("a")',
+        'INSERT INTO "test" ("a") SELECT CAST("a" AS INT) AS "a" FROM (VALUES (3)) AS "t"("a")',
+    ]
+
+
 def test_alter_table_drop_column_cascade(make_mocked_engine_adapter: t.Callable):
     adapter = make_mocked_engine_adapter(PostgresEngineAdapter)
 
@@ -392,6 +392,7 @@ def test_destroy(copy_to_temp_path):
         "_environments",
         "_snapshots",
         "_intervals",
+        "_interval_revisions",
         "_auto_restatements",
         "_environment_statements",
         "_intervals",
@@ -498,3 +499,33 @@ def test_evaluate_uncategorized_snapshot(init_and_plan_context: t.Callable):
         "sushi.top_waiters", start="2023-01-05", end="2023-01-06", execution_time=now()
     )
     assert set(df["one"].tolist()) == {1}
+
+
+def test_janitor_checkpoints_cleaned_up_environments(mocker: MockerFixture, tmp_path: Path):
+    models_dir = tmp_path / "models"
+    models_dir.mkdir()
+    (models_dir / "model1.sql").write_text("MODEL(name test.model1, kind FULL); SELECT 1 AS col")
+
+    ctx = Context(
+        paths=[tmp_path],
+        config=Config(model_defaults=ModelDefaultsConfig(dialect="duckdb")),
+    )
+    ctx.plan("dev_a", no_prompts=True, auto_apply=True)
+    ctx.plan("dev_b", no_prompts=True, auto_apply=True)
+    ctx.invalidate_environment("dev_a")
+    ctx.invalidate_environment("dev_b")
+
+    def cleanup_expired_views(environments, **kwargs):
+        return ["view drop error"] if environments[0].name == "dev_b" else []
+
+    mocker.patch("sqlmesh.core.context.cleanup_expired_views", side_effect=cleanup_expired_views)
+    mocker.patch(
+        "sqlmesh.core.janitor.iter_expired_snapshot_batches",
+        return_value=iter([]),
+    )
+
+    # The environment that was cleaned up is not processed again by the next run
+    with pytest.raises(SQLMeshError):
+        ctx._run_janitor(ignore_ttl=True)
+    assert ctx.state_sync.get_environment("dev_a") is None
+    assert ctx.state_sync.get_environment("dev_b") is not None
@@ -515,6 +515,7 @@ def test_before_all_after_all_execution_order(tmp_path: Path, mocker: MockerFixt
             "_environments",
             "_versions",
             "_intervals",
+            "_interval_revisions",
             "_auto_restatements",
             "_environment_statements",
         ]
@@ -1,5 +1,7 @@
+import importlib
 import json
 import logging
+import random
 import re
 import typing as t
 from unittest.mock import call, patch
@@ -48,6 +50,8 @@ from sqlmesh.core.state_sync.common import (
     PromotionResult,
     RowBoundary,
 )
+from sqlmesh.core.state_sync.db.interval import IntervalState, _intervals_cache_chunk_id
+from sqlmesh.utils.cache import FileCache
 from sqlmesh.utils.date import now_timestamp, to_datetime, to_timestamp
 from sqlmesh.utils.errors import SQLMeshError, StateMigrationError
 
@@ -191,6 +195,75 @@ def test_push_snapshots(
     )
 
 
+def test_get_snapshot_table_infos(
+    state_sync: EngineAdapterStateSync, make_snapshot: t.Callable, mocker: MockerFixture
+) -> None:
+    snapshot_a = make_snapshot(SqlModel(name="a", query=parse_one("select 1, ds")))
+    snapshot_a.categorize_as(SnapshotChangeCategory.BREAKING)
+    snapshot_b = make_snapshot(SqlModel(name="b", query=parse_one("select 2, ds")))
+    snapshot_b.categorize_as(SnapshotChangeCategory.BREAKING, forward_only=True)
+    state_sync.push_snapshots([snapshot_a, snapshot_b])
+
+    get_snapshots_mock = mocker.spy(state_sync.snapshot_state, "_get_snapshots")
+    assert state_sync.get_snapshot_table_infos(
+        [snapshot_a.snapshot_id, snapshot_b.snapshot_id, SnapshotId(name="c", identifier="1")]
+    ) == {
+        snapshot_a.snapshot_id: snapshot_a.table_info,
+        snapshot_b.snapshot_id: snapshot_b.table_info,
+    }
+    get_snapshots_mock.assert_not_called()
+
+    # Snapshots stored without a table info are fully loaded
+    state_sync.engine_adapter.update_table(
+        "sqlmesh._snapshots", {"table_info": None}, where=exp.column("name").eq('"a"')
+    )
+    assert state_sync.get_snapshot_table_infos(
+        [snapshot_a.snapshot_id, snapshot_b.snapshot_id]
+    ) == {
+        snapshot_a.snapshot_id: snapshot_a.table_info,
+        snapshot_b.snapshot_id: snapshot_b.table_info,
+    }
+    get_snapshots_mock.assert_called_once_with({snapshot_a.snapshot_id})
+
+
+def test_get_snapshot_table_infos_after_migration(
+    state_sync: EngineAdapterStateSync, make_snapshot: t.Callable, mocker: MockerFixture
+) -> None:
+    snapshot_a = make_snapshot(SqlModel(name="a", query=parse_one("select 1, ds")))
+    snapshot_a.categorize_as(SnapshotChangeCategory.BREAKING)
+    snapshot_b = make_snapshot(SqlModel(name="b", query=parse_one("select 2, ds")))
+    snapshot_b.categorize_as(SnapshotChangeCategory.BREAKING, forward_only=True)
+    state_sync.push_snapshots([snapshot_a, snapshot_b])
+
+    # Emulate snapshots stored before the table_info column was added
+    state_sync.engine_adapter.update_table("sqlmesh._snapshots", {"table_info": None})
+
+    migration = importlib.import_module("sqlmesh.migrations.v0103_add_table_info_to_snapshots")
+    migration.migrate_rows(state_sync.engine_adapter, "sqlmesh")
+
+    table_infos = dict(
+        state_sync.engine_adapter.fetchall(
+            exp.select("name", "table_info").from_("sqlmesh._snapshots")
+        )
+    )
+    assert table_infos['"a"'] is not None
+    assert table_infos['"b"'] is not None
+
+    get_snapshots_mock = mocker.spy(state_sync.snapshot_state, "_get_snapshots")
+    assert state_sync.get_snapshot_table_infos(
+        [snapshot_a.snapshot_id, snapshot_b.snapshot_id]
+    ) == {
+        snapshot_a.snapshot_id: snapshot_a.table_info,
+        snapshot_b.snapshot_id: snapshot_b.table_info,
+    }
+    get_snapshots_mock.assert_not_called()
+
+    assert state_sync.get_snapshots([snapshot_a, snapshot_b]) == {
+        snapshot_a.snapshot_id: snapshot_a,
+        snapshot_b.snapshot_id: snapshot_b,
+    }
+
+
 def test_duplicates(state_sync: EngineAdapterStateSync, make_snapshot: t.Callable) -> None:
     snapshot_a = make_snapshot(
         SqlModel(
@@ -241,6 +314,202 @@ def get_snapshot_intervals(state_sync) -> t.Callable[[Snapshot], t.Optional[Snap
     return _get_snapshot_intervals
 
 
+def test_get_snapshot_intervals_cached(
+    state_sync: EngineAdapterStateSync,
+    make_snapshot: t.Callable,
+    mocker: MockerFixture,
+    tmp_path,
+) -> None:
+    snapshot_a = make_snapshot(
+        SqlModel(name="a", cron="@daily", query=parse_one("select 1, ds")), version="a"
+    )
+    snapshot_b = make_snapshot(
+        SqlModel(name="b", cron="@daily", query=parse_one("select 2, ds")), version="b"
+    )
+    state_sync.push_snapshots([snapshot_a, snapshot_b])
+    state_sync.add_interval(snapshot_a, "2020-01-01", "2020-01-01")
+    state_sync.add_interval(snapshot_b, "2020-01-01", "2020-01-02")
+
+    def get_intervals() -> t.Dict[str, t.List[t.Tuple[int, int]]]:
+        return {
+            s.name: s.intervals
+            for s in state_sync.interval_state.get_snapshot_intervals([snapshot_a, snapshot_b])
+        }
+
+    fold_mock = mocker.spy(state_sync.interval_state, "_get_snapshot_intervals")
+    expected = {
+        '"a"': [(to_timestamp("2020-01-01"), to_timestamp("2020-01-02"))],
+        '"b"': [(to_timestamp("2020-01-01"), to_timestamp("2020-01-03"))],
+    }
+    assert get_intervals() == expected
+    assert fold_mock.call_count == 1
+
+    # Nothing has changed since the previous call, so nothing is fetched or written
+    put_mock = mocker.spy(FileCache, "put")
+    assert get_intervals() == expected
+    assert fold_mock.call_count == 1
+    put_mock.assert_not_called()
+
+    # Only the snapshot whose intervals have changed is refetched and only its chunk is written
+    state_sync.remove_intervals(
+        [(snapshot_b, (to_timestamp("2020-01-02"), to_timestamp("2020-01-03")))]
+    )
+    expected['"b"'] = [(to_timestamp("2020-01-01"), to_timestamp("2020-01-02"))]
+    assert get_intervals() == expected
+    assert fold_mock.call_count == 2
+    assert [s.name for s in fold_mock.call_args[0][0]] == ['"b"']
+    assert put_mock.call_count == 1
+    assert ('"b"', snapshot_b.version) in put_mock.call_args.kwargs["value"]
+
+    state_sync.compact_intervals()
+    assert get_intervals() == expected
+
+    # A new state sync instance reuses the results cached on disk
+    new_state_sync = EngineAdapterStateSync(
+        state_sync.engine_adapter, schema=c.SQLMESH, cache_dir=tmp_path / c.CACHE
+    )
+    new_fold_mock = mocker.spy(new_state_sync.interval_state, "_get_snapshot_intervals")
+    assert {
+        s.name: s.intervals
+        for s in new_state_sync.interval_state.get_snapshot_intervals([snapshot_a, snapshot_b])
+    } == expected
+    new_fold_mock.assert_not_called()
+
+    # Cached intervals are spread across chunks by snapshot name and version
+    chunk_ids = {
+        _intervals_cache_chunk_id((s.name, s.version), IntervalState.INTERVALS_CACHE_CHUNKS)
+        for s in (snapshot_a, snapshot_b)
+    }
+    assert len(list((tmp_path / c.CACHE / "intervals").iterdir())) == len(chunk_ids)
+
+
+def test_get_snapshot_intervals_cached_state_stores_share_cache_dir(
+    make_snapshot: t.Callable, mocker: MockerFixture, tmp_path
+) -> None:
+    snapshot = make_snapshot(
+        SqlModel(name="a", cron="@daily", query=parse_one("select 1, ds")), version="a"
+    )
+
+    def create_state_sync(cache_namespace: t.Optional[str] = None) -> EngineAdapterStateSync:
+        state_sync = EngineAdapterStateSync(
+            create_engine_adapter(duckdb.connect, "duckdb"),
+            schema=c.SQLMESH,
+            cache_dir=tmp_path / c.CACHE,
+            cache_namespace=cache_namespace,
+        )
+        state_sync.migrate()
+        state_sync.push_snapshots([snapshot])
+        return state_sync
+
+    state_sync_a = create_state_sync()
+    state_sync_b = create_state_sync()
+    state_sync_a.add_interval(snapshot, "2020-01-01", "2020-01-01")
+    state_sync_b.add_interval(snapshot, "2020-01-01", "2020-01-02")
+
+    # Intervals cached for one state store are never reused for another one
+    for state_sync, end in ((state_sync_a, "2020-01-02"), (state_sync_b, "2020-01-03")):
+        for _ in range(2):
+            assert state_sync.interval_state.get_snapshot_intervals([snapshot])[0].intervals == [
+                (to_timestamp("2020-01-01"), to_timestamp(end))
+            ]
+
+    # State stores with different namespaces keep separate cache entries
+    state_sync_c = create_state_sync(cache_namespace="c")
+    state_sync_c.add_interval(snapshot, "2020-01-05", "2020-01-05")
+    state_sync_c.interval_state.get_snapshot_intervals([snapshot])
+    assert len(list((tmp_path / c.CACHE / "intervals").iterdir())) == 2
+
+    # Writes append revisions without reading them first
+    fetchall_mock = mocker.spy(state_sync_c.engine_adapter, "fetchall")
+    state_sync_c.add_interval(snapshot, "2020-01-06", "2020-01-06")
+    state_sync_c.remove_intervals(
+        [(snapshot, (to_timestamp("2020-01-05"), to_timestamp("2020-01-06")))]
+    )
+    fetchall_mock.assert_not_called()
+
+
+def test_get_snapshot_intervals_cached_rewritten_records(
+    state_sync: EngineAdapterStateSync,
+    make_snapshot: t.Callable,
+    mocker: MockerFixture,
+    tmp_path,
+) -> None:
+    # Records rewritten with the same creation timestamp must still invalidate cached intervals
+    mocker.patch(
+        "sqlmesh.core.state_sync.db.interval.now_timestamp",
+        return_value=to_timestamp("2024-01-01"),
+    )
+    snapshot = make_snapshot(
+        SqlModel(name="a", cron="@daily", query=parse_one("select 1, ds")), version="a"
+    )
+    state_sync.push_snapshots([snapshot])
+    state_sync.add_interval(snapshot, "2020-01-01", "2020-01-02")
+
+    reader = EngineAdapterStateSync(
+        state_sync.engine_adapter, schema=c.SQLMESH, cache_dir=tmp_path / "reader_cache"
+    )
+    assert reader.interval_state.get_snapshot_intervals([snapshot])[0].intervals == [
+        (to_timestamp("2020-01-01"), to_timestamp("2020-01-03"))
+    ]
+
+    # Compaction replaces both records with a single one which has the same creation timestamp
+    state_sync.remove_intervals(
+        [(snapshot, (to_timestamp("2020-01-02"), to_timestamp("2020-01-03")))]
+    )
+    state_sync.compact_intervals()
+    assert reader.interval_state.get_snapshot_intervals([snapshot])[0].intervals == [
+        (to_timestamp("2020-01-01"), to_timestamp("2020-01-02"))
+    ]
+
+
+def test_get_snapshot_intervals_server_side_aggregation(
+    state_sync: EngineAdapterStateSync, make_snapshot: t.Callable
+) -> None:
+    rng = random.Random(7)
+    snapshots = []
+    for i in range(5):
+        snapshot = make_snapshot(
+            SqlModel(name=f"m{i}", cron="@daily", query=parse_one(f"select {i}, ds")),
+            version=f"v{i}",
+        )
+        snapshot.categorize_as(SnapshotChangeCategory.BREAKING)
+        snapshots.append(snapshot)
+    state_sync.push_snapshots(snapshots)
+
+    day = 24 * 60 * 60 * 1000
+    base = to_timestamp("2020-01-01")
+    for _ in range(200):
+        snapshot = rng.choice(snapshots)
+        start = base + rng.randint(0, 60) * day
+        end = start + rng.randint(1, 5) * day
+        state_sync.add_snapshots_intervals(
+            [
+                SnapshotIntervals(
+                    name=snapshot.name,
+                    identifier=snapshot.identifier,
+                    version=snapshot.version,
+                    dev_version=snapshot.dev_version,
+                    intervals=[] if rng.random() < 0.3 else [(start, end)],
+                    dev_intervals=[(start, end)] if rng.random() < 0.3 else [],
+                    last_altered_ts=rng.choice([None, start]),
+                )
+            ]
+        )
+    # Removals depend on the order in which records were added and are folded client-side
+    state_sync.remove_intervals([(snapshots[0], (base + 10 * day, base + 20 * day))])
+
+    def sort_key(snapshot_intervals: SnapshotIntervals) -> t.Tuple[str, str]:
+        return (snapshot_intervals.name, snapshot_intervals.identifier or "")
+
+    interval_state = state_sync.interval_state
+    expected = sorted(interval_state._get_snapshot_intervals(snapshots)[1], key=sort_key)
+    assert len(expected) == 5
+    assert any(s.intervals and len(s.intervals) > 1 for s in expected)
+
+    aggregated = sorted(interval_state._get_aggregated_snapshot_intervals(snapshots), key=sort_key)
+    assert aggregated == expected
+
+
 def test_add_interval(
     state_sync: EngineAdapterStateSync,
     make_snapshot: t.Callable,
@@ -537,6 +806,51 @@ def test_compact_intervals_delete_batches(
     )
 
 
+def test_compact_intervals_in_batches(
+    state_sync: EngineAdapterStateSync,
+    make_snapshot: t.Callable,
+    get_snapshot_intervals: t.Callable,
+    mocker: MockerFixture,
+) -> None:
+    snapshots = [
+        make_snapshot(
+            SqlModel(name=name, cron="@daily", query=parse_one("select 1, ds")),
+            version=name,
+        )
+        for name in ("a", "b", "c")
+    ]
+    state_sync.push_snapshots(snapshots)
+
+    for snapshot in snapshots:
+        state_sync.add_interval(snapshot, "2020-01-01", "2020-01-05")
+        state_sync.add_interval(snapshot, "2020-01-06", "2020-01-10")
+
+    assert state_sync.interval_state.count_uncompacted_intervals() == 6
+
+    # The threshold hasn't been reached yet
+    state_sync.compact_intervals(min_uncompacted_intervals=7)
+    assert state_sync.interval_state.count_uncompacted_intervals() == 6
+
+    compact_spy = mocker.spy(state_sync.interval_state, "compact_intervals")
+    transaction_spy = mocker.spy(state_sync, "_transaction")
+
+    state_sync.compact_intervals(batch_size=2, min_uncompacted_intervals=6)
+
+    assert [spy_call.args[0] for spy_call in compact_spy.call_args_list] == [
+        [s.name_version for s in snapshots[:2]],
+        [snapshots[2].name_version],
+    ]
+    assert compact_spy.spy_return == (2, 1)
+    assert transaction_spy.call_count == 2
+    assert state_sync.interval_state.count_uncompacted_intervals() == 0
+    assert not state_sync.interval_state.get_uncompacted_snapshots()
+
+    for snapshot in snapshots:
+        assert get_snapshot_intervals(snapshot).intervals == [
+            (to_timestamp("2020-01-01"), to_timestamp("2020-01-11"))
+        ]
+
+
 def test_promote_snapshots(state_sync: EngineAdapterStateSync, make_snapshot: t.Callable):
     snapshot_a = make_snapshot(
         SqlModel(
@@ -46,6 +46,7 @@ from sqlmesh.core.renderer import render_statements
 from sqlmesh.core.model.kind import ModelKindName
 from sqlmesh.core.state_sync.cache import CachingStateSync
 from sqlmesh.core.state_sync.db import EngineAdapterStateSync
+from sqlmesh.utils.cache import PACKED_CACHE_FILE_NAME
 from sqlmesh.utils.connection_pool import SingletonConnectionPool, ThreadLocalSharedConnectionPool
 from sqlmesh.utils.date import (
     make_inclusive_end,
@@ -55,6 +56,7 @@ from sqlmesh.utils.date import (
     to_timestamp,
     yesterday_ds,
 )
+from sqlmesh.utils.hashing import hash_data
 from sqlmesh.utils.errors import (
     ConfigError,
     SQLMeshError,
@@ -1488,6 +1490,109 @@ def test_cache_path_configurations(tmp_path: pathlib.Path):
     assert context.cache_dir == project_dir / ".cache"
 
 
+def test_packed_cache_backend(tmp_path: pathlib.Path):
+    project_dir = tmp_path / "project"
+    (project_dir / "models").mkdir(parents=True)
+    (project_dir / "models" / "test_model.sql").write_text(
+        "MODEL (name test.test_model); SELECT 1 AS a"
+    )
+    (project_dir / "config.yaml").write_text(
+        "model_defaults:\n  dialect: duckdb\ncache:\n  backend: packed\n  max_size_mb: 10"
+    )
+
+    context = Context(paths=str(project_dir))
+    assert context.config.cache.backend.is_packed
+    assert context.config.cache.max_size_bytes == 10 * 1024 * 1024
+    assert '"memory"."test"."test_model"' in context.models
+
+    cache_dir = project_dir / c.CACHE
+    assert (cache_dir / PACKED_CACHE_FILE_NAME).exists()
+    assert not (cache_dir / "model_definition").exists()
+
+    context.clear_caches()
+    assert not cache_dir.exists()
+
+    context.load()
+    assert (cache_dir / PACKED_CACHE_FILE_NAME).exists()
+
+
+def test_nodes_to_snapshots_reuses_fingerprint_index(tmp_path: pathlib.Path, mocker: MockerFixture):
+    models_dir = tmp_path / "models"
+    models_dir.mkdir()
+    (models_dir / "parent.sql").write_text("MODEL (name test.parent); SELECT 1 AS a")
+    (models_dir / "child.sql").write_text("MODEL (name test.child); SELECT a FROM test.parent")
+    (tmp_path / "config.yaml").write_text("model_defaults:\n  dialect: duckdb")
+
+    def fingerprints() -> t.Dict[str, str]:
+        context = Context(paths=tmp_path)
+        return {
+            name: snapshot.fingerprint.to_identifier()
+            for name, snapshot in context._nodes_to_snapshots(dict(context._models)).items()
+        }
+
+    initial = fingerprints()
+    assert (tmp_path / c.CACHE / "fingerprint_index").exists()
+
+    hash_data_mock = mocker.patch("sqlmesh.core.model.definition.hash_data", wraps=hash_data)
+    assert fingerprints() == initial
+    hash_data_mock.assert_not_called()
+
+    (models_dir / "parent.sql").write_text("MODEL (name test.parent); SELECT 2 AS a")
+    updated = fingerprints()
+    assert updated['"memory"."test"."parent"'] != initial['"memory"."test"."parent"']
+    assert updated['"memory"."test"."child"'] != initial['"memory"."test"."child"']
+
+
+def test_reload_paths(tmp_path: pathlib.Path):
+    models_dir = tmp_path / "models"
+    models_dir.mkdir()
+    parent_path = models_dir / "parent.sql"
+    parent_path.write_text("MODEL (name test.parent); SELECT 1 AS a")
+    child_path = models_dir / "child.sql"
+    child_path.write_text("MODEL (name test.child); SELECT * FROM test.parent")
+    other_path = models_dir / "other.sql"
+    other_path.write_text("MODEL (name test.other); SELECT 1 AS c")
+    (tmp_path / "config.yaml").write_text("model_defaults:\n  dialect: duckdb")
+
+    context = Context(paths=tmp_path)
+    child = context.get_model("test.child")
+    other = context.get_model("test.other")
+    assert child.columns_to_types == {"a": exp.DataType.build("int")}
+
+    parent_path.write_text("MODEL (name test.parent); SELECT 1 AS a, 2 AS b")
+    assert context.reload_paths([parent_path]) == {
+        '"memory"."test"."parent"',
+        '"memory"."test"."child"',
+    }
+    assert context.get_model("test.child") is not child
+    assert list(context.get_model("test.child").columns_to_types or {}) == ["a", "b"]
+    assert (
+        context.get_model("test.child").columns_to_types
+        == context.get_model("test.parent").columns_to_types
+    )
+    assert context.get_model("test.other") is other
+    assert context.get_model("test.parent")._path == parent_path
+
+    other_path.write_text("MODEL (name test.renamed); SELECT 1 AS c")
+    assert context.reload_paths([other_path]) == {
+        '"memory"."test"."other"',
+        '"memory"."test"."renamed"',
+    }
+    assert not context.get_model("test.other")
+    assert context.get_model("test.renamed")
+
+    # Modifications of other files require a full load
+    child_path.write_text("MODEL (name test.child, owner test); SELECT * FROM test.parent")
+    parent_path.write_text("MODEL (name test.parent); SELECT 1 AS a")
+    assert context.reload_paths([parent_path]) is None
+    assert context.get_model("test.child").owner == "test"
+
+    new_path = models_dir / "new.sql"
+    new_path.write_text("MODEL (name test.new); SELECT 1 AS d")
+    assert context.reload_paths([new_path]) is None
+    assert context.get_model("test.new")
+
+
 def test_plan_apply_populates_cache(copy_to_temp_path, mocker):
     sushi_paths = copy_to_temp_path("examples/sushi")
     sushi_path = sushi_paths[0]
@@ -1765,6 +1870,8 @@ def test_physical_schema_mapping(tmp_path: pathlib.Path) -> None:
 def test_janitor(sushi_context, mocker: MockerFixture) -> None:
     adapter_mock = mocker.MagicMock()
     adapter_mock.dialect = "duckdb"
+    adapter_mock.SUPPORTS_MULTI_OBJECT_DROP = False
+    adapter_mock.multithreaded = False
     state_sync_mock = mocker.MagicMock()
 
     environments = [
@@ -1879,6 +1986,13 @@ def test_janitor_environment_filter(sushi_context, mocker: MockerFixture) -> Non
     state_sync_mock.get_expired_snapshots.assert_not_called()
     state_sync_mock.compact_intervals.assert_not_called()
 
+    # Compaction can still be requested explicitly
+    sushi_context._run_janitor(environment="target_env", compact=True)
+    state_sync_mock.get_expired_snapshots.assert_not_called()
+    state_sync_mock.compact_intervals.assert_called_once_with(
+        batch_size=None, min_uncompacted_intervals=None
+    )
+
 
 @pytest.mark.slow
 def test_janitor_environment_not_expired_warning(sushi_context, mocker: MockerFixture) -> None:
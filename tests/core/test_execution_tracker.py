@@ -48,3 +48,28 @@ def test_execution_tracker_thread_isolation() -> None:
         ].total_rows_processed
         == 10
     )
+
+
+def test_execution_tracker_duration_estimates() -> None:
+    execution_tracker = QueryExecutionTracker(duration_smoothing=0.5)
+    execution_tracker.update_duration_estimates({"a": 100.0, "b": 50.0})
+
+    snapshot_id_batch = SnapshotIdBatch(
+        snapshot_id=SnapshotId(name="c", identifier="c"), batch_id=0
+    )
+    with execution_tracker.track_execution(snapshot_id_batch):
+        pass
+
+    stats = execution_tracker.get_execution_stats(snapshot_id_batch)
+    assert stats is not None
+    assert stats.duration_ms is not None
+
+    execution_tracker.record_duration("a", 200)
+    estimates = execution_tracker.get_duration_estimates()
+    assert estimates["a"] == 150.0
+    assert estimates["b"] == 50.0
+    assert estimates["c"] == stats.duration_ms
+
+    # Recorded estimates take precedence over the seeded ones
+    execution_tracker.update_duration_estimates({"a": 0.0})
+    assert execution_tracker.get_duration_estimates()["a"] == 150.0
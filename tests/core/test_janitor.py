@@ -40,6 +40,8 @@ def state_sync(duck_conn, tmp_path):
 def test_cleanup_expired_views(mocker: MockerFixture, make_snapshot: t.Callable):
     adapter = mocker.MagicMock()
     adapter.dialect = None
+    adapter.SUPPORTS_MULTI_OBJECT_DROP = False
+    adapter.multithreaded = False
     snapshot_a = make_snapshot(SqlModel(name="catalog.schema.a", query=parse_one("select 1, ds")))
     snapshot_a.categorize_as(SnapshotChangeCategory.BREAKING)
     snapshot_b = make_snapshot(SqlModel(name="catalog.schema.b", query=parse_one("select 1, ds")))
@@ -105,6 +107,8 @@ def test_cleanup_expired_views_collects_failures(
 ):
     adapter = mocker.MagicMock()
     adapter.dialect = None
+    adapter.SUPPORTS_MULTI_OBJECT_DROP = False
+    adapter.multithreaded = False
     adapter.drop_schema.side_effect = Exception("Failed to drop the schema")
     adapter.drop_view.side_effect = Exception("Failed to drop the view")
 
@@ -139,6 +143,8 @@ def test_cleanup_expired_views_continues_past_failures(
 ):
     adapter = mocker.MagicMock()
     adapter.dialect = None
+    adapter.SUPPORTS_MULTI_OBJECT_DROP = False
+    adapter.multithreaded = False
 
     snapshot_failing = make_snapshot(
         SqlModel(name="catalog.schema.failing", query=parse_one("select 1"))
@@ -184,6 +190,55 @@ def test_cleanup_expired_views_continues_past_failures(
     assert "failing" in failures[0]
 
 
+def test_cleanup_expired_views_multi_object_drop(mocker: MockerFixture, make_snapshot: t.Callable):
+    adapter = mocker.MagicMock()
+    adapter.dialect = None
+    adapter.SUPPORTS_MULTI_OBJECT_DROP = True
+    adapter.multithreaded = True
+
+    snapshots = []
+    for name in ("a", "b", "c"):
+        snapshot = make_snapshot(
+            SqlModel(name=f"catalog.schema.{name}", query=parse_one("select 1"))
+        )
+        snapshot.categorize_as(SnapshotChangeCategory.BREAKING)
+        snapshots.append(snapshot.table_info)
+    environment = Environment(
+        name="test_environment",
+        suffix_target=EnvironmentSuffixTarget.TABLE,
+        snapshots=snapshots,
+        start_at="2022-01-01",
+        end_at="2022-01-01",
+        plan_id="test_plan_id",
+        previous_plan_id="test_plan_id",
+    )
+    expected_views = [
+        "catalog.schema.a__test_environment",
+        "catalog.schema.b__test_environment",
+        "catalog.schema.c__test_environment",
+    ]
+
+    assert not cleanup_expired_views(adapter, {}, [environment], concurrent_tasks=4)
+    adapter.drop_views.assert_called_once_with(expected_views, ignore_if_not_exists=True)
+    adapter.drop_view.assert_not_called()
+    adapter.recycle.assert_called_once()
+
+    # The views are dropped one by one to isolate the failures if the statement fails
+    adapter.reset_mock()
+    adapter.drop_views.side_effect = Exception("boom")
+
+    def drop_view_side_effect(view, ignore_if_not_exists=True):
+        if view.startswith("catalog.schema.b"):
+            raise Exception("boom")
+
+    adapter.drop_view.side_effect = drop_view_side_effect
+
+    failures = cleanup_expired_views(adapter, {}, [environment], concurrent_tasks=4)
+    assert sorted(call.args[0] for call in adapter.drop_view.call_args_list) == expected_views
+    assert len(failures) == 1
+    assert "catalog.schema.b__test_environment" in failures[0]
+
+
 def test_delete_expired_snapshots_common_function_batching(
     state_sync: EngineAdapterStateSync, make_snapshot: t.Callable, mocker: MockerFixture
 ):
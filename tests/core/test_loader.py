@@ -201,3 +201,66 @@ def my_model(context, **kwargs):
     assert model.description == "model_payload_a"
     path_b.write_text(model_payload_b)
     context.load()  # raise no error to duplicate key if the functions are identical (by registry class_method)
+
+
+@pytest.mark.slow
+def test_load_sql_models_from_cache(tmp_path: Path, mocker) -> None:
+    init_example_project(tmp_path, engine_type="duckdb")
+    config = Config(model_defaults=ModelDefaultsConfig(dialect="duckdb"))
+
+    context = Context(paths=tmp_path, config=config)
+    models = {fqn: model.data_hash for fqn, model in context.models.items()}
+    assert {"glob", "stat", "cache read", "parse", "schema update", "render"} <= set(
+        context.load_timings.durations
+    )
+
+    from sqlmesh.core import loader
+
+    load_sql_models_mock = mocker.patch.object(
+        loader, "load_sql_models", side_effect=loader.load_sql_models
+    )
+    context.load()
+
+    # All models are read from the cache except for seed models, which aren't cached
+    seed_model_path = tmp_path / "models" / "seed_model.sql"
+    load_sql_models_mock.assert_called_once_with(seed_model_path)
+    assert {fqn: model.data_hash for fqn, model in context.models.items()} == models
+    assert context.load_timings.durations["cache read"] > 0
+
+    # Only the modified model is parsed again
+    model_path = tmp_path / "models" / "full_model.sql"
+    model_path.write_text(
+        model_path.read_text().replace("AS num_orders,", "AS num_orders, 1 AS one,")
+    )
+    load_sql_models_mock.reset_mock()
+    context.load()
+    assert {call.args[0] for call in load_sql_models_mock.call_args_list} == {
+        seed_model_path,
+        model_path,
+    }
+
+
+@pytest.mark.slow
+def test_load_sql_models_from_cache_entry_ids_on_main_thread(tmp_path: Path, mocker) -> None:
+    import threading
+
+    from sqlmesh.core.loader import SqlMeshLoader
+
+    init_example_project(tmp_path, engine_type="duckdb")
+    config = Config(model_defaults=ModelDefaultsConfig(dialect="duckdb"))
+    Context(paths=tmp_path, config=config)
+
+    # Entry ids include the default catalog which may be fetched from the engine, so they must be
+    # computed before cache entries are read concurrently
+    threads = set()
+    model_cache_entry_id = SqlMeshLoader._Cache._model_cache_entry_id
+
+    def _model_cache_entry_id(self, model_path: Path) -> str:
+        threads.add(threading.current_thread())
+        return model_cache_entry_id(self, model_path)
+
+    mocker.patch("sqlmesh.core.constants.MAX_CACHE_READ_WORKERS", 4)
+    mocker.patch.object(SqlMeshLoader._Cache, "_model_cache_entry_id", _model_cache_entry_id)
+    Context(paths=tmp_path, config=config)
+
+    assert threads == {threading.main_thread()}
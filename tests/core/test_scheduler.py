@@ -5,6 +5,7 @@ from pytest_mock.plugin import MockerFixture
 from sqlglot import parse_one, parse
 from sqlglot.helper import first
 
+from sqlmesh.core.config.common import SchedulingPolicy
 from sqlmesh.core.context import Context, ExecutionContext
 from sqlmesh.core.environment import EnvironmentNamingInfo
 from sqlmesh.core.macros import RuntimeStage
@@ -24,7 +25,10 @@ from sqlmesh.core.scheduler import (
     SnapshotToIntervals,
     EvaluateNode,
     SchedulingUnit,
+    CreateNode,
     DummyNode,
+    critical_path_lengths,
+    node_duration_estimator,
 )
 from sqlmesh.core.signal import signal
 from sqlmesh.core.snapshot import (
@@ -34,6 +38,7 @@ from sqlmesh.core.snapshot import (
     DeployabilityIndex,
     snapshots_to_dag,
 )
+from sqlmesh.utils.dag import DAG
 from sqlmesh.utils.date import to_datetime, to_timestamp, DatetimeRanges, TimeLike
 from sqlmesh.utils.errors import CircuitBreakerError, NodeAuditsErrors
 
@@ -1213,3 +1218,74 @@ def test_dag_upstream_dependency_caching_with_complex_diamond(mocker: MockerFixt
         expected_g_node: {expected_a_node},
         expected_h_node: {expected_a_node},
     }
+
+
+def test_critical_path_lengths():
+    interval = (to_timestamp("2023-01-01"), to_timestamp("2023-01-02"))
+    a = EvaluateNode(snapshot_name='"a"', interval=interval, batch_index=0)
+    b = EvaluateNode(snapshot_name='"b"', interval=interval, batch_index=0)
+    c = EvaluateNode(snapshot_name='"c"', interval=interval, batch_index=0)
+    d = EvaluateNode(snapshot_name='"d"', interval=interval, batch_index=0)
+    create_d = CreateNode(snapshot_name='"d"')
+
+    # a <- b <- create_d <- d
+    # c
+    dag: DAG[SchedulingUnit] = DAG({a: set(), b: {a}, create_d: {b}, d: {create_d}, c: set()})
+
+    estimate = node_duration_estimator({'"a"': 10.0, '"b"': 20.0, '"c"': 100.0})
+    assert estimate(d) == 20.0
+    assert estimate(create_d) == 0.0
+
+    assert critical_path_lengths(dag, estimate) == {
+        a: 50.0,
+        b: 40.0,
+        create_d: 20.0,
+        d: 20.0,
+        c: 100.0,
+    }
+
+    assert node_duration_estimator({})(a) == 1.0
+
+
+def test_critical_path_scheduling_policy(mocker: MockerFixture, make_snapshot):
+    snapshot_a = make_snapshot(SqlModel(name="a", query=parse_one("SELECT 1 as id")))
+    snapshot_b = make_snapshot(SqlModel(name="b", query=parse_one("SELECT * FROM a")))
+    snapshot_c = make_snapshot(SqlModel(name="c", query=parse_one("SELECT 1 as id")))
+    snapshot_b = snapshot_b.model_copy(update={"parents": (snapshot_a.snapshot_id,)})
+    for snapshot in (snapshot_a, snapshot_b, snapshot_c):
+        snapshot.categorize_as(SnapshotChangeCategory.BREAKING)
+
+    interval = (to_timestamp("2023-01-01"), to_timestamp("2023-01-02"))
+    merged_intervals = {
+        snapshot_a: [interval],
+        snapshot_b: [interval],
+        snapshot_c: [interval],
+    }
+    node_a = EvaluateNode(snapshot_name='"a"', interval=interval, batch_index=0)
+    node_b = EvaluateNode(snapshot_name='"b"', interval=interval, batch_index=0)
+    node_c = EvaluateNode(snapshot_name='"c"', interval=interval, batch_index=0)
+
+    snapshot_evaluator = mocker.Mock()
+    snapshot_evaluator.execution_tracker.get_duration_estimates.return_value = {
+        '"a"': 10.0,
+        '"b"': 100.0,
+        '"c"': 50.0,
+    }
+
+    scheduler = Scheduler(
+        snapshots=[snapshot_a, snapshot_b, snapshot_c],
+        snapshot_evaluator=snapshot_evaluator,
+        state_sync=mocker.Mock(),
+        default_catalog=None,
+        scheduling_policy=SchedulingPolicy.CRITICAL_PATH,
+    )
+    dag = scheduler._dag(merged_intervals)
+    priority = scheduler._node_priority(dag)
+    assert priority
+
+    # The chain a <- b takes longer than c, so a should be started first
+    assert sorted(dag.roots, key=priority) == [node_a, node_c]
+    assert sorted(dag, key=priority) == [node_a, node_b, node_c]
+
+    scheduler.scheduling_policy = SchedulingPolicy.DEFAULT
+    assert scheduler._node_priority(dag) is None
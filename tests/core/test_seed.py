@@ -1,8 +1,11 @@
+import zlib
+from io import StringIO
+
 import pandas as pd  # noqa: TID253
 import pytest
 from sqlglot import exp
 
-from sqlmesh.core.model.seed import CsvSettings, Seed
+from sqlmesh.core.model.seed import CsvSettings, Seed, column_hash
 
 
 def test_read():
@@ -97,3 +100,48 @@ def test_column_hashes():
         **seed.reader().column_hashes,
         "ds": "3396890652",
     }
+
+
+@pytest.mark.parametrize("batch_size", [1, 2, 3, 100])
+def test_column_hash_batched(batch_size: int):
+    column = pd.Series([1.5, None, 3.0, 4.25, None], name="value")
+    assert column_hash(column, batch_size=batch_size) == str(
+        zlib.crc32(column.to_json().encode("utf-8"))
+    )
+    assert column_hash(column.iloc[:0], batch_size=batch_size) == str(zlib.crc32(b"{}"))
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 100])
+@pytest.mark.parametrize(
+    "content",
+    [
+        "key,value,amount\n1,one,1.5\n2,two,2.5\n3,three,\n4,four,4.0\n5,five,5.25\n",
+        # Chunks without missing values are inferred as integers, the whole column as floats
+        "key,amount\n1,1\n2,\n3,3\n4,4\n5,\n",
+        # Chunks with only numbers are inferred as integers, the whole column as strings
+        "key,value\n1,1\n2,2\n3,three\n4,4\n5,5\n",
+    ],
+)
+def test_read_chunked(content: str, chunk_size: int):
+    seed = Seed(content=content)
+    reader = seed.reader(settings=CsvSettings())
+    reader.chunk_size = chunk_size
+    expected_reader = seed.reader(settings=CsvSettings())
+    expected_df = pd.read_csv(StringIO(content), index_col=False, low_memory=False)
+
+    assert (
+        reader.column_hashes
+        == expected_reader.column_hashes
+        == {
+            column_name: column_hash(expected_df[column_name])
+            for column_name in expected_df.columns
+        }
+    )
+    assert reader.columns_to_types == expected_reader.columns_to_types
+
+    for batch_size in (None, 1, 2, 3):
+        batches = list(reader.read(batch_size=batch_size))
+        assert [len(batch) for batch in batches] == [
+            len(batch) for batch in expected_reader.read(batch_size=batch_size)
+        ]
+        pd.testing.assert_frame_equal(pd.concat(batches), expected_df)
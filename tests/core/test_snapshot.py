@@ -1,5 +1,6 @@
 import pickle
 import json
+import random
 import typing as t
 from copy import deepcopy
 from datetime import datetime, timedelta
@@ -47,17 +48,26 @@ from sqlmesh.core.snapshot import (
     SnapshotIdAndVersion,
     SnapshotChangeCategory,
     SnapshotFingerprint,
+    IntervalSet,
     SnapshotIntervals,
     SnapshotTableInfo,
     earliest_start_date,
     fingerprint_from_node,
     has_paused_forward_only,
+    merge_intervals,
     missing_intervals,
 )
 from sqlmesh.core.snapshot.cache import SnapshotCache
 from sqlmesh.core.snapshot.categorizer import categorize_change
 from sqlmesh.core.snapshot.definition import (
+    FingerprintIndex,
+    Interval,
+    Intervals,
+    Node,
     apply_auto_restatements,
+    compute_missing_intervals,
+    expand_range,
+    remove_interval,
     display_name,
     get_next_model_interval_start,
     check_ready_intervals,
@@ -70,7 +80,7 @@ from sqlmesh.utils import AttributeDict
 from sqlmesh.utils.date import DatetimeRanges, to_date, to_datetime, to_timestamp
 from sqlmesh.utils.errors import SQLMeshError, SignalEvalError
 from sqlmesh.utils.jinja import JinjaMacroRegistry, MacroInfo
-from sqlmesh.utils.hashing import md5
+from sqlmesh.utils.hashing import hash_data, md5
 from sqlmesh.core.console import get_console
 
 
@@ -419,6 +429,91 @@ def test_missing_intervals(snapshot: Snapshot):
     ]
 
 
+def _reference_compute_missing_intervals(
+    interval_unit: IntervalUnit,
+    intervals: t.Tuple[Interval, ...],
+    start_ts: int,
+    end_ts: int,
+    lookback: int,
+    model_end_ts: t.Optional[int],
+) -> Intervals:
+    """The straightforward O(timestamps x intervals) implementation used to validate the optimized one."""
+    if start_ts == end_ts:
+        return []
+
+    timestamps = expand_range(start_ts, end_ts, interval_unit)
+    missing = set()
+
+    for current_ts, next_ts in zip(timestamps, timestamps[1:]):
+        for low, high in intervals:
+            if current_ts < low:
+                missing.add((current_ts, next_ts))
+                break
+            elif current_ts >= low and next_ts <= high:
+                break
+        else:
+            missing.add((current_ts, next_ts))
+
+    if missing:
+        if lookback:
+            if model_end_ts:
+                croniter = interval_unit.croniter(end_ts)
+                end_ts = to_timestamp(croniter.get_prev(estimate=True))
+
+                while model_end_ts < end_ts:
+                    end_ts = to_timestamp(croniter.get_prev(estimate=True))
+                    lookback -= 1
+
+                lookback = max(lookback, 0)
+
+            for i, (current_ts, next_ts) in enumerate(zip(timestamps, timestamps[1:])):
+                parent = timestamps[i + lookback : i + lookback + 2]
+
+                if len(parent) < 2 or tuple(parent) in missing:
+                    missing.add((current_ts, next_ts))
+
+        if model_end_ts:
+            missing = {interval for interval in missing if interval[0] < model_end_ts}
+
+    return sorted(missing)
+
+
+@pytest.mark.parametrize("seed", range(300))
+def test_compute_missing_intervals_matches_reference(seed: int):
+    rng = random.Random(seed)
+
+    interval_unit = rng.choice(
+        [IntervalUnit.DAY, IntervalUnit.HOUR, IntervalUnit.QUARTER_HOUR, IntervalUnit.FIVE_MINUTE]
+    )
+    step = interval_unit.milliseconds
+    base_ts = to_timestamp("2023-01-01")
+
+    # Occasionally use unaligned boundaries to exercise partial intervals
+    start_ts = base_ts + rng.randint(0, 5) * step + rng.choice([0, 0, 0, step // 3])
+    end_ts = start_ts + rng.randint(0, 60) * step + rng.choice([0, 0, 0, step // 2])
+
+    intervals = []
+    cursor = base_ts
+    for _ in range(rng.randint(0, 8)):
+        low = cursor + rng.randint(0, 10) * step
+        high = low + rng.randint(1, 10) * step + rng.choice([0, 0, 0, step // 4])
+        intervals.append((low, high))
+        cursor = high if rng.random() < 0.8 else low
+
+    if rng.random() < 0.2:
+        # The function must behave identically for unsorted input too
+        rng.shuffle(intervals)
+
+    lookback = rng.choice([0, 0, 1, 2, 5])
+    model_end_ts = rng.choice([None, None, start_ts + rng.randint(0, 70) * step])
+
+    assert compute_missing_intervals.__wrapped__(
+        interval_unit, tuple(intervals), start_ts, end_ts, lookback, model_end_ts
+    ) == _reference_compute_missing_intervals(
+        interval_unit, tuple(intervals), start_ts, end_ts, lookback, model_end_ts
+    )
+
+
 def test_missing_intervals_partial(make_snapshot):
     snapshot = make_snapshot(
         SqlModel(
@@ -888,6 +983,65 @@ def test_remove_intervals(snapshot):
     assert snapshot.intervals == []
 
 
+def test_interval_set():
+    intervals = IntervalSet([(10, 20), (0, 5), (5, 7), (30, 40)])
+    assert intervals == [(0, 7), (10, 20), (30, 40)]
+    assert len(intervals) == 3
+    assert intervals[0] == (0, 7)
+    assert intervals[-1] == (30, 40)
+    assert intervals[1:] == [(10, 20), (30, 40)]
+
+    intervals.add(7, 10)
+    assert intervals == [(0, 20), (30, 40)]
+
+    intervals.remove(15, 35)
+    assert intervals == [(0, 15), (35, 40)]
+
+    intervals.remove(5, 6)
+    assert intervals == [(0, 5), (6, 15), (35, 40)]
+
+    # Removing an empty interval splits the interval that contains it, like remove_interval
+    intervals.remove(8, 8)
+    assert intervals == [(0, 5), (6, 8), (8, 15), (35, 40)]
+    intervals.remove(6, 6)
+    intervals.remove(15, 15)
+    assert intervals == [(0, 5), (6, 8), (8, 15), (35, 40)]
+
+    intervals.add(7, 9)
+    assert intervals == [(0, 5), (6, 15), (35, 40)]
+
+    copied = intervals.copy()
+    copied.add(100, 200)
+    assert copied != intervals
+
+    unpickled = pickle.loads(pickle.dumps(intervals))
+    assert unpickled == intervals
+    assert json.loads(json.dumps(intervals.to_list())) == [[0, 5], [6, 15], [35, 40]]
+
+    intervals.remove(0, 100)
+    assert not intervals
+    assert intervals == []
+
+
+@pytest.mark.parametrize("seed", range(100))
+def test_interval_set_matches_merge_and_remove_intervals(seed: int):
+    rng = random.Random(seed)
+    expected: Intervals = []
+    intervals = IntervalSet()
+
+    for _ in range(50):
+        start = rng.randint(0, 100)
+        if rng.random() < 0.6:
+            end = start + rng.randint(1, 15)
+            expected = merge_intervals([*expected, (start, end)])
+            intervals.add(start, end)
+        else:
+            end = start + rng.randint(0, 15)
+            expected = remove_interval(expected, start, end)
+            intervals.remove(start, end)
+        assert intervals.to_list() == expected
+
+
 def test_get_removal_intervals_full_history_restatement_model(make_snapshot):
     execution_time = to_timestamp("2024-01-02")
     model = SqlModel(
@@ -1146,6 +1300,84 @@ def test_fingerprint_standalone_audits(parent_model: Model):
     assert new_fingerprint.metadata_hash != fingerprint.metadata_hash
 
 
+def test_fingerprint_deep_graph():
+    depth = 3000
+    nodes: t.Dict[str, Node] = {}
+    for i in range(depth):
+        query = "SELECT 1 AS a" if i == 0 else f"SELECT a FROM db.model_{i - 1}"
+        model = SqlModel(name=f"db.model_{i}", query=parse_one(query))
+        nodes[model.fqn] = model
+
+    cache: t.Dict[str, SnapshotFingerprint] = {}
+    fingerprint = fingerprint_from_node(nodes['"db"."model_2999"'], nodes=nodes, cache=cache)
+    assert len(cache) == depth
+
+    # The fingerprint depends on every ancestor
+    nodes['"db"."model_0"'] = SqlModel(name="db.model_0", query=parse_one("SELECT 2 AS a"))
+    new_fingerprint = fingerprint_from_node(nodes['"db"."model_2999"'], nodes=nodes)
+    assert new_fingerprint.data_hash == fingerprint.data_hash
+    assert new_fingerprint.parent_data_hash != fingerprint.parent_data_hash
+
+
+def test_fingerprint_cycle():
+    model_a = SqlModel(name="db.a", query=parse_one("SELECT a FROM db.b"))
+    model_b = SqlModel(name="db.b", query=parse_one("SELECT a FROM db.a"))
+    nodes: t.Dict[str, Node] = {model_a.fqn: model_a, model_b.fqn: model_b}
+
+    with pytest.raises(SQLMeshError, match="Detected a cycle"):
+        fingerprint_from_node(model_a, nodes=nodes)
+
+
+def test_fingerprint_index(mocker: MockerFixture):
+    def make_nodes(parent_query: str) -> t.Dict[str, Node]:
+        parent = SqlModel(name="db.parent", query=parse_one(parent_query))
+        child = SqlModel(name="db.child", query=parse_one("SELECT a FROM db.parent"))
+        other = SqlModel(name="db.other", query=parse_one("SELECT 1 AS b"))
+        parent._cache_entry_id = f"parent__{parent_query}"
+        child._cache_entry_id = "child"
+        other._cache_entry_id = "other"
+        return {node.fqn: node for node in (parent, child, other)}
+
+    def fingerprint_all(
+        nodes: t.Dict[str, Node], index: FingerprintIndex
+    ) -> t.Dict[str, SnapshotFingerprint]:
+        cache: t.Dict[str, SnapshotFingerprint] = {}
+        for node in nodes.values():
+            fingerprint_from_node(node, nodes=nodes, cache=cache, index=index)
+        return cache
+
+    index: FingerprintIndex = {}
+    nodes = make_nodes("SELECT 1 AS a")
+    fingerprints = fingerprint_all(nodes, index)
+    assert fingerprints == {fqn: fingerprint_from_node(n, nodes=nodes) for fqn, n in nodes.items()}
+    assert set(index) == set(nodes)
+
+    # Nothing has changed, so none of the nodes are hashed again
+    hash_data_mock = mocker.patch("sqlmesh.core.model.definition.hash_data", wraps=hash_data)
+    nodes = make_nodes("SELECT 1 AS a")
+    assert fingerprint_all(nodes, index) == fingerprints
+    hash_data_mock.assert_not_called()
+    assert nodes['"db"."child"'].data_hash == fingerprints['"db"."child"'].data_hash
+
+    # Only the changed node and its children are hashed again
+    nodes = make_nodes("SELECT 2 AS a")
+    new_fingerprints = fingerprint_all(nodes, index)
+    assert new_fingerprints == {
+        fqn: fingerprint_from_node(n, nodes=nodes) for fqn, n in nodes.items()
+    }
+    # Both the data and the metadata hash of the parent and the child
+    assert hash_data_mock.call_count == 4
+    assert new_fingerprints['"db"."parent"'] != fingerprints['"db"."parent"']
+    assert new_fingerprints['"db"."child"'] != fingerprints['"db"."child"']
+    assert new_fingerprints['"db"."other"'] == fingerprints['"db"."other"']
+
+    # Nodes without a cache entry are never looked up in the index
+    nodes = {fqn: node.copy() for fqn, node in make_nodes("SELECT 2 AS a").items()}
+    assert all(node._cache_entry_id is None for node in nodes.values())
+    assert fingerprint_all(nodes, index) == new_fingerprints
+    assert hash_data_mock.call_count == 10
+
+
 def test_fingerprint_virtual_properties(model: Model, parent_model: Model):
     original_model = deepcopy(model)
     fingerprint = fingerprint_from_node(model, nodes={})
@@ -4,16 +4,26 @@ import pandas as pd  # noqa: TID253
 from sqlglot import exp
 from sqlmesh.core import dialect as d
 import typing as t
+from datetime import datetime
 from io import StringIO
+from pathlib import Path
 from rich.console import Console
 from sqlmesh.core.console import TerminalConsole
 from sqlmesh.core.context import Context
-from sqlmesh.core.config import AutoCategorizationMode, CategorizerConfig, DuckDBConnectionConfig
+from sqlmesh.core.config import (
+    AutoCategorizationMode,
+    CategorizerConfig,
+    Config,
+    DuckDBConnectionConfig,
+    GatewayConfig,
+    ModelDefaultsConfig,
+)
+from sqlmesh.core.engine_adapter import EngineAdapter, PostgresEngineAdapter
 from sqlmesh.core.model import SqlModel, load_sql_based_model
 from sqlmesh.core.model.common import ParsableSql
-from sqlmesh.core.table_diff import TableDiff, SchemaDiff
+from sqlmesh.core.table_diff import RowDiff, StreamingTableDiff, TableDiff, SchemaDiff
 import numpy as np  # noqa: TID253
-from sqlmesh.utils.errors import SQLMeshError
+from sqlmesh.utils.errors import ConfigError, SQLMeshError
 from sqlmesh.utils.rich import strip_ansi_codes
 
 pytestmark = pytest.mark.slow
@@ -1246,3 +1256,315 @@ def test_data_diff_nulls_in_some_grain_columns():
         "null value",
         "null value modified",
     ]
+
+
+@pytest.mark.parametrize("on", [["key"], ["key", "category"]])
+def test_data_diff_hashdiff(on: t.List[str], mocker: MockerFixture):
+    engine_adapter = DuckDBConnectionConfig().create_engine_adapter()
+
+    columns_to_types = {
+        "key": exp.DataType.build("int"),
+        "category": exp.DataType.build("varchar"),
+        "value": exp.DataType.build("double"),
+        "label": exp.DataType.build("varchar"),
+    }
+    src_df = pd.DataFrame(
+        {
+            "key": range(2000),
+            "category": ["a", "b"] * 1000,
+            "value": [i / 7 for i in range(2000)],
+            "label": [None if i % 10 == 0 else f"label_{i}" for i in range(2000)],
+        }
+    )
+    target_df = src_df.copy()
+    target_df.loc[5, "value"] = 1000.0
+    target_df.loc[1500, "label"] = ""
+    target_df.loc[20, "label"] = "not null anymore"
+    target_df = target_df.drop(index=[7, 1999])
+    target_df = pd.concat(
+        [target_df, pd.DataFrame([{"key": 5000, "category": "c", "value": 1.0, "label": "new"}])]
+    )
+    src_df = pd.concat(
+        [src_df, pd.DataFrame([{"key": None, "category": "a", "value": 1.0, "label": "null"}])]
+    )
+
+    engine_adapter.create_table("hashdiff_source", columns_to_types)
+    engine_adapter.create_table("hashdiff_target", columns_to_types)
+    engine_adapter.insert_append("hashdiff_source", src_df)
+    engine_adapter.insert_append("hashdiff_target", target_df)
+
+    def make_diff(algorithm: str) -> TableDiff:
+        return TableDiff(
+            adapter=engine_adapter,
+            source="hashdiff_source",
+            target="hashdiff_target",
+            on=on,
+            algorithm=algorithm,
+        )
+
+    join_diff = make_diff("join").row_diff()
+
+    mocker.patch.object(TableDiff, "HASHDIFF_BISECTION_FACTOR", 4)
+    mocker.patch.object(TableDiff, "HASHDIFF_MAX_LEAF_ROWS", 20)
+    segment_checksums_spy = mocker.spy(TableDiff, "_segment_checksums")
+    hashdiff = make_diff("hashdiff").row_diff()
+
+    # Segments were bisected more than once on each side
+    assert segment_checksums_spy.call_count > 2
+
+    assert hashdiff.stats == join_diff.stats
+    assert hashdiff.target_count == 1999
+    assert hashdiff.partial_match_count == 3
+    assert hashdiff.t_only_count == 1
+    pd.testing.assert_frame_equal(hashdiff.column_stats, join_diff.column_stats)
+    pd.testing.assert_frame_equal(hashdiff.sample, join_diff.sample)
+    pd.testing.assert_frame_equal(hashdiff.joined_sample, join_diff.joined_sample)
+    pd.testing.assert_frame_equal(hashdiff.s_sample, join_diff.s_sample)
+    pd.testing.assert_frame_equal(hashdiff.t_sample, join_diff.t_sample)
+
+
+def test_data_diff_hashdiff_identical_tables():
+    engine_adapter = DuckDBConnectionConfig().create_engine_adapter()
+    df = pd.DataFrame({"key": range(100), "value": [f"value_{i}" for i in range(100)]})
+    engine_adapter.ctas("hashdiff_source", df)
+    engine_adapter.ctas("hashdiff_target", df)
+
+    row_diff = TableDiff(
+        adapter=engine_adapter,
+        source="hashdiff_source",
+        target="hashdiff_target",
+        on=["key"],
+        algorithm="hashdiff",
+    ).row_diff()
+
+    assert row_diff.source_count == 100
+    assert row_diff.target_count == 100
+    assert row_diff.full_match_count == 100
+    assert row_diff.stats["distinct_count_s"] == 100
+    assert row_diff.column_stats["pct_match"].tolist() == [100.0]
+    assert row_diff.sample.empty
+
+
+def test_data_diff_hashdiff_values_with_delimiters():
+    engine_adapter = DuckDBConnectionConfig().create_engine_adapter()
+    engine_adapter.ctas(
+        "hashdiff_source",
+        pd.DataFrame({"key": [1, 2], "a": ["x,y", "1:x"], "b": ["z", None]}),
+    )
+    engine_adapter.ctas(
+        "hashdiff_target",
+        pd.DataFrame({"key": [1, 2], "a": ["x", "1:x"], "b": ["y,z", "-"]}),
+    )
+
+    def make_diff(algorithm: str) -> TableDiff:
+        return TableDiff(
+            adapter=engine_adapter,
+            source="hashdiff_source",
+            target="hashdiff_target",
+            on=["key"],
+            algorithm=algorithm,
+        )
+
+    join_diff = make_diff("join").row_diff()
+    hashdiff = make_diff("hashdiff").row_diff()
+
+    # Rows whose values only differ by where the delimiter is are not matched
+    assert hashdiff.partial_match_count == 2
+    assert hashdiff.full_match_count == 0
+    assert hashdiff.stats == join_diff.stats
+
+
+@pytest.mark.parametrize("on", [["key"], ["key", "category"]])
+def test_data_diff_streamed(on: t.List[str], tmp_path: Path):
+    columns_to_types = {
+        "key": exp.DataType.build("int"),
+        "category": exp.DataType.build("varchar"),
+        "value": exp.DataType.build("double"),
+        "label": exp.DataType.build("varchar"),
+    }
+    src_df = pd.DataFrame(
+        {
+            "key": range(100),
+            "category": ["a", "b"] * 50,
+            "value": [i / 7 for i in range(100)],
+            "label": [None if i % 10 == 0 else f"label_{i}" for i in range(100)],
+        }
+    )
+    target_df = src_df.copy()
+    target_df.loc[5, "value"] = 1000.0
+    target_df.loc[20, "label"] = "not null anymore"
+    target_df.loc[21, "value"] = src_df["value"][21] + 0.00001
+    target_df = target_df.drop(index=[7, 99])
+    target_df = pd.concat(
+        [
+            target_df,
+            pd.DataFrame(
+                [
+                    {"key": 500, "category": "c", "value": 1.0, "label": "new"},
+                    {"key": 30, "category": "a", "value": 30 / 7, "label": "duplicate"},
+                ]
+            ),
+        ]
+    )
+    src_df = pd.concat(
+        [src_df, pd.DataFrame([{"key": None, "category": "a", "value": 1.0, "label": "null"}])]
+    )
+
+    def create_tables(
+        engine_adapter: EngineAdapter, source: bool = True, target: bool = True
+    ) -> EngineAdapter:
+        for table, df, create in (("source", src_df, source), ("target", target_df, target)):
+            if create:
+                engine_adapter.create_table(table, columns_to_types)
+                engine_adapter.insert_append(table, df)
+        return engine_adapter
+
+    join_diff = TableDiff(
+        adapter=create_tables(DuckDBConnectionConfig().create_engine_adapter()),
+        source="source",
+        target="target",
+        on=on,
+    ).row_diff()
+
+    mismatches_path = tmp_path / "mismatches.csv"
+    streamed_diff = StreamingTableDiff(
+        adapter=create_tables(DuckDBConnectionConfig().create_engine_adapter(), target=False),
+        target_adapter=create_tables(
+            DuckDBConnectionConfig().create_engine_adapter(), source=False
+        ),
+        source="source",
+        target="target",
+        on=on,
+        limit=2,
+        batch_size=7,
+        mismatches_path=mismatches_path,
+    ).row_diff()
+
+    assert streamed_diff.stats == join_diff.stats
+    assert streamed_diff.partial_match_count == 3
+    assert streamed_diff.t_only_count == 1
+    pd.testing.assert_frame_equal(
+        streamed_diff.column_stats, join_diff.column_stats, check_dtype=False
+    )
+    assert streamed_diff.joined_sample.columns.tolist() == join_diff.joined_sample.columns.tolist()
+    assert streamed_diff.s_sample.columns.tolist() == join_diff.s_sample.columns.tolist()
+    assert streamed_diff.t_sample.columns.tolist() == join_diff.t_sample.columns.tolist()
+    assert streamed_diff.joined_sample["key"].tolist() == [5, 20]
+    assert streamed_diff.t_sample["key"].tolist() == [500]
+
+    # Every mismatch is written out, not only the sampled ones
+    mismatches = pd.read_csv(mismatches_path)
+    assert mismatches["__sqlmesh_sample_type"].value_counts().to_dict() == {
+        "common_rows": 3,
+        "source_only": 3,
+        "target_only": 1,
+    }
+
+
+def test_data_diff_streamed_normalizes_values():
+    source_adapter = DuckDBConnectionConfig().create_engine_adapter()
+    target_adapter = DuckDBConnectionConfig().create_engine_adapter()
+    source_adapter.execute(
+        "CREATE TABLE source AS SELECT 1 AS id, 1.50::DECIMAL(10, 2) AS amount, "
+        "'2024-01-01 01:00:00+01'::TIMESTAMPTZ AS ts, 'a' AS name"
+    )
+    target_adapter.execute(
+        "CREATE TABLE target AS SELECT 1::BIGINT AS ID, 1.5::DOUBLE AS AMOUNT, "
+        "'2024-01-01 00:00:00'::TIMESTAMP AS ts, 'b' AS name"
+    )
+
+    table_diff = StreamingTableDiff(
+        adapter=source_adapter,
+        target_adapter=target_adapter,
+        source="source",
+        target="target",
+        on=["id"],
+    )
+    row_diff = table_diff.row_diff()
+
+    assert row_diff.join_count == 1
+    assert row_diff.column_stats["pct_match"].to_dict() == {
+        "amount": 100.0,
+        "ts": 100.0,
+        "name": 0.0,
+    }
+    assert row_diff.joined_sample.to_dict("records") == [{"id": 1, "s__name": "a", "t__name": "b"}]
+    assert not table_diff.schema_diff().added
+    assert not table_diff.schema_diff().removed
+
+
+def test_data_diff_streamed_postgres_collation(make_mocked_engine_adapter: t.Callable):
+    source_adapter = make_mocked_engine_adapter(PostgresEngineAdapter)
+    source_adapter.columns = lambda *args, **kwargs: {
+        "id": exp.DataType.build("int"),
+        "code": exp.DataType.build("varchar"),
+        "ts": exp.DataType.build("timestamp"),
+    }
+    target_adapter = DuckDBConnectionConfig().create_engine_adapter()
+    target_adapter.execute(
+        "CREATE TABLE target AS SELECT 1 AS id, 'a' AS code, '2024-01-01'::TIMESTAMP AS ts"
+    )
+
+    def row_diff(on: t.List[str]) -> RowDiff:
+        source_adapter.cursor.fetchmany.side_effect = [[(1, "a", datetime(2024, 1, 1))], []]
+        return StreamingTableDiff(
+            adapter=source_adapter,
+            target_adapter=target_adapter,
+            source="source",
+            target="target",
+            on=on,
+        ).row_diff()
+
+    # Collations can't be applied to numeric or temporal keys in Postgres
+    assert row_diff(["id", "ts"]).full_match_count == 1
+    assert source_adapter.cursor.execute.call_args[0][0] == (
+        'SELECT "id", "code", "ts" FROM "source" ORDER BY "id", "ts"'
+    )
+
+    assert row_diff(["code"]).full_match_count == 1
+    assert source_adapter.cursor.execute.call_args[0][0] == (
+        'SELECT "id", "code", "ts" FROM "source" ORDER BY "code" COLLATE "C"'
+    )
+
+
+def test_table_diff_across_gateways(tmp_path: Path, mocker: MockerFixture):
+    config = Config(
+        gateways={
+            "main": GatewayConfig(connection=DuckDBConnectionConfig()),
+            "other": GatewayConfig(connection=DuckDBConnectionConfig()),
+        },
+        default_gateway="main",
+        model_defaults=ModelDefaultsConfig(dialect="duckdb"),
+    )
+    context = Context(paths=tmp_path, config=config)
+    for gateway, values in (("main", "(1, 'a'), (2, 'b')"), ("other", "(1, 'a'), (2, 'c')")):
+        context.engine_adapters[gateway].execute(
+            f"CREATE TABLE tbl AS SELECT * FROM (VALUES {values}) AS t(id, name)"
+        )
+
+    mismatches_file = tmp_path / "mismatches.csv"
+    table_diff = context.table_diff(
+        "tbl", "other|tbl", on=["id"], show=False, mismatches_file=str(mismatches_file)
+    )[0]
+
+    assert isinstance(table_diff, StreamingTableDiff)
+    assert table_diff.source_alias == "tbl"
+    assert table_diff.target_alias == "other"
+    row_diff = table_diff.row_diff()
+    assert row_diff.full_match_count == 1
+    assert row_diff.partial_match_count == 1
+    assert mismatches_file.read_text().count("common_rows") == 1
+
+    # The algorithm only applies to tables which are joined by the engine
+    log_warning = mocker.spy(context.console, "log_warning")
+    context.table_diff("tbl", "other|tbl", on=["id"], show=False, algorithm="hashdiff")
+    log_warning.assert_called_once()
+    assert "'hashdiff' algorithm is ignored" in log_warning.call_args[0][0]
+
+    # Tables in the same gateway are still joined by the engine
+    table_diff = context.table_diff("main|tbl", "tbl", on=["id"], show=False)[0]
+    assert not isinstance(table_diff, StreamingTableDiff)
+    assert table_diff.row_diff().full_match_count == 2
+
+    with pytest.raises(ConfigError, match="can't be diffed together with a model selection"):
+        context.table_diff("main|tbl", "other|tbl", select_models=["*"], show=False)
@@ -30,7 +30,8 @@ from sqlmesh.core.engine_adapter import EngineAdapter
 from sqlmesh.core.macros import MacroEvaluator, macro
 from sqlmesh.core.model import Model, SqlModel, load_sql_based_model, model
 from sqlmesh.core.model.common import ParsableSql
-from sqlmesh.core.test.definition import ModelTest, PythonModelTest, SqlModelTest
+from sqlmesh.core.test.definition import FixtureCache, ModelTest, PythonModelTest, SqlModelTest
+from sqlmesh.core.test import runner
 from sqlmesh.core.test.result import ModelTextTestResult
 from sqlmesh.core.test.context import TestExecutionContext
 from sqlmesh.utils import Verbosity
@@ -3527,3 +3528,93 @@ test_foo:
 
     assert "Ran 1 tests" in output
     assert "Failed tests (1)" in output
+
+
+def test_shared_fixtures(sushi_context: Context, mocker: MockerFixture) -> None:
+    model = _create_model("SELECT id, value FROM raw")
+    body = load_yaml(
+        """
+test_foo:
+  model: sushi.foo
+  inputs:
+    raw:
+      - id: 1
+        value: 2
+  outputs:
+    query:
+      - id: 1
+        value: 2
+        """
+    )
+    engine_adapter = sushi_context.test_connection_config.create_engine_adapter(
+        register_comments_override=False
+    )
+    fixture_cache = FixtureCache(engine_adapter)
+    ctas = mocker.spy(engine_adapter, "ctas")
+
+    for test_name in ("test_foo", "test_bar"):
+        _check_successful_or_raise(
+            SqlModelTest(
+                body=body["test_foo"],
+                test_name=test_name,
+                model=model,
+                models=sushi_context._models,
+                engine_adapter=engine_adapter,
+                dialect=sushi_context.config.dialect,
+                path=None,
+                default_catalog=sushi_context.default_catalog,
+                fixture_cache=fixture_cache,
+            ).run()
+        )
+
+    ctas.assert_called_once()
+    fixture_table = ctas.call_args[0][0]
+    assert engine_adapter.table_exists(fixture_table)
+
+    fixture_cache.cleanup()
+    assert not engine_adapter.table_exists(fixture_table)
+
+
+@use_terminal_console
+def test_processes(tmp_path: Path, mocker: MockerFixture) -> None:
+    init_example_project(tmp_path, engine_type="duckdb")
+
+    original_test_file = tmp_path / "tests" / "test_full_model.yaml"
+    test_body = original_test_file.read_text()
+    for i in range(3):
+        (tmp_path / "tests" / f"test_success_{i}.yaml").write_text(
+            test_body.replace("test_example_full_model", f"test_success_{i}")
+        )
+    (tmp_path / "tests" / "test_failure.yaml").write_text(
+        test_body.replace("test_example_full_model", "test_failure").replace(
+            "num_orders: 2", "num_orders: 3"
+        )
+    )
+
+    config = Config(
+        default_connection=DuckDBConnectionConfig(),
+        model_defaults=ModelDefaultsConfig(dialect="duckdb"),
+    )
+    context = Context(paths=tmp_path, config=config)
+    run_tests_in_processes = mocker.spy(runner, "_run_tests_in_processes")
+
+    result = context.test(processes=2)
+
+    run_tests_in_processes.assert_called_once()
+    assert result.testsRun == 5
+    assert len(result.successes) == 4
+    assert [test.test_name for test in result.get_fail_and_error_tests()] == ["test_failure"]
+    assert result.failure_tables
+    assert len(result.test_durations) == 5
+    assert (
+        result.slowest_tests(limit=2)
+        == sorted(result.test_durations, key=lambda test_duration: -test_duration[1])[:2]
+    )
+
+    with capture_output() as captured_output:
+        context.test(processes=2, verbosity=Verbosity.VERBOSE)
+
+    output = captured_output.stdout
+    assert "Slowest tests:" in output
+    assert "Ran 5 tests" in output
+    assert "Failed tests (1):" in output
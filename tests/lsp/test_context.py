@@ -91,3 +91,28 @@ def test_context_get_or_load_from_no_context_via_workspace_folder():
     assert isinstance(lsp_context, LSPContext)
     assert isinstance(server.context_state, ContextLoaded)
     assert server.context_state.lsp_context is lsp_context
+
+
+def test_lsp_context_reload_files(tmp_path: Path):
+    models_dir = tmp_path / "models"
+    models_dir.mkdir()
+    parent_path = models_dir / "parent.sql"
+    parent_path.write_text("MODEL (name test.parent); SELECT 1 AS a")
+    child_path = models_dir / "child.sql"
+    child_path.write_text("MODEL (name test.child); SELECT a FROM test.parent")
+    other_path = models_dir / "other.sql"
+    other_path.write_text("MODEL (name test.other); SELECT 1 AS c")
+    (tmp_path / "config.yaml").write_text("model_defaults:\n  dialect: duckdb")
+
+    lsp_context = LSPContext(Context(paths=tmp_path))
+    for path in (parent_path, child_path, other_path):
+        lsp_context.render_model(URI.from_path(path))
+        lsp_context.lint_model(URI.from_path(path))
+
+    parent_path.write_text("MODEL (name test.renamed); SELECT 1 AS a")
+    lsp_context.reload_files([parent_path])
+
+    # Only the cached results of the saved file and its downstream models are dropped
+    assert set(lsp_context._render_cache) == {other_path}
+    assert set(lsp_context._lint_cache) == {other_path}
+    assert lsp_context.map[parent_path] == ModelTarget(names=["test.renamed"])
@@ -0,0 +1,48 @@
+from pathlib import Path
+
+from pytest_mock import MockerFixture
+
+from sqlmesh.core.context import Context
+from sqlmesh.lsp.context import LSPContext
+from sqlmesh.lsp.symbols import SymbolIndex
+from sqlmesh.utils.lineage import ModelReference
+
+
+def _create_project(tmp_path: Path) -> Path:
+    models_dir = tmp_path / "models"
+    models_dir.mkdir()
+    (models_dir / "parent.sql").write_text("MODEL (name test.parent); SELECT 1 AS a")
+    (models_dir / "child.sql").write_text(
+        "MODEL (name test.child);\nSELECT parent.a FROM test.parent AS parent"
+    )
+    (models_dir / "other.sql").write_text("MODEL (name test.other); SELECT 1 AS b")
+    (tmp_path / "config.yaml").write_text("model_defaults:\n  dialect: duckdb")
+    return models_dir
+
+
+def test_symbol_index_model_references(tmp_path: Path):
+    models_dir = _create_project(tmp_path)
+    lsp_context = LSPContext(Context(paths=tmp_path))
+
+    references = lsp_context.symbols.model_references(models_dir / "parent.sql")
+    assert {path for path, _ in references} == {models_dir / "child.sql"}
+    assert all(isinstance(ref, ModelReference) for _, ref in references)
+    assert lsp_context.symbols.model_references(models_dir / "other.sql") == []
+
+
+def test_symbol_index_is_persisted(tmp_path: Path, mocker: MockerFixture):
+    models_dir = _create_project(tmp_path)
+    parent_path = models_dir / "parent.sql"
+
+    expected = LSPContext(Context(paths=tmp_path)).symbols.model_references(parent_path)
+    assert expected
+
+    extract_symbols = mocker.spy(SymbolIndex, "_extract_symbols")
+    lsp_context = LSPContext(Context(paths=tmp_path))
+    assert lsp_context.symbols.model_references(parent_path) == expected
+    extract_symbols.assert_not_called()
+
+    (models_dir / "child.sql").write_text("MODEL (name test.child);\nSELECT 1 AS a")
+    lsp_context.reload_files([models_dir / "child.sql"])
+    assert lsp_context.symbols.model_references(parent_path) == []
+    assert extract_symbols.call_count == 1
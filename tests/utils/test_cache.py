@@ -1,13 +1,30 @@
+import pickle
 import typing as t
 from pathlib import Path
 
+import pytest
 from pytest_mock.plugin import MockerFixture
 from sqlglot import parse_one
 
 from sqlmesh.core import dialect as d
-from sqlmesh.core.model import SqlModel, load_sql_based_model
-from sqlmesh.core.model.cache import OptimizedQueryCache
-from sqlmesh.utils.cache import FileCache
+from sqlmesh.core.model import (
+    SeedKind,
+    SeedModel,
+    SqlModel,
+    create_seed_model,
+    load_sql_based_model,
+)
+from sqlmesh.core.model.cache import OptimizedQueryCache, SeedColumnsCache
+from sqlmesh.core.model.seed import CsvSeedReader
+from sqlmesh.utils.cache import (
+    PACKED_CACHE_FILE_NAME,
+    _PACKED_STORES,
+    CacheBackend,
+    FileCache,
+    PackedCacheStore,
+    configure_cache_dir,
+)
+from sqlmesh.utils.concurrency import concurrent_apply_to_values
 from sqlmesh.utils.pydantic import PydanticModel
 
 
@@ -133,6 +150,58 @@ def test_optimized_query_cache_macro_def_change(tmp_path: Path, mocker: MockerFi
     )
 
 
+def test_optimized_query_cache_load_entry(tmp_path: Path, mocker: MockerFixture):
+    model = SqlModel(
+        name="test_model",
+        query=parse_one("SELECT a FROM tbl"),
+        mapping_schema={"tbl": {"a": "int"}},
+    )
+
+    cache = OptimizedQueryCache(tmp_path)
+    name = cache._entry_name(model)
+
+    entry = cache.load_entry(model, name)
+    assert entry.optimized_rendered_query is not None
+    assert cache.load_entry(model.copy(), name) == entry
+
+    # The entry can be applied to another copy of the model without reading the cache
+    new_model = model.copy()
+    file_cache_get = mocker.spy(cache._file_cache, "get")
+    assert cache.with_entry(new_model, entry, name)
+    file_cache_get.assert_not_called()
+    assert new_model._query_renderer._optimized_cache == entry.optimized_rendered_query
+
+
+def test_seed_columns_cache(tmp_path: Path, mocker: MockerFixture):
+    seed_path = tmp_path / "seed.csv"
+    seed_path.write_text("key,value\n1,one\n2,two\n")
+
+    model = create_seed_model("db.seed", SeedKind(path=str(seed_path)))
+    assert isinstance(model, SeedModel)
+    expected_columns_to_types = model.columns_to_types
+    expected_column_hashes = model.column_hashes
+    expected_data_hash = model.data_hash
+
+    cache = SeedColumnsCache(tmp_path / "cache")
+    assert not cache.with_seed_columns(model.copy())
+
+    # The seed content doesn't have to be parsed once its columns have been cached
+    read_csv = mocker.spy(CsvSeedReader, "_read_csv")
+    new_model = model.copy()
+    assert cache.with_seed_columns(new_model)
+    assert new_model.columns_to_types == expected_columns_to_types
+    assert new_model.column_hashes == expected_column_hashes
+    assert new_model.data_hash == expected_data_hash
+    read_csv.assert_not_called()
+
+    # A change in the seed content or settings results in a new entry
+    seed_path.write_text("key,value\n1,one\n2,three\n")
+    assert not cache.with_seed_columns(create_seed_model("db.seed", SeedKind(path=str(seed_path))))
+    assert not cache.with_seed_columns(
+        create_seed_model("db.seed", SeedKind(path=str(seed_path), csv_settings={"delimiter": ";"}))
+    )
+
+
 def test_file_cache_init_handles_stale_file(tmp_path: Path, mocker: MockerFixture) -> None:
     cache: FileCache[_TestEntry] = FileCache(tmp_path)
 
@@ -149,3 +218,95 @@ def test_file_cache_init_handles_stale_file(tmp_path: Path, mocker: MockerFixtur
     mocker.patch.object(Path, "stat", flaky_stat)
 
     FileCache(tmp_path)
+
+
+@pytest.fixture
+def packed_cache_dir(tmp_path: Path) -> t.Iterator[Path]:
+    configure_cache_dir(tmp_path, backend=CacheBackend.PACKED)
+    yield tmp_path
+    configure_cache_dir(tmp_path, backend=CacheBackend.FILES)
+
+
+def test_packed_file_cache(packed_cache_dir: Path, mocker: MockerFixture):
+    cache: FileCache[_TestEntry] = FileCache(packed_cache_dir, prefix="test")
+    other_cache: FileCache[_TestEntry] = FileCache(packed_cache_dir, prefix="other")
+
+    test_entry_a = _TestEntry(value="value_a")
+    test_entry_b = _TestEntry(value="value_b")
+
+    loader = mocker.Mock(return_value=test_entry_a)
+
+    assert cache.get("test_name", "test_entry_a") is None
+    assert not cache.exists("test_name", "test_entry_a")
+
+    assert cache.get_or_load("test_name", "test_entry_a", loader=loader) == test_entry_a
+    assert cache.get_or_load("test_name", "test_entry_a", loader=loader) == test_entry_a
+    assert cache.exists("test_name", "test_entry_a")
+    loader.assert_called_once()
+
+    cache.put("test_name", "test_entry_b", value=test_entry_b)
+    assert cache.get("test_name", "test_entry_b") == test_entry_b
+    assert cache.get("test_name", "test_entry_a") == test_entry_a
+    assert other_cache.get("test_name", "test_entry_a") is None
+
+    other_cache.put("test_name", "test_entry_a", value=test_entry_b)
+    cache.clear()
+    assert cache.get("test_name", "test_entry_a") is None
+    assert other_cache.get("test_name", "test_entry_a") == test_entry_b
+
+    # All entries are stored in a single file
+    assert [
+        p.name for p in packed_cache_dir.iterdir() if not p.name.endswith(("-wal", "-shm"))
+    ] == [PACKED_CACHE_FILE_NAME]
+
+
+def test_packed_file_cache_prunes_stale_entries(packed_cache_dir: Path):
+    cache: FileCache[_TestEntry] = FileCache(packed_cache_dir)
+    cache.put("test_name", value=_TestEntry(value="value"))
+
+    store = _PACKED_STORES[packed_cache_dir.resolve()]
+    store.prune(cache._cache_version, 0)
+    assert cache.exists("test_name")
+
+    store.prune("new_version", 0)
+    assert not cache.exists("test_name")
+
+
+def test_packed_file_cache_lru_eviction(packed_cache_dir: Path, mocker: MockerFixture):
+    configure_cache_dir(packed_cache_dir, backend=CacheBackend.PACKED, max_size_bytes=2500)
+    mocker.patch.object(PackedCacheStore, "EVICTION_CHECK_INTERVAL", 1)
+    time_mock = mocker.patch("sqlmesh.utils.cache.time.time")
+
+    cache: FileCache[str] = FileCache(packed_cache_dir)
+    for i in range(3):
+        time_mock.return_value = i * PackedCacheStore.ACCESS_TIME_RESOLUTION * 2
+        cache.put(f"entry_{i}", value="x" * 1000)
+
+    # The oldest entry is evicted to make room for the third one
+    assert cache.get("entry_0") is None
+    assert cache.get("entry_1") is not None
+    assert cache.get("entry_2") is not None
+
+    # Reading an entry refreshes its access time, so the other one gets evicted next
+    time_mock.return_value = 10 * PackedCacheStore.ACCESS_TIME_RESOLUTION
+    assert cache.get("entry_1") is not None
+    cache.put("entry_3", value="x" * 1000)
+
+    assert cache.get("entry_1") is not None
+    assert cache.get("entry_2") is None
+    assert cache.get("entry_3") is not None
+
+
+def test_packed_file_cache_concurrent_access(packed_cache_dir: Path):
+    cache: FileCache[_TestEntry] = FileCache(packed_cache_dir)
+    names = [f"entry_{i}" for i in range(50)]
+
+    concurrent_apply_to_values(
+        names, lambda name: cache.put(name, value=_TestEntry(value=name)), tasks_num=8
+    )
+    results = concurrent_apply_to_values(names, cache.get, tasks_num=8)
+    assert results == [_TestEntry(value=name) for name in names]
+
+    # The cache can be sent to other processes
+    unpickled_cache = pickle.loads(pickle.dumps(cache))
+    assert unpickled_cache.get("entry_0") == _TestEntry(value="entry_0")
@@ -2,8 +2,11 @@ import pytest
 from pytest_mock.plugin import MockerFixture
 
 from sqlmesh.core.snapshot import SnapshotId
+from sqlmesh.utils.dag import DAG
 from sqlmesh.utils.concurrency import (
+    ConcurrentDAGExecutor,
     NodeExecutionFailedError,
+    concurrent_apply_to_dag,
     concurrent_apply_to_snapshots,
     concurrent_apply_to_values,
 )
@@ -147,3 +150,89 @@ def test_concurrent_apply(tasks_num: int):
     values = [1, 2, 3, 4, 5, 6, 7, 8, 9, 10]
     results = concurrent_apply_to_values(values, lambda x: x * 2, tasks_num)
     assert results == [x * 2 for x in values]
+
+
+def test_concurrent_dag_executor_respects_node_ordering():
+    dag: DAG[str] = DAG({"e": set(), "d": set(), "c": set(), "b": {"a"}, "a": set()})
+
+    processed_nodes = []
+    errors, skipped = ConcurrentDAGExecutor(
+        dag, lambda n: processed_nodes.append(n), tasks_num=1, raise_on_error=True
+    ).run()
+
+    assert not errors
+    assert not skipped
+    assert processed_nodes == ["a", "b", "c", "d", "e"]
+
+
+def test_concurrent_dag_executor_custom_priority():
+    dag: DAG[str] = DAG({"a": set(), "b": set(), "c": set(), "d": {"c"}})
+    priorities = {"a": 2, "b": 1, "c": 0, "d": 3}
+
+    processed_nodes = []
+    ConcurrentDAGExecutor(
+        dag,
+        lambda n: processed_nodes.append(n),
+        tasks_num=1,
+        raise_on_error=True,
+        priority=lambda n: priorities[n],
+    ).run()
+
+    assert processed_nodes == ["c", "b", "a", "d"]
+
+
+def test_concurrent_apply_to_dag_single_task_priority():
+    dag: DAG[str] = DAG({"a": set(), "b": set(), "c": set(), "d": {"c"}, "e": {"a"}})
+    priorities = {"a": 2, "b": 1, "c": 0, "d": 3, "e": 4}
+
+    processed_nodes = []
+
+    def fn(node: str) -> None:
+        processed_nodes.append(node)
+        if node == "a":
+            raise RuntimeError("failed")
+
+    errors, skipped = concurrent_apply_to_dag(
+        dag, fn, tasks_num=1, raise_on_error=False, priority=lambda n: priorities[n]
+    )
+
+    assert processed_nodes == ["c", "b", "a", "d"]
+    assert [error.node for error in errors] == ["a"]
+    assert skipped == ["e"]
+
+
+def test_concurrent_dag_executor_large_dag():
+    dag: DAG[int] = DAG()
+    for i in range(2000):
+        dag.add(i, [i - 1, i - 2] if i > 1 else [])
+
+    processed_nodes = []
+    errors, skipped = ConcurrentDAGExecutor(
+        dag, lambda n: processed_nodes.append(n), tasks_num=4, raise_on_error=True
+    ).run()
+
+    assert not errors
+    assert not skipped
+    assert processed_nodes == list(range(2000))
+
+
+def test_concurrent_dag_executor_skips_downstream_of_failed_node():
+    dag: DAG[str] = DAG(
+        {"a": set(), "b": {"a"}, "c": {"a", "b"}, "d": {"c"}, "e": set(), "f": {"e", "d"}}
+    )
+
+    def fn(node: str) -> None:
+        if node == "a":
+            raise RuntimeError("fail")
+
+    executor = ConcurrentDAGExecutor(dag, fn, tasks_num=2, raise_on_error=False)
+    errors, skipped = executor.run()
+
+    assert [e.node for e in errors] == ["a"]
+    assert len(skipped) == 4
+    assert set(skipped) == {"b", "c", "d", "f"}
+
+    # The executor can be reused
+    errors, skipped = executor.run()
+    assert [e.node for e in errors] == ["a"]
+    assert set(skipped) == {"b", "c", "d", "f"}
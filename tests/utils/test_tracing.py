@@ -0,0 +1,54 @@
+import json
+import threading
+from pathlib import Path
+
+from sqlmesh.utils.tracing import active_tracer, span, start_tracing, stop_tracing, traced
+
+
+@traced("test")
+def _traced_function(value: int) -> int:
+    with span("inner", "test", value=value):
+        return value + 1
+
+
+def test_tracing_disabled():
+    assert active_tracer() is None
+    assert _traced_function(1) == 2
+    with span("noop"):
+        pass
+    assert active_tracer() is None
+
+
+def test_tracer_spans(tmp_path: Path):
+    tracer = start_tracing()
+    try:
+        assert active_tracer() is tracer
+        assert _traced_function(1) == 2
+
+        thread = threading.Thread(target=_traced_function, args=(2,))
+        thread.start()
+        thread.join()
+    finally:
+        assert stop_tracing() is tracer
+    assert active_tracer() is None
+
+    assert [s.name for s in tracer.spans] == ["inner", "_traced_function"] * 2
+    inner, outer = tracer.spans[:2]
+    assert outer.start <= inner.start
+    assert outer.duration >= inner.duration
+    assert outer.self_time == outer.duration - inner.duration
+    assert inner.self_time == inner.duration
+    assert tracer.spans[2].thread_id != tracer.spans[0].thread_id
+
+    summary = {s.name: s for s in tracer.summary()}
+    assert summary["_traced_function"].count == 2
+    assert summary["inner"].total_time == summary["inner"].self_time
+    assert tracer.format_summary()[0].split() == ["self", "(s)", "total", "(s)", "calls", "span"]
+
+    trace_path = tmp_path / "trace" / "plan.json"
+    tracer.write_chrome_trace(trace_path)
+    events = json.loads(trace_path.read_text())["traceEvents"]
+    assert len(events) == 4
+    assert events[0]["name"] == "_traced_function"
+    assert events[0]["ph"] == "X"
+    assert events[1]["args"] == {"value": "1"}
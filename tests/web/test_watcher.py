@@ -0,0 +1,46 @@
+from pathlib import Path
+
+from pytest_mock import MockerFixture
+
+from sqlmesh.core.context import Context
+from web.server import models
+from web.server.settings import Settings
+from web.server.watcher import reload_models
+
+
+def test_reload_models(tmp_path: Path, mocker: MockerFixture) -> None:
+    models_dir = tmp_path / "models"
+    models_dir.mkdir()
+    parent_path = models_dir / "parent.sql"
+    parent_path.write_text("MODEL (name test.parent); SELECT 1 AS a")
+    (models_dir / "child.sql").write_text("MODEL (name test.child); SELECT a FROM test.parent")
+    (models_dir / "other.sql").write_text("MODEL (name test.other); SELECT 1 AS b")
+    (tmp_path / "config.yaml").write_text("model_defaults:\n  dialect: duckdb")
+    settings = Settings(project_path=tmp_path)
+
+    get_context_mock = mocker.patch(
+        "web.server.watcher.get_loaded_context_if_exists", return_value=None
+    )
+    assert reload_models(settings, {parent_path}) is None
+
+    get_context_mock.return_value = Context(paths=tmp_path)
+    parent_path.write_text("MODEL (name test.parent); SELECT 1 AS a, 2 AS c")
+    delta = reload_models(settings, {parent_path})
+
+    assert isinstance(delta, models.ModelsDelta)
+    assert {model.name for model in delta.changed} == {"test.parent", "test.child"}
+    assert delta.removed == []
+    assert delta.lineage == {
+        '"memory"."test"."parent"': [],
+        '"memory"."test"."child"': ['"memory"."test"."parent"'],
+    }
+
+    (models_dir / "new.sql").write_text("MODEL (name test.new); SELECT 1 AS d")
+    all_models = reload_models(settings, {models_dir / "new.sql"})
+    assert isinstance(all_models, list)
+    assert {model.name for model in all_models} == {
+        "test.parent",
+        "test.child",
+        "test.other",
+        "test.new",
+    }
@@ -10,6 +10,12 @@ import {
 } from '~/models/environment'
 import { isNil, isStringEmptyOrNil, isTrue } from '~/utils'
 
+export interface ModelsDelta {
+  changed: Model[]
+  removed: string[]
+  lineage: Record<string, string[]>
+}
+
 interface ContextStore {
   version?: string
   nodeColors: Record<string, string>
@@ -30,6 +36,7 @@ interface ContextStore {
   addConfirmation: (confirmation: Confirmation) => void
   removeConfirmation: () => void
   setModels: (models?: Model[]) => void
+  applyModelsDelta: (delta: ModelsDelta) => void
   isModel: (nameOrPath: string) => boolean
   isExistingEnvironment: (
     environment: ModelEnvironment | EnvironmentName,
@@ -144,6 +151,41 @@ export const useStoreContext = create<ContextStore>((set, get) => ({
       }, new Map()),
     }))
   },
+  applyModelsDelta({ changed, removed }) {
+    const models = new Map(get().models)
+
+    removed.forEach(fqn => {
+      const model = models.get(fqn)
+
+      if (isNil(model)) return
+
+      models.delete(model.name)
+      models.delete(model.fqn)
+      models.delete(model.path)
+    })
+
+    changed.forEach(model => {
+      const tempModel = new ModelSQLMeshModel(model)
+      let maybeModel =
+        models.get(tempModel.path) ??
+        models.get(tempModel.name) ??
+        models.get(tempModel.fqn)
+
+      if (isNil(maybeModel)) {
+        maybeModel = tempModel
+      } else {
+        maybeModel.update(model)
+      }
+
+      models.set(maybeModel.name, maybeModel)
+      models.set(maybeModel.fqn, maybeModel)
+      models.set(maybeModel.path, maybeModel)
+    })
+
+    set(() => ({
+      models,
+    }))
+  },
   getNextEnvironment() {
     return get().environments.values().next().value ?? environment
   },
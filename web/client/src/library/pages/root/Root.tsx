@@ -72,6 +72,7 @@ export default function Root({
   const setShowConfirmation = useStoreContext(s => s.setShowConfirmation)
   const removeConfirmation = useStoreContext(s => s.removeConfirmation)
   const setModels = useStoreContext(s => s.setModels)
+  const applyModelsDelta = useStoreContext(s => s.applyModelsDelta)
   const addRemoteEnvironments = useStoreContext(s => s.addRemoteEnvironments)
   const addLocalEnvironment = useStoreContext(s => s.addLocalEnvironment)
   const setEnvironment = useStoreContext(s => s.setEnvironment)
@@ -328,8 +329,10 @@ export default function Root({
     const channelErrors = channel?.('errors', displayErrors)
     const channelTests = channel?.('tests', updateTests)
     const channelModels = channel?.('models', updateModels)
+    const channelModelsDelta = channel?.('models-delta', applyModelsDelta)
 
     channelModels?.subscribe()
+    channelModelsDelta?.subscribe()
 
     if (modules.hasPlans) {
       channelTests?.subscribe()
@@ -358,6 +361,7 @@ export default function Root({
       void cancelRequestModels()
 
       channelModels?.unsubscribe()
+      channelModelsDelta?.unsubscribe()
 
       if (modules.hasPlans) {
         cancelRequestEnvironments()
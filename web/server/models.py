@@ -40,6 +40,7 @@ class EventName(str, enum.Enum):
     FILE = "file"
     FORMAT_FILE = "format-file"
     MODELS = "models"
+    MODELS_DELTA = "models-delta"
     TESTS = "tests"
     PLAN_APPLY = "plan-apply"
     PLAN_OVERVIEW = "plan-overview"
@@ -189,6 +190,14 @@ class Model(PydanticModel):
     hash: str
 
 
+class ModelsDelta(PydanticModel):
+    changed: t.List[Model]
+    removed: t.List[str]
+    """The fully qualified names of the models that no longer exist."""
+    lineage: t.Dict[str, t.List[str]]
+    """The parents of each changed model."""
+
+
 class ChangeDisplay(PydanticModel):
     name: str
     view_name: str
@@ -107,6 +107,13 @@ def get_loaded_context(
         )
 
 
+def get_loaded_context_if_exists(settings: Settings) -> t.Optional[Context]:
+    """Returns the loaded context without loading it if it hasn't been requested yet."""
+    if not _get_loaded_context.cache_info().currsize:
+        return None
+    return _get_loaded_context(settings.project_path, settings.config, settings.gateway)
+
+
 def get_context(settings: Settings = Depends(get_settings)) -> t.Optional[Context]:
     try:
         return _get_context(settings.project_path, settings.config, settings.gateway)
@@ -124,6 +131,10 @@ def get_context_or_raise(settings: Settings = Depends(get_settings)) -> Context:
     return context
 
 
+def invalidate_path_to_model_mapping() -> None:
+    _get_path_to_model_mapping.cache_clear()
+
+
 def invalidate_context_cache() -> None:
     _get_context.cache_clear()
     _get_loaded_context.cache_clear()
@@ -1,3 +1,4 @@
+import asyncio
 import typing as t
 from pathlib import Path
 
@@ -7,13 +8,17 @@ from sqlmesh.core import constants as c
 from sqlmesh.core.context import Context
 from web.server import models
 from web.server.api.endpoints.files import _get_directory, _get_file_with_content
+from web.server.api.endpoints.models import serialize_all_models, serialize_model
 from web.server.console import api_console
 from web.server.exceptions import ApiException
 from web.server.settings import (
     Settings,
     get_context,
+    get_loaded_context_if_exists,
+    get_loaded_context_lock,
     get_settings,
     invalidate_context_cache,
+    invalidate_path_to_model_mapping,
 )
 from web.server.utils import is_relative_to
 
@@ -47,6 +52,8 @@ async def watch_project() -> None:
     ):
         changes: t.List[models.ArtifactChange] = []
         directories: t.Dict[str, models.Directory] = {}
+        # Changes are debounced by awatch and coalesced here, so that each batch is reloaded at once
+        project_paths: t.Set[Path] = set()
         for change, path_str in entries:
             path = Path(path_str)
             relative_path = path.relative_to(settings.project_path)
@@ -75,16 +82,8 @@ async def watch_project() -> None:
                             ),
                         )
                     )
-                if context:
-                    in_paths = any(is_relative_to(path, p) for p in paths)
-                    is_modified_new_file = change == Change.modified and any(
-                        path not in loader._path_mtimes for loader in context._loaders
-                    )
-                    should_track_file = path.is_file() and in_paths
-                    should_reset_mtime = Change.added or is_modified_new_file
-                    if should_track_file and should_reset_mtime:
-                        for loader in context._loaders:
-                            loader._path_mtimes[path] = 0
+                if context and not path.is_dir() and any(is_relative_to(path, p) for p in paths):
+                    project_paths.add(path)
 
             except Exception:
                 error = ApiException(
@@ -117,6 +116,56 @@ async def watch_project() -> None:
                     trigger="config",
                 ).to_dict(),
             )
+        elif project_paths:
+            try:
+                # Reloading blocks on the context lock, so it's done outside of the event loop
+                delta = await asyncio.to_thread(reload_models, settings, project_paths)
+            except Exception:
+                invalidate_context_cache()
+                api_console.log_event(
+                    event=models.EventName.ERRORS,
+                    data=ApiException(
+                        message="Error reloading models",
+                        origin="API -> watcher -> reload_models",
+                    ).to_dict(),
+                )
+            else:
+                if isinstance(delta, models.ModelsDelta):
+                    api_console.log_event(event=models.EventName.MODELS_DELTA, data=delta.dict())
+                elif delta is not None:
+                    api_console.log_event(event=models.EventName.MODELS, data=delta)
+
+
+def reload_models(
+    settings: Settings, paths: t.Set[Path]
+) -> t.Optional[t.Union[models.ModelsDelta, t.List[models.Model]]]:
+    """Reloads the models defined in the changed files of an already loaded context.
+
+    Args:
+        settings: The server settings.
+        paths: The project files that were modified, added or deleted.
+
+    Returns:
+        The changed models and their lineage if only the affected models were reloaded, all models
+        if the whole project had to be loaded, or None if the context hasn't been loaded yet.
+    """
+    with get_loaded_context_lock:
+        context = get_loaded_context_if_exists(settings)
+        if context is None:
+            # The next request loads the context along with the changes
+            return None
+
+        affected = context.reload_paths(paths)
+        invalidate_path_to_model_mapping()
+        if affected is None:
+            return serialize_all_models(context)
+
+        changed = [model for fqn, model in context.models.items() if fqn in affected]
+        return models.ModelsDelta(
+            changed=[serialize_model(context, model) for model in changed],
+            removed=sorted(fqn for fqn in affected if fqn not in context.models),
+            lineage={model.fqn: sorted(model.depends_on) for model in changed},
+        )
 
 
 def is_config_changed(